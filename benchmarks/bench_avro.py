@@ -0,0 +1,131 @@
+"""
+Micro-benchmark: message serialization throughput for an AvroModel event,
+JSON vs. Avro parsing the schema on every call (previous behaviour) vs.
+Avro with the parsed-schema cache, with and without the registry wire format.
+
+Run from the repository root:
+
+    python benchmarks/bench_avro.py [--number N]
+
+Avro paths need fastavro (``pip install fastavro``); without it only JSON
+is reported.
+
+Columns:
+- bytes:   payload size
+- enc/s:   messages serialized per second
+- dec/s:   messages deserialized per second
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strider.messaging.avro import AvroModel, InMemorySchemaRegistry  # noqa: E402
+
+
+class LineItem(AvroModel):
+    __avro_namespace__ = "com.bench"
+
+    sku: str
+    quantity: int
+    unit_price: float
+
+
+class OrderPlaced(AvroModel):
+    """Order event with a nested array: a schema worth caching."""
+
+    __avro_namespace__ = "com.bench"
+
+    order_id: int
+    customer_id: int
+    currency: str
+    total: float
+    placed_at: datetime
+    items: list[LineItem]
+    tags: dict[str, str] | None = None
+    note: str | None = None
+
+
+def make_event() -> OrderPlaced:
+    return OrderPlaced(
+        order_id=1_000_001,
+        customer_id=42,
+        currency="BRL",
+        total=310.7,
+        placed_at=datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc),
+        items=[LineItem(sku=f"SKU-{i}", quantity=i + 1, unit_price=10.5 * (i + 1)) for i in range(5)],
+        tags={"channel": "web", "campaign": "summer"},
+    )
+
+
+def measure(fn, number: int) -> float:
+    """Best-of-5 calls per second."""
+    return number / min(timeit.repeat(fn, number=number, repeat=5))
+
+
+def uncached_paths(event: OrderPlaced):
+    """The previous to_avro/from_avro: fastavro.parse_schema on every call."""
+    import fastavro
+
+    def encode() -> bytes:
+        buffer = BytesIO()
+        fastavro.schemaless_writer(buffer, fastavro.parse_schema(OrderPlaced.__avro_schema__()), event.model_dump())
+        return buffer.getvalue()
+
+    def decode(data: bytes) -> OrderPlaced:
+        schema = fastavro.parse_schema(OrderPlaced.__avro_schema__())
+        return OrderPlaced.model_validate(fastavro.schemaless_reader(BytesIO(data), schema))
+
+    return encode, decode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=5000, help="messages per measurement")
+    args = parser.parse_args()
+
+    event = make_event()
+    paths = {
+        "json": (
+            lambda: json.dumps(event.model_dump(mode="json")).encode(),
+            lambda data: OrderPlaced.model_validate(json.loads(data)),
+        ),
+    }
+    try:
+        import fastavro  # noqa: F401
+    except ImportError:
+        print("\nfastavro not installed: Avro paths skipped")
+    else:
+        registry = InMemorySchemaRegistry()
+        paths["avro (parse per call)"] = uncached_paths(event)
+        paths["avro (cached)"] = (
+            lambda: event.to_avro(),
+            lambda data: OrderPlaced.from_avro(data),
+        )
+        paths["avro (cached + wire)"] = (
+            lambda: event.to_avro(registry=registry),
+            lambda data: OrderPlaced.from_avro(data, registry=registry),
+        )
+
+    print(f"\nOrderPlaced with {len(event.items)} items")
+    print(f"  {'path':<24}{'bytes':>7}{'enc/s':>12}{'dec/s':>12}")
+    for name, (encode, decode) in paths.items():
+        data = encode()
+        assert decode(data) == event
+        print(
+            f"  {name:<24}{len(data):>7}"
+            f"{measure(encode, args.number):>12,.0f}"
+            f"{measure(lambda: decode(data), args.number):>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Micro-benchmark: StructSchema load/dump, compiled codecs vs. the previous
+reflective implementation.
+
+Run from the repository root:
+
+    python benchmarks/bench_struct_schema.py [--number N]
+
+Scenarios:
+- wide:   one schema with 200 primitive fields (+ 50 unknown keys)
+- nested: 6 levels of NestedField, 10 fields per level
+- prefs:  a realistic small schema with aliases and a nested block
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import timeit
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strider.schema import (  # noqa: E402
+    BooleanField,
+    FloatField,
+    IntegerField,
+    ListField,
+    NestedField,
+    StringField,
+    StructSchema,
+)
+
+logging.getLogger("strider.schema").setLevel(logging.ERROR)
+
+
+# =============================================================================
+# Previous implementation (reference for comparison)
+# =============================================================================
+
+def legacy_from_dict_safe(cls, data):
+    result = {}
+    extra_data = {}
+    normalized = {}
+    for key, value in data.items():
+        if key in cls._fields:
+            normalized[key] = value
+        elif key in cls._alias_map:
+            normalized[cls._alias_map[key]] = value
+        else:
+            extra_data[key] = value
+    for name, field in cls._fields.items():
+        if name in normalized:
+            try:
+                result[name] = field.coerce(normalized[name])
+            except (ValueError, TypeError):
+                result[name] = field.get_default()
+        else:
+            result[name] = field.get_default()
+    instance = cls.__new__(cls)
+    for name, value in result.items():
+        object.__setattr__(instance, name, value)
+    object.__setattr__(instance, "_extra_data", extra_data)
+    return instance
+
+
+def legacy_from_dict_fast(cls, data):
+    result = {}
+    extra_data = data
+    for key, value in data.items():
+        if key in cls._fields:
+            field = cls._fields[key]
+            try:
+                result[key] = field.fast_coerce(value)
+            except (ValueError, TypeError):
+                result[key] = field.get_default()
+            extra_data = {k: v for k, v in extra_data.items() if k != key}
+        elif key in cls._alias_map:
+            actual_key = cls._alias_map[key]
+            field = cls._fields[actual_key]
+            try:
+                result[actual_key] = field.fast_coerce(value)
+            except (ValueError, TypeError):
+                result[actual_key] = field.get_default()
+            extra_data = {k: v for k, v in extra_data.items() if k != key}
+    for name, field in cls._fields.items():
+        if name not in result:
+            result[name] = field.get_default()
+    instance = cls.__new__(cls)
+    for name, value in result.items():
+        object.__setattr__(instance, name, value)
+    object.__setattr__(instance, "_extra_data", extra_data)
+    return instance
+
+
+def legacy_to_dict(instance):
+    result = {}
+    for name, field in instance._fields.items():
+        value = getattr(instance, name, field.get_default())
+        result[name] = field.serialize(value)
+    result.update(instance._extra_data)
+    return result
+
+
+# =============================================================================
+# Schemas
+# =============================================================================
+
+def make_wide(width: int = 200) -> tuple[type[StructSchema], dict]:
+    kinds = (
+        (lambda: StringField(default=""), lambda i: f"value-{i}"),
+        (lambda: IntegerField(default=0), lambda i: i),
+        (lambda: FloatField(default=0.0), lambda i: i / 3),
+        (lambda: BooleanField(default=False), lambda i: bool(i % 2)),
+    )
+    namespace, data = {}, {}
+    for i in range(width):
+        make_field, make_value = kinds[i % len(kinds)]
+        namespace[f"f{i}"] = make_field()
+        data[f"f{i}"] = make_value(i)
+    for i in range(width // 4):
+        data[f"unknown_{i}"] = i
+    return type("Wide", (StructSchema,), namespace), data
+
+
+def make_nested(depth: int = 6, width: int = 10) -> tuple[type[StructSchema], dict]:
+    schema, data = None, None
+    for level in range(depth):
+        namespace = {f"s{i}": StringField(default="") for i in range(width)}
+        level_data = {f"s{i}": f"{level}-{i}" for i in range(width)}
+        namespace["items"] = ListField(IntegerField(), max_size=100)
+        level_data["items"] = list(range(20))
+        if schema is not None:
+            namespace["child"] = NestedField(schema)
+            level_data["child"] = data
+        schema = type(f"Level{level}", (StructSchema,), namespace)
+        data = level_data
+    return schema, data
+
+
+class Notifications(StructSchema):
+    email = BooleanField(default=True)
+    push = BooleanField(default=True)
+    digest = StringField(default="daily", aliases=["frequency"])
+
+
+class Preferences(StructSchema):
+    theme = StringField(default="system", choices=["light", "dark", "system"])
+    language = StringField(default="pt-BR", aliases=["lang"])
+    timezone = StringField(default="UTC", aliases=["tz"])
+    page_size = IntegerField(default=25)
+    notifications = NestedField(Notifications)
+
+
+PREFS_DATA = {
+    "theme": "dark",
+    "lang": "en",
+    "tz": "America/Sao_Paulo",
+    "page_size": "50",
+    "notifications": {"email": 1, "frequency": "weekly"},
+    "legacy_flag": True,
+}
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+@contextmanager
+def legacy_codecs():
+    """Swap the previous implementation in (nested schemas included)."""
+    saved = {name: StructSchema.__dict__[name] for name in ("from_dict_safe", "from_dict_fast", "to_dict")}
+    StructSchema.from_dict_safe = classmethod(legacy_from_dict_safe)
+    StructSchema.from_dict_fast = classmethod(legacy_from_dict_fast)
+    StructSchema.to_dict = legacy_to_dict
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(StructSchema, name, value)
+
+
+def measure(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def bench(label: str, cls: type[StructSchema], data: dict, number: int) -> None:
+    instance = cls.from_dict_safe(data)
+    compiled = {
+        "from_dict_safe": measure(lambda: cls.from_dict_safe(data), number),
+        "from_dict_fast": measure(lambda: cls.from_dict_fast(data), number),
+        "to_dict": measure(instance.to_dict, number),
+    }
+    with legacy_codecs():
+        assert cls.from_dict_safe(data).to_dict() == instance.to_dict()
+        legacy = {
+            "from_dict_safe": measure(lambda: cls.from_dict_safe(data), number),
+            "from_dict_fast": measure(lambda: cls.from_dict_fast(data), number),
+            "to_dict": measure(instance.to_dict, number),
+        }
+
+    print(f"\n{label}")
+    print(f"  {'operation':<16}{'legacy µs':>12}{'compiled µs':>14}{'speedup':>10}")
+    for name, new in compiled.items():
+        old = legacy[name]
+        print(f"  {name:<16}{old:>12.2f}{new:>14.2f}{old / new:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000, help="calls per measurement")
+    args = parser.parse_args()
+
+    wide, wide_data = make_wide()
+    nested, nested_data = make_nested()
+    bench("wide (200 fields + 50 unknown keys)", wide, wide_data, max(args.number // 10, 1))
+    bench("nested (6 levels x 10 fields)", nested, nested_data, max(args.number // 10, 1))
+    bench("prefs (aliases + nested)", Preferences, PREFS_DATA, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Micro-benchmark: WebSocket codecs (JSON, msgpack, CBOR, +deflate) for a
+telemetry broadcast, per-recipient encoding vs. Channel once-per-broadcast.
+
+Run from the repository root:
+
+    python benchmarks/bench_ws_codecs.py [--number N] [--recipients R]
+
+Codecs whose library is not installed (``pip install strider[realtime]``)
+are reported and skipped.
+
+Columns:
+- bytes:     frame size on the wire (before transport-level compression)
+- enc/s:     frames encoded per second
+- dec/s:     frames decoded per second
+- per-conn:  broadcasts/s when every recipient encodes its own frame
+- channel:   broadcasts/s through Channel(codec=...), one encode per broadcast
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from strider.realtime import Channel, codec_available, get_codec  # noqa: E402
+
+
+CODECS = ["json", "msgpack", "cbor", "json+deflate", "msgpack+deflate", "cbor+deflate"]
+
+
+def make_tick(n: int = 0) -> dict:
+    """A realistic market/telemetry push: a few scalars and a small depth book."""
+    return {
+        "type": "tick",
+        "symbol": "R_100",
+        "seq": 1_000_000 + n,
+        "ts": 1_760_000_000.123 + n,
+        "bid": 1234.5678,
+        "ask": 1234.6012,
+        "volume": 18234,
+        "depth": [[1234.50 - i * 0.01, 100 + i * 7] for i in range(10)],
+        "flags": {"halted": False, "auction": False},
+    }
+
+
+def measure(fn, number: int) -> float:
+    """Best-of-5 calls per second."""
+    return number / min(timeit.repeat(fn, number=number, repeat=5))
+
+
+def bench_channel(name: str, message: dict, recipients: int, number: int) -> float:
+    async def run() -> float:
+        channel = Channel(maxlen=1)
+        for _ in range(recipients):
+            await channel.subscribe_queue(codec=name)
+        loop = asyncio.get_running_loop()
+        best = float("inf")
+        for _ in range(5):
+            start = loop.time()
+            for _ in range(number):
+                await channel.publish(message)
+            best = min(best, loop.time() - start)
+        return number / best
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=5000, help="frames per measurement")
+    parser.add_argument("--recipients", type=int, default=100, help="subscribers per broadcast")
+    args = parser.parse_args()
+
+    message = make_tick()
+    broadcasts = max(args.number // args.recipients, 1)
+
+    print(f"\ntick broadcast to {args.recipients} recipients")
+    print(f"  {'codec':<18}{'bytes':>7}{'enc/s':>12}{'dec/s':>12}{'per-conn':>11}{'channel':>11}")
+    for name in CODECS:
+        if not codec_available(name):
+            print(f"  {name:<18}   (not installed)")
+            continue
+        codec = get_codec(name)
+        frame = codec.encode(message)
+        assert codec.decode(frame)["seq"] == message["seq"]
+
+        def per_connection() -> None:
+            for _ in range(args.recipients):
+                codec.encode(message)
+
+        print(
+            f"  {name:<18}{len(frame):>7}"
+            f"{measure(lambda: codec.encode(message), args.number):>12,.0f}"
+            f"{measure(lambda: codec.decode(frame), args.number):>12,.0f}"
+            f"{measure(per_connection, broadcasts):>11,.0f}"
+            f"{bench_channel(name, message, args.recipients, broadcasts):>11,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
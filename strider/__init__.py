@@ -23,316 +23,677 @@ With explicit model and view:
     # urlpatterns = [path("items", ItemViewSet)]
 """
 
-from strider.models import Model, Field, SoftDeleteMixin, SoftDeleteManager, TenantSoftDeleteManager
-from strider.serializers import (
-    InputSchema,
-    OutputSchema,
-    Serializer,
-    PaginatedResponse,
-    ErrorResponse,
-    SuccessResponse,
-    DeleteResponse,
-    ValidationErrorResponse,
-    NotFoundResponse,
-    ConflictResponse,
-)
-from strider.views import (
-    APIView,
-    ViewSet,
-    ModelViewSet,
-    ReadOnlyModelViewSet,
-    CreateModelViewSet,
-    ListModelViewSet,
-    ListCreateModelViewSet,
-    RetrieveUpdateModelViewSet,
-    RetrieveDestroyModelViewSet,
-    RetrieveUpdateDestroyModelViewSet,
-    SearchModelViewSet,
-    BulkModelViewSet,
-    action,
-)
-from strider.routing import Router, AutoRouter
-from strider.urls import path, include, URLPattern, URLInclude
-from strider.realtime import WebSocketView, SSEView, Channel, sse_response
-from strider.permissions import Permission, IsAuthenticated, AllowAny, IsAdmin, IsOwner, HasRole
-from strider.dependencies import Depends, get_db, get_current_user, set_session_factory
-from strider.config import (
-    Settings, 
-    get_settings, 
-    configure, 
-    apply_settings,
-    is_configured, 
-    reset_settings,
-    auto_configure_auth,
-    is_auth_configured,
-)
-from strider.app import StrideApp, get_application
-
-# Validation
-from strider.validation import (
-    SchemaModelValidator,
-    SchemaModelMismatchError,
-    ValidationWarning,
-    validate_schema,
-    validate_all_viewsets,
-)
-
-# Advanced Fields (UUID7, JSON, FileField, etc.)
-from strider.fields import (
-    uuid7,
-    uuid7_str,
-    AdaptiveJSON,
-    AdvancedField,
-    FileField,
-    FieldFile,
-)
-
-# Multi-Tenancy
-from strider.tenancy import (
-    set_tenant,
-    get_tenant,
-    require_tenant,
-    clear_tenant,
-    TenantMixin,
-    FlexibleTenantMixin,
-    TenantMiddleware,
-    tenant_context,
-    get_tenant_dependency,
-)
-
-# Database Replicas
-from strider.database import (
-    DatabaseSession,
-    init_db,
-    init_replicas,
-    close_replicas,
-    get_db_replicas,
-    get_write_db,
-    get_read_db,
-    DBSession,
-    WriteSession,
-    ReadSession,
-)
-
-# Advanced QuerySets
-from strider.querysets import (
-    SoftDeleteQuerySet,
-    TenantQuerySet,
-    TenantSoftDeleteQuerySet,
-)
-
-# DateTime - SEMPRE use timezone.now() em vez de datetime.now()
-from strider.datetime import (
-    # Classe principal - USE ESTA
-    timezone,
-    # Classes de tipo
-    DateTime,
-    Date,
-    Time,
-    TimeDelta,
-    UTC,
-    # Configuração
-    configure_datetime,
-    get_datetime_config,
-    get_timezone,
-)
-
-# Middleware - Sistema Django-style
-from strider.middleware import (
-    ASGIMiddleware,
-    BaseMiddleware,
-    configure_middleware,
-    register_middleware,
-    apply_middlewares,
-    get_middleware_stack_info,
-    print_middleware_stack,
-    # Pre-built middlewares (Pure ASGI)
-    TimingMiddleware,
-    RequestIDMiddleware,
-    LoggingMiddleware,
-    MaintenanceModeMiddleware,
-    SecurityHeadersMiddleware,
-)
-
-# Auth - ViewSet
-from strider.auth.views import AuthViewSet
-
-# Auth - Sistema plugável de autenticação
-from strider.auth import (
-    # Config
-    AuthConfig,
-    configure_auth,
-    get_auth_config,
-    # Interfaces (para criar backends customizados)
-    AuthBackend,
-    PasswordHasher,
-    TokenBackend,
-    PermissionBackend,
-    # Registry
-    register_auth_backend,
-    register_password_hasher,
-    register_token_backend,
-    register_permission_backend,
-    get_auth_backend,
-    get_password_hasher,
-    get_token_backend,
-    get_permission_backend,
-    # Hashers
-    PBKDF2Hasher,
-    Argon2Hasher,
-    BCryptHasher,
-    ScryptHasher,
-    # Tokens
-    JWTBackend,
-    create_access_token,
-    create_refresh_token,
-    decode_token,
-    verify_token,
-    # Backends
-    ModelBackend,
-    TokenAuthBackend,
-    # Permission Backends
-    DefaultPermissionBackend,
-    ObjectPermissionBackend,
-    # Models
-    AbstractUser,
-    AbstractUUIDUser,
-    Group,
-    Permission as AuthPermission,
-    PermissionsMixin,
-    get_user_model,
-    # Decorators
-    HasPermission,
-    IsInGroup,
-    require_permission,
-    require_group,
-    require_superuser,
-    require_staff,
-    require_active,
-    login_required,
-    # Middleware
-    AuthenticationMiddleware,
-    OptionalAuthenticationMiddleware,
-)
-
-# Migrations
-from strider.migrations import (
-    makemigrations,
-    migrate,
-    showmigrations,
-    rollback,
-    MigrationEngine,
-    Migration,
-)
-
-# Validators
-from strider.validators import (
-    ValidationError,
-    UniqueValidationError,
-    MultipleValidationErrors,
-    UniqueValidator,
-    UniqueTogetherValidator,
-    ExistsValidator,
-    RegexValidator,
-    EmailValidator,
-    URLValidator,
-    SlugValidator,
-    PhoneValidator,
-    CPFValidator,
-    CNPJValidator,
-    MinLengthValidator,
-    MaxLengthValidator,
-    MinValueValidator,
-    MaxValueValidator,
-    RangeValidator,
-    PasswordValidator,
-    ChoiceValidator,
-    FileExtensionValidator,
-    FileSizeValidator,
-)
-
-# Relations - Django-like relationship helpers
-from strider.relations import (
-    Rel,
-    AssociationTable,
-)
-
-# Choices - Django-style enums with value and label
-from strider.choices import (
-    Choices,
-    TextChoices,
-    IntegerChoices,
-    # Common choices
-    ThemeOptions,
-    CommonStatus,
-    PublishStatus,
-    OrderStatus,
-    PaymentStatus,
-    TaskPriority,
-    Weekday,
-    Month,
-    Gender,
-    Visibility,
-)
-
-# Storage - File storage (local or GCS with signed URLs)
-from strider.storage import (
-    save_file,
-    delete_file,
-    get_file_url,
-    file_exists,
-    get_storage_file_fields,
-    collect_file_paths,
-    StorageFile,
-    storage_file_property,
-)
-
-# Exceptions - Centralized exception classes
-from strider.exceptions import (
-    # Base
-    StrideException,
-    CoreException,
-    # Validation
-    ValidationException,
-    FieldValidationError,
-    UniqueConstraintError,
-    # Database
-    DatabaseException,
-    DoesNotExist,
-    MultipleObjectsReturned,
-    IntegrityError,
-    # Auth
-    AuthException,
-    AuthenticationFailed,
-    InvalidCredentials,
-    InvalidToken,
-    TokenExpired,
-    PermissionDenied,
-    UserInactive,
-    UserNotFound,
-    # HTTP
-    BadRequest,
-    Unauthorized,
-    Forbidden,
-    NotFound,
-    MethodNotAllowed,
-    Conflict,
-    UnprocessableEntity,
-    TooManyRequests,
-    InternalServerError,
-    ServiceUnavailable,
-    # Business
-    BusinessException,
-    ResourceLocked,
-    PreconditionFailed,
-    OperationNotAllowed,
-    QuotaExceeded,
-    # Configuration
-    ConfigurationError,
-    MissingDependency,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.17.95"
+
+if TYPE_CHECKING:
+    from strider.models import Model, Field, SoftDeleteMixin, SoftDeleteManager, TenantSoftDeleteManager
+    from strider.serializers import (
+        InputSchema,
+        OutputSchema,
+        Serializer,
+        PaginatedResponse,
+        BatchResponse,
+        ErrorResponse,
+        SuccessResponse,
+        DeleteResponse,
+        ValidationErrorResponse,
+        NotFoundResponse,
+        ConflictResponse,
+    )
+    from strider.views import (
+        APIView,
+        ViewSet,
+        ModelViewSet,
+        ReadOnlyModelViewSet,
+        CreateModelViewSet,
+        ListModelViewSet,
+        ListCreateModelViewSet,
+        RetrieveUpdateModelViewSet,
+        RetrieveDestroyModelViewSet,
+        RetrieveUpdateDestroyModelViewSet,
+        SearchModelViewSet,
+        BulkModelViewSet,
+        action,
+    )
+    from strider.routing import Router, AutoRouter
+    from strider.urls import path, include, URLPattern, URLInclude
+    from strider.realtime import (
+        WebSocketView,
+        SSEView,
+        Channel,
+        sse_response,
+        get_backplane,
+        configure_backplane,
+        register_codec,
+    )
+    from strider.permissions import Permission, IsAuthenticated, AllowAny, IsAdmin, IsOwner, HasRole
+    from strider.dependencies import Depends, get_db, get_current_user, set_session_factory
+    from strider.config import (
+        Settings, 
+        get_settings, 
+        configure, 
+        apply_settings,
+        is_configured, 
+        reset_settings,
+        auto_configure_auth,
+        is_auth_configured,
+    )
+    from strider.app import StrideApp, get_application
+
+    # Validation
+    from strider.validation import (
+        SchemaModelValidator,
+        SchemaModelMismatchError,
+        ValidationWarning,
+        validate_schema,
+        validate_all_viewsets,
+    )
+
+    # Advanced Fields (UUID7, JSON, FileField, etc.)
+    from strider.fields import (
+        uuid7,
+        uuid7_str,
+        AdaptiveJSON,
+        AdvancedField,
+        FileField,
+        FieldFile,
+    )
+
+    # Multi-Tenancy
+    from strider.tenancy import (
+        set_tenant,
+        get_tenant,
+        require_tenant,
+        clear_tenant,
+        TenantMixin,
+        FlexibleTenantMixin,
+        TenantMiddleware,
+        tenant_context,
+        get_tenant_dependency,
+    )
+
+    # Database Replicas
+    from strider.database import (
+        DatabaseSession,
+        init_db,
+        init_replicas,
+        close_replicas,
+        get_db_replicas,
+        get_write_db,
+        get_read_db,
+        DBSession,
+        WriteSession,
+        ReadSession,
+    )
+
+    # Advanced QuerySets
+    from strider.querysets import (
+        SoftDeleteQuerySet,
+        TenantQuerySet,
+        TenantSoftDeleteQuerySet,
+        LoadProfile,
+        strict_loading,
+    )
+
+    # Cache
+    from strider.cache import get_cache, configure_cache, cache_response, invalidate_model
+
+    # DataLoader
+    from strider.dataloader import DataLoader, Loaders
+    from strider.dependencies import get_loaders, RequestLoaders
+
+    # DateTime - SEMPRE use timezone.now() em vez de datetime.now()
+    from strider.datetime import (
+        # Classe principal - USE ESTA
+        timezone,
+        # Classes de tipo
+        DateTime,
+        Date,
+        Time,
+        TimeDelta,
+        UTC,
+        # Configuração
+        configure_datetime,
+        get_datetime_config,
+        get_timezone,
+    )
+
+    # Middleware - Sistema Django-style
+    from strider.middleware import (
+        ASGIMiddleware,
+        BaseMiddleware,
+        configure_middleware,
+        register_middleware,
+        apply_middlewares,
+        get_middleware_stack_info,
+        print_middleware_stack,
+        # Pre-built middlewares (Pure ASGI)
+        TimingMiddleware,
+        RequestIDMiddleware,
+        LoggingMiddleware,
+        MaintenanceModeMiddleware,
+        SecurityHeadersMiddleware,
+    )
+
+    # Auth - ViewSet
+    from strider.auth.views import AuthViewSet
+
+    # Auth - Sistema plugável de autenticação
+    from strider.auth import (
+        # Config
+        AuthConfig,
+        configure_auth,
+        get_auth_config,
+        # Interfaces (para criar backends customizados)
+        AuthBackend,
+        PasswordHasher,
+        TokenBackend,
+        PermissionBackend,
+        # Registry
+        register_auth_backend,
+        register_password_hasher,
+        register_token_backend,
+        register_permission_backend,
+        get_auth_backend,
+        get_password_hasher,
+        get_token_backend,
+        get_permission_backend,
+        # Hashers
+        PBKDF2Hasher,
+        Argon2Hasher,
+        BCryptHasher,
+        ScryptHasher,
+        # Tokens
+        JWTBackend,
+        create_access_token,
+        create_refresh_token,
+        decode_token,
+        verify_token,
+        # Backends
+        ModelBackend,
+        TokenAuthBackend,
+        # Permission Backends
+        DefaultPermissionBackend,
+        ObjectPermissionBackend,
+        # Models
+        AbstractUser,
+        AbstractUUIDUser,
+        Group,
+        Permission as AuthPermission,
+        PermissionsMixin,
+        get_user_model,
+        # Decorators
+        HasPermission,
+        IsInGroup,
+        require_permission,
+        require_group,
+        require_superuser,
+        require_staff,
+        require_active,
+        login_required,
+        # Middleware
+        AuthenticationMiddleware,
+        OptionalAuthenticationMiddleware,
+    )
+
+    # Migrations
+    from strider.migrations import (
+        makemigrations,
+        migrate,
+        showmigrations,
+        rollback,
+        MigrationEngine,
+        Migration,
+    )
+
+    # Validators
+    from strider.validators import (
+        ValidationError,
+        UniqueValidationError,
+        MultipleValidationErrors,
+        UniqueValidator,
+        UniqueTogetherValidator,
+        ExistsValidator,
+        RegexValidator,
+        EmailValidator,
+        URLValidator,
+        SlugValidator,
+        PhoneValidator,
+        CPFValidator,
+        CNPJValidator,
+        MinLengthValidator,
+        MaxLengthValidator,
+        MinValueValidator,
+        MaxValueValidator,
+        RangeValidator,
+        PasswordValidator,
+        ChoiceValidator,
+        FileExtensionValidator,
+        FileSizeValidator,
+    )
+
+    # Relations - Django-like relationship helpers
+    from strider.relations import (
+        Rel,
+        AssociationTable,
+    )
+
+    # Choices - Django-style enums with value and label
+    from strider.choices import (
+        Choices,
+        TextChoices,
+        IntegerChoices,
+        # Common choices
+        ThemeOptions,
+        CommonStatus,
+        PublishStatus,
+        OrderStatus,
+        PaymentStatus,
+        TaskPriority,
+        Weekday,
+        Month,
+        Gender,
+        Visibility,
+    )
+
+    # Storage - File storage (local or GCS with signed URLs)
+    from strider.storage import (
+        save_file,
+        delete_file,
+        get_file_url,
+        file_exists,
+        get_storage_file_fields,
+        collect_file_paths,
+        StorageFile,
+        storage_file_property,
+    )
+
+    # Exceptions - Centralized exception classes
+    from strider.exceptions import (
+        # Base
+        StrideException,
+        CoreException,
+        # Validation
+        ValidationException,
+        FieldValidationError,
+        UniqueConstraintError,
+        # Database
+        DatabaseException,
+        DoesNotExist,
+        MultipleObjectsReturned,
+        IntegrityError,
+        # Auth
+        AuthException,
+        AuthenticationFailed,
+        InvalidCredentials,
+        InvalidToken,
+        TokenExpired,
+        PermissionDenied,
+        UserInactive,
+        UserNotFound,
+        # HTTP
+        BadRequest,
+        Unauthorized,
+        Forbidden,
+        NotFound,
+        MethodNotAllowed,
+        Conflict,
+        UnprocessableEntity,
+        TooManyRequests,
+        InternalServerError,
+        ServiceUnavailable,
+        # Business
+        BusinessException,
+        ResourceLocked,
+        PreconditionFailed,
+        OperationNotAllowed,
+        QuotaExceeded,
+        # Configuration
+        ConfigurationError,
+        MissingDependency,
+    )
+
+    # Messaging (Enterprise)
+    from strider.messaging.decorators import event, consumer, on_event, publish_event
+
+    # Tasks (Enterprise)
+    from strider.tasks.decorators import task, periodic_task
+
+
+# =============================================================================
+# Lazy exports (PEP 562)
+#
+# Nothing below is imported until first attribute access, so `import strider`
+# (and every `strider.<submodule>` import, which runs this file first) does
+# not pay for FastAPI, SQLAlchemy, Jinja or pydantic schema construction.
+# Values: "module" or "module:attr" when the public name is an alias.
+# =============================================================================
+
+_LAZY_EXPORTS: dict[str, str] = {
+    # strider.models
+    "Model": "strider.models",
+    "Field": "strider.models",
+    "SoftDeleteMixin": "strider.models",
+    "SoftDeleteManager": "strider.models",
+    "TenantSoftDeleteManager": "strider.models",
+
+    # strider.serializers
+    "InputSchema": "strider.serializers",
+    "OutputSchema": "strider.serializers",
+    "Serializer": "strider.serializers",
+    "PaginatedResponse": "strider.serializers",
+    "BatchResponse": "strider.serializers",
+    "ErrorResponse": "strider.serializers",
+    "SuccessResponse": "strider.serializers",
+    "DeleteResponse": "strider.serializers",
+    "ValidationErrorResponse": "strider.serializers",
+    "NotFoundResponse": "strider.serializers",
+    "ConflictResponse": "strider.serializers",
+
+    # strider.views
+    "APIView": "strider.views",
+    "ViewSet": "strider.views",
+    "ModelViewSet": "strider.views",
+    "ReadOnlyModelViewSet": "strider.views",
+    "CreateModelViewSet": "strider.views",
+    "ListModelViewSet": "strider.views",
+    "ListCreateModelViewSet": "strider.views",
+    "RetrieveUpdateModelViewSet": "strider.views",
+    "RetrieveDestroyModelViewSet": "strider.views",
+    "RetrieveUpdateDestroyModelViewSet": "strider.views",
+    "SearchModelViewSet": "strider.views",
+    "BulkModelViewSet": "strider.views",
+    "action": "strider.views",
+
+    # strider.routing
+    "Router": "strider.routing",
+    "AutoRouter": "strider.routing",
+
+    # strider.urls
+    "path": "strider.urls",
+    "include": "strider.urls",
+    "URLPattern": "strider.urls",
+    "URLInclude": "strider.urls",
+
+    # strider.realtime
+    "WebSocketView": "strider.realtime",
+    "SSEView": "strider.realtime",
+    "Channel": "strider.realtime",
+    "sse_response": "strider.realtime",
+    "get_backplane": "strider.realtime",
+    "configure_backplane": "strider.realtime",
+    "register_codec": "strider.realtime",
+
+    # strider.permissions
+    "Permission": "strider.permissions",
+    "IsAuthenticated": "strider.permissions",
+    "AllowAny": "strider.permissions",
+    "IsAdmin": "strider.permissions",
+    "IsOwner": "strider.permissions",
+    "HasRole": "strider.permissions",
+
+    # strider.dependencies
+    "Depends": "strider.dependencies",
+    "get_db": "strider.dependencies",
+    "get_current_user": "strider.dependencies",
+    "set_session_factory": "strider.dependencies",
+
+    # strider.config
+    "Settings": "strider.config",
+    "get_settings": "strider.config",
+    "configure": "strider.config",
+    "apply_settings": "strider.config",
+    "is_configured": "strider.config",
+    "reset_settings": "strider.config",
+    "auto_configure_auth": "strider.config",
+    "is_auth_configured": "strider.config",
+
+    # strider.app
+    "StrideApp": "strider.app",
+    "get_application": "strider.app",
+
+    # Validation
+    "SchemaModelValidator": "strider.validation",
+    "SchemaModelMismatchError": "strider.validation",
+    "ValidationWarning": "strider.validation",
+    "validate_schema": "strider.validation",
+    "validate_all_viewsets": "strider.validation",
+
+    # Advanced Fields (UUID7, JSON, FileField, etc.)
+    "uuid7": "strider.fields",
+    "uuid7_str": "strider.fields",
+    "AdaptiveJSON": "strider.fields",
+    "AdvancedField": "strider.fields",
+    "FileField": "strider.fields",
+    "FieldFile": "strider.fields",
+
+    # Multi-Tenancy
+    "set_tenant": "strider.tenancy",
+    "get_tenant": "strider.tenancy",
+    "require_tenant": "strider.tenancy",
+    "clear_tenant": "strider.tenancy",
+    "TenantMixin": "strider.tenancy",
+    "FlexibleTenantMixin": "strider.tenancy",
+    "TenantMiddleware": "strider.tenancy",
+    "tenant_context": "strider.tenancy",
+    "get_tenant_dependency": "strider.tenancy",
+
+    # Database Replicas
+    "DatabaseSession": "strider.database",
+    "init_db": "strider.database",
+    "init_replicas": "strider.database",
+    "close_replicas": "strider.database",
+    "get_db_replicas": "strider.database",
+    "get_write_db": "strider.database",
+    "get_read_db": "strider.database",
+    "DBSession": "strider.database",
+    "WriteSession": "strider.database",
+    "ReadSession": "strider.database",
+
+    # Advanced QuerySets
+    "SoftDeleteQuerySet": "strider.querysets",
+    "TenantQuerySet": "strider.querysets",
+    "TenantSoftDeleteQuerySet": "strider.querysets",
+    "LoadProfile": "strider.querysets",
+    "strict_loading": "strider.querysets",
+
+    # Cache
+    "get_cache": "strider.cache",
+    "configure_cache": "strider.cache",
+    "cache_response": "strider.cache",
+    "invalidate_model": "strider.cache",
+
+    # DataLoader
+    "DataLoader": "strider.dataloader",
+    "Loaders": "strider.dataloader",
+    "get_loaders": "strider.dependencies",
+    "RequestLoaders": "strider.dependencies",
+
+    # DateTime - SEMPRE use timezone.now() em vez de datetime.now()
+    "timezone": "strider.datetime",
+    "DateTime": "strider.datetime",
+    "Date": "strider.datetime",
+    "Time": "strider.datetime",
+    "TimeDelta": "strider.datetime",
+    "UTC": "strider.datetime",
+    "configure_datetime": "strider.datetime",
+    "get_datetime_config": "strider.datetime",
+    "get_timezone": "strider.datetime",
+
+    # Middleware - Sistema Django-style
+    "ASGIMiddleware": "strider.middleware",
+    "BaseMiddleware": "strider.middleware",
+    "configure_middleware": "strider.middleware",
+    "register_middleware": "strider.middleware",
+    "apply_middlewares": "strider.middleware",
+    "get_middleware_stack_info": "strider.middleware",
+    "print_middleware_stack": "strider.middleware",
+    "TimingMiddleware": "strider.middleware",
+    "RequestIDMiddleware": "strider.middleware",
+    "LoggingMiddleware": "strider.middleware",
+    "MaintenanceModeMiddleware": "strider.middleware",
+    "SecurityHeadersMiddleware": "strider.middleware",
+
+    # Auth - ViewSet
+    "AuthViewSet": "strider.auth.views",
+
+    # Auth - Sistema plugável de autenticação
+    "AuthConfig": "strider.auth",
+    "configure_auth": "strider.auth",
+    "get_auth_config": "strider.auth",
+    "AuthBackend": "strider.auth",
+    "PasswordHasher": "strider.auth",
+    "TokenBackend": "strider.auth",
+    "PermissionBackend": "strider.auth",
+    "register_auth_backend": "strider.auth",
+    "register_password_hasher": "strider.auth",
+    "register_token_backend": "strider.auth",
+    "register_permission_backend": "strider.auth",
+    "get_auth_backend": "strider.auth",
+    "get_password_hasher": "strider.auth",
+    "get_token_backend": "strider.auth",
+    "get_permission_backend": "strider.auth",
+    "PBKDF2Hasher": "strider.auth",
+    "Argon2Hasher": "strider.auth",
+    "BCryptHasher": "strider.auth",
+    "ScryptHasher": "strider.auth",
+    "JWTBackend": "strider.auth",
+    "create_access_token": "strider.auth",
+    "create_refresh_token": "strider.auth",
+    "decode_token": "strider.auth",
+    "verify_token": "strider.auth",
+    "ModelBackend": "strider.auth",
+    "TokenAuthBackend": "strider.auth",
+    "DefaultPermissionBackend": "strider.auth",
+    "ObjectPermissionBackend": "strider.auth",
+    "AbstractUser": "strider.auth",
+    "AbstractUUIDUser": "strider.auth",
+    "Group": "strider.auth",
+    "AuthPermission": "strider.auth:Permission",
+    "PermissionsMixin": "strider.auth",
+    "get_user_model": "strider.auth",
+    "HasPermission": "strider.auth",
+    "IsInGroup": "strider.auth",
+    "require_permission": "strider.auth",
+    "require_group": "strider.auth",
+    "require_superuser": "strider.auth",
+    "require_staff": "strider.auth",
+    "require_active": "strider.auth",
+    "login_required": "strider.auth",
+    "AuthenticationMiddleware": "strider.auth",
+    "OptionalAuthenticationMiddleware": "strider.auth",
+
+    # Migrations
+    "makemigrations": "strider.migrations",
+    "migrate": "strider.migrations",
+    "showmigrations": "strider.migrations",
+    "rollback": "strider.migrations",
+    "MigrationEngine": "strider.migrations",
+    "Migration": "strider.migrations",
+
+    # Validators
+    "ValidationError": "strider.validators",
+    "UniqueValidationError": "strider.validators",
+    "MultipleValidationErrors": "strider.validators",
+    "UniqueValidator": "strider.validators",
+    "UniqueTogetherValidator": "strider.validators",
+    "ExistsValidator": "strider.validators",
+    "RegexValidator": "strider.validators",
+    "EmailValidator": "strider.validators",
+    "URLValidator": "strider.validators",
+    "SlugValidator": "strider.validators",
+    "PhoneValidator": "strider.validators",
+    "CPFValidator": "strider.validators",
+    "CNPJValidator": "strider.validators",
+    "MinLengthValidator": "strider.validators",
+    "MaxLengthValidator": "strider.validators",
+    "MinValueValidator": "strider.validators",
+    "MaxValueValidator": "strider.validators",
+    "RangeValidator": "strider.validators",
+    "PasswordValidator": "strider.validators",
+    "ChoiceValidator": "strider.validators",
+    "FileExtensionValidator": "strider.validators",
+    "FileSizeValidator": "strider.validators",
+
+    # Relations - Django-like relationship helpers
+    "Rel": "strider.relations",
+    "AssociationTable": "strider.relations",
+
+    # Choices - Django-style enums with value and label
+    "Choices": "strider.choices",
+    "TextChoices": "strider.choices",
+    "IntegerChoices": "strider.choices",
+    "ThemeOptions": "strider.choices",
+    "CommonStatus": "strider.choices",
+    "PublishStatus": "strider.choices",
+    "OrderStatus": "strider.choices",
+    "PaymentStatus": "strider.choices",
+    "TaskPriority": "strider.choices",
+    "Weekday": "strider.choices",
+    "Month": "strider.choices",
+    "Gender": "strider.choices",
+    "Visibility": "strider.choices",
+
+    # Storage - File storage (local or GCS with signed URLs)
+    "save_file": "strider.storage",
+    "delete_file": "strider.storage",
+    "get_file_url": "strider.storage",
+    "file_exists": "strider.storage",
+    "get_storage_file_fields": "strider.storage",
+    "collect_file_paths": "strider.storage",
+    "StorageFile": "strider.storage",
+    "storage_file_property": "strider.storage",
+
+    # Exceptions - Centralized exception classes
+    "StrideException": "strider.exceptions",
+    "CoreException": "strider.exceptions",
+    "ValidationException": "strider.exceptions",
+    "FieldValidationError": "strider.exceptions",
+    "UniqueConstraintError": "strider.exceptions",
+    "DatabaseException": "strider.exceptions",
+    "DoesNotExist": "strider.exceptions",
+    "MultipleObjectsReturned": "strider.exceptions",
+    "IntegrityError": "strider.exceptions",
+    "AuthException": "strider.exceptions",
+    "AuthenticationFailed": "strider.exceptions",
+    "InvalidCredentials": "strider.exceptions",
+    "InvalidToken": "strider.exceptions",
+    "TokenExpired": "strider.exceptions",
+    "PermissionDenied": "strider.exceptions",
+    "UserInactive": "strider.exceptions",
+    "UserNotFound": "strider.exceptions",
+    "BadRequest": "strider.exceptions",
+    "Unauthorized": "strider.exceptions",
+    "Forbidden": "strider.exceptions",
+    "NotFound": "strider.exceptions",
+    "MethodNotAllowed": "strider.exceptions",
+    "Conflict": "strider.exceptions",
+    "UnprocessableEntity": "strider.exceptions",
+    "TooManyRequests": "strider.exceptions",
+    "InternalServerError": "strider.exceptions",
+    "ServiceUnavailable": "strider.exceptions",
+    "BusinessException": "strider.exceptions",
+    "ResourceLocked": "strider.exceptions",
+    "PreconditionFailed": "strider.exceptions",
+    "OperationNotAllowed": "strider.exceptions",
+    "QuotaExceeded": "strider.exceptions",
+    "ConfigurationError": "strider.exceptions",
+    "MissingDependency": "strider.exceptions",
+
+    # Messaging (Enterprise)
+    "event": "strider.messaging.decorators",
+    "consumer": "strider.messaging.decorators",
+    "on_event": "strider.messaging.decorators",
+    "publish_event": "strider.messaging.decorators",
+
+    # Tasks (Enterprise)
+    "task": "strider.tasks.decorators",
+    "periodic_task": "strider.tasks.decorators",
+}
+
 __all__ = [
     # Models
     "Model",
@@ -345,6 +706,7 @@ __all__ = [
     "OutputSchema",
     "Serializer",
     "PaginatedResponse",
+    "BatchResponse",
     "ErrorResponse",
     "SuccessResponse",
     "DeleteResponse",
@@ -437,6 +799,26 @@ __all__ = [
     "SoftDeleteQuerySet",
     "TenantQuerySet",
     "TenantSoftDeleteQuerySet",
+    "LoadProfile",
+    "strict_loading",
+    # Cache
+    "get_cache",
+    "configure_cache",
+    "cache_response",
+    "invalidate_model",
+    # DataLoader
+    "DataLoader",
+    "Loaders",
+    "get_loaders",
+    "RequestLoaders",
+    # Realtime
+    "WebSocketView",
+    "SSEView",
+    "Channel",
+    "sse_response",
+    "get_backplane",
+    "configure_backplane",
+    "register_codec",
     # DateTime
     "timezone",
     "DateTime",
@@ -610,20 +992,16 @@ __all__ = [
 ]
 
 
-# =============================================================================
-# Enterprise Features (Lazy imports to avoid requiring optional dependencies)
-# =============================================================================
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them in the module."""
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module 'strider' has no attribute '{name}'")
+    module_path, _, attr = target.partition(":")
+    value = getattr(import_module(module_path), attr or name)
+    globals()[name] = value
+    return value
 
-def __getattr__(name: str):
-    """Lazy import for enterprise features."""
-    # Messaging decorators
-    if name in ("event", "consumer", "on_event", "publish_event"):
-        from strider.messaging.decorators import event, consumer, on_event, publish_event
-        return locals()[name]
-    
-    # Task decorators
-    if name in ("task", "periodic_task"):
-        from strider.tasks.decorators import task, periodic_task
-        return locals()[name]
-    
-    raise AttributeError(f"module 'core' has no attribute '{name}'")
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
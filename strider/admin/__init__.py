@@ -26,48 +26,122 @@ Tipos para autocomplete:
     - IconType: Literal com ícones Lucide disponíveis
 """
 
-from strider.admin.site import AdminSite
-from strider.admin.options import ModelAdmin, InlineModelAdmin
-from strider.admin.exceptions import (
-    AdminConfigurationError,
-    AdminRegistrationError,
-    AdminRuntimeError,
-)
-from strider.admin.middleware import AdminSessionMiddleware
-from strider.admin.types import (
-    WidgetConfig,
-    FieldsetConfig,
-    FieldsetOptions,
-    IconType,
-    PermissionType,
-    WidgetType,
-    ColumnInfo,
-    ModelT,
-)
-from strider.admin._typing import (
-    model_fields,
-    get_model_field_names,
-)
-
-# ── Models internos do Admin — importados no module-level para garantir ──
-# que são registrados no Base.metadata e visíveis ao sistema de migrações.
-from strider.admin.models import (  # noqa: F401
-    AuditLog,
-    AdminSession,
-    TaskExecution,
-    PeriodicTaskSchedule,
-    WorkerHeartbeat,
-)
-
-# Singleton default — usado na maioria dos projetos
-default_site = AdminSite(name="default")
-
-# Proxy functions para conveniência
-register = default_site.register
-unregister = default_site.unregister
-
-# Alias para compatibilidade com pattern Django
-admin = default_site
+import threading
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from strider.admin.site import AdminSite
+    from strider.admin.options import ModelAdmin, InlineModelAdmin
+    from strider.admin.exceptions import (
+        AdminConfigurationError,
+        AdminRegistrationError,
+        AdminRuntimeError,
+    )
+    from strider.admin.middleware import AdminSessionMiddleware
+    from strider.admin.types import (
+        WidgetConfig,
+        FieldsetConfig,
+        FieldsetOptions,
+        IconType,
+        PermissionType,
+        WidgetType,
+        ColumnInfo,
+        ModelT,
+    )
+    from strider.admin._typing import (
+        model_fields,
+        get_model_field_names,
+    )
+    from strider.admin.models import (
+        AuditLog,
+        AdminSession,
+        TaskExecution,
+        PeriodicTaskSchedule,
+        SchedulerLease,
+        OutboxMessage,
+        ProcessedMessage,
+        WorkerHeartbeat,
+    )
+
+    default_site: AdminSite
+    admin: AdminSite
+
+
+# ── Lazy exports (PEP 562) ──
+# Importar strider.admin (ou qualquer submódulo) não carrega SQLAlchemy,
+# Starlette nem os models do admin até que um nome seja acessado.
+_LAZY_EXPORTS: dict[str, str] = {
+    "AdminSite": "strider.admin.site",
+    "ModelAdmin": "strider.admin.options",
+    "InlineModelAdmin": "strider.admin.options",
+    "AdminConfigurationError": "strider.admin.exceptions",
+    "AdminRegistrationError": "strider.admin.exceptions",
+    "AdminRuntimeError": "strider.admin.exceptions",
+    "AdminSessionMiddleware": "strider.admin.middleware",
+    "WidgetConfig": "strider.admin.types",
+    "FieldsetConfig": "strider.admin.types",
+    "FieldsetOptions": "strider.admin.types",
+    "IconType": "strider.admin.types",
+    "PermissionType": "strider.admin.types",
+    "WidgetType": "strider.admin.types",
+    "ColumnInfo": "strider.admin.types",
+    "ModelT": "strider.admin.types",
+    "model_fields": "strider.admin._typing",
+    "get_model_field_names": "strider.admin._typing",
+    "AuditLog": "strider.admin.models",
+    "AdminSession": "strider.admin.models",
+    "TaskExecution": "strider.admin.models",
+    "PeriodicTaskSchedule": "strider.admin.models",
+    "SchedulerLease": "strider.admin.models",
+    "OutboxMessage": "strider.admin.models",
+    "ProcessedMessage": "strider.admin.models",
+    "WorkerHeartbeat": "strider.admin.models",
+}
+
+# Nomes ligados ao singleton default_site
+_SITE_EXPORTS = ("default_site", "admin", "register", "unregister")
+_site_lock = threading.Lock()
+
+
+def _create_default_site() -> None:
+    """
+    Cria o singleton default — usado na maioria dos projetos.
+    
+    Os models internos do Admin são importados junto para garantir que
+    estejam registrados no Base.metadata e visíveis ao sistema de migrações
+    sempre que o site é usado.
+    """
+    import_module("strider.admin.models")
+    from strider.admin.site import AdminSite
+    
+    if "default_site" in globals():
+        return
+    site = AdminSite(name="default")
+    g = globals()
+    g["default_site"] = site
+    # Alias para compatibilidade com pattern Django
+    g["admin"] = site
+    # Proxy functions para conveniência
+    g["register"] = site.register
+    g["unregister"] = site.unregister
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SITE_EXPORTS:
+        with _site_lock:
+            _create_default_site()
+        return globals()[name]
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module 'strider.admin' has no attribute '{name}'")
+    value = getattr(import_module(target), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(_SITE_EXPORTS))
 
 
 def action(
@@ -128,5 +202,8 @@ __all__ = [
     "AdminSession",
     "TaskExecution",
     "PeriodicTaskSchedule",
+    "SchedulerLease",
+    "OutboxMessage",
+    "ProcessedMessage",
     "WorkerHeartbeat",
 ]
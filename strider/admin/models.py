@@ -216,6 +216,70 @@ class PeriodicTaskSchedule(Model):
         return f"<PeriodicTaskSchedule {self.task_name} ({schedule})>"
 
 
+class SchedulerLease(Model):
+    """
+    Lease-based leader election for the task scheduler.
+
+    One row per lease name.  A scheduler becomes leader by atomically
+    taking a row whose lease expired (or that it already holds); ``token``
+    increases on every change of holder (fencing token).
+    """
+    __tablename__ = "admin_scheduler_leases"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=100, unique=True, index=True)
+    holder: Mapped[str] = Field.string(max_length=255)
+    token: Mapped[int] = Field.integer(default=1)
+    expires_at: Mapped[DateTime] = Field.datetime()
+
+    def __repr__(self) -> str:
+        return f"<SchedulerLease {self.name} holder={self.holder} token={self.token}>"
+
+
+class OutboxMessage(Model):
+    """
+    Transactional outbox for messaging.
+
+    Rows are added in the same session (and transaction) as the model
+    changes they describe, then published by ``OutboxRelay`` in ``id``
+    order.  ``delivered_at`` is set once the broker accepted the message;
+    ``attempts``/``last_error`` track failed publishes.
+    """
+    __tablename__ = "admin_outbox_messages"
+
+    id: Mapped[int] = Field.pk()
+    topic: Mapped[str] = Field.string(max_length=255, index=True)
+    key: Mapped[str | None] = Field.string(max_length=255, nullable=True)
+    payload_json: Mapped[str] = Field.text()
+    headers_json: Mapped[str | None] = Field.text(nullable=True)
+    attempts: Mapped[int] = Field.integer(default=0)
+    last_error: Mapped[str | None] = Field.string(max_length=1000, nullable=True)
+    created_at: Mapped[DateTime] = Field.datetime(auto_now_add=True)
+    delivered_at: Mapped[DateTime | None] = Field.datetime(nullable=True, index=True)
+
+    def __repr__(self) -> str:
+        state = "delivered" if self.delivered_at else f"pending attempts={self.attempts}"
+        return f"<OutboxMessage {self.id} {self.topic} [{state}]>"
+
+
+class ProcessedMessage(Model):
+    """
+    Keys of messages already handled by idempotent workers.
+
+    Written in batches by ``DatabaseDedupStore``; ``key`` carries the
+    worker scope (``group:message-key``).  Rows older than the dedup TTL
+    no longer count and can be purged.
+    """
+    __tablename__ = "admin_processed_messages"
+
+    id: Mapped[int] = Field.pk()
+    key: Mapped[str] = Field.string(max_length=255, unique=True, index=True)
+    created_at: Mapped[DateTime] = Field.datetime(index=True)
+
+    def __repr__(self) -> str:
+        return f"<ProcessedMessage {self.key}>"
+
+
 class WorkerHeartbeat(Model):
     """
     Tracks active workers via periodic heartbeat.
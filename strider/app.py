@@ -426,6 +426,12 @@ class StrideApp:
         except Exception:
             pass  # Messaging may not be configured
         
+        from strider.cache import close_cache
+        await close_cache()
+        
+        from strider.realtime import close_backplane
+        await close_backplane()
+        
         # Fecha conexões
         if self.settings.has_read_replica:
             from strider.database import close_replicas
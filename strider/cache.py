@@ -0,0 +1,532 @@
+"""
+Cache plugável: backends async (memória local e Redis), proteção contra
+stampede (single-flight) e cache declarativo de views.
+
+Backends::
+
+    from strider.cache import get_cache
+
+    cache = get_cache()                      # definido por settings.cache_backend
+    await cache.set("stats", {"total": 10}, ttl=60)
+    await cache.get("stats")
+    await cache.get_many(["a", "b"])
+    await cache.delete("stats")
+
+    # Só um coroutine por chave calcula o valor; os demais aguardam
+    report = await cache.get_or_set("report", build_report, ttl=300)
+
+ViewSets (list/retrieve)::
+
+    class ProductViewSet(ModelViewSet):
+        model = Product
+        cache_actions = {"list": 60, "retrieve": 300}
+
+Views arbitrárias e actions customizadas::
+
+    from strider.cache import cache_response
+
+    class StatsView(APIView):
+        @cache_response(ttl=30, models=[Order])
+        async def get(self, request, **kwargs):
+            ...
+
+Invalidação: as chaves de view incluem uma versão por model. ``Model.save()``
+e ``Model.delete()`` trocam a versão dos models observados depois do commit
+da sessão (nada muda se a transação sofrer rollback), então entradas
+antigas deixam de ser lidas e expiram pelo TTL. Escritas em massa
+(``QuerySet.update``/``delete``) não passam por ``save`` — use
+``invalidate_model(Model)`` após o commit delas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import logging
+import pickle
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from starlette.requests import Request
+
+
+logger = logging.getLogger("strider.cache")
+
+_MISSING = object()
+
+
+class CacheBackend:
+    """
+    Interface base dos backends de cache.
+
+    Subclasses implementam ``get``/``set``/``add``/``delete``/``get_many``.
+    ``ttl=None`` usa ``default_ttl``; ``ttl=0`` grava sem expiração.
+    """
+
+    def __init__(self, default_ttl: float | None = 300.0, key_prefix: str = "") -> None:
+        self.default_ttl = default_ttl
+        self.key_prefix = key_prefix
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def make_key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    def _ttl(self, ttl: float | None) -> float | None:
+        ttl = self.default_ttl if ttl is None else ttl
+        return ttl or None
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        raise NotImplementedError
+
+    async def add(self, key: str, value: Any, ttl: float | None = None) -> bool:
+        """Grava apenas se a chave não existir. Retorna True se gravou."""
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> bool:
+        raise NotImplementedError
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Retorna {chave: valor} apenas das chaves presentes."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """
+        Retorna o valor em cache ou calcula com ``factory()`` e grava.
+
+        Single-flight: requisições concorrentes pela mesma chave ausente
+        aguardam o primeiro cálculo em vez de chamar ``factory`` de novo.
+        A coordenação é por processo.
+        """
+        value = await self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await factory()
+            await self.set(key, value, ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # marca como consumida (sem waiters, evita warning)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            self._inflight.pop(key, None)
+        return value
+
+
+class LocalMemoryCache(CacheBackend):
+    """
+    Cache em processo: LRU limitado por ``max_entries`` com TTL por entrada.
+
+    Os valores são guardados por referência (sem cópia) — não mute objetos
+    obtidos do cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        default_ttl: float | None = 300.0,
+        key_prefix: str = "",
+    ) -> None:
+        super().__init__(default_ttl=default_ttl, key_prefix=key_prefix)
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+
+    def _lookup(self, key: str) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any, ttl: float | None) -> None:
+        ttl = self._ttl(ttl)
+        self._data[key] = (time.monotonic() + ttl if ttl else None, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(self.make_key(key))
+        return default if value is _MISSING else value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self._store(self.make_key(key), value, ttl)
+
+    async def add(self, key: str, value: Any, ttl: float | None = None) -> bool:
+        full_key = self.make_key(key)
+        if self._lookup(full_key) is not _MISSING:
+            return False
+        self._store(full_key, value, ttl)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self._data.pop(self.make_key(key), None) is not None
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        found = {}
+        for key in keys:
+            value = self._lookup(self.make_key(key))
+            if value is not _MISSING:
+                found[key] = value
+        return found
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache em Redis (standalone, cluster ou sentinel).
+
+    O cliente é criado sob demanda por ``create_redis_client`` com as
+    configurações ``redis_*`` (ou ``cache_url``). Valores são serializados
+    com pickle. Um cliente compatível pode ser injetado via ``client=``.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        mode: str | None = None,
+        default_ttl: float | None = 300.0,
+        key_prefix: str = "",
+        client: Any = None,
+        **client_kwargs: Any,
+    ) -> None:
+        super().__init__(default_ttl=default_ttl, key_prefix=key_prefix)
+        self.url = url
+        self.mode = mode
+        self._client = client
+        self._client_kwargs = client_kwargs
+        self._connect_lock = asyncio.Lock()
+
+    async def connect(self) -> Any:
+        if self._client is None:
+            async with self._connect_lock:
+                if self._client is None:
+                    from strider.messaging.redis.connection import create_redis_client
+
+                    self._client = await create_redis_client(
+                        url=self.url, mode=self.mode, **self._client_kwargs,
+                    )
+        return self._client
+
+    async def close(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if close is not None:
+                result = close()
+                if hasattr(result, "__await__"):
+                    await result
+
+    @staticmethod
+    def _dumps(value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _loads(raw: Any) -> Any:
+        return pickle.loads(raw)
+
+    def _expiry(self, ttl: float | None) -> dict[str, int]:
+        ttl = self._ttl(ttl)
+        if not ttl:
+            return {}
+        return {"px": max(1, int(ttl * 1000))}
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        client = await self.connect()
+        raw = await client.get(self.make_key(key))
+        return default if raw is None else self._loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        client = await self.connect()
+        await client.set(self.make_key(key), self._dumps(value), **self._expiry(ttl))
+
+    async def add(self, key: str, value: Any, ttl: float | None = None) -> bool:
+        client = await self.connect()
+        return bool(await client.set(
+            self.make_key(key), self._dumps(value), nx=True, **self._expiry(ttl),
+        ))
+
+    async def delete(self, key: str) -> bool:
+        client = await self.connect()
+        return bool(await client.delete(self.make_key(key)))
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        client = await self.connect()
+        # Em cluster as chaves caem em slots diferentes: mget não atômico
+        mget = getattr(client, "mget_nonatomic", None) or client.mget
+        values = await mget([self.make_key(k) for k in keys])
+        return {k: self._loads(raw) for k, raw in zip(keys, values) if raw is not None}
+
+
+# =============================================================================
+# Instância global
+# =============================================================================
+
+_cache: CacheBackend | None = None
+
+
+def create_cache_from_settings() -> CacheBackend:
+    """Cria o backend definido por ``settings.cache_backend``."""
+    from strider.config import get_settings
+
+    settings = get_settings()
+    if settings.cache_backend == "redis":
+        return RedisCache(
+            url=settings.cache_url or settings.redis_url,
+            default_ttl=settings.cache_default_ttl,
+            key_prefix=settings.cache_key_prefix,
+        )
+    return LocalMemoryCache(
+        max_entries=settings.cache_max_entries,
+        default_ttl=settings.cache_default_ttl,
+        key_prefix=settings.cache_key_prefix,
+    )
+
+
+def get_cache() -> CacheBackend:
+    """Retorna o cache global (criado a partir das settings no primeiro uso)."""
+    global _cache
+    if _cache is None:
+        _cache = create_cache_from_settings()
+    return _cache
+
+
+def configure_cache(backend: CacheBackend | None) -> None:
+    """Define o cache global. ``None`` volta ao backend das settings."""
+    global _cache
+    _cache = backend
+
+
+async def close_cache() -> None:
+    """Fecha o cache global, se já foi criado (após as invalidações pendentes)."""
+    if _pending_invalidations:
+        await asyncio.gather(*_pending_invalidations)
+    if _cache is not None:
+        await _cache.close()
+
+
+# =============================================================================
+# Versões por model (invalidação)
+# =============================================================================
+
+def _version_key(model: Any) -> str:
+    return f"version:{model.__tablename__}"
+
+
+async def invalidate_model(model: Any) -> None:
+    """Invalida todas as entradas de view que dependem do model."""
+    await get_cache().set(_version_key(model), secrets.token_hex(8), ttl=0)
+
+
+# Models escritos na transação, em session.info, até o commit
+_DIRTY_MODELS = "strider.cache.dirty_models"
+_pending_invalidations: set[asyncio.Task] = set()
+_listening = False
+
+
+def invalidate_on_commit(session: Any, model: Any) -> None:
+    """
+    Invalida o model quando a transação de *session* for commitada.
+
+    Trocar a versão antes do commit deixaria uma leitura concorrente
+    gravar dados ainda não commitados sob a versão nova, e um rollback
+    invalidaria à toa. Numa ``AsyncSession`` a troca é aguardada dentro
+    do próprio ``commit()`` da transação externa; rollback descarta a
+    marcação.
+    """
+    _listen_for_commits()
+    sync_session = getattr(session, "sync_session", session)
+    sync_session.info.setdefault(_DIRTY_MODELS, set()).add(model)
+
+
+def _listen_for_commits() -> None:
+    global _listening
+    if _listening:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_transaction_end", _after_transaction_end)
+    _listening = True
+
+
+def _after_commit(session: Any) -> None:
+    models = session.info.pop(_DIRTY_MODELS, None)
+    if not models:
+        return
+    from sqlalchemy.exc import MissingGreenlet
+    from sqlalchemy.util import await_only
+
+    # AsyncSession: o evento roda no greenlet do commit(), que só retorna
+    # depois da troca (leitura logo após o commit já vê a versão nova)
+    coro = _invalidate_models(models)
+    try:
+        await_only(coro)
+        return
+    except MissingGreenlet:
+        coro.close()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Session síncrona fora de um loop
+        asyncio.run(_invalidate_models(models))
+        return
+    # Session síncrona dentro do loop: não dá para bloquear; close_cache() espera
+    task = loop.create_task(_invalidate_models(models))
+    _pending_invalidations.add(task)
+    task.add_done_callback(_pending_invalidations.discard)
+
+
+def _after_transaction_end(session: Any, transaction: Any) -> None:
+    # Transação externa encerrada sem commit (rollback/close): descarta
+    if transaction.parent is None:
+        session.info.pop(_DIRTY_MODELS, None)
+
+
+async def _invalidate_models(models: Iterable[Any]) -> None:
+    for model in models:
+        try:
+            await invalidate_model(model)
+        except Exception as e:
+            # Falha no cache não deve quebrar a escrita; o TTL limita a defasagem
+            logger.warning("Could not invalidate cache for %s: %s", model.__name__, e)
+
+
+async def model_versions(models: Iterable[Any]) -> list[str]:
+    """
+    Versões atuais dos models, criando as ausentes.
+
+    Uma versão nova (aleatória) é gerada quando a chave some — por
+    eviction ou restart do Redis —, então entradas antigas nunca voltam
+    a ser válidas.
+    """
+    cache = get_cache()
+    keys = [_version_key(m) for m in models]
+    found = await cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            await cache.add(key, secrets.token_hex(8), ttl=0)
+            found[key] = await cache.get(key)
+    return [str(found[key]) for key in keys]
+
+
+# =============================================================================
+# Cache de views
+# =============================================================================
+
+def _request_user_key(request: "Request") -> str:
+    user = request.scope.get("user")
+    if user is not None and getattr(user, "is_authenticated", False):
+        user = getattr(user, "_user", user)
+    else:
+        user = getattr(request.state, "user", None)
+    if user is None:
+        return "anon"
+    return str(getattr(user, "id", None) or getattr(user, "identity", None) or id(user))
+
+
+async def view_cache_key(
+    name: str,
+    request: "Request",
+    models: Iterable[Any] = (),
+    vary_on_user: bool = True,
+) -> str:
+    """Chave de cache de uma view: nome, URL, usuário e versões dos models."""
+    parts = [request.method, request.url.path, str(request.url.query)]
+    if vary_on_user:
+        parts.append(_request_user_key(request))
+    parts.extend(await model_versions(models))
+    digest = hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:32]
+    return f"view:{name}:{digest}"
+
+
+def _find_request(args: tuple, kwargs: dict) -> Any:
+    from starlette.requests import Request
+
+    request = kwargs.get("request")
+    if isinstance(request, Request):
+        return request
+    for arg in args:
+        if isinstance(arg, Request):
+            return arg
+    return None
+
+
+def cache_response(
+    ttl: float | None = None,
+    *,
+    models: Iterable[Any] = (),
+    vary_on_user: bool = True,
+) -> Callable:
+    """
+    Decorator que cacheia o retorno de uma view/action GET.
+
+    Em métodos de ViewSet, ``self.model`` entra nas dependências de
+    invalidação automaticamente. Requisições que não são GET/HEAD passam
+    direto. Com ``vary_on_user=False`` a resposta é compartilhada entre
+    usuários: use só para dados públicos.
+
+    Args:
+        ttl: Segundos de vida (None usa ``settings.cache_default_ttl``)
+        models: Models cujas escritas invalidam a resposta
+        vary_on_user: Se True, separa o cache por usuário autenticado
+    """
+    declared = tuple(models)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request = _find_request(args, kwargs)
+            if request is None or request.method not in ("GET", "HEAD"):
+                return await func(*args, **kwargs)
+
+            deps = declared
+            owner_model = getattr(args[0], "model", None) if args else None
+            if owner_model is not None and hasattr(owner_model, "__tablename__"):
+                deps = (owner_model, *declared)
+
+            key = await view_cache_key(func.__qualname__, request, deps, vary_on_user)
+            return await get_cache().get_or_set(key, lambda: func(*args, **kwargs), ttl=ttl)
+
+        return wrapper
+
+    return decorator
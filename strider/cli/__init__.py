@@ -8,12 +8,26 @@ Comandos disponíveis:
 - strider showmigrations: Mostra status das migrações
 - strider rollback: Reverte migrações
 - strider run: Executa o servidor de desenvolvimento
+- strider serve: Executa o servidor de produção (prefork)
 - strider shell: Abre shell interativo
 - strider routes: Lista rotas registradas
 - strider test: Executa testes com ambiente isolado
 - strider version: Mostra versão do framework
 """
 
-from strider.cli.main import cli, main
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from strider.cli.main import cli, main
 
 __all__ = ["cli", "main"]
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy (PEP 562): importar strider.cli.<submódulo> não carrega o CLI inteiro
+    if name in __all__:
+        value = getattr(import_module("strider.cli.main"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'strider.cli' has no attribute '{name}'")
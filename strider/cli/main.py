@@ -11,6 +11,7 @@ Comandos:
     showmigrations  Mostra status das migrações
     rollback        Reverte migrações
     run             Executa servidor de desenvolvimento
+    serve           Executa servidor de produção (prefork)
     shell           Abre shell interativo async
     routes          Lista rotas registradas
     test            Executa testes com ambiente isolado
@@ -1995,6 +1996,59 @@ def cmd_run(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_serve(args: argparse.Namespace) -> int:
+    """Executa servidor de produção (prefork com preload)."""
+    import logging
+
+    config = load_config()
+    from strider.config import get_settings
+    settings = get_settings()
+    
+    host = args.host or config["host"]
+    port = args.port or config["port"]
+    app_module = args.app or config["app_module"]
+    workers = args.workers or settings.workers
+    
+    cwd = os.getcwd()
+    if cwd not in sys.path:
+        sys.path.insert(0, cwd)
+    
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="[%(asctime)s] [%(process)d] %(levelname)s %(name)s: %(message)s",
+    )
+    
+    try:
+        from strider.server import serve
+        return serve(
+            app_module,
+            host=host,
+            port=port,
+            workers=workers,
+            max_requests=(
+                args.max_requests if args.max_requests is not None
+                else settings.server_max_requests
+            ),
+            max_requests_jitter=(
+                args.max_requests_jitter if args.max_requests_jitter is not None
+                else settings.server_max_requests_jitter
+            ),
+            graceful_timeout=(
+                args.graceful_timeout if args.graceful_timeout is not None
+                else settings.server_graceful_timeout
+            ),
+            reuse_port=settings.server_reuse_port and args.reuse_port,
+            backlog=settings.server_backlog,
+            log_level=args.log_level,
+        )
+    except ImportError as e:
+        print(error(f"Cannot start server: {e}"))
+        return 1
+    except OSError as e:
+        print(error(f"Cannot bind {host}:{port}: {e}"))
+        return 1
+
+
 def cmd_shell(args: argparse.Namespace) -> int:
     """Abre shell interativo async."""
     config = load_config()
@@ -2441,6 +2495,42 @@ def cmd_scheduler(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_outbox_relay(args: argparse.Namespace) -> int:
+    """Start the transactional outbox relay."""
+    print()
+    print(bold("Starting Outbox Relay"))
+    print("=" * 50)
+    print()
+    
+    # Add current directory to path
+    cwd = os.getcwd()
+    if cwd not in sys.path:
+        sys.path.insert(0, cwd)
+    os.environ["PYTHONPATH"] = cwd
+    
+    # Import app to configure database and producers
+    try:
+        config = load_config()
+        app_module = config.get("app_module", "src.main")
+        try:
+            importlib.import_module(app_module)
+        except ImportError:
+            pass
+    except Exception as e:
+        print(warning(f"Warning: Could not import app module: {e}"))
+    
+    # Run relay
+    from strider.messaging.outbox import run_outbox_relay
+    
+    try:
+        asyncio.run(run_outbox_relay())
+    except KeyboardInterrupt:
+        print()
+        print(info("Outbox relay stopped."))
+    
+    return 0
+
+
 def cmd_consumer(args: argparse.Namespace) -> int:
     """Start event consumer."""
     print()
@@ -3478,6 +3568,7 @@ Examples:
   strider makemigrations          Generate migrations
   strider migrate                 Apply migrations
   strider run                     Start development server
+  strider serve                   Start production server
   strider shell                   Open interactive shell
 
 For more information, visit: https://github.com/SorPuti/strider
@@ -3568,6 +3659,48 @@ For more information, visit: https://github.com/SorPuti/strider
     run_parser.add_argument("--no-reload", action="store_false", dest="reload", help="Disable auto-reload")
     run_parser.set_defaults(func=cmd_run)
     
+    # serve
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run production server (prefork workers, preloaded app)",
+    )
+    serve_parser.add_argument("--host", help="Host to bind (default: 0.0.0.0)")
+    serve_parser.add_argument("-p", "--port", type=int, help="Port to bind (default: 8000)")
+    serve_parser.add_argument("--app", help="App module (default: src.main)")
+    serve_parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        help="Number of worker processes (default: cgroup CPU quota)",
+    )
+    serve_parser.add_argument(
+        "--max-requests",
+        type=int,
+        help="Restart a worker after this many requests (default: 0, disabled)",
+    )
+    serve_parser.add_argument(
+        "--max-requests-jitter",
+        type=int,
+        help="Random extra requests added to --max-requests per worker",
+    )
+    serve_parser.add_argument(
+        "--graceful-timeout",
+        type=float,
+        help="Seconds a worker may drain connections before being killed (default: 30)",
+    )
+    serve_parser.add_argument(
+        "--no-reuse-port",
+        action="store_false",
+        dest="reuse_port",
+        help="Share one listening socket instead of SO_REUSEPORT per worker",
+    )
+    serve_parser.add_argument(
+        "--log-level",
+        default="info",
+        choices=["critical", "error", "warning", "info", "debug"],
+        help="Log level (default: info)",
+    )
+    serve_parser.set_defaults(func=cmd_serve)
+    
     # shell
     shell_parser = subparsers.add_parser("shell", help="Open interactive shell")
     shell_parser.set_defaults(func=cmd_shell)
@@ -3631,6 +3764,13 @@ For more information, visit: https://github.com/SorPuti/strider
     )
     scheduler_parser.set_defaults(func=cmd_scheduler)
     
+    # outbox-relay
+    outbox_parser = subparsers.add_parser(
+        "outbox-relay",
+        help="Publish pending transactional outbox messages"
+    )
+    outbox_parser.set_defaults(func=cmd_outbox_relay)
+    
     # consumer
     consumer_parser = subparsers.add_parser(
         "consumer",
@@ -276,6 +276,20 @@ class Settings(BaseSettings):
         default=3600,
         description="Tempo em segundos para reciclar conexões",
     )
+    relationship_loading: Literal["selectin", "deferred", "raise"] = PydanticField(
+        default="selectin",
+        description=(
+            "Carregamento padrão dos relacionamentos Rel.* sem lazy explícito: "
+            "'selectin' (eager), 'deferred' (ao acessar) ou 'raise' (só via load profile)"
+        ),
+    )
+    relationship_strict_loading: bool = PydanticField(
+        default=False,
+        description=(
+            "Queries do QuerySet não carregam relacionamentos fora do load profile "
+            "e acessos implícitos levantam erro (use em testes)"
+        ),
+    )
     
     # =========================================================================
     # API
@@ -526,14 +540,34 @@ class Settings(BaseSettings):
         default=8000,
         description="Porta do servidor",
     )
-    workers: int = PydanticField(
-        default=1,
-        description="Número de workers (use 1 em desenvolvimento)",
+    workers: int | None = PydanticField(
+        default=None,
+        description="Número de workers do `strider serve` (None = cota de CPU do cgroup)",
     )
     reload: bool = PydanticField(
         default=True,
         description="Auto-reload em desenvolvimento",
     )
+    server_max_requests: int = PydanticField(
+        default=0,
+        description="Recicla o worker após N requests (0 = nunca)",
+    )
+    server_max_requests_jitter: int = PydanticField(
+        default=0,
+        description="Requests extras aleatórios por worker (evita reciclar todos juntos)",
+    )
+    server_graceful_timeout: float = PydanticField(
+        default=30.0,
+        description="Tempo máximo para um worker drenar conexões antes do SIGKILL (segundos)",
+    )
+    server_reuse_port: bool = PydanticField(
+        default=True,
+        description="Um listener SO_REUSEPORT por worker (Linux)",
+    )
+    server_backlog: int = PydanticField(
+        default=2048,
+        description="Backlog do socket de escuta",
+    )
     
     # =========================================================================
     # Performance
@@ -775,10 +809,93 @@ class Settings(BaseSettings):
         default="dead-letter",
         description="Tópico para mensagens que falharam",
     )
+    messaging_dlq_batch_size: int = PydanticField(
+        default=100,
+        description="Mensagens acumuladas por tópico de DLQ antes de publicar em lote",
+    )
+    messaging_dlq_flush_interval: float = PydanticField(
+        default=1.0,
+        description="Intervalo máximo (segundos) para publicar mensagens acumuladas na DLQ",
+    )
+    messaging_retry_max_wait: float = PydanticField(
+        default=5.0,
+        description=(
+            "Máximo de segundos que o consumer de retry segura uma mensagem; ainda não vencida, "
+            "ela volta ao tópico de retry (0 = espera até o horário)"
+        ),
+    )
+    messaging_outbox_batch_size: int = PydanticField(
+        default=100,
+        description="Mensagens do outbox lidas e publicadas por lote pelo relay",
+    )
+    messaging_outbox_poll_interval: float = PydanticField(
+        default=1.0,
+        description="Intervalo (segundos) entre leituras do outbox quando não há lote cheio",
+    )
+    messaging_outbox_max_attempts: int = PydanticField(
+        default=10,
+        description="Tentativas de publicação antes de a mensagem do outbox ficar parada para inspeção",
+    )
+    messaging_dedup_store: Literal["memory", "redis", "database"] = PydanticField(
+        default="memory",
+        description=(
+            "Store de deduplicação dos workers com dedup_key: memory (LRU por processo), "
+            "redis (SET NX, compartilhado) ou database (admin_processed_messages)"
+        ),
+    )
+    messaging_dedup_ttl: int = PydanticField(
+        default=86400,
+        description="Tempo (segundos) que uma chave processada suprime reentregas",
+    )
+    messaging_dedup_max_keys: int = PydanticField(
+        default=100000,
+        description="Máximo de chaves no store em memória (LRU)",
+    )
+    messaging_dedup_batch_size: int = PydanticField(
+        default=100,
+        description="Chaves acumuladas antes do INSERT em lote no store database",
+    )
+    messaging_flow_control: bool = PydanticField(
+        default=False,
+        description=(
+            "Controle de fluxo dos workers: pausa o consumer quando as mensagens em "
+            "processamento atingem a marca alta"
+        ),
+    )
+    messaging_flow_high_messages: int = PydanticField(
+        default=1000,
+        description=(
+            "Mensagens em processamento (entregas simultâneas, lotes) que pausam o consumer; "
+            "limitada a batch_size x entregas simultâneas"
+        ),
+    )
+    messaging_flow_low_messages: int = PydanticField(
+        default=500,
+        description="Mensagens em processamento abaixo das quais o consumer é retomado",
+    )
+    messaging_flow_high_bytes: int = PydanticField(
+        default=0,
+        description="Bytes em processamento que pausam o consumer (0 desabilita o limite por bytes)",
+    )
+    messaging_flow_low_bytes: int = PydanticField(
+        default=0,
+        description="Bytes em processamento abaixo dos quais o consumer é retomado (0 = metade da marca alta)",
+    )
     avro_default_namespace: str = PydanticField(
         default="com.core.events",
         description="Namespace padrão para schemas Avro (ex: com.mycompany.events)",
     )
+    avro_schema_registry: Literal["none", "memory", "file"] = PydanticField(
+        default="none",
+        description=(
+            "Registro de schemas do AvroModel: none (Avro puro), memory ou file. "
+            "Com registro, mensagens usam o wire format Confluent (magic byte + schema id)"
+        ),
+    )
+    avro_schema_registry_path: str = PydanticField(
+        default="avro_schemas.json",
+        description="Arquivo JSON do registro de schemas quando avro_schema_registry='file'",
+    )
     
     # =========================================================================
     # TASKS / WORKERS
@@ -824,6 +941,32 @@ class Settings(BaseSettings):
         default="none",
         description="Onde armazenar resultados de tasks",
     )
+    task_scheduler_interval: float = PydanticField(
+        default=1.0,
+        description="Intervalo máximo entre ticks do scheduler (segundos)",
+    )
+    task_scheduler_leader_election: Literal["none", "database", "redis"] = PydanticField(
+        default="database",
+        description=(
+            "Eleição de líder do scheduler (lease). Com 'database' ou 'redis' "
+            "vários schedulers podem rodar para disponibilidade sem disparar jobs em dobro"
+        ),
+    )
+    task_scheduler_lease_seconds: int = PydanticField(
+        default=30,
+        description="Duração do lease de líder do scheduler; renovado a cada 1/3 do tempo",
+    )
+    task_scheduler_max_catchup: int = PydanticField(
+        default=100,
+        description="Máximo de execuções perdidas disparadas por task com catchup='all'",
+    )
+    task_scheduler_refresh_seconds: float = PydanticField(
+        default=30.0,
+        description=(
+            "Intervalo para o líder reler is_enabled de admin_periodic_tasks "
+            "(habilitar/desabilitar pelo admin sem reiniciar); 0 desativa"
+        ),
+    )
     
     # =========================================================================
     # REDIS (para tasks, cache, etc)
@@ -858,6 +1001,72 @@ class Settings(BaseSettings):
         default=10000,
         description="Tamanho máximo de streams Redis (MAXLEN)",
     )
+    redis_consumer_count: int = PydanticField(
+        default=10,
+        description="Entradas lidas por XREADGROUP/XAUTOCLAIM (também o tamanho do lote de XACK)",
+    )
+    redis_consumer_block_ms: int = PydanticField(
+        default=5000,
+        description="Tempo máximo de bloqueio do XREADGROUP em milissegundos",
+    )
+    redis_consumer_claim_interval: float = PydanticField(
+        default=30.0,
+        description="Segundos entre varreduras XAUTOCLAIM de entradas pendentes (0 desabilita)",
+    )
+    redis_consumer_min_idle_ms: int = PydanticField(
+        default=60000,
+        description="Tempo ocioso mínimo (ms) para reivindicar uma entrada pendente de outro consumer",
+    )
+    redis_consumer_max_deliveries: int = PydanticField(
+        default=5,
+        description="Entregas antes de mover a entrada para o stream de dead-letter (0 = sem limite)",
+    )
+    redis_consumer_stale_ms: int = PydanticField(
+        default=3_600_000,
+        description="Consumers sem pendências e ociosos por mais que isso (ms) são removidos do grupo (0 desabilita)",
+    )
+    
+    # =========================================================================
+    # CACHE
+    # =========================================================================
+    
+    cache_backend: Literal["memory", "redis"] = PydanticField(
+        default="memory",
+        description="Backend de cache: memory (LRU em processo) ou redis",
+    )
+    cache_url: str | None = PydanticField(
+        default=None,
+        description="URL Redis do cache (None usa redis_url, com redis_mode)",
+    )
+    cache_default_ttl: float = PydanticField(
+        default=300.0,
+        description="TTL padrão das entradas de cache em segundos (0 = sem expiração)",
+    )
+    cache_max_entries: int = PydanticField(
+        default=10000,
+        description="Máximo de entradas no cache em memória (LRU)",
+    )
+    cache_key_prefix: str = PydanticField(
+        default="strider:cache:",
+        description="Prefixo das chaves de cache",
+    )
+    
+    # =========================================================================
+    # REALTIME
+    # =========================================================================
+    
+    realtime_backplane: Literal["memory", "redis"] = PydanticField(
+        default="memory",
+        description="Backplane dos Channels nomeados: memory (um processo) ou redis (pub/sub entre workers)",
+    )
+    realtime_redis_url: str | None = PydanticField(
+        default=None,
+        description="URL Redis do backplane realtime (None usa redis_url)",
+    )
+    realtime_channel_prefix: str = PydanticField(
+        default="strider:rt:",
+        description="Prefixo dos canais pub/sub do backplane",
+    )
     
     # =========================================================================
     # CLI / PROJECT DISCOVERY
@@ -998,6 +1207,25 @@ class Settings(BaseSettings):
         default=30,
         description="Days to retain task execution records before purge",
     )
+    ops_task_persist_mode: Literal["buffered", "sync"] = PydanticField(
+        default="buffered",
+        description=(
+            "How task lifecycle transitions are written: 'buffered' batches them "
+            "into periodic multi-row upserts, 'sync' writes each one immediately"
+        ),
+    )
+    ops_task_persist_flush_interval: float = PydanticField(
+        default=1.0,
+        description="Seconds between flushes of buffered task transitions",
+    )
+    ops_task_persist_batch_size: int = PydanticField(
+        default=500,
+        description="Buffered task transitions that trigger an early flush (and rows per statement)",
+    )
+    ops_task_persist_max_pending: int = PydanticField(
+        default=10000,
+        description="Maximum buffered task transitions per worker (bounded memory)",
+    )
     ops_worker_heartbeat_interval: int = PydanticField(
         default=30,
         description="Worker heartbeat interval in seconds",
@@ -0,0 +1,290 @@
+"""
+Carregamento em lote (DataLoader) de models e relacionamentos.
+
+Coleta as chaves pedidas durante um tick do event loop e resolve todas
+com um único ``WHERE key IN (...)`` por model/relacionamento, mantendo o
+resultado em cache pelo resto do request.
+
+Em views (dependency)::
+
+    from strider.dependencies import RequestLoaders
+
+    @router.get("/orders")
+    async def orders(db: DatabaseSession, loaders: RequestLoaders):
+        orders = await Order.objects.using(db).all()
+        customers = await asyncio.gather(
+            *(loaders.model(Customer).load(o.customer_id) for o in orders)
+        )  # 1 query
+
+Relacionamentos aninhados de um OutputSchema::
+
+    await OrderOutput.prefetch(orders, loaders)   # 1 query por nível
+    items = [OrderOutput.model_validate(o).model_dump() for o in orders]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import types
+import typing
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping, Sequence
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import inspect as sa_inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import RelationshipDirection
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+BatchLoadFn = Callable[[list[Any]], Awaitable[Sequence[Any] | Mapping[Any, Any]]]
+
+
+class DataLoader:
+    """
+    Agrupa chamadas ``load(key)`` feitas no mesmo tick em uma chamada de
+    ``batch_load(keys)``.
+
+    ``batch_load`` recebe as chaves (sem repetição) e retorna os valores na
+    mesma ordem ou um mapping ``{chave: valor}`` (chaves ausentes viram None).
+
+    Args:
+        batch_load: Função async que resolve um lote de chaves
+        max_batch_size: Divide lotes maiores em várias chamadas
+        cache: Se True, cada chave é resolvida uma única vez
+    """
+
+    def __init__(
+        self,
+        batch_load: BatchLoadFn,
+        *,
+        max_batch_size: int | None = None,
+        cache: bool = True,
+    ) -> None:
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self._futures: dict[Hashable, asyncio.Future] = {}
+        self._queue: list[Hashable] = []
+
+    def load(self, key: Hashable) -> asyncio.Future:
+        """Agenda ``key`` no lote atual; aguarde o retorno para o valor."""
+        future = self._futures.get(key)
+        if future is not None and (self.cache or not future.done()):
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> list[Any]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """Insere um valor já conhecido no cache (não sobrescreve)."""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: Hashable | None = None) -> None:
+        """Remove ``key`` (ou tudo) do cache."""
+        if key is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(key, None)
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        size = self.max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            asyncio.ensure_future(self._resolve(keys[start:start + size]))
+
+    async def _resolve(self, keys: list[Hashable]) -> None:
+        futures = [self._futures[key] for key in keys]
+        try:
+            values = await self.batch_load(keys)
+            if isinstance(values, Mapping):
+                values = [values.get(key) for key in keys]
+            elif len(values) != len(keys):
+                raise ValueError(
+                    f"batch_load retornou {len(values)} valores para {len(keys)} chaves"
+                )
+        except Exception as exc:
+            for key, future in zip(keys, futures):
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key, future, value in zip(keys, futures, values):
+            if not self.cache and self._futures.get(key) is future:
+                del self._futures[key]
+            if not future.done():
+                future.set_result(value)
+
+
+# =============================================================================
+# Loaders por request
+# =============================================================================
+
+_current_loaders: ContextVar["Loaders | None"] = ContextVar("strider_loaders", default=None)
+
+
+def get_current_loaders() -> "Loaders | None":
+    """Loaders do request atual (definidos pela dependency ``get_loaders``)."""
+    return _current_loaders.get()
+
+
+class Loaders:
+    """
+    Registro de DataLoaders de um request, ligado a uma sessão.
+
+    As queries dos lotes são serializadas (uma ``AsyncSession`` não aceita
+    operações concorrentes).
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._loaders: dict[tuple, DataLoader] = {}
+        self._lock = asyncio.Lock()
+
+    def model(self, model: type, key: str = "id") -> DataLoader:
+        """Loader ``valor de key -> instância | None``."""
+        return self._get(("model", model, key), lambda: self._load_models(model, key))
+
+    def related(self, model: type, name: str) -> DataLoader:
+        """
+        Loader do relacionamento ``model.name``, indexado pelo valor da
+        coluna local (FK no many-to-one, PK no one-to-many/many-to-many).
+        Retorna instância (ou None) ou lista, conforme o relacionamento.
+        """
+        prop = _relationship(model, name)
+        if prop.direction is RelationshipDirection.MANYTOONE:
+            _, remote = _single_pair(prop.local_remote_pairs, prop)
+            return self.model(prop.mapper.class_, prop.mapper.get_property_by_column(remote).key)
+        return self._get(("related", model, name), lambda: self._load_collection(prop))
+
+    async def load_related(self, objects: Iterable[Any], name: str) -> list[Any]:
+        """
+        Carrega ``name`` nos objetos onde ele ainda não foi carregado e
+        retorna os objetos relacionados (achatados, sem None).
+        """
+        objects = [obj for obj in objects if obj is not None]
+        if not objects:
+            return []
+        prop = _relationship(type(objects[0]), name)
+        local, _ = _single_pair(
+            prop.synchronize_pairs if prop.secondary is not None else prop.local_remote_pairs, prop,
+        )
+        local_key = prop.parent.get_property_by_column(local).key
+
+        pending = [obj for obj in objects if name in sa_inspect(obj).unloaded]
+        if pending:
+            loader = self.related(type(pending[0]), name)
+            values = await loader.load_many(getattr(obj, local_key) for obj in pending)
+            for obj, value in zip(pending, values):
+                if prop.uselist:
+                    value = list(value or [])
+                set_committed_value(obj, name, value)
+
+        related: list[Any] = []
+        for obj in objects:
+            value = obj.__dict__.get(name)
+            if prop.uselist:
+                related.extend(value or [])
+            elif value is not None:
+                related.append(value)
+        return related
+
+    async def prefetch(self, objects: Iterable[Any], schema: type) -> None:
+        """
+        Carrega, nível a nível, os relacionamentos que ``schema`` serializa
+        como schemas aninhados — uma query por relacionamento e nível.
+        """
+        objects = [obj for obj in objects if obj is not None]
+        if not objects:
+            return
+        mapper = sa_inspect(type(objects[0]))
+        for name, info in schema.model_fields.items():
+            nested = nested_schema(info.annotation)
+            if nested is None or name not in mapper.relationships:
+                continue
+            related = await self.load_related(objects, name)
+            await self.prefetch(related, nested)
+
+    def _get(self, key: tuple, factory: Callable[[], BatchLoadFn]) -> DataLoader:
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = self._loaders[key] = DataLoader(factory())
+        return loader
+
+    def _load_models(self, model: type, key: str) -> BatchLoadFn:
+        column = getattr(model, key)
+
+        async def batch(keys: list[Any]) -> dict[Any, Any]:
+            async with self._lock:
+                result = await self.session.execute(select(model).where(column.in_(keys)))
+            return {getattr(obj, key): obj for obj in result.scalars()}
+
+        return batch
+
+    def _load_collection(self, prop: Any) -> BatchLoadFn:
+        target = prop.mapper.class_
+
+        async def batch(keys: list[Any]) -> dict[Any, list[Any]]:
+            if prop.secondary is not None:
+                _, link = _single_pair(prop.synchronize_pairs, prop)
+                stmt = (
+                    select(target, link)
+                    .join(prop.secondary, prop.secondaryjoin)
+                    .where(link.in_(keys))
+                )
+            else:
+                _, remote = _single_pair(prop.local_remote_pairs, prop)
+                link = getattr(target, prop.mapper.get_property_by_column(remote).key)
+                stmt = select(target, link).where(link.in_(keys))
+            if prop.order_by:
+                stmt = stmt.order_by(*prop.order_by)
+
+            async with self._lock:
+                result = await self.session.execute(stmt)
+            grouped: dict[Any, list[Any]] = {key: [] for key in keys}
+            for obj, value in result.all():
+                grouped[value].append(obj)
+            return grouped
+
+        return batch
+
+
+def _relationship(model: type, name: str) -> Any:
+    relationships = sa_inspect(model).relationships
+    if name not in relationships:
+        raise ValueError(f"{model.__name__}.{name} não é um relacionamento")
+    return relationships[name]
+
+
+def _single_pair(pairs: Sequence[tuple[Any, Any]], prop: Any) -> tuple[Any, Any]:
+    if len(pairs) != 1:
+        raise ValueError(f"{prop}: DataLoader não suporta chaves compostas")
+    return pairs[0]
+
+
+def nested_schema(annotation: Any) -> type | None:
+    """Schema Pydantic aninhado em ``T``, ``T | None`` ou ``list[T]``."""
+    from pydantic import BaseModel
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    origin = typing.get_origin(annotation)
+    if origin in (list, tuple, set, frozenset, Sequence, typing.Union, types.UnionType):
+        for arg in typing.get_args(annotation):
+            found = nested_schema(arg)
+            if found is not None:
+                return found
+    return None
@@ -36,6 +36,8 @@ __all__ = [
     "DatabaseSession",
     "CurrentUser",
     "OptionalUser",
+    "get_loaders",
+    "RequestLoaders",
 ]
 
 
@@ -319,11 +321,34 @@ def get_settings_dep() -> Settings:
     return get_settings()
 
 
+async def get_loaders(db: AsyncSession = Depends(get_db)) -> AsyncGenerator[Any, None]:
+    """
+    Dependency que fornece os DataLoaders do request (ver strider.dataloader).
+    
+    Os loaders ficam disponíveis também via ``get_current_loaders()``,
+    usado pelos serializers para carregar relacionamentos aninhados em lote.
+    
+    Uso:
+        @router.get("/orders")
+        async def orders(db: DatabaseSession, loaders: RequestLoaders):
+            customer = await loaders.model(Customer).load(order.customer_id)
+    """
+    from strider.dataloader import Loaders, _current_loaders
+    
+    loaders = Loaders(db)
+    token = _current_loaders.set(loaders)
+    try:
+        yield loaders
+    finally:
+        _current_loaders.reset(token)
+
+
 # Type aliases para uso com Annotated
 DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
 CurrentUser = Annotated[Any, Depends(get_current_user)]
 OptionalUser = Annotated[Any | None, Depends(get_optional_user)]
 AppSettings = Annotated[Settings, Depends(get_settings_dep)]
+RequestLoaders = Annotated[Any, Depends(get_loaders)]
 
 
 # Dependency factory para injeção customizada
@@ -298,8 +298,8 @@ EXPOSE 8000
 HEALTHCHECK --interval=30s --timeout=10s --start-period=5s --retries=3 \\
     CMD curl -f http://localhost:8000/health || exit 1
 
-# Default command
-CMD ["stride", "run", "--host", "0.0.0.0", "--port", "8000", "--no-reload"]
+# Default command (prefork server; workers default to the container CPU quota)
+CMD ["strider", "serve", "--host", "0.0.0.0", "--port", "8000"]
 '''
     
     # .dockerignore
@@ -94,6 +94,8 @@ spec:
         - name: api
           image: your-registry/core-app:latest
           imagePullPolicy: Always
+          # Workers follow the CPU limit (cgroup quota)
+          command: ["strider", "serve", "--host", "0.0.0.0", "--port", "8000", "--graceful-timeout", "15"]
           ports:
             - containerPort: 8000
               name: http
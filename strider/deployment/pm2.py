@@ -29,10 +29,11 @@ def generate_pm2(output_dir: Path) -> None:
     // ==========================================================================
     {
       name: "api",
-      script: "stride",
-      args: "run --host 0.0.0.0 --port 8000 --no-reload",
-      instances: "max",  // Use all available CPUs
-      exec_mode: "cluster",
+      script: "strider",
+      args: "serve --host 0.0.0.0 --port 8000",
+      // strider serve forks one worker per CPU itself; SIGHUP = rolling reload
+      instances: 1,
+      exec_mode: "fork",
       autorestart: true,
       watch: false,
       max_memory_restart: "1G",
@@ -46,9 +47,8 @@ def generate_pm2(output_dir: Path) -> None:
         ENVIRONMENT: "development",
         DEBUG: "true",
       },
-      // Graceful shutdown
-      kill_timeout: 5000,
-      wait_ready: true,
+      // Graceful shutdown (> server_graceful_timeout)
+      kill_timeout: 35000,
       listen_timeout: 10000,
     },
 
@@ -12,9 +12,9 @@ from datetime import datetime, timedelta
 from typing import Any, TYPE_CHECKING, Generic, TypeVar, overload
 from uuid import UUID
 
-from sqlalchemy import Uuid, String, Text, TypeDecorator, JSON
+from sqlalchemy import Uuid, String, Text, TypeDecorator, JSON, bindparam, func
 from sqlalchemy.orm import mapped_column, Mapped
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Dialect
@@ -50,6 +50,31 @@ class AdaptiveJSON(TypeDecorator):
         if dialect.name == "postgresql":
             return dialect.type_descriptor(JSONB())
         return dialect.type_descriptor(JSON())
+    
+    @staticmethod
+    def patch_expression(column: Any, document: dict, paths: set[tuple]) -> Any:
+        """
+        Expressão PostgreSQL que aplica só os `paths` alterados sobre `column`.
+        
+        Cada caminho presente em `document` vira um ``jsonb_set`` com o novo
+        valor; caminhos ausentes são removidos com ``#-``. O pai de cada
+        caminho precisa existir no valor atual da coluna (``jsonb_set`` não
+        cria níveis intermediários).
+        """
+        expr = column
+        for path in sorted(paths):
+            target = bindparam(None, [str(key) for key in path], type_=ARRAY(Text))
+            value: Any = document
+            for key in path:
+                value = value.get(key, _ABSENT) if isinstance(value, dict) else _ABSENT
+            if value is _ABSENT:
+                expr = expr.op("#-", return_type=JSONB)(target)
+            else:
+                expr = func.jsonb_set(expr, target, bindparam(None, value, type_=JSONB), type_=JSONB)
+        return expr
+
+
+_ABSENT = object()
 
 
 # =============================================================================
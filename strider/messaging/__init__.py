@@ -55,58 +55,161 @@ Configuration:
     kafka_fire_and_forget = true
 """
 
-from strider.messaging.base import (
-    MessageBroker,
-    Producer,
-    Consumer,
-    Event,
-    EventHandler,
-)
-from strider.messaging.config import (
-    MessagingSettings,
-    get_messaging_settings,
-    configure_messaging,
-)
-from strider.messaging.decorators import (
-    event,
-    consumer,
-    on_event,
-)
-from strider.messaging.registry import (
-    get_broker,
-    get_producer,
-    register_broker,
-    register_consumer,
-    get_consumers,
-    get_kafka_consumer_class,
-    create_consumer,
-    publish,
-    publish_event,
-)
-from strider.messaging.topics import (
-    Topic,
-    EventTopic,
-    CommandTopic,
-    StateTopic,
-    get_topic,
-    get_all_topics,
-    register_topic,
-)
-from strider.messaging.avro import (
-    AvroModel,
-    avro_schema,
-)
-from strider.messaging.workers import (
-    worker,
-    Worker,
-    WorkerConfig,
-    RetryPolicy,
-    get_worker,
-    get_all_workers,
-    list_workers,
-    run_worker,
-    run_all_workers,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from strider.messaging.base import (
+        MessageBroker,
+        Producer,
+        Consumer,
+        Event,
+        EventHandler,
+    )
+    from strider.messaging.config import (
+        MessagingSettings,
+        get_messaging_settings,
+        configure_messaging,
+    )
+    from strider.messaging.decorators import (
+        event,
+        consumer,
+        on_event,
+    )
+    from strider.messaging.registry import (
+        get_broker,
+        get_producer,
+        register_broker,
+        register_consumer,
+        get_consumers,
+        get_kafka_consumer_class,
+        create_consumer,
+        publish,
+        publish_event,
+    )
+    from strider.messaging.topics import (
+        Topic,
+        EventTopic,
+        CommandTopic,
+        StateTopic,
+        get_topic,
+        get_all_topics,
+        register_topic,
+    )
+    from strider.messaging.avro import (
+        AvroModel,
+        avro_schema,
+        SchemaRegistry,
+        InMemorySchemaRegistry,
+        FileSchemaRegistry,
+        get_schema_registry,
+        set_schema_registry,
+    )
+    from strider.messaging.outbox import (
+        enqueue,
+        enqueue_event,
+        OutboxRelay,
+    )
+    from strider.messaging.dedup import (
+        DedupStore,
+        MemoryDedupStore,
+        RedisDedupStore,
+        DatabaseDedupStore,
+        create_dedup_store,
+    )
+    from strider.messaging.tracking import current_message
+    from strider.messaging.flow import FlowController
+    from strider.messaging.workers import (
+        worker,
+        Worker,
+        WorkerConfig,
+        RetryPolicy,
+        get_worker,
+        get_all_workers,
+        list_workers,
+        run_worker,
+        run_all_workers,
+    )
+
+
+# Lazy exports (PEP 562): workers and CLI commands that only need one
+# backend do not import every broker, Avro and the settings-bound config.
+_LAZY_EXPORTS: dict[str, str] = {
+    # strider.messaging.base
+    "MessageBroker": "strider.messaging.base",
+    "Producer": "strider.messaging.base",
+    "Consumer": "strider.messaging.base",
+    "Event": "strider.messaging.base",
+    "EventHandler": "strider.messaging.base",
+
+    # strider.messaging.config
+    "MessagingSettings": "strider.messaging.config",
+    "get_messaging_settings": "strider.messaging.config",
+    "configure_messaging": "strider.messaging.config",
+
+    # strider.messaging.decorators
+    "event": "strider.messaging.decorators",
+    "consumer": "strider.messaging.decorators",
+    "on_event": "strider.messaging.decorators",
+
+    # strider.messaging.registry
+    "get_broker": "strider.messaging.registry",
+    "get_producer": "strider.messaging.registry",
+    "register_broker": "strider.messaging.registry",
+    "register_consumer": "strider.messaging.registry",
+    "get_consumers": "strider.messaging.registry",
+    "get_kafka_consumer_class": "strider.messaging.registry",
+    "create_consumer": "strider.messaging.registry",
+    "publish": "strider.messaging.registry",
+    "publish_event": "strider.messaging.registry",
+
+    # strider.messaging.topics
+    "Topic": "strider.messaging.topics",
+    "EventTopic": "strider.messaging.topics",
+    "CommandTopic": "strider.messaging.topics",
+    "StateTopic": "strider.messaging.topics",
+    "get_topic": "strider.messaging.topics",
+    "get_all_topics": "strider.messaging.topics",
+    "register_topic": "strider.messaging.topics",
+
+    # strider.messaging.avro
+    "AvroModel": "strider.messaging.avro",
+    "avro_schema": "strider.messaging.avro",
+    "SchemaRegistry": "strider.messaging.avro",
+    "InMemorySchemaRegistry": "strider.messaging.avro",
+    "FileSchemaRegistry": "strider.messaging.avro",
+    "get_schema_registry": "strider.messaging.avro",
+    "set_schema_registry": "strider.messaging.avro",
+
+    # strider.messaging.outbox
+    "enqueue": "strider.messaging.outbox",
+    "enqueue_event": "strider.messaging.outbox",
+    "OutboxRelay": "strider.messaging.outbox",
+
+    # strider.messaging.dedup
+    "DedupStore": "strider.messaging.dedup",
+    "MemoryDedupStore": "strider.messaging.dedup",
+    "RedisDedupStore": "strider.messaging.dedup",
+    "DatabaseDedupStore": "strider.messaging.dedup",
+    "create_dedup_store": "strider.messaging.dedup",
+
+    # strider.messaging.tracking
+    "current_message": "strider.messaging.tracking",
+
+    # strider.messaging.flow
+    "FlowController": "strider.messaging.flow",
+
+    # strider.messaging.workers
+    "worker": "strider.messaging.workers",
+    "Worker": "strider.messaging.workers",
+    "WorkerConfig": "strider.messaging.workers",
+    "RetryPolicy": "strider.messaging.workers",
+    "get_worker": "strider.messaging.workers",
+    "get_all_workers": "strider.messaging.workers",
+    "list_workers": "strider.messaging.workers",
+    "run_worker": "strider.messaging.workers",
+    "run_all_workers": "strider.messaging.workers",
+}
 
 __all__ = [
     # Base classes
@@ -144,6 +247,24 @@ __all__ = [
     # Avro
     "AvroModel",
     "avro_schema",
+    "SchemaRegistry",
+    "InMemorySchemaRegistry",
+    "FileSchemaRegistry",
+    "get_schema_registry",
+    "set_schema_registry",
+    # Outbox
+    "enqueue",
+    "enqueue_event",
+    "OutboxRelay",
+    # Idempotent consumers
+    "DedupStore",
+    "MemoryDedupStore",
+    "RedisDedupStore",
+    "DatabaseDedupStore",
+    "create_dedup_store",
+    "current_message",
+    # Flow control
+    "FlowController",
     # Workers
     "worker",
     "Worker",
@@ -155,3 +276,16 @@ __all__ = [
     "run_worker",
     "run_all_workers",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module 'strider.messaging' has no attribute '{name}'")
+    value = getattr(import_module(target), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -25,6 +25,17 @@ Example:
     #         {"name": "metadata", "type": ["null", {"type": "map", "values": "string"}], "default": null}
     #     ]
     # }
+
+Serialization:
+    Parsed schemas are cached by fingerprint, and writer/reader resolution
+    pairs are cached as well, so ``to_avro``/``from_avro`` never re-parse.
+
+    With a schema registry the payload is wrapped in the Confluent wire
+    format — magic byte ``0`` + 4-byte big-endian schema id + Avro body:
+
+        registry = FileSchemaRegistry("avro_schemas.json")
+        data = event.to_avro(registry=registry)
+        event = UserEvent.from_avro(data, registry=registry)
 """
 
 from __future__ import annotations
@@ -34,7 +45,12 @@ from datetime import datetime, date, time
 from decimal import Decimal
 from enum import Enum
 from uuid import UUID
+from pathlib import Path
+import hashlib
 import json
+import os
+import struct
+import types
 
 from pydantic import BaseModel
 
@@ -81,8 +97,8 @@ def _python_type_to_avro(
     origin = get_origin(python_type)
     args = get_args(python_type)
     
-    # Handle Optional (Union with None)
-    if origin is Union:
+    # Handle Optional (Union with None), incluindo ``X | None`` (PEP 604)
+    if origin is Union or origin is types.UnionType:
         non_none_types = [t for t in args if t is not type(None)]
         if len(non_none_types) == 1:
             # Optional[X] -> ["null", X]
@@ -276,6 +292,291 @@ def _pydantic_to_avro_schema(
     return schema
 
 
+# =============================================================================
+# Parsed schema cache
+# =============================================================================
+
+# fingerprint -> schema parseado pelo fastavro
+_parsed_schemas: dict[str, Any] = {}
+# (writer fingerprint, reader fingerprint) -> (writer parseado, reader parseado ou None)
+_resolutions: dict[tuple[str, str], tuple[Any, Any]] = {}
+# id(schema) -> (schema, fingerprint): schemas estáveis (ex: AvroModel) não são re-serializados
+_fingerprints_by_object: dict[int, tuple[Any, str]] = {}
+_OBJECT_CACHE_SIZE = 1024
+
+
+def _fastavro() -> Any:
+    try:
+        import fastavro
+    except ImportError:
+        raise ImportError(
+            "fastavro is required for Avro serialization. "
+            "Install with: pip install strider[avro]"
+        )
+    return fastavro
+
+
+def schema_fingerprint(schema: dict[str, Any] | str) -> str:
+    """
+    Stable fingerprint of a schema (SHA-256 of its canonical JSON).
+
+    Key order does not matter; any other difference (including defaults
+    and docs) gives a different fingerprint.
+    """
+    if isinstance(schema, str):
+        schema = json.loads(schema)
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _fingerprint(schema: dict[str, Any]) -> str:
+    hit = _fingerprints_by_object.get(id(schema))
+    if hit is not None and hit[0] is schema:
+        return hit[1]
+    fingerprint = schema_fingerprint(schema)
+    if len(_fingerprints_by_object) >= _OBJECT_CACHE_SIZE:
+        _fingerprints_by_object.clear()
+    _fingerprints_by_object[id(schema)] = (schema, fingerprint)
+    return fingerprint
+
+
+def parse_schema(schema: dict[str, Any], fingerprint: str | None = None) -> Any:
+    """``fastavro.parse_schema`` with a process-wide cache keyed by fingerprint."""
+    fingerprint = fingerprint or _fingerprint(schema)
+    parsed = _parsed_schemas.get(fingerprint)
+    if parsed is None:
+        parsed = _parsed_schemas[fingerprint] = _fastavro().parse_schema(schema)
+    return parsed
+
+
+def _resolution(writer: dict[str, Any], reader: dict[str, Any]) -> tuple[Any, Any]:
+    writer_fp, reader_fp = _fingerprint(writer), _fingerprint(reader)
+    key = (writer_fp, reader_fp)
+    resolved = _resolutions.get(key)
+    if resolved is None:
+        # Mesmo schema: leitura direta, sem resolução writer -> reader
+        resolved = _resolutions[key] = (
+            parse_schema(writer, writer_fp),
+            None if writer_fp == reader_fp else parse_schema(reader, reader_fp),
+        )
+    return resolved
+
+
+def clear_schema_cache() -> None:
+    """Drop every cached parsed schema and resolution."""
+    _parsed_schemas.clear()
+    _resolutions.clear()
+    _fingerprints_by_object.clear()
+
+
+# =============================================================================
+# Wire format (Confluent: magic byte + schema id)
+# =============================================================================
+
+MAGIC_BYTE = 0
+_HEADER = struct.Struct(">bI")
+
+
+def encode_envelope(schema_id: int, payload: bytes) -> bytes:
+    """Prefix *payload* with the 5-byte header (magic byte + schema id)."""
+    return _HEADER.pack(MAGIC_BYTE, schema_id) + payload
+
+
+def decode_envelope(data: bytes) -> tuple[int, memoryview]:
+    """Split an enveloped message into ``(schema_id, payload)``."""
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Avro message too short for wire format ({len(data)} bytes)")
+    magic, schema_id = _HEADER.unpack_from(data)
+    if magic != MAGIC_BYTE:
+        raise ValueError(f"Unknown Avro wire format magic byte: {magic}")
+    return schema_id, memoryview(data)[_HEADER.size:]
+
+
+class SchemaRegistry:
+    """
+    Base class for schema registries used by the wire format.
+
+    ``register`` returns the id of a schema under a subject, assigning one
+    on first use; ``get_schema`` returns the schema for an id.  Both are
+    cached in memory, so after warm-up they cost a dict lookup.  Subclasses
+    implement ``_store`` and ``_fetch``.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[int, dict[str, Any]] = {}
+        self._ids: dict[tuple[str, str], int] = {}
+
+    def register(self, subject: str, schema: dict[str, Any]) -> int:
+        """Id of *schema* under *subject* (registered if new)."""
+        fingerprint = _fingerprint(schema)
+        schema_id = self._ids.get((subject, fingerprint))
+        if schema_id is None:
+            schema_id = self._store(subject, schema, fingerprint)
+            self._ids[(subject, fingerprint)] = schema_id
+            self._schemas[schema_id] = schema
+        return schema_id
+
+    def get_schema(self, schema_id: int) -> dict[str, Any]:
+        """Schema registered under *schema_id* (``KeyError`` if unknown)."""
+        schema = self._schemas.get(schema_id)
+        if schema is None:
+            schema = self._schemas[schema_id] = self._fetch(schema_id)
+        return schema
+
+    def _store(self, subject: str, schema: dict[str, Any], fingerprint: str) -> int:
+        raise NotImplementedError
+
+    def _fetch(self, schema_id: int) -> dict[str, Any]:
+        raise KeyError(schema_id)
+
+
+class InMemorySchemaRegistry(SchemaRegistry):
+    """
+    Process-local registry (tests, single process).
+
+    Like the Confluent registry, an identical schema gets the same id in
+    every subject.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._fingerprints: dict[str, int] = {}
+        self.subjects: dict[str, list[int]] = {}
+
+    def _store(self, subject: str, schema: dict[str, Any], fingerprint: str) -> int:
+        schema_id = self._fingerprints.setdefault(fingerprint, len(self._fingerprints) + 1)
+        versions = self.subjects.setdefault(subject, [])
+        if schema_id not in versions:
+            versions.append(schema_id)
+        return schema_id
+
+
+class FileSchemaRegistry(SchemaRegistry):
+    """
+    Registry persisted to a local JSON file.
+
+    Meant for development and single-host deployments: the file is re-read
+    before assigning an id and replaced atomically, but concurrent writers
+    on different hosts are not coordinated.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        super().__init__()
+        self.path = Path(path)
+
+    def _load(self) -> dict[str, Any]:
+        if not self.path.exists():
+            return {"schemas": {}, "fingerprints": {}, "subjects": {}}
+        with self.path.open(encoding="utf-8") as f:
+            return json.load(f)
+
+    def _store(self, subject: str, schema: dict[str, Any], fingerprint: str) -> int:
+        data = self._load()
+        schema_id = data["fingerprints"].get(fingerprint)
+        if schema_id is None:
+            schema_id = max(map(int, data["schemas"]), default=0) + 1
+            data["fingerprints"][fingerprint] = schema_id
+            data["schemas"][str(schema_id)] = schema
+        versions = data["subjects"].setdefault(subject, [])
+        if schema_id not in versions:
+            versions.append(schema_id)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.path)
+        return schema_id
+
+    def _fetch(self, schema_id: int) -> dict[str, Any]:
+        return self._load()["schemas"][str(schema_id)]
+
+
+_schema_registry: SchemaRegistry | None = None
+_schema_registry_set = False
+
+
+def set_schema_registry(registry: SchemaRegistry | None) -> None:
+    """Install the default registry (``None`` disables the wire format)."""
+    global _schema_registry, _schema_registry_set
+    _schema_registry = registry
+    _schema_registry_set = True
+
+
+def get_schema_registry() -> SchemaRegistry | None:
+    """
+    Default registry: the one installed with ``set_schema_registry`` or
+    the one selected by ``settings.avro_schema_registry``.
+    """
+    global _schema_registry, _schema_registry_set
+    if _schema_registry_set:
+        return _schema_registry
+    try:
+        from strider.config import get_settings, is_configured
+        if not is_configured():
+            return None
+        settings = get_settings()
+    except Exception:
+        return None
+    backend = getattr(settings, "avro_schema_registry", "none")
+    if backend == "memory":
+        _schema_registry = InMemorySchemaRegistry()
+    elif backend == "file":
+        _schema_registry = FileSchemaRegistry(settings.avro_schema_registry_path)
+    _schema_registry_set = True
+    return _schema_registry
+
+
+def serialize_avro(
+    record: dict[str, Any],
+    schema: dict[str, Any],
+    *,
+    registry: SchemaRegistry | None = None,
+    subject: str | None = None,
+) -> bytes:
+    """
+    Encode *record* with *schema* (parsed once, then cached).
+
+    With a *registry* the result uses the wire format; *subject* defaults
+    to the record's full name (``namespace.Name``).
+    """
+    from io import BytesIO
+
+    buffer = BytesIO()
+    _fastavro().schemaless_writer(buffer, parse_schema(schema), record)
+    payload = buffer.getvalue()
+    if registry is None:
+        return payload
+    return encode_envelope(registry.register(subject or _full_name(schema), schema), payload)
+
+
+def deserialize_avro(
+    data: bytes,
+    reader_schema: dict[str, Any],
+    *,
+    registry: SchemaRegistry | None = None,
+    writer_schema: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Decode *data* into a record shaped by *reader_schema*.
+
+    The writer schema comes from the envelope when *registry* is given,
+    else from *writer_schema* (default: the reader schema); when it
+    differs, Avro schema resolution maps it onto the reader schema.
+    """
+    from io import BytesIO
+
+    if registry is not None:
+        schema_id, data = decode_envelope(data)
+        writer_schema = registry.get_schema(schema_id)
+    writer, reader = _resolution(writer_schema or reader_schema, reader_schema)
+    return _fastavro().schemaless_reader(BytesIO(data), writer, reader)
+
+
+def _full_name(schema: dict[str, Any]) -> str:
+    namespace = schema.get("namespace")
+    return f"{namespace}.{schema['name']}" if namespace else schema["name"]
+
+
 class AvroModelMeta(type(BaseModel)):
     """Metaclass that adds Avro schema generation to Pydantic models."""
     
@@ -348,31 +649,45 @@ class AvroModel(BaseModel, metaclass=AvroModelMeta):
         """
         return json.dumps(cls.__avro_schema__(), indent=2)
     
-    def to_avro(self) -> bytes:
+    @classmethod
+    def avro_subject(cls) -> str:
+        """Registry subject: the record's full name (``namespace.Name``)."""
+        return _full_name(cls.__avro_schema__())
+    
+    def to_avro(
+        self,
+        *,
+        registry: SchemaRegistry | None = None,
+        subject: str | None = None,
+    ) -> bytes:
         """
         Serialize model to Avro bytes.
         
         Requires fastavro package.
         
+        Args:
+            registry: Schema registry for the wire format (default:
+                ``get_schema_registry()``; none configured = plain Avro)
+            subject: Registry subject (default: ``avro_subject()``)
+        
         Returns:
             Avro-encoded bytes
         """
-        try:
-            import fastavro
-            from io import BytesIO
-        except ImportError:
-            raise ImportError(
-                "fastavro is required for Avro serialization. "
-                "Install with: pip install fastavro"
-            )
-        
-        schema = fastavro.parse_schema(self.__avro_schema__())
-        buffer = BytesIO()
-        fastavro.schemaless_writer(buffer, schema, self.model_dump())
-        return buffer.getvalue()
+        return serialize_avro(
+            self.model_dump(),
+            self.__avro_schema__(),
+            registry=registry or get_schema_registry(),
+            subject=subject,
+        )
     
     @classmethod
-    def from_avro(cls, data: bytes) -> "AvroModel":
+    def from_avro(
+        cls,
+        data: bytes,
+        *,
+        registry: SchemaRegistry | None = None,
+        writer_schema: dict[str, Any] | None = None,
+    ) -> "AvroModel":
         """
         Deserialize model from Avro bytes.
         
@@ -380,22 +695,18 @@ class AvroModel(BaseModel, metaclass=AvroModelMeta):
         
         Args:
             data: Avro-encoded bytes
+            registry: Schema registry for the wire format (default:
+                ``get_schema_registry()``)
+            writer_schema: Schema the data was written with, when it
+                differs from this model's (plain Avro only)
         
         Returns:
             Model instance
         """
-        try:
-            import fastavro
-            from io import BytesIO
-        except ImportError:
-            raise ImportError(
-                "fastavro is required for Avro deserialization. "
-                "Install with: pip install fastavro"
-            )
-        
-        schema = fastavro.parse_schema(cls.__avro_schema__())
-        buffer = BytesIO(data)
-        record = fastavro.schemaless_reader(buffer, schema)
+        registry = registry or (None if writer_schema is not None else get_schema_registry())
+        record = deserialize_avro(
+            data, cls.__avro_schema__(), registry=registry, writer_schema=writer_schema,
+        )
         return cls.model_validate(record)
 
 
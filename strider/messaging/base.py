@@ -11,6 +11,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Callable, Awaitable, TypeVar, Generic
 from datetime import datetime
+import asyncio
 import json
 import uuid
 
@@ -276,6 +277,27 @@ class Producer(ABC):
         for message in messages:
             await self.send(topic, message)
     
+    async def send_batch_with_headers(
+        self,
+        topic: str,
+        records: list[tuple[dict[str, Any], str | None, dict[str, str] | None]],
+    ) -> int:
+        """
+        Send (message, key, headers) records to a topic.
+        
+        Default implementation awaits the ``send`` calls concurrently.
+        Override for batch optimization.
+        
+        Args:
+            topic: Topic name
+            records: List of (payload, key, headers)
+        
+        Returns:
+            Number of messages sent
+        """
+        await asyncio.gather(*(self.send(topic, message, key, headers) for message, key, headers in records))
+        return len(records)
+    
     async def send_fire_and_forget(
         self,
         topic: str,
@@ -395,6 +417,26 @@ class Consumer(ABC):
     def is_running(self) -> bool:
         """Check if consumer is running."""
         return False
+    
+    async def pause(self) -> bool:
+        """
+        Stop fetching new messages (flow control).
+        
+        Returns:
+            True if the backend paused natively; False if the caller
+            must hold back on its own
+        """
+        return False
+    
+    async def resume(self) -> None:
+        """Resume fetching after ``pause()``."""
+        # Sem pausa nativa: nada a retomar
+        return None
+    
+    @property
+    def concurrent_deliveries(self) -> int:
+        """Messages handed to the handler at the same time (flow control)."""
+        return 1
 
 
 class ConsumerGroup:
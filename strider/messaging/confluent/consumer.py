@@ -33,6 +33,7 @@ class ConfluentConsumer(Consumer):
         self._running = False
         self._task: asyncio.Task | None = None
         self._db_session_factory = None
+        self._paused = False
 
     @staticmethod
     def _resolve_topics(topics: list) -> list[str]:
@@ -91,6 +92,9 @@ class ConfluentConsumer(Consumer):
                 if msg is None:
                     await asyncio.sleep(0.01)
                     continue
+                if self._paused:
+                    # Partições atribuídas por um rebalance chegam sem pausa
+                    self._consumer.pause(self._consumer.assignment())
                 if msg.error():
                     error = msg.error()
                     if error.code() != error._PARTITION_EOF:
@@ -178,6 +182,18 @@ class ConfluentConsumer(Consumer):
     def is_running(self) -> bool:
         return self._running
 
+    async def pause(self) -> bool:
+        if self._consumer is None:
+            return False
+        self._paused = True
+        self._consumer.pause(self._consumer.assignment())
+        return True
+
+    async def resume(self) -> None:
+        self._paused = False
+        if self._consumer is not None:
+            self._consumer.resume(self._consumer.assignment())
+
     async def commit(self) -> None:
         if self._consumer:
             self._consumer.commit()
@@ -232,6 +232,16 @@ class ConfluentProducer(Producer):
 
         return len(messages)
 
+    async def send_batch_with_headers(
+        self,
+        topic: str,
+        records: list[tuple[dict[str, Any], str | None, dict[str, str] | None]],
+    ) -> int:
+        for message, key, headers in records:
+            await self.send(topic, message, key=key, headers=headers, wait=False)
+        self._producer.flush()
+        return len(records)
+
     async def flush(self, timeout: float | None = None) -> int:
         if self._producer:
             return self._producer.flush(timeout=timeout or -1)
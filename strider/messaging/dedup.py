@@ -0,0 +1,435 @@
+"""
+Idempotent consumers: suppress redelivered messages by key.
+
+Rebalances, retries and producer retries redeliver messages that were
+already handled, and the handler runs its side effects again.  Workers
+with a ``dedup_key`` check a store before running the handler: a message
+whose key was already processed costs one lookup instead of a handler
+execution.
+
+Keys come from the payload or the headers:
+
+- ``"id"``, ``"data.order_id"``: dotted path into the payload;
+- ``"header:event_id"``: header of the message being handled;
+- a callable ``(message) -> str | None``.
+
+Messages without a key are always handled.  Keys are scoped by worker
+(consumer group), so two workers on the same topic both handle a message.
+
+Stores (``messaging_dedup_store``):
+
+- ``MemoryDedupStore``: LRU with TTL, per process;
+- ``RedisDedupStore``: ``SET key 1 NX PX ttl``, shared by every replica;
+- ``DatabaseDedupStore``: ``admin_processed_messages``, keys written in
+  batched upserts.
+
+A key is recorded only after the handler succeeds; while a message is
+being handled its key is held in memory, so a redelivery arriving
+meanwhile is also suppressed.  A message sent to the retry topic keeps
+its key held until the retry resolves (or ``retry delay + HOLD_GRACE``
+passes, should the retry be consumed by another replica); the retry
+itself takes the key over instead of being suppressed by it.  Messages
+that end in the DLQ are not recorded.
+
+Example:
+    class ChargeWorker(Worker):
+        input_topic = "payments"
+        dedup_key = "header:event_id"
+        dedup_store = "redis"
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable
+import hashlib
+import logging
+import time
+
+from strider.messaging.tracking import current_message
+
+
+logger = logging.getLogger(__name__)
+
+KeySpec = str | Callable[[dict[str, Any]], Any]
+
+# Segundos além do delay do retry em que a chave continua retida
+HOLD_GRACE = 300.0
+
+
+class DedupStore(ABC):
+    """Record of processed message keys."""
+
+    @abstractmethod
+    async def contains(self, key: str) -> bool:
+        """Whether *key* was processed within the TTL."""
+        ...
+
+    @abstractmethod
+    async def add(self, keys: list[str]) -> None:
+        """Record *keys* as processed."""
+        ...
+
+    async def flush(self) -> None:
+        """Write buffered keys (stores that batch)."""
+        # Stores sem buffer: nada a gravar
+        return None
+
+    async def close(self) -> None:
+        await self.flush()
+
+
+class MemoryDedupStore(DedupStore):
+    """
+    Per-process LRU of processed keys.
+
+    Args:
+        ttl: Seconds a key suppresses redeliveries
+        max_keys: Keys kept; the least recently seen are evicted first
+        clock: Monotonic clock in seconds (tests)
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 86400,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_keys = max(max_keys, 1)
+        self.clock = clock
+        # key -> expira em (ordem = LRU)
+        self._keys: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    async def contains(self, key: str) -> bool:
+        expires = self._keys.get(key)
+        if expires is None:
+            return False
+        if expires <= self.clock():
+            del self._keys[key]
+            return False
+        self._keys.move_to_end(key)
+        return True
+
+    async def add(self, keys: list[str]) -> None:
+        expires = self.clock() + self.ttl
+        for key in keys:
+            self._keys[key] = expires
+            self._keys.move_to_end(key)
+        while len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+
+
+class RedisDedupStore(DedupStore):
+    """
+    Processed keys in Redis, shared by every worker replica.
+
+    Keys are written with ``SET NX PX`` (one pipeline per batch) and
+    expire on their own after *ttl*.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 86400,
+        url: str | None = None,
+        prefix: str = "strider:dedup:",
+        client: Any = None,
+    ) -> None:
+        self.ttl = ttl
+        self.url = url
+        self.prefix = prefix
+        self._client = client
+
+    async def connect(self) -> Any:
+        if self._client is None:
+            from strider.messaging.redis.connection import create_redis_client
+            self._client = await create_redis_client(url=self.url)
+        return self._client
+
+    async def contains(self, key: str) -> bool:
+        client = await self.connect()
+        return bool(await client.exists(self.prefix + key))
+
+    async def add(self, keys: list[str]) -> None:
+        client = await self.connect()
+        ttl_ms = int(self.ttl * 1000)
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(self.prefix + key, 1, nx=True, px=ttl_ms)
+            await pipe.execute()
+
+
+class DatabaseDedupStore(DedupStore):
+    """
+    Processed keys in ``admin_processed_messages``.
+
+    Keys are buffered and written as one upsert when ``batch_size`` is
+    reached or ``flush_interval`` has passed; buffered keys already count
+    for ``contains``.  Keys buffered when the process dies are lost, and
+    their messages may be handled again.
+
+    Args:
+        session_factory: Session factory (default: ``strider.models.get_session``)
+        ttl: Seconds a key suppresses redeliveries
+        batch_size: Buffered keys that trigger a write
+        flush_interval: Maximum seconds a key stays buffered while keys
+            keep arriving
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Any] | None = None,
+        ttl: float = 86400,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self.ttl = ttl
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self._pending: dict[str, Any] = {}
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _column_key(key: str) -> str:
+        # A coluna tem 255 caracteres; chaves maiores viram hash
+        if len(key) <= 255:
+            return key
+        return "sha256:" + hashlib.sha256(key.encode()).hexdigest()
+
+    async def contains(self, key: str) -> bool:
+        from datetime import timedelta
+        from sqlalchemy import select
+        from strider.admin.models import ProcessedMessage
+        from strider.datetime import timezone
+
+        key = self._column_key(key)
+        if key in self._pending:
+            return True
+        cutoff = timezone.now() - timedelta(seconds=self.ttl)
+        db = await self._session()
+        async with db:
+            found = await db.execute(
+                select(ProcessedMessage.id).where(
+                    ProcessedMessage.key == key,
+                    ProcessedMessage.created_at >= cutoff,
+                )
+            )
+            return found.first() is not None
+
+    async def add(self, keys: list[str]) -> None:
+        from strider.datetime import timezone
+
+        now = timezone.now()
+        for key in keys:
+            self._pending[self._column_key(key)] = now
+        if len(self._pending) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        from strider.admin.models import ProcessedMessage
+
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        rows = [{"key": key, "created_at": created_at} for key, created_at in batch.items()]
+        try:
+            db = await self._session()
+            async with db:
+                # Upsert: chave expirada vista de novo renova o created_at
+                await ProcessedMessage.objects.using(db).bulk_create(
+                    rows,
+                    batch_size=self.batch_size,
+                    update_conflicts=True,
+                    unique_fields=["key"],
+                    update_fields=["created_at"],
+                    hydrate=False,
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning("Failed to record %d processed message key(s): %s", len(batch), e)
+            batch.update(self._pending)
+            self._pending = batch
+
+    async def purge(self) -> int:
+        """Delete keys older than the TTL.  Returns how many."""
+        from datetime import timedelta
+        from sqlalchemy import delete
+        from strider.admin.models import ProcessedMessage
+        from strider.datetime import timezone
+
+        cutoff = timezone.now() - timedelta(seconds=self.ttl)
+        db = await self._session()
+        async with db:
+            result = await db.execute(delete(ProcessedMessage).where(ProcessedMessage.created_at < cutoff))
+            await db.commit()
+        return result.rowcount or 0
+
+    async def _session(self) -> Any:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from strider.models import get_session
+        return await get_session()
+
+
+def create_dedup_store(backend: str | None = None) -> DedupStore:
+    """
+    Build the store selected by *backend* or ``settings.messaging_dedup_store``.
+    """
+    from strider.config import get_settings
+
+    settings = get_settings()
+    backend = backend or settings.messaging_dedup_store
+    ttl = settings.messaging_dedup_ttl
+    if backend == "memory":
+        return MemoryDedupStore(ttl=ttl, max_keys=settings.messaging_dedup_max_keys)
+    if backend == "redis":
+        return RedisDedupStore(ttl=ttl, url=settings.redis_url)
+    if backend == "database":
+        return DatabaseDedupStore(ttl=ttl, batch_size=settings.messaging_dedup_batch_size)
+    raise ValueError(f"Unknown dedup store '{backend}'. Use memory, redis or database")
+
+
+def key_getter(spec: KeySpec) -> Callable[[dict[str, Any]], str | None]:
+    """Turn a ``dedup_key`` spec into ``(message) -> key or None``."""
+    if callable(spec):
+        def from_callable(message: dict[str, Any]) -> str | None:
+            value = spec(message)
+            return None if value is None else str(value)
+        return from_callable
+
+    if spec.startswith("header:"):
+        name = spec[len("header:"):]
+
+        def from_header(message: dict[str, Any]) -> str | None:
+            incoming = current_message()
+            value = (incoming.headers or {}).get(name) if incoming else None
+            return None if value is None else str(value)
+        return from_header
+
+    path = spec.split(".")
+
+    def from_payload(message: dict[str, Any]) -> str | None:
+        value: Any = message
+        for part in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return None if value is None else str(value)
+    return from_payload
+
+
+class Deduplicator:
+    """
+    Dedup check for one worker.
+
+    Args:
+        store: Processed-key store
+        key: Key spec (payload path, ``"header:<name>"`` or callable)
+        scope: Prefix isolating this worker's keys (usually the group id)
+    """
+
+    def __init__(self, store: DedupStore, key: KeySpec, *, scope: str = "") -> None:
+        self.store = store
+        self.scope = scope
+        self._get_key = key_getter(key)
+        # Chaves em processamento
+        self._inflight: set[str] = set()
+        # Chaves aguardando retry -> prazo (monotonic)
+        self._held: dict[str, float] = {}
+
+        self.checked = 0
+        self.hits = 0
+        self.errors = 0
+
+    def key_for(self, message: dict[str, Any]) -> str | None:
+        try:
+            key = self._get_key(message)
+        except Exception as e:
+            logger.warning(f"Could not derive dedup key: {e}")
+            return None
+        return None if key is None else f"{self.scope}:{key}"
+
+    async def is_duplicate(self, key: str) -> bool:
+        """
+        Check *key*; if it is new, hold it as in-flight until
+        ``processed()`` or ``release()``.  Store errors fail open.
+        """
+        self.checked += 1
+        if key in self._inflight or self._is_held(key):
+            self.hits += 1
+            return True
+        try:
+            seen = await self.store.contains(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Dedup lookup failed, handling message: {e}")
+            seen = False
+        if seen:
+            self.hits += 1
+            return True
+        self._inflight.add(key)
+        return False
+
+    def _is_held(self, key: str) -> bool:
+        deadline = self._held.get(key)
+        if deadline is None:
+            return False
+        if deadline <= time.monotonic():
+            del self._held[key]
+            return False
+        return True
+
+    def hold(self, keys: list[str], delay: float) -> None:
+        """
+        Keep in-flight *keys* held while their messages wait for a retry
+        due in *delay* seconds; redeliveries stay suppressed until the
+        retry takes them over with ``resume()`` or ``HOLD_GRACE`` passes.
+        """
+        self._inflight.difference_update(keys)
+        deadline = time.monotonic() + delay + HOLD_GRACE
+        for key in keys:
+            self._held[key] = deadline
+
+    def resume(self, key: str) -> bool:
+        """Move a held *key* back to in-flight for its retry. False if not held."""
+        if not self._is_held(key):
+            return False
+        del self._held[key]
+        self._inflight.add(key)
+        return True
+
+    async def processed(self, keys: list[str]) -> None:
+        """Record *keys* as handled."""
+        self._inflight.difference_update(keys)
+        try:
+            await self.store.add(keys)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Failed to record {len(keys)} dedup key(s): {e}")
+
+    def release(self, keys: list[str]) -> None:
+        """Forget in-flight *keys* without recording them (handler gave up)."""
+        self._inflight.difference_update(keys)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "dedup_checked": self.checked,
+            "dedup_hits": self.hits,
+            "dedup_hit_rate": round(self.hits / self.checked, 4) if self.checked else 0.0,
+            "dedup_errors": self.errors,
+        }
+
+    async def close(self) -> None:
+        try:
+            await self.store.close()
+        except Exception as e:
+            logger.warning(f"Failed to close dedup store: {e}")
@@ -0,0 +1,174 @@
+"""
+Flow control for message consumers.
+
+Without backpressure a consumer keeps fetching while handlers slow down,
+and everything accepted but not finished (concurrent deliveries, batches
+waiting to fill) accumulates in memory.
+
+``FlowController`` counts in-flight messages and bytes against two
+watermarks:
+
+- reaching a high watermark pauses the source (``on_pause``);
+- dropping below both low watermarks resumes it (``on_resume``).
+
+The gap between the watermarks avoids flapping.  ``on_pause`` returns
+whether the source paused natively (Kafka partitions, Redis reads,
+RabbitMQ deliveries); when it did not, ``acquire()`` itself blocks the
+caller until the backlog drains.
+
+Example:
+    flow = FlowController(
+        high_messages=1000,
+        low_messages=500,
+        on_pause=consumer.pause,
+        on_resume=consumer.resume,
+    )
+
+    async def handle(message):
+        await flow.acquire(size)
+        try:
+            ...
+        finally:
+            await flow.release(size=size)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable
+import asyncio
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class FlowController:
+    """
+    High/low watermarks on in-flight messages and bytes.
+
+    Args:
+        high_messages: In-flight messages that pause the source (0 disables)
+        low_messages: In-flight messages below which it resumes (default: half)
+        high_bytes: In-flight bytes that pause the source (0 disables)
+        low_bytes: In-flight bytes below which it resumes (default: half)
+        on_pause: ``async () -> bool`` pausing the source; ``True`` if it
+            paused natively
+        on_resume: ``async () -> None`` resuming the source
+        clock: Monotonic clock in seconds (tests)
+    """
+
+    def __init__(
+        self,
+        *,
+        high_messages: int = 1000,
+        low_messages: int | None = None,
+        high_bytes: int = 0,
+        low_bytes: int | None = None,
+        on_pause: Callable[[], Awaitable[Any]] | None = None,
+        on_resume: Callable[[], Awaitable[Any]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.high_messages = max(high_messages, 0)
+        self.low_messages = self.high_messages // 2 if low_messages is None else min(low_messages, self.high_messages)
+        self.high_bytes = max(high_bytes, 0)
+        self.low_bytes = self.high_bytes // 2 if low_bytes is None else min(low_bytes, self.high_bytes)
+        self._on_pause = on_pause
+        self._on_resume = on_resume
+        self.clock = clock
+
+        self.inflight = 0
+        self.inflight_bytes = 0
+        self._paused = False
+        self._blocking = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        self._paused_since = 0.0
+
+        self.pauses = 0
+        self.paused_seconds = 0.0
+        self.max_inflight = 0
+
+    @property
+    def tracks_bytes(self) -> bool:
+        """Whether callers need to report message sizes."""
+        return self.high_bytes > 0
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def metrics(self) -> dict[str, Any]:
+        paused_seconds = self.paused_seconds
+        if self._paused:
+            paused_seconds += self.clock() - self._paused_since
+        return {
+            "flow_inflight": self.inflight,
+            "flow_inflight_bytes": self.inflight_bytes,
+            "flow_max_inflight": self.max_inflight,
+            "flow_paused": self._paused,
+            "flow_pauses": self.pauses,
+            "flow_paused_seconds": round(paused_seconds, 3),
+        }
+
+    def _above_high(self) -> bool:
+        return (
+            (self.high_messages > 0 and self.inflight >= self.high_messages)
+            or (self.high_bytes > 0 and self.inflight_bytes >= self.high_bytes)
+        )
+
+    def _below_low(self) -> bool:
+        return (
+            (self.high_messages == 0 or self.inflight <= self.low_messages)
+            and (self.high_bytes == 0 or self.inflight_bytes <= self.low_bytes)
+        )
+
+    async def acquire(self, size: int = 0) -> None:
+        """
+        Account one message of *size* bytes.  Waits while the source is
+        paused without native support.
+        """
+        while self._paused and self._blocking:
+            await self._resumed.wait()
+        self.inflight += 1
+        self.inflight_bytes += size
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        if not self._paused and self._above_high():
+            await self._pause()
+
+    async def release(self, count: int = 1, size: int = 0) -> None:
+        """Account *count* finished messages totalling *size* bytes."""
+        self.inflight = max(self.inflight - count, 0)
+        self.inflight_bytes = max(self.inflight_bytes - size, 0)
+        if self._paused and self._below_low():
+            await self._resume()
+
+    async def _pause(self) -> None:
+        self._paused = True
+        self._resumed.clear()
+        self._paused_since = self.clock()
+        self.pauses += 1
+        native = False
+        if self._on_pause is not None:
+            try:
+                native = bool(await self._on_pause())
+            except Exception as e:
+                logger.warning(f"Could not pause consumer: {e}")
+        # on_pause pode ter liberado mensagens e já retomado
+        if self._paused:
+            self._blocking = not native
+        logger.info(
+            f"Flow control: paused at {self.inflight} message(s) / {self.inflight_bytes} byte(s) in flight"
+        )
+
+    async def _resume(self) -> None:
+        self._paused = False
+        self._blocking = False
+        self.paused_seconds += self.clock() - self._paused_since
+        if self._on_resume is not None:
+            try:
+                await self._on_resume()
+            except Exception as e:
+                logger.warning(f"Could not resume consumer: {e}")
+        self._resumed.set()
+        logger.info(f"Flow control: resumed at {self.inflight} message(s) in flight")
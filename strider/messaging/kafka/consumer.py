@@ -35,6 +35,7 @@ class KafkaConsumer(Consumer):
         self._running = False
         self._task: asyncio.Task | None = None
         self._db_session_factory = None
+        self._paused = False
 
     @staticmethod
     def _resolve_topics(topics: list) -> list[str]:
@@ -102,11 +103,26 @@ class KafkaConsumer(Consumer):
     def is_running(self) -> bool:
         return self._running
 
+    async def pause(self) -> bool:
+        if self._consumer is None:
+            return False
+        self._paused = True
+        self._consumer.pause(*self._consumer.assignment())
+        return True
+
+    async def resume(self) -> None:
+        self._paused = False
+        if self._consumer is not None:
+            self._consumer.resume(*self._consumer.paused())
+
     async def _consume_loop(self) -> None:
         try:
             async for message in self._consumer:
                 if not self._running:
                     break
+                if self._paused:
+                    # Partições atribuídas por um rebalance chegam sem pausa
+                    self._consumer.pause(*self._consumer.assignment())
                 try:
                     await self._track_message(message)
                     await self.process_message(message.value)
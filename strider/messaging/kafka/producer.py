@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Any
+import asyncio
 import json
 
 from strider.messaging.base import Producer, Event
@@ -157,6 +158,19 @@ class KafkaProducer(Producer):
 
         return len(messages)
 
+    async def send_batch_with_headers(
+        self,
+        topic: str,
+        records: list[tuple[dict[str, Any], str | None, dict[str, str] | None]],
+    ) -> int:
+        # Enfileira em ordem no acumulador e espera todas as entregas juntas
+        deliveries = [
+            await self.send(topic, message, key=key, headers=headers, wait=False)
+            for message, key, headers in records
+        ]
+        await asyncio.gather(*deliveries)
+        return len(records)
+
     async def send_batch_fire_and_forget(self, topic: str, messages: list[dict[str, Any]]) -> int:
         if not self._started:
             await self.start()
@@ -0,0 +1,328 @@
+"""
+Transactional outbox for messaging.
+
+Calling ``publish``/``publish_event`` right after saving a model costs a
+broker round trip inside the request, and the two writes are not atomic:
+the commit can succeed while the publish fails (lost event), or the
+publish can succeed while the transaction rolls back (phantom event).
+
+With the outbox, the message is written to ``admin_outbox_messages`` in
+the same ``AsyncSession`` as the model, so it is committed (or rolled
+back) together with it.  ``OutboxRelay`` publishes the table afterwards:
+
+- rows are read in ``id`` order, ``batch_size`` at a time;
+- each batch is grouped by topic; consecutive plain messages go out with
+  ``send_batch`` and consecutive messages with a key or headers (every
+  ``enqueue_event`` row) with ``send_batch_with_headers``, in order;
+- published rows get ``delivered_at``; a failed topic keeps its rows
+  pending (``attempts``/``last_error``) and stops there, so later rows of
+  the same topic are not published ahead of it;
+- rows that fail ``max_attempts`` times are left for inspection.
+
+Delivery is at-least-once: a relay that crashes between publishing and
+committing ``delivered_at`` publishes the batch again.
+
+Example:
+    async with await get_session() as db:
+        order = Order(customer_id=1, total=10)
+        db.add(order)
+        await db.flush()
+        enqueue_event(db, "order.created", {"order_id": order.id}, topic="orders")
+        await db.commit()
+
+    # Processo separado (core outbox-relay) ou task da aplicação
+    relay = OutboxRelay()
+    await relay.start()
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any, Callable, TYPE_CHECKING
+import asyncio
+import json
+import logging
+
+from strider.messaging.registry import resolve_topic
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from strider.admin.models import OutboxMessage
+
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(
+    db: "AsyncSession",
+    topic: str | type,
+    data: dict[str, Any] | Any,
+    *,
+    key: str | None = None,
+    headers: dict[str, str] | None = None,
+) -> "OutboxMessage":
+    """
+    Add a message to the outbox in *db*'s transaction.
+
+    Same arguments as ``publish`` (``Topic`` classes validate *data*).
+    Nothing is sent and nothing is committed: the message becomes visible
+    to the relay when the caller commits *db*.
+    """
+    from strider.admin.models import OutboxMessage
+
+    topic_name, data = resolve_topic(topic, data)
+    message = OutboxMessage(
+        topic=topic_name,
+        key=key,
+        payload_json=json.dumps(data, default=str),
+        headers_json=json.dumps(headers) if headers else None,
+        attempts=0,
+    )
+    db.add(message)
+    return message
+
+
+def enqueue_event(
+    db: "AsyncSession",
+    event_name: str,
+    data: dict[str, Any],
+    *,
+    topic: str | None = None,
+    key: str | None = None,
+    source: str | None = None,
+) -> "OutboxMessage":
+    """
+    Outbox version of ``publish_event``: same ``Event`` envelope and
+    headers, written in *db*'s transaction.
+    """
+    from strider.config import get_settings
+    from strider.messaging.base import Event
+
+    settings = get_settings()
+    event = Event(
+        name=event_name,
+        data=data,
+        source=source or settings.messaging_event_source,
+    )
+    headers = {"event_name": event.name, "event_id": event.id, "event_source": event.source}
+    return enqueue(
+        db,
+        topic or settings.messaging_default_topic,
+        event.to_dict(),
+        key=key,
+        headers=headers,
+    )
+
+
+def _is_plain(row: "OutboxMessage") -> bool:
+    """Payload only: fits ``send_batch``."""
+    return row.key is None and row.headers_json is None
+
+
+class OutboxRelay:
+    """
+    Publishes pending outbox rows through a producer.
+
+    Several relays can run at the same time: rows are locked with
+    ``FOR UPDATE SKIP LOCKED`` where the database supports it.  Ordering
+    per topic is only guaranteed with a single relay.
+
+    Args:
+        producer: Producer with ``send``/``send_batch`` (default:
+            ``get_producer()``)
+        session_factory: Session factory (default: ``strider.models.get_session``)
+        batch_size: Rows read and published per batch
+        poll_interval: Seconds to wait when the outbox has no full batch
+        max_attempts: Failed publishes before a row is left pending
+    """
+
+    def __init__(
+        self,
+        producer: Any = None,
+        *,
+        session_factory: Callable[[], Any] | None = None,
+        batch_size: int | None = None,
+        poll_interval: float | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        from strider.config import get_settings
+
+        settings = get_settings()
+        self._producer = producer
+        self._session_factory = session_factory
+        self.batch_size = max(batch_size or settings.messaging_outbox_batch_size, 1)
+        self.poll_interval = (
+            poll_interval if poll_interval is not None else settings.messaging_outbox_poll_interval
+        )
+        self.max_attempts = max_attempts or settings.messaging_outbox_max_attempts
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._running = False
+
+        self.relayed = 0
+        self.failed = 0
+        self.batches = 0
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "outbox_relayed": self.relayed,
+            "outbox_failed": self.failed,
+            "outbox_batches": self.batches,
+        }
+
+    def notify(self) -> None:
+        """Wake the relay now (e.g. right after committing outbox rows)."""
+        self._wakeup.set()
+
+    async def relay_once(self) -> int:
+        """Publish one batch.  Returns how many rows were delivered."""
+        from sqlalchemy import select, update
+        from strider.admin.models import OutboxMessage
+        from strider.datetime import timezone
+
+        db = await self._session()
+        async with db:
+            rows = (
+                await db.execute(
+                    select(OutboxMessage)
+                    .where(
+                        OutboxMessage.delivered_at.is_(None),
+                        OutboxMessage.attempts < self.max_attempts,
+                    )
+                    .order_by(OutboxMessage.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).scalars().all()
+            if not rows:
+                return 0
+
+            delivered, errors = await self._publish(rows)
+
+            if delivered:
+                await db.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id.in_(delivered))
+                    .values(delivered_at=timezone.now())
+                )
+            for error, ids in errors.items():
+                await db.execute(
+                    update(OutboxMessage)
+                    .where(OutboxMessage.id.in_(ids))
+                    .values(attempts=OutboxMessage.attempts + 1, last_error=error[:1000])
+                )
+            await db.commit()
+
+        self.batches += 1
+        self.relayed += len(delivered)
+        self.failed += sum(len(ids) for ids in errors.values())
+        return len(delivered)
+
+    async def _publish(self, rows: list["OutboxMessage"]) -> tuple[list[int], dict[str, list[int]]]:
+        """Publish *rows* per topic.  Returns (delivered ids, error -> ids)."""
+        producer = self._producer
+        if producer is None:
+            from strider.messaging import get_producer
+            producer = self._producer = get_producer()
+        if hasattr(producer, "_started") and not producer._started:
+            await producer.start()
+
+        by_topic: dict[str, list["OutboxMessage"]] = {}
+        for row in rows:
+            by_topic.setdefault(row.topic, []).append(row)
+
+        delivered: list[int] = []
+        errors: dict[str, list[int]] = {}
+        for topic, messages in by_topic.items():
+            sent = 0
+            try:
+                while sent < len(messages):
+                    # Sequência de mensagens do mesmo tipo (simples ou com key/headers): um envio
+                    plain = _is_plain(messages[sent])
+                    end = sent + 1
+                    while end < len(messages) and _is_plain(messages[end]) == plain:
+                        end += 1
+                    chunk = messages[sent:end]
+                    if plain:
+                        await producer.send_batch(topic, [json.loads(m.payload_json) for m in chunk])
+                    else:
+                        await producer.send_batch_with_headers(topic, [
+                            (
+                                json.loads(m.payload_json),
+                                m.key,
+                                json.loads(m.headers_json) if m.headers_json else None,
+                            )
+                            for m in chunk
+                        ])
+                    delivered.extend(m.id for m in chunk)
+                    sent = end
+            except Exception as e:
+                logger.error(f"Outbox publish to '{topic}' failed ({len(messages) - sent} pending): {e}")
+                errors.setdefault(str(e) or type(e).__name__, []).extend(m.id for m in messages[sent:])
+        return delivered, errors
+
+    async def purge_delivered(self, older_than: timedelta) -> int:
+        """Delete rows delivered more than *older_than* ago.  Returns how many."""
+        from sqlalchemy import delete
+        from strider.admin.models import OutboxMessage
+        from strider.datetime import timezone
+
+        db = await self._session()
+        async with db:
+            result = await db.execute(
+                delete(OutboxMessage).where(OutboxMessage.delivered_at < timezone.now() - older_than)
+            )
+            await db.commit()
+        return result.rowcount or 0
+
+    async def run(self) -> None:
+        """Relay until ``stop()``; full batches are followed immediately."""
+        self._running = True
+        while self._running:
+            self._wakeup.clear()
+            try:
+                relayed = await self.relay_once()
+            except Exception as e:
+                logger.error(f"Outbox relay error: {e}")
+                relayed = 0
+            if relayed < self.batch_size and self._running:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def stop(self) -> None:
+        self._running = False
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Run the relay in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="outbox-relay")
+
+    async def close(self) -> None:
+        """Stop the background task after the batch in progress."""
+        self.stop()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _session(self) -> Any:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from strider.models import get_session
+        return await get_session()
+
+
+async def run_outbox_relay() -> None:
+    """
+    Run the outbox relay until interrupted.
+
+    Convenience function for CLI.  Initializes the database from
+    ``settings.database_url`` first, as the task scheduler and worker do.
+    """
+    from strider.config import get_settings
+    from strider.models import init_database
+
+    await init_database(get_settings().database_url)
+    await OutboxRelay().run()
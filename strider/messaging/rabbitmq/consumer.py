@@ -14,7 +14,14 @@ logger = logging.getLogger(__name__)
 
 
 class RabbitMQConsumer(Consumer):
-    """RabbitMQ consumer with automatic event tracking."""
+    """
+    RabbitMQ consumer with automatic event tracking.
+
+    ``prefetch_count`` (default: ``settings.rabbitmq_prefetch_count``)
+    bounds the unacknowledged deliveries held by this consumer, which is
+    RabbitMQ's native flow control; ``pause()`` cancels the subscription
+    and ``resume()`` subscribes again.
+    """
 
     def __init__(
         self,
@@ -22,6 +29,7 @@ class RabbitMQConsumer(Consumer):
         topics: list[str],
         url: str | None = None,
         message_handler: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+        prefetch_count: int | None = None,
         **kwargs: Any,
     ):
         self._settings = get_settings()
@@ -29,6 +37,7 @@ class RabbitMQConsumer(Consumer):
         self.topics = topics
         self._url = url or self._settings.rabbitmq_url
         self._message_handler = message_handler
+        self.prefetch_count = prefetch_count or getattr(self._settings, "rabbitmq_prefetch_count", 10)
         self._extra_config = kwargs
         self._connection = None
         self._channel = None
@@ -44,7 +53,7 @@ class RabbitMQConsumer(Consumer):
         import aio_pika
         self._connection = await aio_pika.connect_robust(self._url)
         self._channel = await self._connection.channel()
-        await self._channel.set_qos(prefetch_count=self._settings.rabbitmq_prefetch_count)
+        await self._channel.set_qos(prefetch_count=self.prefetch_count)
 
         exchange = await self._channel.declare_exchange(
             self._settings.rabbitmq_exchange,
@@ -75,6 +84,23 @@ class RabbitMQConsumer(Consumer):
     def is_running(self) -> bool:
         return self._running
 
+    @property
+    def concurrent_deliveries(self) -> int:
+        # aio-pika roda um callback por entrega, até o prefetch sem ACK
+        return self.prefetch_count
+
+    async def pause(self) -> bool:
+        if self._queue is None or self._consumer_tag is None:
+            return False
+        # basic.cancel: entregas não confirmadas continuam com este consumer
+        await self._queue.cancel(self._consumer_tag)
+        self._consumer_tag = None
+        return True
+
+    async def resume(self) -> None:
+        if self._queue is not None and self._consumer_tag is None and self._running:
+            self._consumer_tag = await self._queue.consume(self._on_message)
+
     async def _on_message(self, message) -> None:
         async with message.process():
             try:
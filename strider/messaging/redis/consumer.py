@@ -1,4 +1,18 @@
-"""Redis Streams consumer."""
+"""
+Redis Streams consumer.
+
+Entries are read with ``XREADGROUP`` and acknowledged in batches (one
+pipelined ``XACK`` per read).  An entry whose processing fails stays in
+the group's pending entries list (PEL); a periodic ``XAUTOCLAIM`` sweep
+takes over entries idle for longer than ``min_idle_ms`` — left by failed
+attempts or by consumers that crashed — and redelivers them.  Entries
+delivered more than ``max_deliveries`` times are moved to the dead-letter
+stream and acknowledged.
+
+The same sweep removes consumers of the group that have been idle for
+``stale_ms`` with nothing pending, and ``stop()`` removes this consumer's
+own name when it leaves nothing pending behind.
+"""
 
 from __future__ import annotations
 
@@ -6,6 +20,10 @@ from typing import Any, Callable, Awaitable
 import json
 import asyncio
 import logging
+import os
+import socket
+import time
+import uuid
 
 from strider.messaging.base import Consumer, Event
 from strider.config import get_settings
@@ -13,9 +31,31 @@ from strider.messaging.registry import get_event_handlers
 
 logger = logging.getLogger(__name__)
 
+# Cursor de XAUTOCLAIM que indica fim da varredura
+_END_CURSORS = ("0-0", b"0-0")
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
 
 class RedisConsumer(Consumer):
-    """Redis Streams consumer with automatic event tracking."""
+    """
+    Redis Streams consumer with automatic event tracking.
+
+    Args:
+        group_id: Consumer group
+        topics: Streams to consume
+        redis_url: Redis URL (default: ``settings.redis_url``)
+        message_handler: Handler for every message (default: registry handlers)
+        consumer_name: Name inside the group (default: ``group:host:pid:random``)
+        claim_interval: Seconds between ``XAUTOCLAIM`` sweeps (0 disables recovery)
+        min_idle_ms: Idle time before a pending entry can be claimed
+        max_deliveries: Deliveries before dead-lettering (0 = unlimited)
+        dead_letter_stream: Dead-letter stream (default: ``settings.messaging_dead_letter_topic``)
+        stale_ms: Idle time after which consumers with nothing pending are removed (0 disables)
+        client: Existing Redis client (not closed on ``stop()``)
+    """
 
     def __init__(
         self,
@@ -24,25 +64,53 @@ class RedisConsumer(Consumer):
         redis_url: str | None = None,
         message_handler: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
         consumer_name: str | None = None,
+        *,
+        claim_interval: float | None = None,
+        min_idle_ms: int | None = None,
+        max_deliveries: int | None = None,
+        dead_letter_stream: str | None = None,
+        stale_ms: int | None = None,
+        client: Any = None,
         **kwargs: Any,
     ):
         self._settings = get_settings()
+        settings = self._settings
         self.group_id = group_id
         self.topics = topics
-        self._redis_url = redis_url or self._settings.redis_url
+        self._redis_url = redis_url or settings.redis_url
         self._message_handler = message_handler
-        self._consumer_name = consumer_name or f"{group_id}-{id(self)}"
+        self._consumer_name = consumer_name or (
+            f"{group_id}:{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        )
+        self.claim_interval = (
+            settings.redis_consumer_claim_interval if claim_interval is None else claim_interval
+        )
+        self.min_idle_ms = settings.redis_consumer_min_idle_ms if min_idle_ms is None else min_idle_ms
+        self.max_deliveries = (
+            settings.redis_consumer_max_deliveries if max_deliveries is None else max_deliveries
+        )
+        self.dead_letter_stream = dead_letter_stream or settings.messaging_dead_letter_topic
+        self.stale_ms = settings.redis_consumer_stale_ms if stale_ms is None else stale_ms
         self._extra_config = kwargs
-        self._redis = None
+        self._redis = client
+        self._owns_client = client is None
         self._running = False
         self._task: asyncio.Task | None = None
+        self._last_claim = 0.0
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+
+    @property
+    def consumer_name(self) -> str:
+        return self._consumer_name
 
     async def start(self) -> None:
         if self._running:
             return
 
-        from strider.messaging.redis.connection import create_redis_client
-        self._redis = await create_redis_client(url=self._redis_url, **self._extra_config)
+        if self._redis is None:
+            from strider.messaging.redis.connection import create_redis_client
+            self._redis = await create_redis_client(url=self._redis_url, **self._extra_config)
 
         for topic in self.topics:
             try:
@@ -52,6 +120,7 @@ class RedisConsumer(Consumer):
                     raise
 
         self._running = True
+        self._last_claim = 0.0
         self._task = asyncio.create_task(self._consume_loop())
         logger.info(f"Redis consumer '{self.group_id}' started, streams: {self.topics}")
 
@@ -65,39 +134,182 @@ class RedisConsumer(Consumer):
                 pass
             self._task = None
         if self._redis:
-            await self._redis.close()
+            try:
+                await self._release_consumer_name()
+            except Exception as e:
+                logger.warning(f"Could not remove consumer '{self._consumer_name}': {e}")
+            if self._owns_client:
+                await self._redis.close()
             self._redis = None
         logger.info(f"Redis consumer '{self.group_id}' stopped")
 
     def is_running(self) -> bool:
         return self._running
 
+    async def pause(self) -> bool:
+        # Para de emitir XREADGROUP; o que já foi lido segue no PEL
+        self._resumed.clear()
+        return True
+
+    async def resume(self) -> None:
+        self._resumed.set()
+
     async def _consume_loop(self) -> None:
-        streams = {topic: ">" for topic in self.topics}
         while self._running:
             try:
-                messages = await self._redis.xreadgroup(
-                    self.group_id,
-                    self._consumer_name,
-                    streams,
-                    count=self._settings.redis_consumer_count,
-                    block=self._settings.redis_consumer_block_ms,
-                )
-                if not messages:
-                    continue
-                for stream, entries in messages:
-                    for entry_id, entry_data in entries:
-                        try:
-                            await self._process_entry(stream, entry_id, entry_data)
-                            await self._redis.xack(stream, self.group_id, entry_id)
-                        except Exception as e:
-                            logger.error(f"Error processing message: {e}")
+                await self._resumed.wait()
+                await self.poll()
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Consumer loop error: {e}")
                 await asyncio.sleep(1)
 
+    async def poll(self) -> int:
+        """
+        One consume iteration: the recovery sweep when due, then one
+        ``XREADGROUP`` batch.  Returns the number of new entries read.
+        """
+        if self.claim_interval and time.monotonic() - self._last_claim >= self.claim_interval:
+            self._last_claim = time.monotonic()
+            await self.claim_pending()
+
+        messages = await self._redis.xreadgroup(
+            self.group_id,
+            self._consumer_name,
+            {topic: ">" for topic in self.topics},
+            count=self._settings.redis_consumer_count,
+            block=self._settings.redis_consumer_block_ms,
+        )
+        read = 0
+        for stream, entries in messages or ():
+            read += len(entries)
+            await self._handle_entries(stream, entries)
+        return read
+
+    async def _handle_entries(
+        self,
+        stream: Any,
+        entries: list[tuple[Any, dict]],
+        dead: set[Any] = frozenset(),
+    ) -> None:
+        """Process *entries* and acknowledge the successful ones in one ``XACK``."""
+        acked: list[Any] = []
+        try:
+            for entry_id, entry_data in entries:
+                if entry_id in dead:
+                    await self._dead_letter(stream, entry_id, entry_data)
+                    acked.append(entry_id)
+                    continue
+                try:
+                    await self._process_entry(stream, entry_id, entry_data)
+                    acked.append(entry_id)
+                except Exception as e:
+                    # Fica pendente; volta via XAUTOCLAIM após min_idle_ms
+                    logger.error(f"Error processing message {_text(entry_id)}: {e}")
+        finally:
+            await self._ack({stream: acked})
+
+    async def _ack(self, acks: dict[Any, list[Any]]) -> None:
+        """Acknowledge entries of several streams in a single round trip."""
+        acks = {stream: ids for stream, ids in acks.items() if ids}
+        if not acks:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for stream, ids in acks.items():
+                pipe.xack(stream, self.group_id, *ids)
+            await pipe.execute()
+
+    async def claim_pending(self) -> int:
+        """
+        Claim and process entries idle for ``min_idle_ms`` in every stream.
+
+        Returns the number of entries claimed.
+        """
+        claimed = 0
+        count = self._settings.redis_consumer_count
+        for stream in self.topics:
+            cursor: Any = "0-0"
+            while True:
+                reply = await self._redis.xautoclaim(
+                    stream,
+                    self.group_id,
+                    self._consumer_name,
+                    min_idle_time=self.min_idle_ms,
+                    start_id=cursor,
+                    count=count,
+                )
+                cursor, entries = reply[0], reply[1]
+                # Redis < 7 devolve entradas já removidas (MAXLEN) com dados nulos
+                gone = [entry_id for entry_id, data in entries if data is None]
+                entries = [(entry_id, data) for entry_id, data in entries if data is not None]
+                if gone:
+                    await self._ack({stream: gone})
+                if entries:
+                    claimed += len(entries)
+                    dead = await self._exhausted(stream, [entry_id for entry_id, _ in entries])
+                    await self._handle_entries(stream, entries, dead)
+                if cursor in _END_CURSORS:
+                    break
+            if self.stale_ms:
+                await self._remove_stale_consumers(stream)
+        if claimed:
+            logger.info(f"Redis consumer '{self._consumer_name}' claimed {claimed} pending entries")
+        return claimed
+
+    async def _exhausted(self, stream: Any, entry_ids: list[Any]) -> set[Any]:
+        """Entries whose delivery count exceeds ``max_deliveries``."""
+        if not self.max_deliveries:
+            return set()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for entry_id in entry_ids:
+                pipe.xpending_range(
+                    stream, self.group_id, min=_text(entry_id), max=_text(entry_id), count=1,
+                )
+            replies = await pipe.execute()
+        return {
+            entry_id
+            for entry_id, rows in zip(entry_ids, replies)
+            if rows and rows[0]["times_delivered"] > self.max_deliveries
+        }
+
+    async def _dead_letter(self, stream: Any, entry_id: Any, entry_data: dict) -> None:
+        logger.warning(
+            f"Moving {_text(stream)}/{_text(entry_id)} to '{self.dead_letter_stream}' "
+            f"after {self.max_deliveries} deliveries"
+        )
+        await self._redis.xadd(
+            self.dead_letter_stream,
+            {
+                **entry_data,
+                "source_stream": _text(stream),
+                "source_id": _text(entry_id),
+                "group": self.group_id,
+            },
+            maxlen=self._settings.redis_stream_max_len,
+            approximate=True,
+        )
+
+    async def _remove_stale_consumers(self, stream: Any) -> None:
+        for info in await self._redis.xinfo_consumers(stream, self.group_id):
+            name = _text(info["name"])
+            if name == self._consumer_name or info["pending"] or info["idle"] < self.stale_ms:
+                continue
+            await self._redis.xgroup_delconsumer(stream, self.group_id, name)
+            logger.info(f"Removed stale consumer '{name}' from {_text(stream)}/{self.group_id}")
+
+    async def _release_consumer_name(self) -> None:
+        """Delete this consumer from its groups unless it still owns pending entries."""
+        for topic in self.topics:
+            pending = await self._redis.xpending_range(
+                topic, self.group_id, min="-", max="+", count=1, consumername=self._consumer_name,
+            )
+            if pending:
+                # DELCONSUMER descartaria as pendências; outro consumer as reivindica
+                return
+        for topic in self.topics:
+            await self._redis.xgroup_delconsumer(topic, self.group_id, self._consumer_name)
+
     async def _process_entry(self, stream: str, entry_id: str, entry_data: dict) -> None:
         data_str = entry_data.get(b"data") or entry_data.get("data")
         if isinstance(data_str, bytes):
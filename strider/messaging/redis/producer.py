@@ -74,3 +74,28 @@ class RedisProducer(Producer):
                 pipe.xadd(topic, entry, maxlen=self._settings.redis_stream_max_len, approximate=True)
             await pipe.execute()
         return len(messages)
+
+    async def send_batch_with_headers(
+        self,
+        topic: str,
+        records: list[tuple[dict[str, Any], str | None, dict[str, str] | None]],
+    ) -> int:
+        if not self._started:
+            await self.start()
+
+        from strider.messaging.tracking import track_outgoing
+
+        entries = []
+        for message, key, headers in records:
+            _, headers = await track_outgoing(topic, message, headers, key)
+            entry = {"data": json.dumps(message)}
+            if key:
+                entry["key"] = key
+            if headers:
+                entry["headers"] = json.dumps(headers)
+            entries.append(entry)
+        async with self._redis.pipeline() as pipe:
+            for entry in entries:
+                pipe.xadd(topic, entry, maxlen=self._settings.redis_stream_max_len, approximate=True)
+            await pipe.execute()
+        return len(records)
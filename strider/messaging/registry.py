@@ -315,6 +315,28 @@ async def disconnect_all_brokers() -> None:
 # Simplified Publishing API
 # =============================================================================
 
+def resolve_topic(topic: str | type, data: dict[str, Any] | Any) -> tuple[str, Any]:
+    """
+    Resolve the topic name and payload for publishing.
+    
+    Topic classes validate the payload against their schema; Pydantic
+    models sent to plain topic names are dumped to a dict.
+    
+    Returns:
+        (topic_name, data)
+    """
+    from pydantic import BaseModel
+    from strider.messaging.topics import Topic
+    
+    if isinstance(topic, type) and issubclass(topic, Topic):
+        return topic.name, topic.validate(data)
+    if isinstance(topic, str):
+        if isinstance(data, BaseModel):
+            data = data.model_dump()
+        return topic, data
+    raise TypeError(f"topic must be str or Topic class, got {type(topic)}")
+
+
 async def publish(
     topic: str | type,
     data: dict[str, Any] | Any,
@@ -359,20 +381,7 @@ async def publish(
         # Explicit wait for confirmation
         await publish("critical-events", data, wait=True)
     """
-    from pydantic import BaseModel
-    from strider.messaging.topics import Topic
-    
-    # Resolve topic name and validate
-    topic_name: str
-    if isinstance(topic, type) and issubclass(topic, Topic):
-        topic_name = topic.name
-        data = topic.validate(data)
-    elif isinstance(topic, str):
-        topic_name = topic
-        if isinstance(data, BaseModel):
-            data = data.model_dump()
-    else:
-        raise TypeError(f"topic must be str or Topic class, got {type(topic)}")
+    topic_name, data = resolve_topic(topic, data)
     
     # Get producer and send
     producer = get_producer()
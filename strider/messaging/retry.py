@@ -0,0 +1,259 @@
+"""
+Failure handling for message workers.
+
+A failed message used to be retried inline (``asyncio.sleep`` for the
+whole backoff) and dead-lettered with one ``send`` per message, so a burst
+of poison messages stalled the consumer.  This module moves both off the
+hot path without keeping the only copy of a message in memory:
+
+- ``RetryScheduler`` republishes a failed message to the worker's retry
+  topic with the next attempt number and its due time in headers
+  (``retry_attempt``, ``retry_at``).  The handler returns as soon as the
+  broker accepted it, so the original is only acknowledged once the retry
+  is durable.  A second consumer on the retry topic waits until the due
+  time (``wait``) and runs the handler with the carried attempt number.
+  It never holds a message longer than ``max_wait``: one that is not due
+  by then goes back to the retry topic unchanged (``defer``), so a long
+  backoff does not leave entries unacknowledged past the broker's
+  redelivery timeout (Redis ``min_idle_ms``).
+- ``DeadLetterWriter`` buffers dead letters per topic and publishes them
+  with ``send_batch`` when a batch fills up, on ``flush`` or every
+  ``flush_interval``.  A batch the broker rejected stays buffered and is
+  retried on the next flush.
+
+Both keep in-memory counters (``scheduled_by_attempt()``, ``written``...)
+that the worker reports with its heartbeat.
+
+Example:
+    retries = RetryScheduler(producer, "orders.retry")
+    dead_letters = DeadLetterWriter(producer, batch_size=100)
+    await dead_letters.start()
+
+    await retries.schedule(message, attempt=1, delay=policy.get_delay(0))
+    ...
+    attempt = await retries.wait(current_message().headers)
+    if attempt is None:
+        await retries.defer(message, current_message().headers)
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any, Callable
+import asyncio
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+RETRY_ATTEMPT_HEADER = "retry_attempt"
+RETRY_AT_HEADER = "retry_at"
+
+
+class RetryScheduler:
+    """
+    Delayed redelivery of failed messages through a retry topic.
+
+    Args:
+        producer: Producer used to publish to *topic*
+        topic: Retry topic, consumed by the same worker
+        max_wait: Longest ``wait`` per message in seconds (None = until due)
+        clock: Wall clock in seconds (due times travel between processes)
+    """
+
+    def __init__(
+        self,
+        producer: Any,
+        topic: str,
+        *,
+        max_wait: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._producer = producer
+        self.topic = topic
+        self.max_wait = max_wait
+        self.clock = clock
+        self._scheduled_by_attempt: Counter[int] = Counter()
+        self.scheduled = 0
+        self.redelivered = 0
+        self.failed = 0
+        self.deferred = 0
+        self.waiting = 0
+
+    def scheduled_by_attempt(self) -> dict[int, int]:
+        """Messages published to the retry topic per attempt number."""
+        return dict(sorted(self._scheduled_by_attempt.items()))
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "retry_waiting": self.waiting,
+            "retry_scheduled": self.scheduled,
+            "retry_scheduled_by_attempt": self.scheduled_by_attempt(),
+            "retry_redelivered": self.redelivered,
+            "retry_deferred": self.deferred,
+            "retry_failed": self.failed,
+        }
+
+    async def schedule(self, message: dict[str, Any], attempt: int, delay: float) -> None:
+        """
+        Publish *message* for redelivery as *attempt* after *delay* seconds.
+
+        Raises when the broker does not accept it; the caller decides what
+        to do with the message (usually dead-letter it).
+        """
+        headers = {
+            RETRY_ATTEMPT_HEADER: str(attempt),
+            RETRY_AT_HEADER: f"{self.clock() + max(delay, 0.0):.3f}",
+        }
+        try:
+            await self._producer.send(self.topic, message, headers=headers)
+        except Exception:
+            self.failed += 1
+            raise
+        self.scheduled += 1
+        self._scheduled_by_attempt[attempt] += 1
+
+    async def wait(self, headers: dict[str, Any] | None) -> int | None:
+        """
+        Sleep until the due time in *headers* and return the attempt number.
+
+        Sleeps at most ``max_wait``; returns None when the message is still
+        not due, and the caller hands it to ``defer``.  The message stays
+        unacknowledged while waiting, so a worker that stops here leaves it
+        in the broker.
+        """
+        headers = headers or {}
+        attempt = int(headers.get(RETRY_ATTEMPT_HEADER) or 1)
+        delay = float(headers.get(RETRY_AT_HEADER) or 0) - self.clock()
+        due = self.max_wait is None or delay <= self.max_wait
+        if delay > 0:
+            self.waiting += 1
+            try:
+                await asyncio.sleep(delay if due else self.max_wait)
+            finally:
+                self.waiting -= 1
+        if not due:
+            return None
+        self.redelivered += 1
+        return attempt
+
+    async def defer(self, message: dict[str, Any], headers: dict[str, Any] | None) -> None:
+        """
+        Put a message that is not due yet back on the retry topic, same headers.
+
+        Raises when the broker does not accept it; the message is then not
+        acknowledged and the broker redelivers it.
+        """
+        headers = headers or {}
+        await self._producer.send(
+            self.topic,
+            message,
+            headers={
+                RETRY_ATTEMPT_HEADER: str(headers.get(RETRY_ATTEMPT_HEADER) or 1),
+                RETRY_AT_HEADER: str(headers.get(RETRY_AT_HEADER) or 0),
+            },
+        )
+        self.deferred += 1
+
+
+class DeadLetterError(Exception):
+    """A dead letter could not be published (it stays buffered)."""
+
+
+class DeadLetterWriter:
+    """
+    Per-topic batching writer for dead letters.
+
+    Args:
+        producer: Producer with ``send_batch(topic, messages)``
+        batch_size: Buffered messages per topic that trigger a flush
+        flush_interval: Seconds between periodic flushes
+    """
+
+    def __init__(
+        self,
+        producer: Any,
+        *,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._producer = producer
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "dlq_pending": self.pending,
+            "dlq_written": self.written,
+            "dlq_failed": self.failed,
+        }
+
+    async def put(self, topic: str, message: dict[str, Any], *, wait: bool = False) -> None:
+        """
+        Buffer *message* for *topic*.
+
+        With ``wait=True`` the topic is flushed before returning, and
+        ``DeadLetterError`` is raised if the broker rejected it (the letter
+        stays buffered for the next flush).
+        """
+        buffer = self._buffers.setdefault(topic, [])
+        buffer.append(message)
+        if wait or len(buffer) >= self.batch_size:
+            await self.flush(topic)
+            if wait and any(letter is message for letter in self._buffers.get(topic, ())):
+                raise DeadLetterError(f"Dead letter not published to '{topic}'")
+
+    async def flush(self, topic: str | None = None) -> int:
+        """
+        Publish buffered messages (of *topic*, or all).  Returns how many.
+
+        A batch the broker rejects goes back to the front of its buffer.
+        """
+        written = 0
+        async with self._lock:
+            for name in [topic] if topic is not None else list(self._buffers):
+                batch = self._buffers.pop(name, None)
+                if not batch:
+                    continue
+                try:
+                    await self._producer.send_batch(name, batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    self._buffers[name] = batch + self._buffers.get(name, [])
+                    logger.error(f"Failed to publish {len(batch)} dead letter(s) to '{name}', keeping them: {e}")
+                    continue
+                self.written += len(batch)
+                written += len(batch)
+        return written
+
+    async def start(self) -> None:
+        if self._task is None and self.flush_interval > 0:
+            self._task = asyncio.create_task(self._flush_loop(), name="dead-letter-writer")
+
+    async def close(self) -> None:
+        """Stop the periodic flush and publish what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        if self.pending:
+            logger.error(f"Dropping {self.pending} dead letter(s) that could not be published")
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import uuid
 import logging
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger("strider.messaging.tracking")
@@ -12,6 +14,28 @@ _tracker = None
 _enabled = None
 
 
+@dataclass(frozen=True)
+class IncomingMessage:
+    """Broker metadata of the message being handled."""
+
+    topic: str
+    partition: int
+    offset: int
+    headers: dict | None = None
+    key: str | None = None
+
+
+_current_message: ContextVar[IncomingMessage | None] = ContextVar("strider_incoming_message", default=None)
+
+
+def current_message() -> IncomingMessage | None:
+    """
+    Metadata (headers, key, offset...) of the message the consumer is
+    handling, for handlers that only receive the payload.
+    """
+    return _current_message.get()
+
+
 def _get_tracker():
     """Get tracker instance lazily."""
     global _tracker, _enabled
@@ -104,6 +128,9 @@ async def track_incoming(
     worker_id: str | None = None,
 ) -> None:
     """Track incoming event."""
+    # Consumers chamam track_incoming logo antes do handler
+    _current_message.set(IncomingMessage(topic, partition, offset, headers, key))
+
     tracker = _get_tracker()
     if not tracker:
         return
@@ -41,6 +41,7 @@ from typing import Any, Callable, Awaitable, TypeVar, Generic
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import asyncio
+import json
 import functools
 
 from pydantic import BaseModel
@@ -98,12 +99,20 @@ class WorkerConfig:
     input_schema: type[BaseModel] | None = None
     output_schema: type[BaseModel] | None = None
     dlq_topic: str | None = None
+    retry_topic: str | None = None  # None = "<input_topic>.retry"
     
     # Batch processing
     batch_size: int = 1
     batch_timeout: float = 0.0
     batch_handler: Callable[..., Awaitable[Any]] | None = None
     
+    # Idempotência: chave de dedup (path no payload, "header:<nome>" ou callable)
+    dedup_key: str | Callable[[dict], Any] | None = None
+    dedup_store: Any = None  # DedupStore, "memory"/"redis"/"database" ou None (settings)
+    
+    # Controle de fluxo (None = messaging_flow_control)
+    flow_control: bool | None = None
+    
     # Worker class reference
     _worker_class: type | None = None
     
@@ -122,6 +131,10 @@ def worker(
     input_schema: type[BaseModel] | None = None,
     output_schema: type[BaseModel] | None = None,
     dlq_topic: str | None = None,
+    retry_topic: str | None = None,
+    dedup_key: str | Callable[[dict], Any] | None = None,
+    dedup_store: Any = None,
+    flow_control: bool | None = None,
 ):
     """
     Decorator to create a worker from a function.
@@ -147,6 +160,13 @@ def worker(
         input_schema: Optional Pydantic model for input validation
         output_schema: Optional Pydantic model for output validation
         dlq_topic: Dead letter queue topic for failed messages
+        retry_topic: Topic holding messages awaiting retry (default:
+            "<topic>.retry")
+        dedup_key: Skip messages whose key was already processed
+            (payload path, "header:<name>" or callable)
+        dedup_store: DedupStore or backend name (default: messaging_dedup_store)
+        flow_control: Pause/resume the consumer on in-flight watermarks
+            (default: messaging_flow_control)
     
     Returns:
         Decorated function registered as worker
@@ -168,6 +188,10 @@ def worker(
             input_schema=input_schema,
             output_schema=output_schema,
             dlq_topic=_resolve(dlq_topic) if dlq_topic else None,
+            retry_topic=_resolve(retry_topic) if retry_topic else None,
+            dedup_key=dedup_key,
+            dedup_store=dedup_store,
+            flow_control=flow_control,
         )
         
         # Register worker
@@ -223,11 +247,19 @@ class Worker(ABC):
     input_schema: type[BaseModel] | None = None
     output_schema: type[BaseModel] | None = None
     dlq_topic: str | Any | None = None
+    retry_topic: str | Any | None = None
     
     # Batch processing
     batch_size: int = 1
     batch_timeout: float = 0.0
     
+    # Idempotência (ver strider.messaging.dedup)
+    dedup_key: str | Callable[[dict], Any] | None = None
+    dedup_store: Any = None
+    
+    # Controle de fluxo (ver strider.messaging.flow)
+    flow_control: bool | None = None
+    
     # Runtime state
     _running: bool = False
     _consumer = None
@@ -246,6 +278,7 @@ class Worker(ABC):
         input_topic = cls._resolve_topic(cls.input_topic)
         output_topic = cls._resolve_topic(cls.output_topic) if cls.output_topic else None
         dlq_topic = cls._resolve_topic(cls.dlq_topic) if cls.dlq_topic else None
+        retry_topic = cls._resolve_topic(cls.retry_topic) if cls.retry_topic else None
         
         # Check if has batch handler
         has_batch = hasattr(cls, 'process_batch') and cls.process_batch is not Worker.process_batch
@@ -265,9 +298,13 @@ class Worker(ABC):
             input_schema=cls.input_schema,
             output_schema=cls.output_schema,
             dlq_topic=dlq_topic,
+            retry_topic=retry_topic,
             batch_size=cls.batch_size,
             batch_timeout=cls.batch_timeout,
             batch_handler=cls._create_batch_handler(cls) if has_batch else None,
+            dedup_key=cls.dedup_key,
+            dedup_store=cls.dedup_store,
+            flow_control=cls.flow_control,
             _worker_class=cls,
         )
         
@@ -492,6 +529,10 @@ async def _run_worker_config(config: WorkerConfig) -> None:
     import uuid
     from strider.messaging import get_producer
     from strider.messaging.registry import create_consumer
+    from strider.messaging.retry import DeadLetterWriter, RetryScheduler
+    from strider.messaging.tracking import current_message
+    from strider.messaging.dedup import DedupStore, Deduplicator, create_dedup_store
+    from strider.messaging.flow import FlowController
     
     logger = logging.getLogger(f"worker.{config.name}")
     
@@ -551,10 +592,26 @@ async def _run_worker_config(config: WorkerConfig) -> None:
         _shutdown_grace_seconds = float(
             getattr(_settings, "task_shutdown_grace_seconds", 5.0)
         )
+        _dlq_batch_size = int(getattr(_settings, "messaging_dlq_batch_size", 100))
+        _dlq_flush_interval = float(getattr(_settings, "messaging_dlq_flush_interval", 1.0))
+        _retry_max_wait = float(getattr(_settings, "messaging_retry_max_wait", 5.0))
+        _flow_control = bool(getattr(_settings, "messaging_flow_control", False))
+        _flow_high_messages = int(getattr(_settings, "messaging_flow_high_messages", 1000))
+        _flow_low_messages = int(getattr(_settings, "messaging_flow_low_messages", 500))
+        _flow_high_bytes = int(getattr(_settings, "messaging_flow_high_bytes", 0))
+        _flow_low_bytes = int(getattr(_settings, "messaging_flow_low_bytes", 0))
     except Exception:
         _hb_interval = 30
         _offline_ttl_hours = 24
         _shutdown_grace_seconds = 5.0
+        _dlq_batch_size = 100
+        _dlq_flush_interval = 1.0
+        _retry_max_wait = 5.0
+        _flow_control = False
+        _flow_high_messages, _flow_low_messages = 1000, 500
+        _flow_high_bytes = _flow_low_bytes = 0
+    if config.flow_control is not None:
+        _flow_control = config.flow_control
     
     async def _get_session():
         """Get a DB session, trying both session factories. (Issue #18)"""
@@ -673,6 +730,14 @@ async def _run_worker_config(config: WorkerConfig) -> None:
             from sqlalchemy import update
 
             metrics = _get_process_metrics()
+            if retries is not None:
+                metrics.update(retries.metrics())
+            if dead_letters is not None:
+                metrics.update(dead_letters.metrics())
+            if dedup is not None:
+                metrics.update(dedup.metrics())
+            if flow is not None:
+                metrics.update(flow.metrics())
             metadata = _json.dumps(metrics) if metrics else None
 
             values: dict[str, Any] = {
@@ -767,12 +832,139 @@ async def _run_worker_config(config: WorkerConfig) -> None:
         except Exception:
             pass
     
-    # Get producer if output topic or DLQ configured
+    # Get producer if output topic, DLQ or retries configured
+    retrying = config.retry_policy.max_retries > 0
     producer = None
-    if config.output_topic or config.dlq_topic:
+    if config.output_topic or config.dlq_topic or retrying:
         producer = get_producer()
         await producer.start()
     
+    # Falhas fora do hot path: retry via tópico de retry + DLQ em lote por tópico
+    retries = None
+    if retrying:
+        retries = RetryScheduler(
+            producer,
+            config.retry_topic or f"{config.input_topic}.retry",
+            max_wait=_retry_max_wait or None,
+        )
+    dead_letters = None
+    if config.dlq_topic and producer:
+        dead_letters = DeadLetterWriter(
+            producer,
+            batch_size=_dlq_batch_size,
+            flush_interval=_dlq_flush_interval,
+        )
+    
+    # Dedup opt-in: chaves já processadas não chegam ao handler
+    dedup = None
+    if config.dedup_key is not None:
+        store = config.dedup_store
+        if not isinstance(store, DedupStore):
+            store = create_dedup_store(store)
+        dedup = Deduplicator(store, config.dedup_key, scope=config.group_id or config.name)
+    # id(message) -> chave, até o handler terminar ou a mensagem ir para retry/DLQ
+    dedup_keys: dict[int, str] = {}
+    
+    # Controle de fluxo: criado junto com o consumer (pause/resume)
+    flow: FlowController | None = None
+    flow_sizes: dict[int, int] = {}
+    
+    async def finished(messages: list[dict], processed: bool, retry_delay: float | None = None) -> None:
+        """Mensagens que saíram do worker (sucesso, retry ou DLQ): dedup e contagem em processamento."""
+        if dedup is not None:
+            keys = [key for msg in messages if (key := dedup_keys.pop(id(msg), None)) is not None]
+            if keys and processed:
+                await dedup.processed(keys)
+            elif keys and retry_delay is not None:
+                # Retry agendado: a chave continua retida até o retry resolver
+                dedup.hold(keys, retry_delay)
+            elif keys:
+                dedup.release(keys)
+        if flow is not None:
+            size = sum(flow_sizes.pop(id(msg), 0) for msg in messages)
+            await flow.release(len(messages), size)
+    
+    async def dead_letter(messages: list[dict], error: Exception, retries_done: int | None = None) -> None:
+        """Publica na DLQ antes de retornar: só então o consumer confirma as mensagens."""
+        if dead_letters is None or not messages:
+            return
+        for n, message in enumerate(messages, 1):
+            letter = {
+                "original": message,
+                "error": str(error),
+                "worker": config.name,
+            }
+            if retries_done is not None:
+                letter["retries"] = retries_done
+            await dead_letters.put(config.dlq_topic, letter, wait=n == len(messages))
+    
+    async def handle_failure(item: Any, attempt: int, error: Exception) -> None:
+        """
+        Republish the failed item to the retry topic or dead-letter it.
+        Never sleeps; returns once that is durable, so the consumer can ack.
+        """
+        nonlocal _total_errors
+        
+        messages = item if isinstance(item, list) else [item]
+        max_retries = config.retry_policy.max_retries
+        if retries is not None and attempt < max_retries:
+            delay = config.retry_policy.get_delay(attempt)
+            scheduled = 0
+            try:
+                for msg in messages:
+                    await retries.schedule(msg, attempt + 1, delay)
+                    scheduled += 1
+            except Exception as e:
+                logger.error(f"Could not publish retry to '{retries.topic}', dead-lettering: {e}")
+            else:
+                logger.warning(f"Retry {attempt + 1}/{max_retries} in {delay}s: {error}")
+            await finished(messages[:scheduled], processed=False, retry_delay=delay)
+            messages = messages[scheduled:]
+            if not messages:
+                return
+        
+        _total_errors += len(messages)
+        logger.error(f"Failed after {attempt} retries: {error}")
+        await finished(messages, processed=False)
+        await dead_letter(messages, error, attempt)
+    
+    async def run_single(message: dict, attempt: int) -> None:
+        nonlocal _total_processed, _active
+        
+        _active += 1
+        try:
+            result = await config.handler(message)
+            
+            # Validate output
+            if config.output_schema and result:
+                result = config.output_schema.model_validate(result).model_dump()
+            
+            # Publish result
+            if config.output_topic and producer and result:
+                await producer.send(config.output_topic, result)
+            
+            _total_processed += 1
+            await finished([message], processed=True)
+        except Exception as e:
+            await handle_failure(message, attempt, e)
+        finally:
+            _active -= 1
+    
+    async def run_batch(messages: list[dict], attempt: int) -> None:
+        nonlocal _total_processed
+        
+        try:
+            if config.batch_handler:
+                await config.batch_handler(messages)
+            else:
+                for msg in messages:
+                    await config.handler(msg)
+            _total_processed += len(messages)
+        except Exception as e:
+            await handle_failure(messages, attempt, e)
+            return
+        await finished(messages, processed=True)
+    
     # Batch state
     batch: list[dict] = []
     batch_lock = asyncio.Lock()
@@ -780,7 +972,7 @@ async def _run_worker_config(config: WorkerConfig) -> None:
     
     async def flush_batch() -> None:
         """Flush accumulated batch."""
-        nonlocal batch, last_batch_time, _total_processed, _total_errors
+        nonlocal batch, last_batch_time
         
         if not batch:
             return
@@ -793,40 +985,7 @@ async def _run_worker_config(config: WorkerConfig) -> None:
         if not messages_to_process:
             return
         
-        # Process batch with retries
-        last_error = None
-        for attempt in range(config.retry_policy.max_retries + 1):
-            if not _running:
-                return
-            try:
-                if config.batch_handler:
-                    await config.batch_handler(messages_to_process)
-                else:
-                    for msg in messages_to_process:
-                        await config.handler(msg)
-                _total_processed += len(messages_to_process)
-                return  # Success
-                
-            except Exception as e:
-                last_error = e
-                if attempt < config.retry_policy.max_retries:
-                    if not _running:
-                        return
-                    delay = config.retry_policy.get_delay(attempt)
-                    logger.warning(f"Batch retry {attempt + 1}/{config.retry_policy.max_retries} in {delay}s: {e}")
-                    await asyncio.sleep(delay)
-        
-        # All retries failed
-        _total_errors += len(messages_to_process)
-        logger.error(f"Batch failed after {config.retry_policy.max_retries} retries: {last_error}")
-        
-        if config.dlq_topic and producer:
-            for msg in messages_to_process:
-                await producer.send(config.dlq_topic, {
-                    "original": msg,
-                    "error": str(last_error),
-                    "worker": config.name,
-                })
+        await run_batch(messages_to_process, 0)
     
     async def batch_timer() -> None:
         """Timer to flush batch on timeout."""
@@ -835,11 +994,35 @@ async def _run_worker_config(config: WorkerConfig) -> None:
             if config.batch_timeout > 0 and batch:
                 elapsed = asyncio.get_event_loop().time() - last_batch_time
                 if elapsed >= config.batch_timeout:
-                    await flush_batch()
+                    try:
+                        await flush_batch()
+                    except Exception as e:
+                        logger.error(f"Batch flush failed: {e}")
+    
+    async def admit(message: dict, retry: bool = False) -> bool:
+        """Dedup e controle de fluxo antes do handler. False se já foi processada."""
+        # Reentrega já processada: uma consulta em vez do handler
+        if dedup is not None:
+            key = dedup.key_for(message)
+            if key is not None:
+                # O retry assume a chave retida pela tentativa anterior
+                resumed = retry and dedup.resume(key)
+                if not resumed and await dedup.is_duplicate(key):
+                    logger.debug(f"Skipping duplicate message {key}")
+                    return False
+                dedup_keys[id(message)] = key
+        
+        # Controle de fluxo: conta a mensagem até terminar ou ir para retry/DLQ
+        if flow is not None:
+            size = len(json.dumps(message, default=str)) if flow.tracks_bytes else 0
+            await flow.acquire(size)
+            if size:
+                flow_sizes[id(message)] = size
+        return True
     
     async def process_message(message: dict) -> None:
         """Process single message or add to batch. Counters are in-memory only."""
-        nonlocal batch, _total_processed, _total_errors, _active
+        nonlocal batch, _total_errors
         
         # Validate input
         if config.input_schema:
@@ -849,63 +1032,40 @@ async def _run_worker_config(config: WorkerConfig) -> None:
             except Exception as e:
                 _total_errors += 1
                 logger.error(f"Input validation failed: {e}")
-                if config.dlq_topic and producer:
-                    await producer.send(config.dlq_topic, {
-                        "original": message,
-                        "error": str(e),
-                        "worker": config.name,
-                    })
+                await dead_letter([message], e)
                 return
         
+        if not await admit(message):
+            return
+        
         # Batch mode
         if config.batch_size > 1 or config.batch_handler:
             async with batch_lock:
                 batch.append(message)
-                if len(batch) >= config.batch_size:
-                    await flush_batch()
+                full = len(batch) >= config.batch_size
+            # flush_batch também adquire batch_lock (asyncio.Lock não é reentrante)
+            if full:
+                await flush_batch()
             return
         
-        # Single message mode with retries
-        _active += 1
-        last_error = None
-        try:
-            for attempt in range(config.retry_policy.max_retries + 1):
-                try:
-                    result = await config.handler(message)
-                    
-                    # Validate output
-                    if config.output_schema and result:
-                        result = config.output_schema.model_validate(result).model_dump()
-                    
-                    # Publish result
-                    if config.output_topic and producer and result:
-                        await producer.send(config.output_topic, result)
-                    
-                    _total_processed += 1
-                    return  # Success
-                    
-                except Exception as e:
-                    last_error = e
-                    if attempt < config.retry_policy.max_retries:
-                        if not _running:
-                            return
-                        delay = config.retry_policy.get_delay(attempt)
-                        logger.warning(f"Retry {attempt + 1}/{config.retry_policy.max_retries} in {delay}s: {e}")
-                        await asyncio.sleep(delay)
-            
-            # All retries failed
-            _total_errors += 1
-            logger.error(f"Failed after {config.retry_policy.max_retries} retries: {last_error}")
-            
-            if config.dlq_topic and producer:
-                await producer.send(config.dlq_topic, {
-                    "original": message,
-                    "error": str(last_error),
-                    "worker": config.name,
-                    "retries": config.retry_policy.max_retries,
-                })
-        finally:
-            _active -= 1
+        # Single message mode: inline, o consumer só confirma depois do handler
+        await run_single(message, 0)
+    
+    async def process_retry(message: dict) -> None:
+        """Tópico de retry: espera o horário da tentativa e roda o handler."""
+        incoming = current_message()
+        headers = incoming.headers if incoming else None
+        attempt = await retries.wait(headers)
+        if attempt is None:
+            # Ainda não venceu: volta ao tópico em vez de segurar a entrada sem ack
+            await retries.defer(message, headers)
+            return
+        if not await admit(message, retry=True):
+            return
+        if config.batch_size > 1 or config.batch_handler:
+            await run_batch([message], attempt)
+        else:
+            await run_single(message, attempt)
     
     # Create consumer with message handler
     consumer = create_consumer(
@@ -913,6 +1073,40 @@ async def _run_worker_config(config: WorkerConfig) -> None:
         topics=[config.input_topic],
         message_handler=process_message,
     )
+    # Retry em grupo próprio: no RabbitMQ o grupo é o nome da fila
+    retry_consumer = None
+    if retries is not None:
+        retry_consumer = create_consumer(
+            group_id=f"{config.group_id or config.name}.retry",
+            topics=[retries.topic],
+            message_handler=process_retry,
+        )
+    
+    if _flow_control:
+        async def pause_consumer() -> bool:
+            pause = getattr(consumer, "pause", None)
+            native = bool(await pause()) if pause is not None else False
+            # Lote incompleto não enche com o consumer pausado
+            await flush_batch()
+            return native
+        
+        # Handlers inline: o worker nunca segura mais que os lotes das
+        # entregas simultâneas. Com uma entrega por vez o próprio loop do
+        # consumer espera o handler, e só a marca de bytes vale.
+        deliveries = getattr(consumer, "concurrent_deliveries", 1)
+        capacity = max(config.batch_size, 1) * deliveries if deliveries > 1 else 0
+        high_messages = min(_flow_high_messages, capacity) if _flow_high_messages > 0 else 0
+        if high_messages or _flow_high_bytes:
+            flow = FlowController(
+                high_messages=high_messages,
+                low_messages=min(_flow_low_messages, high_messages // 2),
+                high_bytes=_flow_high_bytes,
+                low_bytes=_flow_low_bytes or None,
+                on_pause=pause_consumer,
+                on_resume=getattr(consumer, "resume", None),
+            )
+        else:
+            logger.info(f"Flow control: '{config.name}' handles one delivery at a time, nothing to pause")
     
     # Log startup
     logger.info(f"Starting worker: {config.name}")
@@ -930,12 +1124,17 @@ async def _run_worker_config(config: WorkerConfig) -> None:
     if config.batch_timeout > 0 and (config.batch_size > 1 or config.batch_handler):
         timer_task = asyncio.create_task(batch_timer())
     
+    if dead_letters is not None:
+        await dead_letters.start()
+    
     # Register heartbeat & start heartbeat loop (separate task, fire-and-forget)
     await _register_heartbeat()
     heartbeat_task = asyncio.create_task(_heartbeat_loop())
     
     # Start consumer
     await consumer.start()
+    if retry_consumer is not None:
+        await retry_consumer.start()
     
     # Keep running
     try:
@@ -961,6 +1160,14 @@ async def _run_worker_config(config: WorkerConfig) -> None:
         await _mark_offline()
         
         await consumer.stop()
+        # Retry ainda esperando o horário fica sem ack no broker
+        if retry_consumer is not None:
+            await retry_consumer.stop()
+        
+        if dead_letters is not None:
+            await dead_letters.close()
+        if dedup is not None:
+            await dedup.close()
         
         if producer:
             await producer.stop()
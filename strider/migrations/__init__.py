@@ -10,7 +10,8 @@ Características:
 - Suporte multi-dialeto: SQLite, PostgreSQL, MySQL (via dialect compilers)
 - Detecção automática de mudanças
 - Migrações reversíveis
-- Suporte a migrações de dados (RunPython)
+- Suporte a migrações de dados (RunPython, RunBatched em lotes retomáveis)
+- Operações online (baixo lock) para tabelas grandes
 - Análise pré-produção para evitar erros
 """
 
@@ -29,6 +30,13 @@ from strider.migrations.operations import (
     DropForeignKey,
     RunPython,
     RunSQL,
+    # Online (low-lock) operations
+    AddColumnOnline,
+    CreateIndexOnline,
+    SetNotNullOnline,
+    # Batched data operations
+    RunBatched,
+    BackfillColumn,
     # Enum operations
     CreateEnum,
     DropEnum,
@@ -72,6 +80,13 @@ __all__ = [
     "DropForeignKey",
     "RunPython",
     "RunSQL",
+    # Online (low-lock) operations
+    "AddColumnOnline",
+    "CreateIndexOnline",
+    "SetNotNullOnline",
+    # Batched data operations
+    "RunBatched",
+    "BackfillColumn",
     # Enum operations
     "CreateEnum",
     "DropEnum",
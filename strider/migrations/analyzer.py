@@ -24,6 +24,8 @@ from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
 
+from strider.migrations.migration import misplaced_non_atomic
+
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncConnection
     from strider.migrations.operations import Operation
@@ -63,6 +65,8 @@ class IssueCode(Enum):
     DESTRUCTIVE_OPERATION = "W006"
     IRREVERSIBLE_OPERATION = "W007"
     LONG_RUNNING_OPERATION = "I002"
+    ONLINE_OPERATION_RECOMMENDED = "W009"
+    NON_ATOMIC_AFTER_ATOMIC = "E006"
     
     # SQLite específico
     SQLITE_ALTER_LIMITATION = "W008"
@@ -178,10 +182,19 @@ class MigrationAnalyzer:
                 print(issue)
     """
     
+    # A partir daqui DDL bloqueante vira problema; recomenda operações online
+    LARGE_TABLE_ROWS = 100000
+    # Acima disto a estimativa do catálogo é usada em vez de COUNT(*)
+    ESTIMATE_THRESHOLD = LARGE_TABLE_ROWS
+    
     def __init__(self, dialect: str = "sqlite"):
         from strider.migrations.dialects import get_compiler
         self.dialect = dialect
         self.compiler = get_compiler(dialect)
+        # Cache das informações do banco, válido enquanto o analisador viver
+        self._existing_tables: set[str] | None = None
+        self._row_estimates: dict[str, int] = {}
+        self._row_counts: dict[str, int] = {}
     
     async def analyze(
         self,
@@ -203,38 +216,94 @@ class MigrationAnalyzer:
         result = AnalysisResult(migration_name=migration_name)
         
         # Coleta informações do banco atual
-        await self._collect_database_info(conn, result)
+        await self._collect_database_info(conn, result, operations)
         
         # Analisa cada operação
         for idx, op in enumerate(operations):
             op_issues = await self._analyze_operation(op, idx, conn, result)
             result.issues.extend(op_issues)
         
+        misplaced = misplaced_non_atomic(operations)
+        if misplaced is not None:
+            result.issues.append(MigrationIssue(
+                code=IssueCode.NON_ATOMIC_AFTER_ATOMIC,
+                severity=Severity.ERROR,
+                message=(
+                    "Non-atomic operation after atomic ones: a failure would leave "
+                    "the migration half-applied and unrecorded"
+                ),
+                operation_index=misplaced,
+                operation_description=operations[misplaced].describe(),
+                suggestion="Move online/batched operations to the start of the migration or into their own migration",
+            ))
+        
         return result
     
     async def _collect_database_info(
         self,
         conn: "AsyncConnection",
         result: AnalysisResult,
+        operations: list["Operation"],
     ) -> None:
-        """Coleta informações sobre o estado atual do banco."""
-        try:
-            # Lista tabelas usando o compiler do dialeto
-            tables_result = await conn.execute(text(self.compiler.list_tables_sql()))
-            
-            tables = [row[0] for row in tables_result.fetchall()]
-            
-            # Conta linhas em cada tabela
-            for table in tables:
-                try:
-                    count_result = await conn.execute(text(f'SELECT COUNT(*) FROM "{table}"'))
-                    count = count_result.scalar() or 0
-                    result.table_row_counts[table] = count
-                except Exception:
-                    result.table_row_counts[table] = -1  # Erro ao contar
+        """
+        Coleta contagem de linhas das tabelas tocadas pelas operações.
+        
+        Só as tabelas referenciadas são consultadas. Quando o dialeto expõe
+        estatísticas do catálogo, tabelas grandes usam a estimativa (uma
+        única consulta para o schema todo) em vez de ``COUNT(*)``. Os
+        valores ficam em cache no analisador, que é reutilizado entre as
+        migrações pendentes de um mesmo comando.
+        """
+        touched = {
+            name for op in operations
+            if (name := getattr(op, "table_name", None))
+        }
+        missing = touched - self._row_counts.keys()
+        
+        if missing:
+            try:
+                if self._existing_tables is None:
+                    tables_result = await conn.execute(text(self.compiler.list_tables_sql()))
+                    self._existing_tables = {row[0] for row in tables_result.fetchall()}
+                    self._row_estimates = await self._fetch_row_estimates(conn)
+                
+                for table in missing:
+                    if table not in self._existing_tables:
+                        continue
                     
+                    estimate = self._row_estimates.get(table)
+                    if estimate is not None and estimate >= self.ESTIMATE_THRESHOLD:
+                        self._row_counts[table] = estimate
+                        continue
+                    
+                    try:
+                        quoted = self.compiler.quote_table(table)
+                        count_result = await conn.execute(text(f"SELECT COUNT(*) FROM {quoted}"))
+                        self._row_counts[table] = count_result.scalar() or 0
+                    except Exception:
+                        self._row_counts[table] = -1  # Erro ao contar
+                        
+            except Exception:
+                pass  # Ignora erros na coleta de info
+        
+        for table in touched:
+            if table in self._row_counts:
+                result.table_row_counts[table] = self._row_counts[table]
+    
+    async def _fetch_row_estimates(self, conn: "AsyncConnection") -> dict[str, int]:
+        """Estimativas de linhas por tabela a partir do catálogo (se houver)."""
+        sql = self.compiler.table_row_estimates_sql()
+        if sql is None:
+            return {}
+        try:
+            rows = await conn.execute(text(sql))
+            return {
+                name: int(estimate)
+                for name, estimate in rows.fetchall()
+                if estimate is not None and estimate >= 0
+            }
         except Exception:
-            pass  # Ignora erros na coleta de info
+            return {}
     
     async def _analyze_operation(
         self,
@@ -309,7 +378,19 @@ class MigrationAnalyzer:
             ))
         
         # Aviso: Tabela grande
-        if row_count > 100000:
+        needs_rewrite = not column.nullable or column.default is not None
+        if row_count > self.LARGE_TABLE_ROWS and needs_rewrite and self._recommends_online(op):
+            issues.append(MigrationIssue(
+                code=IssueCode.ONLINE_OPERATION_RECOMMENDED,
+                severity=Severity.WARNING,
+                message=f"Adding NOT NULL/default column to large table '{table_name}' ({row_count:,} rows) may rewrite or lock the table",
+                operation_index=idx,
+                operation_description=op_desc,
+                suggestion="Use AddColumnOnline: add nullable, backfill in batches, then set NOT NULL",
+                auto_fix=self._generate_online_fix(op),
+                context={"row_count": row_count},
+            ))
+        elif row_count > 100000:
             issues.append(MigrationIssue(
                 code=IssueCode.LONG_RUNNING_OPERATION,
                 severity=Severity.INFO,
@@ -484,6 +565,23 @@ class MigrationAnalyzer:
             except Exception:
                 pass
         
+        # SET NOT NULL em tabela grande: full scan sob lock exclusivo
+        if (
+            op.new_nullable is False
+            and row_count > self.LARGE_TABLE_ROWS
+            and self._recommends_online(op)
+        ):
+            issues.append(MigrationIssue(
+                code=IssueCode.ONLINE_OPERATION_RECOMMENDED,
+                severity=Severity.WARNING,
+                message=f"Setting '{column_name}' NOT NULL on large table '{table_name}' ({row_count:,} rows) locks the table while it is scanned",
+                operation_index=idx,
+                operation_description=op_desc,
+                suggestion="Use SetNotNullOnline: backfill NULLs in batches, then enforce NOT NULL with a short lock",
+                auto_fix=self._generate_online_fix(op),
+                context={"row_count": row_count},
+            ))
+        
         # Alterando tipo
         if op.new_type and op.old_type and op.new_type != op.old_type:
             # Detecta possível perda de dados
@@ -571,14 +669,25 @@ class MigrationAnalyzer:
         row_count = result.table_row_counts.get(table_name, 0)
         
         # Tabela grande
-        if row_count > 100000:
+        if row_count > self.LARGE_TABLE_ROWS and self._recommends_online(op):
+            issues.append(MigrationIssue(
+                code=IssueCode.ONLINE_OPERATION_RECOMMENDED,
+                severity=Severity.WARNING,
+                message=f"Creating index on large table '{table_name}' ({row_count:,} rows) blocks writes while it builds",
+                operation_index=idx,
+                operation_description=op_desc,
+                suggestion="Use CreateIndexOnline (CONCURRENTLY on PostgreSQL, INPLACE/LOCK=NONE on MySQL)",
+                auto_fix=self._generate_online_fix(op),
+                context={"row_count": row_count},
+            ))
+        elif row_count > 100000 and getattr(op, "atomic", True):
             issues.append(MigrationIssue(
                 code=IssueCode.LONG_RUNNING_OPERATION,
                 severity=Severity.WARNING,
                 message=f"Creating index on large table '{table_name}' ({row_count:,} rows) may lock the table",
                 operation_index=idx,
                 operation_description=op_desc,
-                suggestion="Consider using CONCURRENTLY (PostgreSQL) or running during maintenance window",
+                suggestion="Consider running during maintenance window",
                 context={"row_count": row_count},
             ))
         
@@ -612,6 +721,80 @@ class MigrationAnalyzer:
         
         return issues
     
+    def _recommends_online(self, op: "Operation") -> bool:
+        """Operação bloqueante que tem variante online neste dialeto."""
+        return self.compiler.supports_online_ddl and getattr(op, "atomic", True)
+    
+    def _generate_online_fix(self, op: "Operation") -> str:
+        """Gera o código da variante online de uma operação."""
+        from strider.migrations.operations import (
+            AddColumnOnline,
+            CreateIndexOnline,
+            SetNotNullOnline,
+        )
+        
+        op_type = type(op).__name__
+        if op_type == "AddColumn":
+            return AddColumnOnline(op.table_name, op.column).to_code()
+        if op_type == "CreateIndex":
+            return CreateIndexOnline(op.table_name, op.index_name, op.columns, op.unique).to_code()
+        return SetNotNullOnline(
+            op.table_name,
+            op.column_name,
+            op.new_type or op.old_type or "TEXT",
+            fill_value=op.new_default if op.set_default else None,
+        ).to_code()
+    
+    async def _analyze_addcolumnonline(
+        self,
+        op: "Operation",
+        idx: int,
+        conn: "AsyncConnection",
+        result: AnalysisResult,
+    ) -> list[MigrationIssue]:
+        """Analisa operação AddColumnOnline (mesmas verificações de dados)."""
+        return await self._analyze_addcolumn(op, idx, conn, result)
+    
+    async def _analyze_createindexonline(
+        self,
+        op: "Operation",
+        idx: int,
+        conn: "AsyncConnection",
+        result: AnalysisResult,
+    ) -> list[MigrationIssue]:
+        """Analisa operação CreateIndexOnline (mesmas verificações de dados)."""
+        return await self._analyze_createindex(op, idx, conn, result)
+    
+    async def _analyze_setnotnullonline(
+        self,
+        op: "Operation",
+        idx: int,
+        conn: "AsyncConnection",
+        result: AnalysisResult,
+    ) -> list[MigrationIssue]:
+        """Analisa operação SetNotNullOnline."""
+        if op.fill_value is not None:
+            return []
+        try:
+            null_result = await conn.execute(text(
+                f'SELECT COUNT(*) FROM {self.compiler.quote_table(op.table_name)} '
+                f'WHERE {self.compiler.quote_column(op.column_name)} IS NULL'
+            ))
+            null_count = null_result.scalar() or 0
+        except Exception:
+            return []
+        if not null_count:
+            return []
+        return [MigrationIssue(
+            code=IssueCode.NOT_NULL_NO_DEFAULT,
+            severity=Severity.ERROR,
+            message=f"Cannot change '{op.column_name}' to NOT NULL - {null_count:,} rows have NULL values",
+            operation_index=idx,
+            operation_description=op.describe(),
+            suggestion="Pass fill_value= to backfill the NULL rows first",
+            context={"table": op.table_name, "column": op.column_name, "null_count": null_count},
+        )]
+    
     def _generate_not_null_fix(self, table_name: str, column) -> str:
         """Gera código para corrigir problema de NOT NULL sem default."""
         col_type = column.type
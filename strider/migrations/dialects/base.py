@@ -35,6 +35,7 @@ class DialectCompiler(ABC):
     supports_drop_constraint: bool = True
     supports_enum: bool = False
     supports_if_not_exists_index: bool = True
+    supports_online_ddl: bool = False
 
     # ── Type mapping ──────────────────────────────────────────────────
     type_mapping: dict[str, str] = {}
@@ -173,6 +174,18 @@ class DialectCompiler(ABC):
         """Return CREATE TABLE SQL for the migrations tracking table."""
         ...
 
+    def checkpoints_table_sql(self, table_name: str) -> str:
+        """Return CREATE TABLE SQL for batched data migration checkpoints."""
+        return f"""
+            CREATE TABLE IF NOT EXISTS {self.quote_table(table_name)} (
+                op_key VARCHAR(64) PRIMARY KEY,
+                description VARCHAR(255) NOT NULL,
+                last_pk VARCHAR(255),
+                rows_done BIGINT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+
     # ── Database info queries ─────────────────────────────────────────
 
     @abstractmethod
@@ -185,6 +198,74 @@ class DialectCompiler(ABC):
         """Return SQL to find tables referencing `table_name`, or None."""
         ...
 
+    def table_row_estimates_sql(self) -> str | None:
+        """
+        Return SQL yielding ``(table_name, estimated_rows)`` for all user
+        tables from catalog statistics, or None if the dialect has none.
+        """
+        return None
+
+    # ── Online DDL ────────────────────────────────────────────────────
+
+    def lock_timeout_sql(self, timeout_ms: int | None) -> str | None:
+        """
+        Return SQL bounding how long the session waits for locks, or None.
+
+        ``timeout_ms=None`` resets the session to the server default.
+        """
+        return None
+
+    def is_lock_timeout(self, exc: BaseException) -> bool:
+        """Whether `exc` means a lock could not be acquired in time."""
+        message = str(exc).lower()
+        return "lock" in message and ("timeout" in message or "locked" in message)
+
+    def add_column_online_sql(self, table_name: str, column_sql: str) -> str:
+        """Return SQL adding a (nullable) column without rewriting the table."""
+        return f"ALTER TABLE {self.quote_table(table_name)} ADD COLUMN {column_sql}"
+
+    def create_index_online_sql(
+        self,
+        table_name: str,
+        index_name: str,
+        columns: list[str],
+        unique: bool = False,
+    ) -> str:
+        """Return SQL building an index without blocking writes, if possible."""
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        exists = " IF NOT EXISTS" if self.supports_if_not_exists_index else ""
+        cols = ", ".join(self.quote_column(c) for c in columns)
+        return (
+            f"CREATE {kind}{exists} {self.quote_column(index_name)} "
+            f"ON {self.quote_table(table_name)} ({cols})"
+        )
+
+    def drop_index_online_sql(self, table_name: str, index_name: str) -> str:
+        """Return SQL dropping an index without blocking writes, if possible."""
+        return f"DROP INDEX IF EXISTS {self.quote_column(index_name)}"
+
+    def invalid_index_sql(self) -> str | None:
+        """
+        Return SQL (bound by ``:name``) selecting a half-built index left by
+        an interrupted online build, or None if the dialect cannot leave one.
+        """
+        return None
+
+    def set_nullable_online_sql(
+        self,
+        table_name: str,
+        column_name: str,
+        col_type: str,
+        nullable: bool,
+        default: Any = None,
+    ) -> list[str]:
+        """Return the statements toggling NOT NULL with the shortest locks."""
+        action = "DROP NOT NULL" if nullable else "SET NOT NULL"
+        return [
+            f"ALTER TABLE {self.quote_table(table_name)} "
+            f"ALTER COLUMN {self.quote_column(column_name)} {action}"
+        ]
+
     # ── Quoting ───────────────────────────────────────────────────────
 
     def quote_table(self, name: str) -> str:
@@ -25,6 +25,7 @@ class MySQLCompiler(DialectCompiler):
     supports_drop_constraint = True
     supports_enum = False  # Could be True, but handled differently
     supports_if_not_exists_index = False
+    supports_online_ddl = True
 
     type_mapping = {
         "DATETIME": "DATETIME",
@@ -64,6 +65,12 @@ class MySQLCompiler(DialectCompiler):
             "WHERE table_schema = DATABASE()"
         )
 
+    def table_row_estimates_sql(self) -> str | None:
+        return (
+            "SELECT table_name, table_rows FROM information_schema.tables "
+            "WHERE table_schema = DATABASE()"
+        )
+
     def foreign_key_check_sql(self, table_name: str) -> str | None:
         return f"""
             SELECT TABLE_NAME
@@ -72,6 +79,63 @@ class MySQLCompiler(DialectCompiler):
                 AND TABLE_SCHEMA = DATABASE()
         """
 
+    # InnoDB online DDL: falha em vez de cair para cópia/lock da tabela
+    _ONLINE = "ALGORITHM=INPLACE, LOCK=NONE"
+
+    def lock_timeout_sql(self, timeout_ms: int | None) -> str | None:
+        # lock_wait_timeout (metadata locks) tem granularidade de segundos
+        if timeout_ms is None:
+            return "SET SESSION lock_wait_timeout = DEFAULT"
+        return f"SET SESSION lock_wait_timeout = {max(1, -(-int(timeout_ms) // 1000))}"
+
+    def is_lock_timeout(self, exc: BaseException) -> bool:
+        # 1205 = ER_LOCK_WAIT_TIMEOUT, 1213 = ER_LOCK_DEADLOCK
+        orig = getattr(exc, "orig", exc)
+        args = getattr(orig, "args", ())
+        if args and isinstance(args[0], int):
+            return args[0] in (1205, 1213)
+        return super().is_lock_timeout(exc)
+
+    def add_column_online_sql(self, table_name: str, column_sql: str) -> str:
+        return f"ALTER TABLE {self.quote_table(table_name)} ADD COLUMN {column_sql}, {self._ONLINE}"
+
+    def create_index_online_sql(
+        self,
+        table_name: str,
+        index_name: str,
+        columns: list[str],
+        unique: bool = False,
+    ) -> str:
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        cols = ", ".join(self.quote_column(c) for c in columns)
+        return (
+            f"ALTER TABLE {self.quote_table(table_name)} "
+            f"ADD {kind} {self.quote_column(index_name)} ({cols}), {self._ONLINE}"
+        )
+
+    def drop_index_online_sql(self, table_name: str, index_name: str) -> str:
+        return (
+            f"ALTER TABLE {self.quote_table(table_name)} "
+            f"DROP INDEX {self.quote_column(index_name)}, {self._ONLINE}"
+        )
+
+    def set_nullable_online_sql(
+        self,
+        table_name: str,
+        column_name: str,
+        col_type: str,
+        nullable: bool,
+        default=None,
+    ) -> list[str]:
+        # MODIFY exige a definição completa da coluna (inclusive o default)
+        column_sql = self.column_to_sql(
+            name=column_name,
+            col_type=col_type,
+            nullable=nullable,
+            default=default,
+        )
+        return [f"ALTER TABLE {self.quote_table(table_name)} MODIFY {column_sql}, {self._ONLINE}"]
+
     def quote_table(self, name: str) -> str:
         return f"`{name}`"
 
@@ -25,6 +25,7 @@ class PostgreSQLCompiler(DialectCompiler):
     supports_add_constraint = True
     supports_drop_constraint = True
     supports_enum = True
+    supports_online_ddl = True
 
     type_mapping = {
         "DATETIME": "TIMESTAMP WITH TIME ZONE",
@@ -77,6 +78,13 @@ class PostgreSQLCompiler(DialectCompiler):
             "WHERE table_schema = 'public'"
         )
 
+    def table_row_estimates_sql(self) -> str | None:
+        return (
+            "SELECT c.relname, c.reltuples::bigint FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p')"
+        )
+
     def foreign_key_check_sql(self, table_name: str) -> str | None:
         return f"""
             SELECT tc.table_name
@@ -87,5 +95,65 @@ class PostgreSQLCompiler(DialectCompiler):
                 AND ccu.table_name = '{table_name}'
         """
 
+    def lock_timeout_sql(self, timeout_ms: int | None) -> str | None:
+        if timeout_ms is None:
+            return "RESET lock_timeout"
+        return f"SET lock_timeout = '{int(timeout_ms)}ms'"
+
+    def is_lock_timeout(self, exc: BaseException) -> bool:
+        # 55P03 = lock_not_available (lock_timeout / NOWAIT)
+        orig = getattr(exc, "orig", exc)
+        code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+        if code:
+            return code == "55P03"
+        return "lock timeout" in str(exc).lower()
+
+    def create_index_online_sql(
+        self,
+        table_name: str,
+        index_name: str,
+        columns: list[str],
+        unique: bool = False,
+    ) -> str:
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        cols = ", ".join(self.quote_column(c) for c in columns)
+        return (
+            f"CREATE {kind} CONCURRENTLY IF NOT EXISTS {self.quote_column(index_name)} "
+            f"ON {self.quote_table(table_name)} ({cols})"
+        )
+
+    def drop_index_online_sql(self, table_name: str, index_name: str) -> str:
+        return f"DROP INDEX CONCURRENTLY IF EXISTS {self.quote_column(index_name)}"
+
+    def invalid_index_sql(self) -> str | None:
+        return (
+            "SELECT 1 FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        )
+
+    def set_nullable_online_sql(
+        self,
+        table_name: str,
+        column_name: str,
+        col_type: str,
+        nullable: bool,
+        default=None,
+    ) -> list[str]:
+        table = self.quote_table(table_name)
+        column = self.quote_column(column_name)
+        if nullable:
+            return [f"ALTER TABLE {table} ALTER COLUMN {column} DROP NOT NULL"]
+        # SET NOT NULL direto faz um full scan sob ACCESS EXCLUSIVE. Com um
+        # CHECK validado antes (lock fraco), o PostgreSQL 12+ pula o scan.
+        check = self.quote_column(f"{table_name}_{column_name}_not_null"[:63])
+        return [
+            f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check}",
+            f"ALTER TABLE {table} ADD CONSTRAINT {check} CHECK ({column} IS NOT NULL) NOT VALID",
+            f"ALTER TABLE {table} VALIDATE CONSTRAINT {check}",
+            f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL",
+            f"ALTER TABLE {table} DROP CONSTRAINT {check}",
+        ]
+
     def quote_table(self, name: str) -> str:
         return f'"{name}"'
@@ -64,6 +64,10 @@ class SQLiteCompiler(DialectCompiler):
             "WHERE type='table' AND name NOT LIKE 'sqlite_%'"
         )
 
+    def lock_timeout_sql(self, timeout_ms: int | None) -> str | None:
+        # Sem timeout explícito, volta ao padrão do driver (5s)
+        return f"PRAGMA busy_timeout = {5000 if timeout_ms is None else int(timeout_ms)}"
+
     def foreign_key_check_sql(self, table_name: str) -> str | None:
         return (
             f"SELECT * FROM sqlite_master WHERE type='table' "
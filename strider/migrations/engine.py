@@ -26,7 +26,7 @@ from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
 logger = logging.getLogger("strider.migrations.engine")
 
 from strider.migrations.dialects import get_compiler, detect_dialect
-from strider.migrations.migration import Migration
+from strider.migrations.migration import Migration, misplaced_non_atomic
 from strider.migrations.operations import (
     Operation,
     CreateTable,
@@ -92,6 +92,8 @@ class MigrationEngine:
         self._engine = create_async_engine(database_url, echo=False)
         self._dialect = detect_dialect(database_url)
         self._compiler = get_compiler(self._dialect)
+        # Snapshot do schema do banco, reaproveitado durante um comando
+        self._db_state: SchemaState | None = None
     
     @property
     def dialect(self) -> str:
@@ -147,6 +149,59 @@ class MigrationEngine:
             {"app": app, "name": name},
         )
     
+    async def _run_operation(
+        self,
+        conn: AsyncConnection,
+        op: Operation,
+        backward: bool = False,
+    ) -> None:
+        """
+        Executa uma operação na conexão da migração.
+        
+        Operações não atômicas (``op.atomic = False``, ex.: DDL online e
+        backfills em lotes) não podem rodar dentro de uma transação:
+        o que já foi feito é commitado e a operação roda em autocommit
+        (``op.autocommit``) ou controlando os próprios commits. Elas vêm
+        sempre antes das atômicas (``_check_operation_order``), então só
+        operações não atômicas anteriores são commitadas aqui.
+        """
+        run = op.backward if backward else op.forward
+        if op.atomic:
+            await run(conn, self.dialect)
+            return
+        
+        await conn.commit()
+        if not op.autocommit:
+            await run(conn, self.dialect)
+            await conn.commit()
+            return
+        
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            await run(conn, self.dialect)
+        finally:
+            # Em autocommit o commit é no-op; só encerra o autobegin do SQLAlchemy
+            await conn.commit()
+            await conn.execution_options(isolation_level=conn.default_isolation_level)
+    
+    @staticmethod
+    def _check_operation_order(migration: Migration) -> None:
+        """
+        Recusa migrações com operações não atômicas depois de atômicas.
+        
+        Aplicando: as não atômicas (idempotentes) rodam primeiro e o resto
+        da migração é commitado junto com o registro. Revertendo: as
+        atômicas são desfeitas junto com a remoção do registro e as não
+        atômicas depois; se uma delas falhar, ``migrate`` a reaplica.
+        """
+        idx = misplaced_non_atomic(migration.operations)
+        if idx is not None:
+            raise RuntimeError(
+                f"Migration {migration.name}: non-atomic operation "
+                f"'{migration.operations[idx].describe()}' must come before atomic ones. "
+                "Move it to the start of the migration or into its own migration."
+            )
+    
     def _get_migration_files(self) -> list[Path]:
         """Lista arquivos de migração ordenados."""
         if not self.migrations_dir.exists():
@@ -598,12 +653,26 @@ migration = Migration(
     ) -> SchemaDiff:
         """Detecta mudanças entre models e banco de dados."""
         models_state = models_to_schema_state(models)
-        
-        async with self._engine.connect() as conn:
-            db_state = await get_database_schema_state(conn)
-        
+        db_state = await self.get_database_state()
         return db_state.diff(models_state)
     
+    async def get_database_state(self, refresh: bool = False) -> SchemaState:
+        """
+        Retorna o snapshot do schema do banco.
+        
+        A reflexão é feita uma única vez por engine (isto é, por comando) e
+        reaproveitada nas chamadas seguintes. Use ``refresh=True`` ou
+        ``invalidate_database_state()`` após alterar o schema.
+        """
+        if self._db_state is None or refresh:
+            async with self._engine.connect() as conn:
+                self._db_state = await get_database_schema_state(conn)
+        return self._db_state
+    
+    def invalidate_database_state(self) -> None:
+        """Descarta o snapshot do schema em cache."""
+        self._db_state = None
+    
     async def makemigrations(
         self,
         models: list[type["Model"]],
@@ -807,8 +876,10 @@ migration = Migration(
                 print(f"  {migration_name}...", end=" ", flush=True)
                 
                 if not fake:
+                    self._check_operation_order(migration)
                     for op in migration.operations:
-                        await op.forward(conn, self.dialect)
+                        await self._run_operation(conn, op)
+                    self.invalidate_database_state()
                 
                 await self._mark_migration_applied(conn, self.app_label, migration_name)
                 await conn.commit()
@@ -875,14 +946,27 @@ migration = Migration(
                 
                 print(f"Rolling back {name}...")
                 
+                # Atômicas são desfeitas na mesma transação que remove o
+                # registro; as não atômicas (as primeiras da migração) depois
+                non_atomic: list[Operation] = []
                 if not fake:
+                    self._check_operation_order(migration)
                     for op in reversed(migration.operations):
+                        if not op.atomic:
+                            non_atomic.append(op)
+                            continue
                         print(f"  - Reverse: {op.describe()}")
-                        await op.backward(conn, self.dialect)
+                        await self._run_operation(conn, op, backward=True)
                 
                 await self._unmark_migration_applied(conn, self.app_label, name)
                 await conn.commit()
                 
+                if not fake:
+                    for op in non_atomic:
+                        print(f"  - Reverse: {op.describe()}")
+                        await self._run_operation(conn, op, backward=True)
+                    self.invalidate_database_state()
+                
                 reverted.append(name)
                 print(f"  OK")
                 
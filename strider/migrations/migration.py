@@ -7,12 +7,31 @@ Cada arquivo de migração contém uma classe Migration que herda desta.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 if TYPE_CHECKING:
     from strider.migrations.operations import Operation
 
 
+def misplaced_non_atomic(operations: Sequence["Operation"]) -> int | None:
+    """
+    Índice da primeira operação não atômica que vem depois de uma atômica.
+    
+    Operações não atômicas (DDL online, backfills em lotes) commitam por
+    conta própria. Se vierem depois de operações atômicas, essas seriam
+    commitadas antes do registro da migração e uma falha deixaria a
+    migração aplicada pela metade. Por isso elas precisam vir primeiro:
+    são idempotentes e o resto da migração roda em uma única transação.
+    """
+    seen_atomic = False
+    for idx, op in enumerate(operations):
+        if getattr(op, "atomic", True):
+            seen_atomic = True
+        elif seen_atomic:
+            return idx
+    return None
+
+
 @dataclass
 class Migration:
     """
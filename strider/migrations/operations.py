@@ -1,22 +1,28 @@
 """Migration operations."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import logging
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Callable, ClassVar, TYPE_CHECKING
 from uuid import UUID
 from collections.abc import Awaitable
 
-from sqlalchemy import text
+from sqlalchemy import inspect, text
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncConnection
     from strider.migrations.dialects.base import DialectCompiler
 
+logger = logging.getLogger("strider.migrations.operations")
+
 
 def fingerprint(operations: list[Operation]) -> str:
     """Generate fingersprint for migrations"""
@@ -298,6 +304,11 @@ class Operation(ABC):
     """Base migration operation."""
     destructive: bool = False
     reversible: bool = True
+    # False: o engine commita o que veio antes e executa a operação fora
+    # da transação da migração. Com autocommit=True a conexão fica em modo
+    # autocommit (DDL online); com False a própria operação faz os commits.
+    atomic: bool = True
+    autocommit: bool = True
 
     @abstractmethod
     def to_fingerprint(self) -> dict | None:
@@ -790,6 +801,616 @@ class DropForeignKey(Operation):
         return f"Drop FK '{self.constraint_name}'"
 
 
+# =============================================================================
+# Online (low-lock) Operations
+# =============================================================================
+
+def _resolve_value(value: Any) -> Any:
+    """Resolve a (possibly callable) default to a bindable value."""
+    if callable(value):
+        try:
+            value = value()
+        except TypeError:
+            value = value(None)
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return value
+
+
+async def _column_exists(conn: "AsyncConnection", table_name: str, column_name: str) -> bool:
+    def check(sync_conn) -> bool:
+        return any(c["name"] == column_name for c in inspect(sync_conn).get_columns(table_name))
+    return await conn.run_sync(check)
+
+
+async def _index_exists(conn: "AsyncConnection", table_name: str, index_name: str) -> bool:
+    def check(sync_conn) -> bool:
+        return any(i["name"] == index_name for i in inspect(sync_conn).get_indexes(table_name))
+    return await conn.run_sync(check)
+
+
+class _OnlineOperation:
+    """
+    Lock timeout and retry shared by the online operations.
+
+    Each DDL statement waits at most ``lock_timeout_ms`` for its lock, so a
+    long-running query on the table cannot queue every other session behind
+    the migration. On timeout the statement is retried with exponential
+    backoff, up to ``max_retries`` times.
+    """
+    lock_timeout_ms: int
+    max_retries: int
+    retry_backoff: float
+    atomic: ClassVar[bool] = False
+
+    @asynccontextmanager
+    async def _lock_timeout(self, conn: "AsyncConnection", compiler: "DialectCompiler"):
+        sql = compiler.lock_timeout_sql(self.lock_timeout_ms)
+        if sql:
+            await conn.execute(text(sql))
+        try:
+            yield
+        finally:
+            reset = compiler.lock_timeout_sql(None)
+            if reset:
+                await conn.execute(text(reset))
+
+    async def _retry(
+        self,
+        compiler: "DialectCompiler",
+        action: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await action()
+            except Exception as exc:
+                if attempt >= self.max_retries or not compiler.is_lock_timeout(exc):
+                    raise
+                attempt += 1
+                delay = self.retry_backoff * (2 ** (attempt - 1))
+                logger.warning(
+                    "%s: lock timeout, retry %d/%d in %.1fs",
+                    self.describe(), attempt, self.max_retries, delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _execute(self, conn: "AsyncConnection", compiler: "DialectCompiler", sql: str) -> None:
+        await self._retry(compiler, lambda: conn.execute(text(sql)))
+
+    async def _backfill(
+        self,
+        conn: "AsyncConnection",
+        compiler: "DialectCompiler",
+        table_name: str,
+        column_name: str,
+        value: Any,
+        *,
+        pk: str,
+        batch_size: int,
+        throttle: float,
+    ) -> int:
+        """
+        Fill NULLs of `column_name` with `value`, walking the primary key in
+        batches of `batch_size` rows. Each UPDATE commits on its own (the
+        engine runs online operations in autocommit), so no long transaction
+        or WAL spike builds up. Only NULL rows are touched, which makes an
+        interrupted backfill safe to run again.
+        """
+        table = compiler.quote_table(table_name)
+        column = compiler.quote_column(column_name)
+        pk_col = compiler.quote_column(pk)
+        
+        total = 0
+        last = None
+        started = time.monotonic()
+        while True:
+            params: dict[str, Any] = {"offset": batch_size - 1}
+            lower = ""
+            if last is not None:
+                lower = f"WHERE {pk_col} > :last "
+                params["last"] = last
+            bound = await conn.execute(
+                text(f"SELECT {pk_col} FROM {table} {lower}ORDER BY {pk_col} LIMIT 1 OFFSET :offset"),
+                params,
+            )
+            upper = bound.scalar()
+            
+            where = [f"{column} IS NULL"]
+            params = {"value": value}
+            if last is not None:
+                where.append(f"{pk_col} > :last")
+                params["last"] = last
+            if upper is not None:
+                where.append(f"{pk_col} <= :upper")
+                params["upper"] = upper
+            update = text(f"UPDATE {table} SET {column} = :value WHERE {' AND '.join(where)}")
+            result = await self._retry(compiler, lambda: conn.execute(update, params))
+            total += max(result.rowcount or 0, 0)
+            
+            if upper is None:
+                break
+            last = upper
+            if throttle:
+                await asyncio.sleep(throttle)
+        
+        elapsed = time.monotonic() - started
+        logger.info(
+            "Backfilled %s.%s: %d rows in %.1fs", table_name, column_name, total, elapsed,
+        )
+        return total
+
+
+@dataclass
+class CreateIndexOnline(_OnlineOperation, CreateIndex):
+    """
+    Create an index without blocking writes.
+
+    PostgreSQL uses ``CREATE INDEX CONCURRENTLY`` and MySQL
+    ``ALGORITHM=INPLACE, LOCK=NONE``; other dialects fall back to a plain
+    ``CREATE INDEX``. An invalid index left by an interrupted concurrent
+    build is dropped and rebuilt, so re-running the migration resumes.
+    """
+    lock_timeout_ms: int = 5000
+    max_retries: int = 5
+    retry_backoff: float = 1.0
+
+    def to_fingerprint(self) -> dict:
+        """Generate fingersprin from object."""
+        return {**super().to_fingerprint(), "op": "CreateIndexOnline"}
+
+    async def forward(self, conn: "AsyncConnection", dialect: str) -> None:
+        compiler = _get_compiler(dialect)
+        
+        async def build() -> None:
+            invalid_sql = compiler.invalid_index_sql()
+            if invalid_sql:
+                invalid = await conn.execute(text(invalid_sql), {"name": self.index_name})
+                if invalid.first():
+                    await conn.execute(text(compiler.drop_index_online_sql(self.table_name, self.index_name)))
+            if not compiler.supports_if_not_exists_index:
+                if await _index_exists(conn, self.table_name, self.index_name):
+                    return
+            await conn.execute(text(compiler.create_index_online_sql(
+                self.table_name, self.index_name, self.columns, self.unique,
+            )))
+        
+        async with self._lock_timeout(conn, compiler):
+            # Um build concorrente que expira deixa um índice inválido:
+            # a tentativa seguinte precisa recomeçar do zero.
+            await self._retry(compiler, build)
+    
+    async def backward(self, conn: "AsyncConnection", dialect: str) -> None:
+        compiler = _get_compiler(dialect)
+        async with self._lock_timeout(conn, compiler):
+            await self._execute(conn, compiler, compiler.drop_index_online_sql(self.table_name, self.index_name))
+    
+    def describe(self) -> str:
+        return f"Create {'unique ' if self.unique else ''}index '{self.index_name}' (online)"
+
+
+@dataclass
+class AddColumnOnline(_OnlineOperation, Operation):
+    """
+    Add a column to a large table in short-lock steps.
+
+    Instead of one ``ADD COLUMN ... NOT NULL DEFAULT`` that may rewrite or
+    lock the whole table, runs: add as nullable -> set default -> batched
+    backfill of existing rows -> set NOT NULL -> unique index (online).
+    Every step is idempotent, so an interrupted run resumes where it stopped.
+    """
+    table_name: str
+    column: ColumnDef
+    pk: str = "id"
+    batch_size: int = 5000
+    throttle: float = 0.0
+    lock_timeout_ms: int = 5000
+    max_retries: int = 5
+    retry_backoff: float = 1.0
+
+    def to_fingerprint(self) -> dict:
+        """Generate fingersprin from object."""
+        return {
+            "op": "AddColumnOnline",
+            "table": self.table_name,
+            "columns": [self.column.to_fingerprint()],
+        }
+
+    async def forward(self, conn: "AsyncConnection", dialect: str) -> None:
+        compiler = _get_compiler(dialect)
+        column = self.column
+        
+        if not compiler.supports_alter_column:
+            # Sem ALTER COLUMN (SQLite) não há como fazer em etapas; lá o
+            # ADD COLUMN com DEFAULT constante já não reescreve a tabela.
+            if not await _column_exists(conn, self.table_name, column.name):
+                await AddColumn(self.table_name, column).forward(conn, dialect)
+            return
+        
+        table = compiler.quote_table(self.table_name)
+        quoted = compiler.quote_column(column.name)
+        value = _resolve_value(column.default)
+        
+        async with self._lock_timeout(conn, compiler):
+            if not await _column_exists(conn, self.table_name, column.name):
+                nullable = replace(column, nullable=True, default=None, unique=False, primary_key=False)
+                await self._execute(conn, compiler, compiler.add_column_online_sql(
+                    self.table_name, nullable.to_sql(dialect),
+                ))
+            
+            if value is not None:
+                default_sql = column.get_default_sql(dialect)
+                if default_sql:
+                    await self._execute(conn, compiler, f"ALTER TABLE {table} ALTER COLUMN {quoted} SET {default_sql}")
+                await self._backfill(
+                    conn, compiler, self.table_name, column.name, value,
+                    pk=self.pk, batch_size=self.batch_size, throttle=self.throttle,
+                )
+            
+            if not column.nullable:
+                for sql in compiler.set_nullable_online_sql(
+                    self.table_name, column.name, column.type, False, default=value,
+                ):
+                    await self._execute(conn, compiler, sql)
+        
+        if column.unique:
+            await CreateIndexOnline(
+                self.table_name, f"{self.table_name}_{column.name}_key", [column.name], unique=True,
+                lock_timeout_ms=self.lock_timeout_ms,
+                max_retries=self.max_retries,
+                retry_backoff=self.retry_backoff,
+            ).forward(conn, dialect)
+    
+    async def backward(self, conn: "AsyncConnection", dialect: str) -> None:
+        compiler = _get_compiler(dialect)
+        table = compiler.quote_table(self.table_name)
+        quoted = compiler.quote_column(self.column.name)
+        async with self._lock_timeout(conn, compiler):
+            await self._execute(conn, compiler, f"ALTER TABLE {table} DROP COLUMN {quoted}")
+    
+    def describe(self) -> str:
+        return f"Add column '{self.column.name}' to '{self.table_name}' (online)"
+    
+    def to_code(self) -> str:
+        c = self.column
+        return f"""AddColumnOnline(
+        table_name='{self.table_name}',
+        column=ColumnDef(
+            name='{c.name}', type='{c.type}', nullable={c.nullable},
+            default={_serialize_default(c.default)}, primary_key={c.primary_key},
+            autoincrement={c.autoincrement}, unique={c.unique}
+        ),
+        pk='{self.pk}',
+        batch_size={self.batch_size},
+        throttle={self.throttle},
+        lock_timeout_ms={self.lock_timeout_ms},
+        max_retries={self.max_retries},
+        retry_backoff={self.retry_backoff},
+    )"""
+
+
+@dataclass
+class SetNotNullOnline(_OnlineOperation, Operation):
+    """
+    Make an existing column NOT NULL on a large table.
+
+    NULLs are first replaced by ``fill_value`` in primary-key batches, then
+    NOT NULL is enforced with the shortest lock the dialect allows
+    (PostgreSQL validates a ``CHECK ... NOT VALID`` constraint first, so
+    ``SET NOT NULL`` skips the full-table scan).
+    """
+    table_name: str
+    column_name: str
+    column_type: str
+    fill_value: Any = None
+    pk: str = "id"
+    batch_size: int = 5000
+    throttle: float = 0.0
+    lock_timeout_ms: int = 5000
+    max_retries: int = 5
+    retry_backoff: float = 1.0
+
+    def to_fingerprint(self) -> dict:
+        """Generate fingersprin from object."""
+        return {
+            "op": "SetNotNullOnline",
+            "table": self.table_name,
+            "column": self.column_name,
+            "type": self.column_type,
+            "fill_value": _normalize_default_value(self.fill_value),
+        }
+
+    async def forward(self, conn: "AsyncConnection", dialect: str) -> None:
+        compiler = _get_compiler(dialect)
+        if not compiler.supports_alter_column:
+            raise NotImplementedError(
+                f"{compiler.display_name} does not support ALTER COLUMN. "
+                f"Consider recreating the table instead."
+            )
+        
+        async with self._lock_timeout(conn, compiler):
+            value = _resolve_value(self.fill_value)
+            if value is not None:
+                await self._backfill(
+                    conn, compiler, self.table_name, self.column_name, value,
+                    pk=self.pk, batch_size=self.batch_size, throttle=self.throttle,
+                )
+            for sql in compiler.set_nullable_online_sql(
+                self.table_name, self.column_name, self.column_type, False,
+            ):
+                await self._execute(conn, compiler, sql)
+    
+    async def backward(self, conn: "AsyncConnection", dialect: str) -> None:
+        compiler = _get_compiler(dialect)
+        async with self._lock_timeout(conn, compiler):
+            for sql in compiler.set_nullable_online_sql(
+                self.table_name, self.column_name, self.column_type, True,
+            ):
+                await self._execute(conn, compiler, sql)
+    
+    def describe(self) -> str:
+        return f"Set '{self.column_name}' NOT NULL in '{self.table_name}' (online)"
+
+
+# =============================================================================
+# Batched Data Operations
+# =============================================================================
+
+# Checkpoints de operações em lotes (retomada após interrupção)
+CHECKPOINTS_TABLE = "_core_migration_checkpoints"
+
+
+@dataclass
+class RunBatched(Operation):
+    """
+    Run a data change over a table in primary-key chunks.
+
+    The table is walked in key order, ``batch_size`` rows at a time. Each
+    chunk runs in its own transaction together with a checkpoint row in
+    ``_core_migration_checkpoints``, so no giant transaction (or WAL spike)
+    builds up and an interrupted ``migrate`` resumes after the last
+    committed chunk.
+
+    ``forward_sql`` receives the inclusive chunk bounds as ``:start`` and
+    ``:end``::
+
+        RunBatched(
+            table_name="orders",
+            forward_sql='UPDATE "orders" SET total = price * qty WHERE id BETWEEN :start AND :end',
+        )
+
+    Alternatively ``forward_func(conn, start, end)`` may return the number
+    of affected rows.
+    """
+    table_name: str
+    forward_sql: str | None = None
+    forward_func: Callable[["AsyncConnection", Any, Any], Awaitable[int | None]] | None = None
+    backward_sql: str | None = None
+    pk: str = "id"
+    batch_size: int = 10000
+    throttle: float = 0.0
+    description: str = "Run batched"
+    reversible: bool = field(init=False)
+
+    atomic: ClassVar[bool] = False
+    autocommit: ClassVar[bool] = False
+    # Intervalo mínimo entre linhas de progresso (segundos)
+    progress_interval: ClassVar[float] = 5.0
+
+    def __post_init__(self):
+        if (self.forward_sql is None) == (self.forward_func is None):
+            raise ValueError("RunBatched needs exactly one of forward_sql or forward_func")
+        self.reversible = self.backward_sql is not None
+
+    def to_fingerprint(self) -> dict:
+        """Generate fingersprin from object."""
+        return {
+            "op": "RunBatched",
+            "table": self.table_name,
+            "forward": self.forward_sql.strip() if self.forward_sql else self.description,
+            "backward": self.backward_sql.strip() if self.backward_sql else None,
+            "pk": self.pk,
+        }
+
+    @property
+    def checkpoint_key(self) -> str:
+        """Stable key of this operation in the checkpoints table."""
+        payload = json.dumps(self.to_fingerprint(), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    async def _run_chunk(
+        self,
+        conn: "AsyncConnection",
+        compiler: "DialectCompiler",
+        start: Any,
+        end: Any,
+    ) -> int:
+        if self.forward_func is not None:
+            return await self.forward_func(conn, start, end) or 0
+        result = await conn.execute(text(self.forward_sql), {"start": start, "end": end})
+        return max(result.rowcount or 0, 0)
+
+    async def _load_checkpoint(
+        self,
+        conn: "AsyncConnection",
+        compiler: "DialectCompiler",
+    ) -> tuple[Any, int]:
+        table = compiler.quote_table(CHECKPOINTS_TABLE)
+        await conn.execute(text(compiler.checkpoints_table_sql(CHECKPOINTS_TABLE)))
+        row = (await conn.execute(
+            text(f"SELECT last_pk, rows_done FROM {table} WHERE op_key = :key"),
+            {"key": self.checkpoint_key},
+        )).first()
+        await conn.commit()
+        if row is None or row[0] is None:
+            return None, 0
+        return json.loads(row[0]), row[1] or 0
+
+    async def _save_checkpoint(
+        self,
+        conn: "AsyncConnection",
+        compiler: "DialectCompiler",
+        last_pk: Any,
+        rows_done: int,
+    ) -> None:
+        table = compiler.quote_table(CHECKPOINTS_TABLE)
+        params = {
+            "key": self.checkpoint_key,
+            "description": self.describe()[:255],
+            "last_pk": json.dumps(last_pk, default=str),
+            "rows_done": rows_done,
+        }
+        updated = await conn.execute(text(
+            f"UPDATE {table} SET last_pk = :last_pk, rows_done = :rows_done, "
+            f"updated_at = CURRENT_TIMESTAMP WHERE op_key = :key"
+        ), params)
+        if not updated.rowcount:
+            await conn.execute(text(
+                f"INSERT INTO {table} (op_key, description, last_pk, rows_done) "
+                f"VALUES (:key, :description, :last_pk, :rows_done)"
+            ), params)
+
+    async def _next_chunk(
+        self,
+        conn: "AsyncConnection",
+        compiler: "DialectCompiler",
+        last_pk: Any,
+    ) -> tuple[Any, Any] | None:
+        """Return the inclusive key range of the next chunk, or None at the end."""
+        table = compiler.quote_table(self.table_name)
+        pk = compiler.quote_column(self.pk)
+        after = f"WHERE {pk} > :last" if last_pk is not None else ""
+        start = (await conn.execute(
+            text(f"SELECT MIN({pk}) FROM {table} {after}"), {"last": last_pk},
+        )).scalar()
+        if start is None:
+            return None
+        end = (await conn.execute(
+            text(f"SELECT {pk} FROM {table} WHERE {pk} >= :start ORDER BY {pk} LIMIT 1 OFFSET :offset"),
+            {"start": start, "offset": self.batch_size - 1},
+        )).scalar()
+        if end is None:
+            end = (await conn.execute(text(f"SELECT MAX({pk}) FROM {table}"))).scalar()
+        return start, end
+
+    async def forward(self, conn: "AsyncConnection", dialect: str) -> None:
+        compiler = _get_compiler(dialect)
+        last_pk, rows_done = await self._load_checkpoint(conn, compiler)
+        if last_pk is not None:
+            print(f"    resuming {self.describe()} after {self.pk}={last_pk} ({rows_done:,} rows done)")
+        
+        started = last_report = time.monotonic()
+        rows_this_run = 0
+        while True:
+            chunk = await self._next_chunk(conn, compiler, last_pk)
+            if chunk is None:
+                break
+            start, end = chunk
+            try:
+                affected = await self._run_chunk(conn, compiler, start, end)
+                rows_done += affected
+                await self._save_checkpoint(conn, compiler, end, rows_done)
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+            rows_this_run += affected
+            last_pk = end
+            
+            now = time.monotonic()
+            if now - last_report >= self.progress_interval:
+                rate = rows_this_run / max(now - started, 1e-9)
+                print(f"    {self.table_name}: {rows_done:,} rows, {self.pk}={end} ({rate:,.0f} rows/s)")
+                last_report = now
+            if self.throttle:
+                await asyncio.sleep(self.throttle)
+        
+        elapsed = time.monotonic() - started
+        rate = rows_this_run / max(elapsed, 1e-9)
+        print(f"    {self.table_name}: {rows_done:,} rows in {elapsed:.1f}s ({rate:,.0f} rows/s)")
+        
+        await conn.execute(
+            text(f"DELETE FROM {compiler.quote_table(CHECKPOINTS_TABLE)} WHERE op_key = :key"),
+            {"key": self.checkpoint_key},
+        )
+        await conn.commit()
+    
+    async def backward(self, conn: "AsyncConnection", dialect: str) -> None:
+        if not self.backward_sql:
+            raise RuntimeError("Operation not reversible")
+        await replace(self, forward_sql=self.backward_sql, forward_func=None, backward_sql=None).forward(conn, dialect)
+    
+    def describe(self) -> str:
+        return self.description
+
+
+@dataclass
+class BackfillColumn(RunBatched):
+    """
+    Fill a column in primary-key chunks (see :class:`RunBatched`).
+
+    Sets ``column_name`` to ``value`` (bound parameter) or to a SQL
+    ``expression`` over the row, by default only where it is still NULL::
+
+        BackfillColumn(table_name="orders", column_name="channel", value="web")
+        BackfillColumn(table_name="orders", column_name="total", expression='"price" * "qty"')
+
+    Reversing is a no-op: the data goes away with the schema change that
+    is reverted next to it.
+    """
+    column_name: str = ""
+    value: Any = None
+    expression: str | None = None
+    only_null: bool = True
+
+    def __post_init__(self):
+        if not self.column_name:
+            raise ValueError("BackfillColumn requires column_name")
+        if self.description == "Run batched":
+            self.description = f"Backfill '{self.column_name}' in '{self.table_name}'"
+        self.reversible = True
+
+    def to_fingerprint(self) -> dict:
+        """Generate fingersprin from object."""
+        return {
+            "op": "BackfillColumn",
+            "table": self.table_name,
+            "column": self.column_name,
+            "value": _normalize_default_value(self.value),
+            "expression": self.expression,
+            "only_null": self.only_null,
+            "pk": self.pk,
+        }
+
+    async def _run_chunk(
+        self,
+        conn: "AsyncConnection",
+        compiler: "DialectCompiler",
+        start: Any,
+        end: Any,
+    ) -> int:
+        table = compiler.quote_table(self.table_name)
+        column = compiler.quote_column(self.column_name)
+        pk = compiler.quote_column(self.pk)
+        
+        params: dict[str, Any] = {"start": start, "end": end}
+        if self.expression is not None:
+            new_value = self.expression
+        else:
+            new_value = ":value"
+            params["value"] = _resolve_value(self.value)
+        where = f"{pk} BETWEEN :start AND :end"
+        if self.only_null:
+            where += f" AND {column} IS NULL"
+        result = await conn.execute(text(f"UPDATE {table} SET {column} = {new_value} WHERE {where}"), params)
+        return max(result.rowcount or 0, 0)
+    
+    async def backward(self, conn: "AsyncConnection", dialect: str) -> None:
+        return None
+
+
 # =============================================================================
 # Custom SQL/Python Operations
 # =============================================================================
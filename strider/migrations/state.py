@@ -503,6 +503,7 @@ def _table_to_state(table) -> TableState | None:
 INTERNAL_TABLES = {
     # Sistema de migrações
     "_core_migrations",
+    "_core_migration_checkpoints",
     # SQLite interno
     "sqlite_sequence",
 }
@@ -511,6 +512,7 @@ INTERNAL_TABLES = {
 # Só podem ser removidas via reset_db com confirmação
 PROTECTED_TABLES = {
     "_core_migrations",
+    "_core_migration_checkpoints",
     "auth_users",
     "auth_groups",
     "auth_permissions",
@@ -520,57 +522,72 @@ PROTECTED_TABLES = {
 }
 
 
-async def get_database_schema_state(conn: "AsyncConnection") -> SchemaState:
-    """Extrai estado atual do schema do banco de dados."""
-    state = SchemaState()
-    
-    # Usa o inspector do SQLAlchemy
-    def inspect_db(connection):
-        inspector = inspect(connection)
-        tables = {}
+def _reflect_tables(connection) -> dict[str, TableState]:
+    """
+    Reflete todas as tabelas do schema padrão de uma vez.
+
+    Usa a reflexão multi-tabela do SQLAlchemy 2.0 (``get_multi_*``): no
+    PostgreSQL são três consultas ao catálogo no total, em vez de três por
+    tabela. Dialetos sem implementação nativa caem no laço por tabela do
+    próprio SQLAlchemy, com o mesmo resultado.
+    """
+    inspector = inspect(connection)
+    table_names = [
+        name for name in inspector.get_table_names()
+        if name not in INTERNAL_TABLES
+    ]
+    if not table_names:
+        return {}
+    
+    multi_columns = inspector.get_multi_columns(filter_names=table_names)
+    multi_fks = inspector.get_multi_foreign_keys(filter_names=table_names)
+    multi_indexes = inspector.get_multi_indexes(filter_names=table_names)
+    
+    tables = {}
+    for table_name in table_names:
+        # Chaves são (schema, tabela); schema padrão é None
+        key = (None, table_name)
         
-        for table_name in inspector.get_table_names():
-            # Ignora tabelas internas do sistema
-            if table_name in INTERNAL_TABLES:
-                continue
-            columns = {}
-            for col in inspector.get_columns(table_name):
-                columns[col["name"]] = ColumnState(
-                    name=col["name"],
-                    type=str(col["type"]),
-                    nullable=col.get("nullable", True),
-                    default=col.get("default"),
-                    primary_key=col.get("primary_key", False),
-                    autoincrement=col.get("autoincrement", False),
-                )
-            
-            foreign_keys = []
-            for fk in inspector.get_foreign_keys(table_name):
-                if fk.get("constrained_columns"):
-                    foreign_keys.append(ForeignKeyState(
-                        column=fk["constrained_columns"][0],
-                        references_table=fk["referred_table"],
-                        references_column=fk["referred_columns"][0] if fk.get("referred_columns") else "id",
-                    ))
-            
-            indexes = []
-            for idx in inspector.get_indexes(table_name):
-                indexes.append(IndexState(
-                    name=idx["name"],
-                    columns=idx["column_names"],
-                    unique=idx.get("unique", False),
-                ))
-            
-            tables[table_name] = TableState(
-                name=table_name,
-                columns=columns,
-                foreign_keys=foreign_keys,
-                indexes=indexes,
+        columns = {}
+        for col in multi_columns.get(key, []):
+            columns[col["name"]] = ColumnState(
+                name=col["name"],
+                type=str(col["type"]),
+                nullable=col.get("nullable", True),
+                default=col.get("default"),
+                primary_key=col.get("primary_key", False),
+                autoincrement=col.get("autoincrement", False),
             )
         
-        return tables
-    
-    tables = await conn.run_sync(inspect_db)
-    state.tables = tables
+        foreign_keys = []
+        for fk in multi_fks.get(key, []):
+            if fk.get("constrained_columns"):
+                foreign_keys.append(ForeignKeyState(
+                    column=fk["constrained_columns"][0],
+                    references_table=fk["referred_table"],
+                    references_column=fk["referred_columns"][0] if fk.get("referred_columns") else "id",
+                ))
+        
+        indexes = []
+        for idx in multi_indexes.get(key, []):
+            indexes.append(IndexState(
+                name=idx["name"],
+                columns=idx["column_names"],
+                unique=idx.get("unique", False),
+            ))
+        
+        tables[table_name] = TableState(
+            name=table_name,
+            columns=columns,
+            foreign_keys=foreign_keys,
+            indexes=indexes,
+        )
     
+    return tables
+
+
+async def get_database_schema_state(conn: "AsyncConnection") -> SchemaState:
+    """Extrai estado atual do schema do banco de dados."""
+    state = SchemaState()
+    state.tables = await conn.run_sync(_reflect_tables)
     return state
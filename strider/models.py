@@ -14,14 +14,18 @@ Usage:
 from __future__ import annotations
 
 from typing import Any, ClassVar, Self, TYPE_CHECKING
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 
 from pydantic import BaseModel as PydanticBaseModel, ConfigDict
 from sqlalchemy import MetaData, Column, Integer, String, Boolean, DateTime as SADateTime, Float, Text, ForeignKey
-from sqlalchemy import select, update, delete, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, RelationshipDirection
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
+from strider.cache import invalidate_on_commit
 from strider.datetime import timezone, DateTime
 
 if TYPE_CHECKING:
@@ -406,6 +410,58 @@ class Field:
         return column
 
 
+# Linhas por statement no bulk_create (multi-row INSERT ... RETURNING)
+BULK_CREATE_BATCH_SIZE = 1000
+
+
+def _related_key(target: Any, column: Any) -> tuple[bool, Any]:
+    """Valor de ``column`` no objeto relacionado, se já conhecido sem ir ao banco."""
+    state = sa_inspect(target)
+    key = state.mapper.get_property_by_column(column).key
+    if key in state.dict:
+        return True, state.dict[key]
+    if state.identity is not None and column in state.mapper.primary_key:
+        return True, state.identity[state.mapper.primary_key.index(column)]
+    return False, None
+
+
+def _column_values(instance: Any) -> dict[str, Any] | None:
+    """
+    Valores de coluna atribuídos na instância (defaults ficam para o INSERT).
+    
+    FKs de many-to-one apontando para objetos já persistidos são copiadas
+    para as colunas locais. Retorna None quando algum relacionamento só pode
+    ser gravado pelo flush (coleções, alvo ainda sem PK).
+    """
+    state = sa_inspect(instance)
+    mapper = state.mapper
+    values = {
+        key: state.dict[key]
+        for key in mapper.column_attrs.keys()
+        if key in state.dict
+    }
+    for prop in mapper.relationships:
+        if prop.key not in state.dict or prop.viewonly:
+            continue
+        target = state.dict[prop.key]
+        if not target:
+            continue
+        if prop.direction is not RelationshipDirection.MANYTOONE:
+            return None
+        for local, remote in prop.local_remote_pairs:
+            known, value = _related_key(target, remote)
+            if not known or value is None:
+                return None
+            values[mapper.get_property_by_column(local).key] = value
+    return values
+
+
+def _populate(instance: Any, keys: Sequence[str], row: Sequence[Any]) -> None:
+    """Copia os valores devolvidos pelo RETURNING para a instância."""
+    for key, value in zip(keys, row):
+        set_committed_value(instance, key, value)
+
+
 class Manager[T: "Model"]:
     """
     Manager para operações de banco de dados.
@@ -478,6 +534,10 @@ class Manager[T: "Model"]:
         """Retorna o primeiro registro ou None."""
         return await self._create_queryset().first()
     
+    async def in_bulk(self, id_list: Iterable[Any], *, field_name: str = "id") -> dict[Any, T]:
+        """Retorna ``{pk: instância}`` para os ids (queries ``IN`` em lotes)."""
+        return await self._create_queryset().in_bulk(id_list, field_name=field_name)
+    
     async def count(self) -> int:
         """Conta registros."""
         return await self._create_queryset().count()
@@ -513,6 +573,18 @@ class Manager[T: "Model"]:
         """Pré-carrega relacionamentos em queries separadas."""
         return self._create_queryset().prefetch_related(*fields)
     
+    def load_profile(self, profile: Any) -> "QuerySet[T]":
+        """Aplica um perfil de carregamento (nome ou LoadProfile)."""
+        return self._create_queryset().load_profile(profile)
+    
+    def only(self, *fields: str) -> "QuerySet[T]":
+        """Carrega apenas estas colunas (load_only)."""
+        return self._create_queryset().only(*fields)
+    
+    def defer(self, *fields: str) -> "QuerySet[T]":
+        """Não carrega estas colunas na query."""
+        return self._create_queryset().defer(*fields)
+    
     async def create(self, **kwargs: Any) -> T:
         """Cria um novo registro."""
         session = self._get_session()
@@ -523,17 +595,195 @@ class Manager[T: "Model"]:
         await instance.after_create()
         return instance
     
-    async def bulk_create(self, objects: list[dict[str, Any]]) -> list[T]:
-        """Cria múltiplos registros de uma vez."""
+    async def bulk_create(
+        self,
+        objects: Sequence[dict[str, Any] | T],
+        *,
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+        ignore_conflicts: bool = False,
+        update_conflicts: bool = False,
+        update_fields: Sequence[str] | None = None,
+        unique_fields: Sequence[str] | None = None,
+        hydrate: bool = True,
+    ) -> list[Any]:
+        """
+        Cria múltiplos registros com ``INSERT ... VALUES (...), (...) RETURNING``
+        em lotes de ``batch_size`` linhas (SQLite >= 3.35, PostgreSQL).
+        
+        Os hooks em lote ``before_bulk_create``/``after_bulk_create`` recebem
+        todas as instâncias. Dialetos sem RETURNING, e instâncias com
+        relacionamentos que só o flush grava (coleções, alvo sem PK), usam
+        add_all + flush.
+        
+        Sem conflitos, PKs e defaults são gravados nas próprias instâncias,
+        com lotes multi-row nos dois dialetos (no SQLite as linhas voltam
+        pela PK; ver ``_insert_returning_in_order``).
+        
+        Args:
+            objects: Dicts de campos ou instâncias (transientes) do model
+            batch_size: Linhas por statement
+            ignore_conflicts: ``ON CONFLICT DO NOTHING`` (linhas ignoradas não retornam)
+            update_conflicts: ``ON CONFLICT (unique_fields) DO UPDATE SET update_fields``
+            update_fields: Colunas atualizadas no conflito
+            unique_fields: Colunas do conflito (default: PK)
+            hydrate: Se False, retorna só as PKs (sem preencher as instâncias)
+        
+        Returns:
+            As instâncias recebidas, já persistentes e na mesma ordem (ou PKs
+            com ``hydrate=False``). Com conflitos, as linhas devolvidas pelo
+            banco, na ordem dele.
+        """
+        if ignore_conflicts and update_conflicts:
+            raise ValueError("Use ignore_conflicts ou update_conflicts, não ambos")
+        if update_conflicts and not update_fields:
+            raise ValueError("update_conflicts requer update_fields")
+        
         session = self._get_session()
-        instances = [self._model_class(**obj) for obj in objects]
-        for instance in instances:
-            await instance.before_create()
-        session.add_all(instances)
-        await session.flush()
-        for instance in instances:
-            await instance.after_create()
-        return instances
+        model = self._model_class
+        instances = [obj if isinstance(obj, model) else model(**obj) for obj in objects]
+        if not instances:
+            return []
+        await model.before_bulk_create(instances)
+        
+        mapper = sa_inspect(model)
+        dialect = session.get_bind(mapper=mapper).dialect
+        conflicts = ignore_conflicts or update_conflicts
+        rows = [_column_values(instance) for instance in instances] if dialect.insert_returning else []
+        if not dialect.insert_returning or any(row is None for row in rows):
+            if conflicts:
+                if dialect.insert_returning:
+                    raise ValueError(
+                        "bulk_create com conflitos não grava relacionamentos; atribua as colunas de FK"
+                    )
+                raise NotImplementedError(
+                    f"bulk_create com conflitos não é suportado no dialeto {dialect.name}"
+                )
+            session.add_all(instances)
+            await session.flush()
+            created: list[Any] = instances
+            if not hydrate:
+                created = [sa_inspect(instance).identity for instance in instances]
+                created = [key[0] if len(key) == 1 else key for key in created]
+        else:
+            stmt = self._bulk_insert_statement(
+                dialect.name, ignore_conflicts, update_fields if update_conflicts else None, unique_fields,
+            )
+            pk_columns = [getattr(model, mapper.get_property_by_column(col).key) for col in mapper.primary_key]
+            keys = [prop.key for prop in mapper.column_attrs if isinstance(prop.columns[0], Column)]
+            options = {"populate_existing": True} if update_conflicts else {}
+            
+            created = []
+            # Backrefs de objetos já na sessão apontam para instâncias ainda
+            # transientes: o autoflush no meio do INSERT só geraria avisos
+            with session.no_autoflush:
+                for start in range(0, len(instances), batch_size):
+                    batch = rows[start:start + batch_size]
+                    if not hydrate:
+                        result = await session.execute(stmt.returning(*pk_columns), batch)
+                        created.extend(row[0] if len(pk_columns) == 1 else tuple(row) for row in result)
+                    elif conflicts:
+                        result = await session.scalars(stmt.returning(model), batch, execution_options=options)
+                        created.extend(result.all())
+                    else:
+                        # Linhas na ordem dos parâmetros: PKs e defaults voltam para as
+                        # instâncias recebidas, que passam a ser persistentes na sessão
+                        result = await self._insert_returning_in_order(session, dialect, stmt, batch, keys)
+                        for instance, row in zip(instances[start:start + batch_size], result):
+                            _populate(instance, keys, row)
+                            make_transient_to_detached(instance)
+                            session.add(instance)
+                            created.append(instance)
+        
+        model._invalidate_cache(session)
+        # Sem hydrate, o hook recebe as instâncias como montadas (sem valores gerados);
+        # com conflitos, as linhas devolvidas pelo banco
+        await model.after_bulk_create(created if hydrate else instances)
+        return created
+    
+    async def _insert_returning_in_order(
+        self,
+        session: AsyncSession,
+        dialect: Any,
+        stmt: Any,
+        rows: list[dict[str, Any]],
+        keys: Sequence[str],
+    ) -> list[Sequence[Any]]:
+        """
+        Executa o INSERT com RETURNING de ``keys`` e devolve as linhas na ordem de ``rows``.
+        
+        No PostgreSQL o SQLAlchemy garante a ordem com lotes multi-row
+        (``sort_by_parameter_order``). No SQLite ele só garante inserindo uma
+        linha por statement; aqui cada sequência de linhas com as mesmas
+        colunas vira um ``INSERT ... VALUES (...), (...)`` e as linhas voltam
+        pela PK: a informada em todas as linhas, ou a rowid gerada, crescente
+        na ordem do VALUES. Outros casos (PK informada só em parte das linhas,
+        PK composta gerada) ficam com o SQLAlchemy.
+        """
+        model = self._model_class
+        columns = [getattr(model, key) for key in keys]
+        if dialect.name != "sqlite":
+            result = await session.execute(stmt.returning(*columns, sort_by_parameter_order=True), rows)
+            return list(result)
+        
+        mapper = sa_inspect(model)
+        pk_keys = [mapper.get_property_by_column(col).key for col in mapper.primary_key]
+        pk_index = [list(keys).index(key) for key in pk_keys]
+        rowid_pk = len(pk_keys) == 1 and isinstance(mapper.primary_key[0].type, Integer)
+        # Defaults Python também viram parâmetros: conta todas as colunas
+        max_rows = max(1, dialect.insertmanyvalues_max_parameters // len(model.__table__.columns))
+        
+        ordered: list[Sequence[Any]] = []
+        start = 0
+        while start < len(rows):
+            # Multi-VALUES usa as colunas da primeira linha: só linhas com as mesmas chaves
+            columns_set = rows[start].keys()
+            end = start + 1
+            while end < len(rows) and end - start < max_rows and rows[end].keys() == columns_set:
+                end += 1
+            run = rows[start:end]
+            supplied = [all(row.get(key) is not None for key in pk_keys) for row in run]
+            if all(supplied):
+                returned = (await session.execute(insert(model).values(run).returning(*columns))).all()
+                by_pk = {tuple(row[i] for i in pk_index): row for row in returned}
+                ordered.extend(by_pk[tuple(row[key] for key in pk_keys)] for row in run)
+            elif rowid_pk and not any(supplied):
+                returned = (await session.execute(insert(model).values(run).returning(*columns))).all()
+                ordered.extend(sorted(returned, key=lambda row: row[pk_index[0]]))
+            else:
+                result = await session.execute(stmt.returning(*columns, sort_by_parameter_order=True), run)
+                ordered.extend(result)
+            start = end
+        return ordered
+    
+    def _bulk_insert_statement(
+        self,
+        dialect_name: str,
+        ignore_conflicts: bool,
+        update_fields: Sequence[str] | None,
+        unique_fields: Sequence[str] | None,
+    ) -> Any:
+        """INSERT do model, com ON CONFLICT quando pedido (PostgreSQL/SQLite)."""
+        model = self._model_class
+        if not ignore_conflicts and not update_fields:
+            return insert(model)
+        
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            raise NotImplementedError(
+                f"bulk_create com conflitos não é suportado no dialeto {dialect_name}"
+            )
+        
+        stmt = dialect_insert(model)
+        index_elements = list(unique_fields or [col.name for col in model.__table__.primary_key])
+        if ignore_conflicts:
+            return stmt.on_conflict_do_nothing(index_elements=index_elements if unique_fields else None)
+        return stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={name: stmt.excluded[name] for name in update_fields},
+        )
     
     async def update(self, filters: dict[str, Any], **values: Any) -> int:
         """Atualiza registros em massa."""
@@ -563,6 +813,22 @@ class ModelMeta(type(Base)):
     """
     
     def __new__(mcs, name: str, bases: tuple, namespace: dict[str, Any], **kwargs: Any):
+        # Política de carregamento do model para relationships sem lazy explícito
+        policy = namespace.get("__relationship_loading__")
+        if policy is None:
+            policy = next(
+                (p for b in bases if (p := getattr(b, "__relationship_loading__", None))),
+                None,
+            )
+        if policy is not None:
+            from strider.relations import apply_relationship_loading
+            apply_relationship_loading(namespace, policy)
+        
+        # Valores gerados pelo banco voltam no próprio INSERT/UPDATE (RETURNING)
+        mapper_args = namespace.get("__mapper_args__")
+        if isinstance(mapper_args, dict) and "eager_defaults" not in mapper_args:
+            namespace["__mapper_args__"] = {**mapper_args, "eager_defaults": True}
+        
         cls = super().__new__(mcs, name, bases, namespace, **kwargs)
         
         # Não adiciona manager à classe Base
@@ -581,6 +847,8 @@ class Model(Base, metaclass=ModelMeta):
     - Manager 'objects' para queries
     - Hooks de ciclo de vida
     - Métodos save/delete async
+    - ``__relationship_loading__``: carregamento padrão dos relacionamentos
+      Rel.* sem ``lazy`` explícito ("selectin", "deferred" ou "raise")
     
     Exemplo:
         class User(Model):
@@ -598,6 +866,12 @@ class Model(Base, metaclass=ModelMeta):
     # Manager será adicionado pela metaclass
     objects: ClassVar[Manager[Self]]
     
+    # Perfis de carregamento nomeados: {"nome": LoadProfile(...)}
+    __load_profiles__: ClassVar[dict[str, Any]] = {}
+    
+    # Server defaults/onupdate buscados via RETURNING no flush (sem SELECT extra)
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Hooks de ciclo de vida
     async def before_create(self) -> None:
         """Hook executado antes de criar o registro."""
@@ -615,6 +889,23 @@ class Model(Base, metaclass=ModelMeta):
         """Hook executado após salvar."""
         pass
     
+    @classmethod
+    async def before_bulk_create(cls, instances: list[Self]) -> None:
+        """
+        Hook em lote executado antes de ``objects.bulk_create``.
+        
+        O padrão chama ``before_create()`` de cada instância; sobrescreva
+        para tratar o lote inteiro de uma vez.
+        """
+        for instance in instances:
+            await instance.before_create()
+    
+    @classmethod
+    async def after_bulk_create(cls, instances: list[Self]) -> None:
+        """Hook em lote executado após ``objects.bulk_create`` (padrão: ``after_create()`` de cada uma)."""
+        for instance in instances:
+            await instance.after_create()
+    
     async def before_delete(self) -> None:
         """Hook executado antes de deletar."""
         pass
@@ -630,8 +921,11 @@ class Model(Base, metaclass=ModelMeta):
         This method:
         1. Calls before_save() hook
         2. Adds the instance to the session
-        3. Flushes changes to the database (but does NOT commit)
-        4. Refreshes the instance to get auto-generated values (id, timestamps)
+        3. Flushes changes to the database (but does NOT commit). Generated
+           values (id, timestamps, server defaults) come back in the same
+           INSERT/UPDATE via RETURNING (``eager_defaults``)
+        4. Refreshes only attributes the flush left expired (dialects
+           without RETURNING, SQL expressions assigned to columns)
         5. Calls after_save() hook
         
         Note: This does NOT commit the transaction. The commit happens
@@ -645,26 +939,84 @@ class Model(Base, metaclass=ModelMeta):
         """
         await self.before_save()
         
-        # Identify columns with default/onupdate that need refresh
-        # This ensures auto-generated values (defaults, auto_now, etc) are loaded
-        columns_to_refresh = [
-            col.name for col in self.__table__.columns
-            if col.default is not None or col.onupdate is not None or col.server_default is not None
-        ]
+        # JSON alterado via StructDescriptor: UPDATE parcial (jsonb_set)
+        patched = self._apply_json_patches(session)
         
         session.add(self)
         await session.flush()
         
-        # Refresh columns that may have been generated by the database
-        # Using explicit attribute_names ensures values are reloaded even with expire_on_commit=False
-        if columns_to_refresh:
-            await session.refresh(self, attribute_names=columns_to_refresh)
-        else:
-            await session.refresh(self)
+        # O documento final já é conhecido: evita reler o JSON inteiro
+        for key, document in patched.items():
+            set_committed_value(self, key, document)
+        
+        # Defaults Python já estão na instância e os do banco vieram no RETURNING;
+        # só relê o que o flush deixou expirado (sem RETURNING no dialeto, expressões SQL)
+        state = sa_inspect(self)
+        expired = [
+            key for key in state.mapper.column_attrs.keys()
+            if key in state.expired_attributes and key not in patched
+        ]
+        if expired:
+            await session.refresh(self, attribute_names=expired)
         
+        self._invalidate_cache(session)
         await self.after_save()
         return self
     
+    @classmethod
+    def _invalidate_cache(cls, session: AsyncSession) -> None:
+        """
+        Troca a versão de cache do model após o commit.
+        
+        Sempre, e não só nos processos que importam views em cache: workers
+        e tasks escrevem no mesmo banco que a API lê do cache compartilhado.
+        """
+        invalidate_on_commit(session, cls)
+    
+    def _apply_json_patches(self, session: AsyncSession) -> dict[str, Any]:
+        """
+        Troca colunas AdaptiveJSON alteradas via StructDescriptor por
+        expressões ``jsonb_set`` (só PostgreSQL, só registros persistidos).
+        
+        Cai no rewrite completo quando os caminhos não são confiáveis: a
+        coluna foi reatribuída por fora do descriptor, o valor commitado
+        mudou desde a primeira escrita ou há caminhos demais.
+        
+        Returns:
+            {atributo: documento final} das colunas reescritas como patch.
+        """
+        from strider.fields import AdaptiveJSON
+        from strider.schema import JSON_PATCH_MAX_PATHS, pop_dirty_paths
+        
+        tracked = pop_dirty_paths(self)
+        state = sa_inspect(self)
+        if not tracked or not state.persistent:
+            return {}
+        if session.get_bind(mapper=state.mapper).dialect.name != "postgresql":
+            return {}
+        
+        patched: dict[str, Any] = {}
+        for key, (base, document, paths) in tracked.items():
+            prop = state.mapper.column_attrs.get(key)
+            if prop is None or not isinstance(prop.columns[0].type, AdaptiveJSON):
+                continue
+            if not paths or len(paths) > JSON_PATCH_MAX_PATHS:
+                continue
+            if state.dict.get(key) is not document:
+                continue
+            history = state.attrs[key].history
+            committed = history.deleted[0] if history.deleted else (
+                history.unchanged[0] if history.unchanged else None
+            )
+            if committed is not base:
+                continue
+            
+            column = prop.columns[0]
+            setattr(self, key, AdaptiveJSON.patch_expression(column, document, paths))
+            patched[key] = document
+        
+        return patched
+    
     async def delete(self, session: AsyncSession) -> None:
         """
         Deleta o registro do banco de dados.
@@ -675,6 +1027,7 @@ class Model(Base, metaclass=ModelMeta):
         await self.before_delete()
         await session.delete(self)
         await session.flush()
+        self._invalidate_cache(session)
         await self.after_delete()
     
     async def refresh(self, session: AsyncSession) -> Self:
@@ -12,11 +12,15 @@ Características:
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
-from collections.abc import Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Literal, TYPE_CHECKING
+from collections.abc import Iterable, Iterator, Sequence
 
 from sqlalchemy import select, func, and_, or_, not_, asc, desc, Boolean, Integer, Float
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, joinedload, lazyload, load_only, raiseload, selectinload
 from sqlalchemy.sql import Select
 
 if TYPE_CHECKING:
@@ -33,6 +37,10 @@ class MultipleObjectsReturned(Exception):
     pass
 
 
+# Valores por query IN em in_bulk (abaixo do limite de parâmetros do SQLite)
+IN_BULK_BATCH_SIZE = 500
+
+
 # Operadores de lookup suportados
 LOOKUP_OPERATORS = {
     "exact": lambda col, val: col == val,
@@ -178,6 +186,124 @@ def parse_lookup(model_class: type, field_lookup: str, value: Any) -> Any:
     return LOOKUP_OPERATORS[operator](column, value)
 
 
+# =============================================================================
+# Load profiles
+# =============================================================================
+
+class LoadProfile:
+    """
+    Perfil de carregamento de relacionamentos para uma query.
+    
+    Args:
+        joined: Caminhos carregados no mesmo SELECT (joinedload)
+        selectin: Caminhos carregados em um SELECT ... IN separado (selectinload)
+        others: Demais relacionamentos - None mantém o ``lazy`` do model,
+            "deferred" carrega só ao acessar, "raise" proíbe SQL implícito
+    
+    Caminhos aninhados usam "__" (ex: "author__profile").
+    
+    Exemplo:
+        class Post(Model):
+            __load_profiles__ = {
+                "list": LoadProfile(joined=["author"], others="raise"),
+                "detail": LoadProfile(joined=["author"], selectin=["tags", "comments"]),
+            }
+        
+        posts = await Post.objects.using(db).load_profile("list").all()
+    """
+    
+    def __init__(
+        self,
+        *,
+        joined: Sequence[str] = (),
+        selectin: Sequence[str] = (),
+        others: Literal["deferred", "raise"] | None = None,
+    ) -> None:
+        if others not in (None, "deferred", "raise"):
+            raise ValueError(f"others deve ser None, 'deferred' ou 'raise', não {others!r}")
+        self.joined = tuple(joined)
+        self.selectin = tuple(selectin)
+        self.others = others
+    
+    def __repr__(self) -> str:
+        return f"LoadProfile(joined={list(self.joined)}, selectin={list(self.selectin)}, others={self.others!r})"
+    
+    def options(self, model_class: type, *, strict: bool = False) -> list[Any]:
+        """
+        Loader options do SQLAlchemy para `model_class`.
+        
+        Com ``strict=True`` relacionamentos fora do perfil (inclusive nos
+        models alcançados pelos caminhos) levantam erro ao serem acessados.
+        """
+        others = "raise" if strict else self.others
+        options: list[Any] = []
+        for loader, paths in ((joinedload, self.joined), (selectinload, self.selectin)):
+            for path in paths:
+                for option in _path_options(model_class, path, loader, others):
+                    options.append(option)
+        if others == "raise":
+            options.append(raiseload("*", sql_only=True))
+        elif others == "deferred":
+            options.append(lazyload("*"))
+        return options
+
+
+def _path_options(model_class: type, path: str, loader: Any, others: str | None) -> Iterator[Any]:
+    """Encadeia `loader` ao longo de "a__b__c"; aplica `others` em cada nível."""
+    current = model_class
+    option = None
+    for part in path.split("__"):
+        attr = getattr(current, part, None)
+        prop = getattr(attr, "property", None)
+        if prop is None or not hasattr(prop, "mapper"):
+            raise ValueError(f"{current.__name__}.{part} não é um relacionamento (caminho {path!r})")
+        option = loader(attr) if option is None else getattr(option, loader.__name__)(attr)
+        current = prop.mapper.class_
+        if others == "raise":
+            yield option.raiseload("*", sql_only=True)
+        elif others == "deferred":
+            yield option.lazyload("*")
+    if others is None:
+        yield option
+
+
+# Strict loading por contexto (testes); None = usa settings
+_strict_loading: ContextVar[bool | None] = ContextVar("strider_strict_loading", default=None)
+
+
+@contextmanager
+def strict_loading(enabled: bool = True) -> Iterator[None]:
+    """
+    Ativa o strict loading no contexto atual.
+    
+    Queries do QuerySet deixam de carregar relacionamentos que não foram
+    pedidos (load_profile / select_related / prefetch_related) e qualquer
+    acesso que dispararia SQL implícito levanta ``InvalidRequestError``.
+    
+    Exemplo:
+        with strict_loading():
+            posts = await Post.objects.using(db).load_profile("list").all()
+            posts[0].comments  # erro: não está no perfil
+    """
+    token = _strict_loading.set(enabled)
+    try:
+        yield
+    finally:
+        _strict_loading.reset(token)
+
+
+def is_strict_loading() -> bool:
+    """Strict loading ativo (contexto ou settings.relationship_strict_loading)."""
+    enabled = _strict_loading.get()
+    if enabled is not None:
+        return enabled
+    try:
+        from strider.config import get_settings
+        return get_settings().relationship_strict_loading
+    except Exception:
+        return False
+
+
 class QuerySet[T: "Model"]:
     """
     QuerySet para operações de banco de dados.
@@ -207,6 +333,9 @@ class QuerySet[T: "Model"]:
         self._offset_value: int | None = None
         self._select_related: list[str] = []
         self._prefetch_related: list[str] = []
+        self._load_profile: LoadProfile | None = None
+        self._only_fields: list[str] = []
+        self._deferred_fields: list[str] = []
     
     def _clone(self) -> "QuerySet[T]":
         """Cria uma cópia do QuerySet."""
@@ -218,6 +347,9 @@ class QuerySet[T: "Model"]:
         qs._offset_value = self._offset_value
         qs._select_related = self._select_related.copy()
         qs._prefetch_related = self._prefetch_related.copy()
+        qs._load_profile = self._load_profile
+        qs._only_fields = self._only_fields.copy()
+        qs._deferred_fields = self._deferred_fields.copy()
         return qs
     
     def _get_session(self) -> AsyncSession:
@@ -259,8 +391,46 @@ class QuerySet[T: "Model"]:
         if self._offset_value is not None:
             stmt = stmt.offset(self._offset_value)
         
+        # Carregamento de relacionamentos
+        options = self._loader_options()
+        if options:
+            stmt = stmt.options(*options)
+        
         return stmt
     
+    def _effective_load_profile(self) -> LoadProfile | None:
+        """Perfil ativo somado a select_related/prefetch_related."""
+        profile = self._load_profile
+        if not (self._select_related or self._prefetch_related):
+            return profile
+        return LoadProfile(
+            joined=(*(profile.joined if profile else ()), *self._select_related),
+            selectin=(*(profile.selectin if profile else ()), *self._prefetch_related),
+            others=profile.others if profile else None,
+        )
+    
+    def _loader_options(self) -> list[Any]:
+        strict = is_strict_loading()
+        profile = self._effective_load_profile()
+        if profile is None:
+            options = [raiseload("*", sql_only=True)] if strict else []
+        else:
+            options = profile.options(self._model_class, strict=strict)
+        if self._only_fields:
+            options.append(load_only(*self._column_attrs(self._only_fields)))
+        if self._deferred_fields:
+            options.extend(defer(attr) for attr in self._column_attrs(self._deferred_fields))
+        return options
+    
+    def _column_attrs(self, names: list[str]) -> list[Any]:
+        columns = sa_inspect(self._model_class).column_attrs
+        attrs = []
+        for name in names:
+            if name not in columns:
+                raise ValueError(f"{self._model_class.__name__}.{name} não é uma coluna")
+            attrs.append(getattr(self._model_class, name))
+        return attrs
+    
     # Métodos de filtragem
     def filter(self, **kwargs: Any) -> "QuerySet[T]":
         """
@@ -339,12 +509,53 @@ class QuerySet[T: "Model"]:
         qs._prefetch_related.extend(fields)
         return qs
     
+    def only(self, *fields: str) -> "QuerySet[T]":
+        """
+        Carrega apenas estas colunas (``load_only``); as demais ficam
+        adiadas. A chave primária é sempre incluída.
+        
+        Equivalente ao only() do Django. Acessar uma coluna adiada numa
+        sessão async levanta erro — inclua tudo que será lido.
+        """
+        qs = self._clone()
+        qs._only_fields = list(dict.fromkeys([*qs._only_fields, *fields]))
+        return qs
+    
+    def defer(self, *fields: str) -> "QuerySet[T]":
+        """Não carrega estas colunas na query (equivalente ao defer() do Django)."""
+        qs = self._clone()
+        qs._deferred_fields.extend(fields)
+        return qs
+    
+    def load_profile(self, profile: str | LoadProfile | None) -> "QuerySet[T]":
+        """
+        Define quais relacionamentos esta query carrega.
+        
+        Aceita um LoadProfile ou o nome de um perfil declarado em
+        ``Model.__load_profiles__``. None remove o perfil.
+        """
+        if isinstance(profile, str):
+            profiles = getattr(self._model_class, "__load_profiles__", None) or {}
+            if profile not in profiles:
+                raise ValueError(
+                    f"{self._model_class.__name__} não declara o load profile {profile!r} "
+                    f"(disponíveis: {sorted(profiles)})"
+                )
+            profile = profiles[profile]
+        qs = self._clone()
+        qs._load_profile = profile
+        return qs
+    
     # Métodos de execução
     async def all(self) -> Sequence[T]:
         """Executa a query e retorna todos os resultados."""
         session = self._get_session()
         stmt = self._build_query()
         result = await session.execute(stmt)
+        profile = self._effective_load_profile()
+        if profile is not None and profile.joined:
+            # joinedload de coleções repete linhas da entidade principal
+            return result.unique().scalars().all()
         return result.scalars().all()
     
     async def first(self) -> T | None:
@@ -381,6 +592,43 @@ class QuerySet[T: "Model"]:
         
         return results[0]
     
+    async def in_bulk(
+        self,
+        id_list: Iterable[Any],
+        *,
+        field_name: str = "id",
+        batch_size: int = IN_BULK_BATCH_SIZE,
+    ) -> dict[Any, T]:
+        """
+        Retorna ``{valor: instância}`` para os valores de ``field_name`` em
+        ``id_list``, com uma query ``IN`` por lote de ``batch_size`` valores.
+        
+        Valores sem registro (ou fora dos filtros do QuerySet) ficam de fora.
+        
+        Raises:
+            ValueError: Se ``field_name`` não for PK nem coluna única
+            TypeError: Se o QuerySet tiver limit/offset
+        """
+        if self._limit_value is not None or self._offset_value is not None:
+            raise TypeError("in_bulk() não pode ser usado com limit/offset")
+        column = sa_inspect(self._model_class).columns.get(field_name)
+        if column is None or not (column.primary_key or column.unique):
+            raise ValueError(
+                f"in_bulk(): '{field_name}' não é PK nem coluna única de {self._model_class.__name__}"
+            )
+        
+        keys = list(dict.fromkeys(id_list))
+        qs = self
+        if self._only_fields and field_name not in self._only_fields:
+            qs = self.only(field_name)
+        
+        found: dict[Any, T] = {}
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start:start + batch_size]
+            for obj in await qs.filter(**{f"{field_name}__in": chunk}).all():
+                found[getattr(obj, field_name)] = obj
+        return found
+    
     async def count(self) -> int:
         """Conta o número de registros."""
         session = self._get_session()
@@ -676,6 +924,9 @@ class SoftDeleteQuerySet[T: "Model"](QuerySet[T]):
         qs._offset_value = self._offset_value
         qs._select_related = self._select_related.copy()
         qs._prefetch_related = self._prefetch_related.copy()
+        qs._load_profile = self._load_profile
+        qs._only_fields = self._only_fields.copy()
+        qs._deferred_fields = self._deferred_fields.copy()
         qs._include_deleted = self._include_deleted
         qs._only_deleted = self._only_deleted
         return qs
@@ -780,6 +1031,9 @@ class TenantQuerySet[T: "Model"](QuerySet[T]):
         qs._offset_value = self._offset_value
         qs._select_related = self._select_related.copy()
         qs._prefetch_related = self._prefetch_related.copy()
+        qs._load_profile = self._load_profile
+        qs._only_fields = self._only_fields.copy()
+        qs._deferred_fields = self._deferred_fields.copy()
         return qs
 
     def for_tenant(
@@ -846,6 +1100,9 @@ class TenantSoftDeleteQuerySet[T: "Model"](SoftDeleteQuerySet[T]):
         qs._offset_value = self._offset_value
         qs._select_related = self._select_related.copy()
         qs._prefetch_related = self._prefetch_related.copy()
+        qs._load_profile = self._load_profile
+        qs._only_fields = self._only_fields.copy()
+        qs._deferred_fields = self._deferred_fields.copy()
         qs._include_deleted = self._include_deleted
         qs._only_deleted = self._only_deleted
         return qs
@@ -46,6 +46,24 @@ Quick start — Channel (pub/sub fan-out)::
 
     async for msg in ticks.subscribe():
         await ws.send_json(msg)
+
+Quick start — named Channel (all workers, via the backplane)::
+
+    ticks = Channel(name="ticks")          # settings.realtime_backplane
+    await ticks.publish({"price": 1.23})   # serialized once
+
+    async for frame in ticks.subscribe(raw=True):
+        await ws.send_text(frame)          # no per-connection encoding
+
+Quick start — binary codecs (subprotocol ``msgpack``, ``cbor`` or ``json``)::
+
+    class Telemetry(WebSocketView):
+        codecs = ["msgpack", "cbor", "json"]
+        compression = True                 # also accepts "msgpack+deflate"...
+
+        async def on_connect(self, ws, **params):
+            async for frame in ticks.subscribe(codec=self.codec.name):
+                await self.send_frame(ws, frame)   # encoded once per broadcast
 """
 
 from __future__ import annotations
@@ -53,6 +71,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import zlib
+from collections.abc import Callable
 from typing import Any, AsyncIterator, ClassVar, TYPE_CHECKING
 
 from starlette.websockets import WebSocket, WebSocketState, WebSocketDisconnect
@@ -207,73 +227,545 @@ async def _check_ws_permissions(
 
 
 # =============================================================================
-# Channel — lightweight in-process pub/sub
+# Backplane — cross-process delivery for named channels
+# =============================================================================
+
+FrameHandler = Callable[[str], None]
+
+
+class Backplane:
+    """
+    Transport that carries serialized channel frames between processes.
+
+    A published frame reaches every handler subscribed to the topic in
+    every process (including the publisher's).  Handlers are plain
+    callables invoked synchronously on the event loop, so local fan-out
+    never awaits or locks.
+
+    Subclasses implement ``publish`` and the ``_listen``/``_unlisten``
+    hooks that attach/detach a topic at the transport level.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, set[FrameHandler]] = {}
+
+    async def publish(self, topic: str, frame: str) -> int:
+        """Send *frame* on *topic*.  Returns the number of receivers reported by the transport."""
+        raise NotImplementedError
+
+    async def subscribe(self, topic: str, handler: FrameHandler) -> None:
+        handlers = self._handlers.setdefault(topic, set())
+        first = not handlers
+        handlers.add(handler)
+        if first:
+            try:
+                await self._listen(topic)
+            except BaseException:
+                # Sem o listen o tópico não recebe nada: desfaz o registro
+                handlers.discard(handler)
+                if not handlers:
+                    self._handlers.pop(topic, None)
+                raise
+
+    async def unsubscribe(self, topic: str, handler: FrameHandler) -> None:
+        handlers = self._handlers.get(topic)
+        if handlers is None:
+            return
+        handlers.discard(handler)
+        if not handlers:
+            del self._handlers[topic]
+            await self._unlisten(topic)
+
+    def dispatch(self, topic: str, frame: str) -> int:
+        """Deliver *frame* to the local handlers of *topic*."""
+        handlers = self._handlers.get(topic)
+        if not handlers:
+            return 0
+        for handler in tuple(handlers):
+            try:
+                handler(frame)
+            except Exception:
+                logger.exception("Backplane handler failed for topic %s", topic)
+        return len(handlers)
+
+    async def _listen(self, topic: str) -> None:
+        """Start receiving *topic* from the transport."""
+
+    async def _unlisten(self, topic: str) -> None:
+        """Stop receiving *topic* from the transport."""
+
+    async def close(self) -> None:
+        self._handlers.clear()
+
+
+class MemoryBackplane(Backplane):
+    """Single-process backplane: publish dispatches straight to local handlers."""
+
+    async def publish(self, topic: str, frame: str) -> int:
+        return self.dispatch(topic, frame)
+
+
+class RedisBackplane(Backplane):
+    """
+    Redis pub/sub backplane.
+
+    One ``PUBLISH`` per channel publish; each process keeps a single pub/sub
+    connection subscribed to the topics that have local subscribers and
+    dispatches every frame once to its local channels.  Delivery is
+    at-most-once (no replay for processes that were disconnected).
+
+    The client is created on demand by ``create_redis_client`` (``redis_*``
+    settings or ``realtime_redis_url``); a compatible client can be injected
+    via ``client=``.  If the pub/sub connection drops, the reader reconnects
+    with exponential backoff (``reconnect_delay`` up to
+    ``max_reconnect_delay``) and resubscribes every topic with local
+    handlers; frames published meanwhile are lost.
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        mode: str | None = None,
+        prefix: str = "strider:rt:",
+        client: Any = None,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        **client_kwargs: Any,
+    ) -> None:
+        super().__init__()
+        self.url = url
+        self.mode = mode
+        self.prefix = prefix
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._client = client
+        self._client_kwargs = client_kwargs
+        self._pubsub: Any = None
+        self._reader: asyncio.Task[None] | None = None
+        self._connect_lock = asyncio.Lock()
+
+    async def connect(self) -> Any:
+        if self._client is None:
+            async with self._connect_lock:
+                if self._client is None:
+                    from strider.messaging.redis.connection import create_redis_client
+
+                    self._client = await create_redis_client(
+                        url=self.url, mode=self.mode, **self._client_kwargs,
+                    )
+        return self._client
+
+    async def publish(self, topic: str, frame: str) -> int:
+        client = await self.connect()
+        return int(await client.publish(self.prefix + topic, frame) or 0)
+
+    async def _listen(self, topic: str) -> None:
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.subscribe(self.prefix + topic)
+            except Exception:
+                logger.warning("Realtime backplane subscribe failed; reconnecting", exc_info=True)
+                await self._drop_pubsub()
+        elif self._reader is None or self._reader.done():
+            # First topic: connect now so it is live on return; on failure the
+            # reader below retries with backoff and resubscribes every topic
+            try:
+                await self._resubscribe()
+            except Exception:
+                logger.warning("Realtime backplane unavailable; retrying in background", exc_info=True)
+        # Without a connection a running reader resubscribes every topic when it reconnects
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read_loop(), name="realtime-backplane")
+
+    async def _unlisten(self, topic: str) -> None:
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.prefix + topic)
+
+    async def _resubscribe(self) -> None:
+        """Open a new pub/sub connection subscribed to every topic with local handlers."""
+        client = await self.connect()
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(*(self.prefix + topic for topic in self._handlers))
+        except BaseException:
+            await _close_resource(pubsub)
+            raise
+        self._pubsub = pubsub
+
+    async def _drop_pubsub(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        try:
+            await _close_resource(pubsub)
+        except Exception:
+            pass
+
+    async def _read_loop(self) -> None:
+        delay = self.reconnect_delay
+        try:
+            while self._handlers:
+                try:
+                    if self._pubsub is None:
+                        await self._resubscribe()
+                        logger.info("Realtime backplane reconnected (%d topics)", len(self._handlers))
+                    message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.warning(
+                        "Realtime backplane connection lost; reconnecting in %.1fs", delay, exc_info=True,
+                    )
+                    await self._drop_pubsub()
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.max_reconnect_delay)
+                    continue
+                delay = self.reconnect_delay
+                if message is None or message.get("type") != "message":
+                    continue
+                channel, data = message["channel"], message["data"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                if isinstance(data, bytes):
+                    data = data.decode()
+                self.dispatch(channel[len(self.prefix):], data)
+        except asyncio.CancelledError:
+            pass
+
+    async def close(self) -> None:
+        await super().close()
+        reader, self._reader = self._reader, None
+        if reader is not None:
+            reader.cancel()
+        pubsub, self._pubsub = self._pubsub, None
+        client, self._client = self._client, None
+        for resource in (pubsub, client):
+            await _close_resource(resource)
+
+
+async def _close_resource(resource: Any) -> None:
+    close = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+    if close is not None:
+        result = close()
+        if hasattr(result, "__await__"):
+            await result
+
+
+_backplane: Backplane | None = None
+
+
+def create_backplane_from_settings() -> Backplane:
+    """Build the backplane selected by ``settings.realtime_backplane``."""
+    from strider.config import get_settings
+
+    settings = get_settings()
+    if settings.realtime_backplane == "redis":
+        return RedisBackplane(
+            url=settings.realtime_redis_url or settings.redis_url,
+            prefix=settings.realtime_channel_prefix,
+        )
+    return MemoryBackplane()
+
+
+def get_backplane() -> Backplane:
+    """Return the global backplane (created from settings on first use)."""
+    global _backplane
+    if _backplane is None:
+        _backplane = create_backplane_from_settings()
+    return _backplane
+
+
+def configure_backplane(backplane: Backplane | None) -> None:
+    """Set the global backplane.  ``None`` goes back to the settings backend."""
+    global _backplane
+    _backplane = backplane
+
+
+async def close_backplane() -> None:
+    """Close the global backplane, if it was created."""
+    if _backplane is not None:
+        await _backplane.close()
+
+
+# =============================================================================
+# Codecs — wire formats negotiated through the WebSocket subprotocol
+# =============================================================================
+
+DEFLATE_SUFFIX = "+deflate"
+
+
+class WebSocketCodec:
+    """
+    Wire format for WebSocket frames, selected by subprotocol name.
+
+    ``encode`` returns ``str`` for text codecs and ``bytes`` for binary
+    ones (``binary = True``); ``decode`` accepts either.
+    """
+
+    name: str = ""
+    binary: bool = False
+
+    def encode(self, message: Any) -> str | bytes:
+        raise NotImplementedError
+
+    def decode(self, frame: str | bytes) -> Any:
+        raise NotImplementedError
+
+
+class JSONCodec(WebSocketCodec):
+    name = "json"
+
+    def encode(self, message: Any) -> str:
+        return json.dumps(message, default=str, separators=(",", ":"))
+
+    def decode(self, frame: str | bytes) -> Any:
+        return json.loads(frame)
+
+
+class MsgpackCodec(WebSocketCodec):
+    """MessagePack (requires ``pip install strider[realtime]``)."""
+
+    name = "msgpack"
+    binary = True
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._packer = msgpack.Packer(default=str)
+        self._unpackb = msgpack.unpackb
+
+    def encode(self, message: Any) -> bytes:
+        return self._packer.pack(message)
+
+    def decode(self, frame: str | bytes) -> Any:
+        return self._unpackb(frame)
+
+
+class CBORCodec(WebSocketCodec):
+    """CBOR, RFC 8949 (requires ``pip install strider[realtime]``)."""
+
+    name = "cbor"
+    binary = True
+
+    def __init__(self) -> None:
+        import cbor2
+
+        self._dumps = cbor2.dumps
+        self._loads = cbor2.loads
+
+    def encode(self, message: Any) -> bytes:
+        return self._dumps(message, default=lambda encoder, value: encoder.encode(str(value)))
+
+    def decode(self, frame: str | bytes) -> Any:
+        return self._loads(frame)
+
+
+class DeflateCodec(WebSocketCodec):
+    """
+    Wraps another codec and zlib-compresses every frame.
+
+    Unlike transport-level ``permessage-deflate`` (negotiated by the ASGI
+    server and applied per connection), the frame is compressed once and
+    the same bytes can be sent to every recipient of a broadcast.
+    """
+
+    binary = True
+
+    def __init__(self, inner: WebSocketCodec, level: int = 6) -> None:
+        self.inner = inner
+        self.level = level
+        self.name = inner.name + DEFLATE_SUFFIX
+
+    def encode(self, message: Any) -> bytes:
+        frame = self.inner.encode(message)
+        if isinstance(frame, str):
+            frame = frame.encode()
+        return zlib.compress(frame, self.level)
+
+    def decode(self, frame: str | bytes) -> Any:
+        if isinstance(frame, str):
+            frame = frame.encode("latin-1")
+        return self.inner.decode(zlib.decompress(frame))
+
+
+_codec_factories: dict[str, Callable[[], WebSocketCodec]] = {
+    "json": JSONCodec,
+    "msgpack": MsgpackCodec,
+    "cbor": CBORCodec,
+}
+_codecs: dict[str, WebSocketCodec] = {}
+
+
+def register_codec(name: str, factory: Callable[[], WebSocketCodec]) -> None:
+    """Register a codec factory under a subprotocol *name*."""
+    _codec_factories[name] = factory
+    _codecs.pop(name, None)
+    _codecs.pop(name + DEFLATE_SUFFIX, None)
+
+
+def get_codec(name: str) -> WebSocketCodec:
+    """
+    Return the (cached) codec for *name*.
+
+    ``"<codec>+deflate"`` wraps the base codec in ``DeflateCodec``.  Raises
+    ``KeyError`` for unknown names and ``ImportError`` when the codec's
+    library is not installed.
+    """
+    codec = _codecs.get(name)
+    if codec is not None:
+        return codec
+    if name.endswith(DEFLATE_SUFFIX):
+        codec = DeflateCodec(get_codec(name[: -len(DEFLATE_SUFFIX)]))
+    else:
+        try:
+            factory = _codec_factories[name]
+        except KeyError:
+            raise KeyError(f"Codec WebSocket desconhecido: '{name}'") from None
+        codec = factory()
+    _codecs[name] = codec
+    return codec
+
+
+def codec_available(name: str) -> bool:
+    """``True`` if *name* is registered and its library can be imported."""
+    try:
+        get_codec(name)
+    except (KeyError, ImportError):
+        return False
+    return True
+
+
+# =============================================================================
+# Channel — pub/sub fan-out
 # =============================================================================
 
+_UNDECODED = object()
+
+
 class Channel:
     """
-    In-process fan-out channel backed by ``asyncio.Queue`` per subscriber.
+    Fan-out channel backed by an ``asyncio.Queue`` per subscriber.
+
+    Unnamed channels are in-process only.  Named channels
+    (``Channel(name="ticks")``) go through the backplane: each publish is
+    serialized to JSON once, sent once, and fanned out to the local
+    subscribers of every process.
 
-    Thread-safe for publish; subscribers are async iterators that yield
-    messages until the channel is closed or the subscriber disconnects.
+    Subscribing with ``codec="msgpack"`` (or any registered codec name)
+    yields frames already encoded in that wire format, so they can be
+    forwarded with ``WebSocketView.send_frame`` without re-encoding per
+    connection: each broadcast is encoded at most once per codec.
+    ``raw=True`` is shorthand for ``codec="json"``.
+
+    Fan-out iterates a snapshot of the subscribers without awaiting, so the
+    publish path takes no lock.
 
     Args:
         maxlen: Maximum queue depth per subscriber.  Slow consumers that
             fall behind will have their oldest messages dropped.
+        name: Topic on the backplane.  ``None`` keeps the channel local.
+        backplane: Backplane for named channels (default: ``get_backplane()``).
     """
 
-    def __init__(self, maxlen: int = 1000) -> None:
+    def __init__(
+        self,
+        maxlen: int = 1000,
+        *,
+        name: str | None = None,
+        backplane: Backplane | None = None,
+    ) -> None:
         self._maxlen = maxlen
-        self._subscribers: set[asyncio.Queue[Any]] = set()
-        self._lock = asyncio.Lock()
+        self.name = name
+        self._backplane = backplane
+        # queue -> codec (recebe o frame já codificado; None = mensagem decodificada)
+        self._subscribers: dict[asyncio.Queue[Any], str | None] = {}
+        self._attached = False
+
+    @property
+    def backplane(self) -> Backplane:
+        return self._backplane or get_backplane()
 
     @property
     def subscriber_count(self) -> int:
         return len(self._subscribers)
 
     async def publish(self, message: Any) -> int:
-        """Broadcast *message* to every active subscriber.  Returns delivery count."""
+        """
+        Broadcast *message* to every subscriber.
+
+        Returns the local delivery count for unnamed channels and the
+        receiver count reported by the backplane for named ones.
+        """
+        if self.name is None:
+            return self._fanout(message, None)
+        return await self.backplane.publish(self.name, self.encode(message))
+
+    @staticmethod
+    def encode(message: Any) -> str:
+        return get_codec("json").encode(message)  # type: ignore[return-value]
+
+    def _on_frame(self, frame: str) -> None:
+        self._fanout(_UNDECODED, frame)
+
+    def _fanout(self, message: Any, frame: str | None) -> int:
+        # Um encode por codec por broadcast, compartilhado entre as conexões
+        frames: dict[str, str | bytes] = {} if frame is None else {"json": frame}
         delivered = 0
-        async with self._lock:
-            dead: list[asyncio.Queue[Any]] = []
-            for q in self._subscribers:
+        for queue, codec in tuple(self._subscribers.items()):
+            if codec is None or codec not in frames:
+                if message is _UNDECODED:
+                    message = json.loads(frame)  # type: ignore[arg-type]
+                if codec is not None:
+                    frames[codec] = get_codec(codec).encode(message)
+            item = message if codec is None else frames[codec]
+            try:
+                queue.put_nowait(item)
+                delivered += 1
+            except asyncio.QueueFull:
                 try:
-                    q.put_nowait(message)
+                    queue.get_nowait()
+                    queue.put_nowait(item)
                     delivered += 1
-                except asyncio.QueueFull:
-                    try:
-                        q.get_nowait()
-                        q.put_nowait(message)
-                        delivered += 1
-                    except Exception:
-                        dead.append(q)
-            for q in dead:
-                self._subscribers.discard(q)
+                except Exception:
+                    self._subscribers.pop(queue, None)
         return delivered
 
-    async def subscribe(self) -> AsyncIterator[Any]:
-        """Return an async iterator that yields messages from this channel."""
-        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._maxlen)
-        async with self._lock:
-            self._subscribers.add(queue)
+    async def subscribe(
+        self, raw: bool = False, *, codec: str | None = None,
+    ) -> AsyncIterator[Any]:
+        """Return an async iterator that yields messages (or encoded frames) from this channel."""
+        queue = await self.subscribe_queue(raw=raw, codec=codec)
         try:
             while True:
                 yield await queue.get()
         finally:
-            async with self._lock:
-                self._subscribers.discard(queue)
+            await self.unsubscribe_queue(queue)
 
-    async def subscribe_queue(self) -> asyncio.Queue[Any]:
+    async def subscribe_queue(
+        self, raw: bool = False, *, codec: str | None = None,
+    ) -> asyncio.Queue[Any]:
         """Return a raw ``asyncio.Queue`` for manual consumption."""
+        if codec is None and raw:
+            codec = "json"
+        if codec is not None:
+            get_codec(codec)  # falha cedo para codec desconhecido/não instalado
         queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._maxlen)
-        async with self._lock:
-            self._subscribers.add(queue)
+        self._subscribers[queue] = codec
+        if self.name is not None and not self._attached:
+            self._attached = True
+            try:
+                await self.backplane.subscribe(self.name, self._on_frame)
+            except BaseException:
+                # O próximo subscriber tenta de novo
+                self._attached = False
+                self._subscribers.pop(queue, None)
+                raise
         return queue
 
     async def unsubscribe_queue(self, queue: asyncio.Queue[Any]) -> None:
         """Remove a previously subscribed queue."""
-        async with self._lock:
-            self._subscribers.discard(queue)
+        self._subscribers.pop(queue, None)
+        if self.name is not None and self._attached and not self._subscribers:
+            self._attached = False
+            await self.backplane.unsubscribe(self.name, self._on_frame)
 
 
 # =============================================================================
@@ -300,15 +792,27 @@ class WebSocketView:
             to require a valid JWT.
         encoding:     ``"json"`` | ``"text"`` | ``"bytes"`` (default ``"json"``)
         subprotocol:  Optional WebSocket subprotocol to negotiate.
+        codecs:       Codec names accepted as subprotocols, in server
+            preference order (e.g. ``["msgpack", "cbor", "json"]``).  When
+            set, the codec replaces ``encoding``/``subprotocol``: it is
+            picked from the client's ``Sec-WebSocket-Protocol`` offer
+            (first entry when the client offers none) and ``self.codec``
+            decodes every incoming frame.
+        compression:  Also accept ``"<codec>+deflate"`` offers, preferred
+            over the plain codec (frames are zlib-compressed once per
+            broadcast).
         keepalive:    Seconds between server-side pings (0 = disabled).
     """
 
     permission_classes: ClassVar[list[type[Permission]]] = []
     encoding: str = "json"
     subprotocol: str | None = None
+    codecs: ClassVar[list[str]] = []
+    compression: bool = False
     keepalive: int = 30
 
     user: Any | None = None
+    codec: WebSocketCodec | None = None
 
     # ── lifecycle hooks (override these) ──
 
@@ -335,7 +839,16 @@ class WebSocketView:
                 await ws.close(code=4003, reason=denied)
                 return
 
-        await ws.accept(subprotocol=self.subprotocol)
+        subprotocol = self.subprotocol
+        if self.codecs:
+            offered = ws.scope.get("subprotocols") or []
+            self.codec = self._negotiate_codec(offered)
+            if self.codec is None:
+                await ws.close(code=4006, reason="No supported subprotocol")
+                return
+            subprotocol = self.codec.name if offered else None
+
+        await ws.accept(subprotocol=subprotocol)
 
         try:
             await self.on_connect(ws, **params)
@@ -373,7 +886,39 @@ class WebSocketView:
                 except Exception:
                     pass
 
+    def _negotiate_codec(self, offered: list[str]) -> WebSocketCodec | None:
+        candidates: list[str] = []
+        for name in self.codecs:
+            if self.compression:
+                candidates.append(name + DEFLATE_SUFFIX)
+            candidates.append(name)
+        if not offered:
+            # Cliente sem subprotocolo (ex: browser simples): codec preferido, sem compressão
+            offered = list(self.codecs)
+        for name in candidates:
+            if name in offered and codec_available(name):
+                return get_codec(name)
+        return None
+
+    async def send(self, ws: WebSocket, message: Any) -> None:
+        """Encode *message* with the negotiated codec (JSON by default) and send it."""
+        await self.send_frame(ws, (self.codec or get_codec("json")).encode(message))
+
+    @staticmethod
+    async def send_frame(ws: WebSocket, frame: str | bytes) -> None:
+        """Send an already-encoded frame (e.g. from ``Channel.subscribe(codec=...)``)."""
+        if isinstance(frame, bytes):
+            await ws.send_bytes(frame)
+        else:
+            await ws.send_text(frame)
+
     async def _receive(self, ws: WebSocket) -> Any:
+        if self.codec is not None:
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+            frame = message.get("bytes")
+            return self.codec.decode(frame if frame is not None else message["text"])
         if self.encoding == "json":
             return await ws.receive_json()
         elif self.encoding == "bytes":
@@ -385,7 +930,7 @@ class WebSocketView:
             while ws.client_state == WebSocketState.CONNECTED:
                 await asyncio.sleep(self.keepalive)
                 if ws.client_state == WebSocketState.CONNECTED:
-                    await ws.send_json({"type": "ping"})
+                    await self.send(ws, {"type": "ping"})
         except (asyncio.CancelledError, Exception):
             pass
 
@@ -404,6 +949,44 @@ class WebSocketView:
 # SSEView — class-based Server-Sent Events endpoint
 # =============================================================================
 
+SSE_PING = ": ping\n\n"
+
+
+async def _with_heartbeats(
+    events: AsyncIterator[Any], interval: float
+) -> AsyncIterator[Any]:
+    """
+    Re-yield *events*, yielding ``None`` whenever *interval* seconds pass
+    without one (the caller emits a ``:ping`` comment).
+
+    The pending ``__anext__`` is awaited again after a heartbeat instead of
+    being cancelled, so the wrapped generator is never interrupted.
+    """
+    if interval <= 0:
+        async for event in events:
+            yield event
+        return
+
+    pending: asyncio.Future[Any] | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(events))
+            done, _ = await asyncio.wait((pending,), timeout=interval)
+            if not done:
+                yield None
+                continue
+            task, pending = pending, None
+            try:
+                event = task.result()
+            except StopAsyncIteration:
+                return
+            yield event
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 class SSEView:
     """
     Class-based SSE endpoint compatible with core-framework routing.
@@ -424,7 +1007,8 @@ class SSEView:
         permission_classes:  List of ``Permission`` classes.  Default ``[]``
             (public).  The SSE endpoint runs through the normal HTTP
             middleware stack so standard auth middleware also applies.
-        ping_interval:  Seconds between ``:ping`` comments (0 = disabled).
+        ping_interval:  Idle seconds before a ``:ping`` comment is sent, so
+            proxies keep the connection open (0 = disabled).
         headers:        Extra response headers.
     """
 
@@ -476,17 +1060,11 @@ class SSEView:
 
         yield ": connected\n\n"
 
-        gen = self.stream(request, **params)
-        ping_task: asyncio.Task[None] | None = None
-
         try:
-            if self.ping_interval > 0:
-                ping_event = asyncio.Event()
-                ping_task = asyncio.create_task(
-                    self._ping_timer(ping_event), name="sse-ping"
-                )
-
-            async for event in gen:
+            async for event in _with_heartbeats(self.stream(request, **params), self.ping_interval):
+                if event is None:
+                    yield SSE_PING
+                    continue
                 if await request.is_disconnected():
                     break
                 yield self._format_sse(event)
@@ -494,17 +1072,6 @@ class SSEView:
             pass
         except Exception:
             logger.exception("SSEView.stream error")
-        finally:
-            if ping_task:
-                ping_task.cancel()
-
-    async def _ping_timer(self, event: asyncio.Event) -> None:
-        try:
-            while True:
-                await asyncio.sleep(self.ping_interval)
-                event.set()
-        except asyncio.CancelledError:
-            pass
 
     @staticmethod
     def _format_sse(event: dict[str, Any]) -> str:
@@ -555,6 +1122,7 @@ def sse_response(
     generator: AsyncIterator[dict[str, Any]],
     *,
     headers: dict[str, str] | None = None,
+    ping_interval: float = 15,
 ) -> StreamingResponse:
     """
     Wrap an async generator of SSE event dicts into a ``StreamingResponse``.
@@ -566,12 +1134,15 @@ def sse_response(
             async def gen():
                 yield {"event": "hello", "data": "world"}
             return sse_response(gen())
+
+    A ``:ping`` comment is sent after ``ping_interval`` idle seconds
+    (0 disables it).
     """
 
     async def _stream():
         yield ": connected\n\n"
-        async for event in generator:
-            yield SSEView._format_sse(event)
+        async for event in _with_heartbeats(generator, ping_interval):
+            yield SSE_PING if event is None else SSEView._format_sse(event)
 
     return StreamingResponse(
         _stream(),
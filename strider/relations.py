@@ -64,9 +64,9 @@ import sys
 from typing import TYPE_CHECKING, Any, TypeVar, overload
 from uuid import UUID
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Table
+from sqlalchemy import Column, ForeignKey, Integer, String, Table, event
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Mapper, RelationshipProperty, mapped_column, relationship
 
 if TYPE_CHECKING:
     from strider.models import Model
@@ -75,6 +75,93 @@ T = TypeVar("T", bound="Model")
 
 logger = logging.getLogger("strider.relations")
 
+# Políticas de carregamento padrão -> estratégia ``lazy`` do SQLAlchemy.
+# "deferred" só carrega ao acessar; "raise" proíbe SQL implícito no acesso
+# (o endpoint precisa pedir o relacionamento via load profile).
+RELATIONSHIP_LOADING_POLICIES = {
+    "selectin": "selectin",
+    "deferred": "select",
+    "raise": "raise_on_sql",
+}
+
+# Marca relationships cujo ``lazy`` vem da política padrão (não explícito)
+# e ainda não foi resolvido; resolvido ao configurar o mapper
+_DEFAULT_LAZY_INFO_KEY = "strider_default_lazy"
+
+
+def _default_lazy(owner: type | None = None) -> str:
+    """
+    Estratégia ``lazy`` para relationships sem ``lazy`` explícito.
+    
+    Ordem: ``__relationship_loading__`` do model (se conhecido) e
+    ``settings.relationship_loading``; "selectin" só quando não há
+    settings (RuntimeError do bootstrap). Outros erros de settings propagam.
+    """
+    policy = getattr(owner, "__relationship_loading__", None) if owner is not None else None
+    if policy is None:
+        from strider.config import get_settings
+        try:
+            policy = get_settings().relationship_loading
+        except RuntimeError:
+            policy = "selectin"
+    try:
+        return RELATIONSHIP_LOADING_POLICIES[policy]
+    except KeyError:
+        raise ValueError(
+            f"Política de carregamento inválida: {policy!r}. "
+            f"Use uma de {sorted(RELATIONSHIP_LOADING_POLICIES)}."
+        ) from None
+
+
+def _lazy_kwargs(lazy: str | None) -> dict[str, Any]:
+    """kwargs de relationship() para `lazy`, marcando quando é o padrão."""
+    if lazy is not None:
+        return {"lazy": lazy}
+    # Provisório até o mapper ser configurado (ver _resolve_default_lazy)
+    return {"lazy": "selectin", "info": {_DEFAULT_LAZY_INFO_KEY: True}}
+
+
+@event.listens_for(Mapper, "before_mapper_configured")
+def _resolve_default_lazy(mapper: Mapper, cls: type) -> None:
+    """
+    Resolve a política padrão dos relationships do mapper.
+    
+    Roda na configuração dos mappers (primeira query ou configure_mappers),
+    e não na definição da classe, quando os settings podem ainda não estar
+    carregados.
+    """
+    pending = [
+        prop for prop in mapper._props.values()
+        if isinstance(prop, RelationshipProperty) and prop.info.get(_DEFAULT_LAZY_INFO_KEY)
+    ]
+    if not pending:
+        return
+    lazy = _default_lazy(cls)
+    for prop in pending:
+        prop.lazy = lazy
+        prop.strategy_key = (("lazy", lazy),)
+        prop.info[_DEFAULT_LAZY_INFO_KEY] = False
+
+
+def apply_relationship_loading(namespace: dict[str, Any], policy: str) -> None:
+    """
+    Aplica a política de carregamento do model aos relationships do corpo
+    da classe que não definiram ``lazy`` explicitamente.
+    
+    Chamado pelo ModelMeta antes do mapeamento declarativo.
+    """
+    lazy = RELATIONSHIP_LOADING_POLICIES.get(policy)
+    if lazy is None:
+        raise ValueError(
+            f"__relationship_loading__ inválido: {policy!r}. "
+            f"Use uma de {sorted(RELATIONSHIP_LOADING_POLICIES)}."
+        )
+    for value in namespace.values():
+        if isinstance(value, RelationshipProperty) and value.info.get(_DEFAULT_LAZY_INFO_KEY):
+            value.lazy = lazy
+            value.strategy_key = (("lazy", lazy),)
+
+
 # Padrão obrigatório para targets de relacionamento: app_label.ModelName
 # Corresponde a src.apps.<app_label>.models.<ModelName>
 RELATIONSHIP_TARGET_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*$")
@@ -314,6 +401,8 @@ class _RelationshipDescriptor:
 
     def __set_name__(self, owner: type, name: str) -> None:
         _validate_relationship_target(self._target, owner, name)
+        if self._kwargs.get("lazy") is None:
+            self._kwargs = {**self._kwargs, **_lazy_kwargs(None)}
         try:
             resolved_class = _resolve_target_to_class(self._target)
             fk_columns = _resolve_foreign_keys_to_columns(
@@ -348,7 +437,7 @@ class _SelfReferentialDescriptor:
         self,
         *,
         back_populates: str | None,
-        lazy: str,
+        lazy: str | None,
         cascade: str,
         uselist: bool,
         foreign_keys: str | None,
@@ -364,9 +453,9 @@ class _SelfReferentialDescriptor:
     def __set_name__(self, owner: type, name: str) -> None:
         kwargs: dict[str, Any] = {
             "back_populates": self._back_populates,
-            "lazy": self._lazy,
             "cascade": self._cascade,
             "uselist": self._uselist,
+            **_lazy_kwargs(self._lazy),
         }
         if self._foreign_keys:
             kwargs["foreign_keys"] = [getattr(owner, self._foreign_keys)]
@@ -545,7 +634,7 @@ class Rel:
         *,
         back_populates: str | None = None,
         backref: str | None = None,
-        lazy: str = "selectin",
+        lazy: str | None = None,
         foreign_keys: list[str] | None = None,
         uselist: bool = False,
     ) -> Mapped[Any]:
@@ -559,7 +648,9 @@ class Rel:
             target: Target model class name (string for forward reference)
             back_populates: Name of the reverse relationship on the target model
             backref: Auto-create reverse relationship (alternative to back_populates)
-            lazy: Loading strategy - "selectin" (default), "joined", "subquery", "select"
+            lazy: Loading strategy - "selectin", "joined", "subquery", "select",
+                "raise_on_sql". None (default) uses the model's
+                ``__relationship_loading__`` or ``settings.relationship_loading``
             foreign_keys: Explicit foreign key columns (for ambiguous relationships)
             uselist: Always False for many-to-one (returns single object)
         
@@ -598,9 +689,9 @@ class Rel:
             resolved,
             back_populates=back_populates,
             backref=backref,
-            lazy=lazy,
             foreign_keys=foreign_keys,
             uselist=False,  # Many-to-one always returns single object
+            **_lazy_kwargs(lazy),
         )
     
     # Alias for Django users
@@ -616,7 +707,7 @@ class Rel:
         *,
         back_populates: str | None = None,
         backref: str | None = None,
-        lazy: str = "selectin",
+        lazy: str | None = None,
         foreign_keys: list[str] | None = None,
         cascade: str = "all, delete-orphan",
         passive_deletes: bool = True,
@@ -632,7 +723,9 @@ class Rel:
             target: Target model class name (string for forward reference)
             back_populates: Name of the reverse relationship on the target model
             backref: Auto-create reverse relationship (alternative to back_populates)
-            lazy: Loading strategy - "selectin" (default), "joined", "subquery", "select"
+            lazy: Loading strategy - "selectin", "joined", "subquery", "select",
+                "raise_on_sql". None (default) uses the model's
+                ``__relationship_loading__`` or ``settings.relationship_loading``
             foreign_keys: Explicit foreign key columns (for ambiguous relationships)
             cascade: Cascade options (default: "all, delete-orphan")
             passive_deletes: Let database handle cascades (default: True)
@@ -675,10 +768,10 @@ class Rel:
         kwargs = {
             "back_populates": back_populates,
             "backref": backref,
-            "lazy": lazy,
             "foreign_keys": foreign_keys,
             "cascade": cascade,
             "passive_deletes": passive_deletes,
+            **_lazy_kwargs(lazy),
         }
         if order_by:
             kwargs["order_by"] = order_by
@@ -697,7 +790,7 @@ class Rel:
         *,
         back_populates: str | None = None,
         backref: str | None = None,
-        lazy: str = "selectin",
+        lazy: str | None = None,
         foreign_keys: list[str] | None = None,
         cascade: str = "all, delete-orphan",
         uselist: bool = False,
@@ -712,7 +805,9 @@ class Rel:
             target: Target model class name (string for forward reference)
             back_populates: Name of the reverse relationship on the target model
             backref: Auto-create reverse relationship (alternative to back_populates)
-            lazy: Loading strategy - "selectin" (default), "joined", "subquery", "select"
+            lazy: Loading strategy - "selectin", "joined", "subquery", "select",
+                "raise_on_sql". None (default) uses the model's
+                ``__relationship_loading__`` or ``settings.relationship_loading``
             foreign_keys: Explicit foreign key columns (for ambiguous relationships)
             cascade: Cascade options (default: "all, delete-orphan")
             uselist: Always False for one-to-one
@@ -757,10 +852,10 @@ class Rel:
             resolved,
             back_populates=back_populates,
             backref=backref,
-            lazy=lazy,
             foreign_keys=foreign_keys,
             cascade=cascade,
             uselist=False,
+            **_lazy_kwargs(lazy),
         )
     
     # Alias
@@ -777,7 +872,7 @@ class Rel:
         secondary: str | Table,
         back_populates: str | None = None,
         backref: str | None = None,
-        lazy: str = "selectin",
+        lazy: str | None = None,
         cascade: str = "all",
         passive_deletes: bool = True,
         order_by: str | None = None,
@@ -793,7 +888,9 @@ class Rel:
             secondary: Association table name (string) or Table object
             back_populates: Name of the reverse relationship on the target model
             backref: Auto-create reverse relationship (alternative to back_populates)
-            lazy: Loading strategy - "selectin" (default), "joined", "subquery", "select"
+            lazy: Loading strategy - "selectin", "joined", "subquery", "select",
+                "raise_on_sql". None (default) uses the model's
+                ``__relationship_loading__`` or ``settings.relationship_loading``
             cascade: Cascade options (default: "all")
             passive_deletes: Let database handle cascades (default: True)
             order_by: Column to order related records by
@@ -840,9 +937,9 @@ class Rel:
             "secondary": secondary,
             "back_populates": back_populates,
             "backref": backref,
-            "lazy": lazy,
             "cascade": cascade,
             "passive_deletes": passive_deletes,
+            **_lazy_kwargs(lazy),
         }
         
         if order_by:
@@ -859,7 +956,7 @@ class Rel:
         *,
         back_populates: str | None = None,
         remote_side: str | None = None,
-        lazy: str = "selectin",
+        lazy: str | None = None,
         cascade: str = "all",
         foreign_keys: str | None = None,
         uselist: bool = True,
@@ -870,7 +967,7 @@ class Rel:
         Args:
             back_populates: Name of the reverse relationship
             remote_side: Column that identifies the "one" side (usually "id")
-            lazy: Loading strategy
+            lazy: Loading strategy (None: model/settings default, see many_to_one)
             cascade: Cascade options
             foreign_keys: Foreign key column name
             uselist: True for one-to-many, False for many-to-one
@@ -919,9 +1016,9 @@ class Rel:
             )
         kwargs: dict[str, Any] = {
             "back_populates": back_populates,
-            "lazy": lazy,
             "cascade": cascade,
             "uselist": uselist,
+            **_lazy_kwargs(lazy),
         }
         if remote_side:
             kwargs["remote_side"] = remote_side
@@ -939,6 +1036,8 @@ class Rel:
 __all__ = [
     "Rel",
     "AssociationTable",
+    "RELATIONSHIP_LOADING_POLICIES",
+    "apply_relationship_loading",
     "clear_model_cache",
     "validate_relationship_target_format",
 ]
@@ -19,7 +19,7 @@ import inspect
 import logging
 import os
 
-from fastapi import APIRouter, Request, Depends, Body
+from fastapi import APIRouter, Request, Response, Depends, Body
 from pydantic import BaseModel, ValidationError as PydanticValidationError, create_model
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,6 +28,7 @@ from strider.serializers import (
     InputSchema,
     OutputSchema,
     PaginatedResponse,
+    BatchResponse,
     ErrorResponse,
     SuccessResponse,
     DeleteResponse,
@@ -753,19 +754,25 @@ class Router(APIRouter):
         # 1. LIST (GET) - Lista paginada
         # ==================================================================
         async def list_route(
-            request, db=Depends(get_db), _user=Depends(get_optional_user),
-            page=1, page_size=viewset_class.page_size,
+            request, response, db=Depends(get_db), _user=Depends(get_optional_user),
+            page=1, page_size=viewset_class.page_size, fields=None, exclude=None,
         ):
+            # fields/exclude são lidos de request.query_params pela ViewSet (aqui só para OpenAPI)
             vs = viewset_class()
-            return await vs.list(request, db, page=page, page_size=page_size)
+            result = await vs.list(request, db, page=page, page_size=page_size)
+            response.headers.update(vs.response_headers)
+            return result
         
         # Annotations programáticas (bypass de __future__.annotations)
         list_route.__annotations__ = {
             "request": Request,
+            "response": Response,
             "db": AsyncSession,
             "_user": Any,
             "page": int,
             "page_size": int,
+            "fields": str | None,
+            "exclude": str | None,
         }
         
         list_openapi_extra, list_success_responses = _build_openapi_examples(
@@ -847,20 +854,62 @@ class Router(APIRouter):
             detail_filter=False  # Só registra detail=False
         )
         
+        # ==================================================================
+        # 3b. BATCH (GET /batch?ids=) - opt-in, antes de /{id}
+        # ==================================================================
+        if viewset_class.batch_retrieve:
+            async def batch_route(
+                request, db=Depends(get_db), _user=Depends(get_optional_user),
+                ids="", fields=None, exclude=None,
+            ):
+                vs = viewset_class()
+                return await vs.batch(request, db, ids=ids)
+            
+            batch_route.__annotations__ = {
+                "request": Request,
+                "db": AsyncSession,
+                "_user": Any,
+                "ids": str,
+                "fields": str | None,
+                "exclude": str | None,
+            }
+            
+            self.add_api_route(
+                f"{prefix}/batch",
+                batch_route,
+                methods=["GET"],
+                tags=tags,
+                name=f"{basename}-batch",
+                summary=f"Get {basename}s by {lookup_url_kwarg} list",
+                description=(
+                    f"Retorna vários **{model_label}** em uma única query via "
+                    f"`?ids=1,2,3` (máximo {viewset_class.batch_max_ids}).\n\n"
+                    f"Ids inexistentes ou sem permissão aparecem em `missing`."
+                ),
+                response_model=BatchResponse[output_schema] if output_schema else None,
+                responses=_build_error_responses(include_422=True),
+            )
+        
         # ==================================================================
         # 4. RETRIEVE (GET detail) - Detalhes com response tipado
         # ==================================================================
         async def retrieve_route(
-            request, db=Depends(get_db), _user=Depends(get_optional_user),
+            request, response, db=Depends(get_db), _user=Depends(get_optional_user),
+            fields=None, exclude=None,
         ):
             vs = viewset_class()
             path_params = request.path_params
-            return await vs.retrieve(request, db, **path_params)
+            result = await vs.retrieve(request, db, **path_params)
+            response.headers.update(vs.response_headers)
+            return result
         
         retrieve_route.__annotations__ = {
             "request": Request,
+            "response": Response,
             "db": AsyncSession,
             "_user": Any,
+            "fields": str | None,
+            "exclude": str | None,
         }
         
         retrieve_openapi_extra, retrieve_success_responses = _build_openapi_examples(
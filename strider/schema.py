@@ -547,6 +547,145 @@ class ChoiceField(Field):
         return d
 
 
+# =============================================================================
+# Compiled Codecs
+# =============================================================================
+
+# Cada subclasse de StructSchema ganha, na definição da classe, um loader e
+# um dumper gerados especificamente para seus campos (mesma técnica de
+# dataclasses/attrs). Em runtime não há iteração sobre os descritores de
+# campo: leitura e escrita de colunas JSON ficam lineares no tamanho do dict.
+
+_MISSING = object()
+
+# Defaults imutáveis podem ser embutidos direto no código gerado
+_INLINE_DEFAULT_TYPES = (str, int, float, bool, bytes, type(None))
+
+# Coerção inline dos campos primitivos (apenas classes exatas, sem override)
+_INLINE_COERCE: dict[type, str] = {
+    StringField: "str(v)",
+    IntegerField: "int(v)",
+    FloatField: "float(v)",
+    BooleanField: "bool(v)",
+}
+
+
+def _default_expr(field: Field, index: int, ns: dict[str, Any]) -> str:
+    """Expressão que produz o default do campo no código gerado."""
+    default = field.default
+    if (
+        type(field).get_default is Field.get_default
+        and "get_default" not in vars(field)
+        and not callable(default)
+        and isinstance(default, _INLINE_DEFAULT_TYPES)
+    ):
+        ns[f"_d{index}"] = default
+        return f"_d{index}"
+    ns[f"_g{index}"] = field.get_default
+    return f"_g{index}()"
+
+
+def _compile_loader(cls: type, fast: bool) -> Any:
+    """
+    Gera ``load(data) -> instance`` para `cls`.
+
+    Uma passada por campo (nome e aliases via ``dict.get``) e, só quando o
+    dict tem chaves desconhecidas, uma passada para montar ``_extra_data``.
+    O nome canônico tem precedência sobre aliases. ``fast=True`` usa
+    ``fast_coerce`` e não loga falhas de coerção.
+    """
+    ns: dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_new": cls.__new__,
+        "_cls": cls,
+        "_warn": logger.warning,
+    }
+    known: set[str] = set()
+    lines = ["def load(data):", "    get = data.get", "    found = 0"]
+    
+    for i, (name, field) in enumerate(cls._fields.items()):
+        known.update((name, *field.aliases))
+        default = _default_expr(field, i, ns)
+        
+        lines.append(f"    v = get({name!r}, _MISSING)")
+        for alias in field.aliases:
+            lines.append("    if v is _MISSING:")
+            lines.append(f"        v = get({alias!r}, _MISSING)")
+        lines.append("    if v is _MISSING:")
+        lines.append(f"        x{i} = {default}")
+        lines.append("    else:")
+        lines.append("        found += 1")
+        
+        inline = _INLINE_COERCE.get(type(field))
+        if inline and not {"coerce", "fast_coerce"} & vars(field).keys():
+            lines.append("        if v is None:")
+            lines.append(f"            x{i} = {'None' if field.nullable else default}")
+            lines.append("        else:")
+            indent = "            "
+            coerce = inline
+        else:
+            ns[f"_c{i}"] = field.fast_coerce if fast else field.coerce
+            indent = "        "
+            coerce = f"_c{i}(v)"
+        lines.append(f"{indent}try:")
+        lines.append(f"{indent}    x{i} = {coerce}")
+        lines.append(f"{indent}except (ValueError, TypeError) as e:")
+        if not fast:
+            lines.append(f"{indent}    _warn(\"Field '%s' coercion failed: %s. Using default.\", {name!r}, e)")
+        lines.append(f"{indent}    x{i} = {default}")
+    
+    ns["_known"] = frozenset(known)
+    lines.append("    if len(data) > found:")
+    lines.append("        extra = {k: x for k, x in data.items() if k not in _known}")
+    lines.append("    else:")
+    lines.append("        extra = {}")
+    lines.append("    inst = _new(_cls)")
+    values = "".join(f"{name!r}: x{i}, " for i, name in enumerate(cls._fields))
+    lines.append(f"    inst.__dict__.update({{{values}'_extra_data': extra}})")
+    lines.append("    return inst")
+    
+    exec("\n".join(lines), ns)
+    load = ns["load"]
+    load.__qualname__ = f"{cls.__qualname__}._load_{'fast' if fast else 'safe'}"
+    return load
+
+
+def _compile_dumper(cls: type) -> Any:
+    """
+    Gera ``dump(instance) -> dict`` para `cls`, serializando campo a campo
+    sem reflexão; ``serialize`` só é chamado nos campos que o sobrescrevem.
+    """
+    ns: dict[str, Any] = {}
+    items = []
+    for i, (name, field) in enumerate(cls._fields.items()):
+        if type(field).serialize is Field.serialize and "serialize" not in vars(field):
+            items.append(f"{name!r}: d[{name!r}]")
+        else:
+            ns[f"_s{i}"] = field.serialize
+            items.append(f"{name!r}: _s{i}(d[{name!r}])")
+    
+    source = "\n".join([
+        "def dump(self):",
+        "    d = self.__dict__",
+        f"    out = {{{', '.join(items)}}}",
+        "    extra = d.get('_extra_data')",
+        "    if extra:",
+        "        out.update(extra)",
+        "    return out",
+    ])
+    exec(source, ns)
+    dump = ns["dump"]
+    dump.__qualname__ = f"{cls.__qualname__}._dump"
+    return dump
+
+
+def _compile_codecs(cls: type) -> None:
+    """(Re)compila loader/dumper de `cls`. Chame após alterar ``_fields``."""
+    cls._load_safe = staticmethod(_compile_loader(cls, fast=False))
+    cls._load_fast = staticmethod(_compile_loader(cls, fast=True))
+    cls._dump = staticmethod(_compile_dumper(cls))
+
+
 # =============================================================================
 # StructSchema Metaclass and Base Class
 # =============================================================================
@@ -583,6 +722,9 @@ class StructSchemaMeta(type):
         cls._alias_map = alias_map
         cls._schema_name = name
         
+        # Loader/dumper especializados para estes campos
+        _compile_codecs(cls)
+        
         return cls
 
 
@@ -598,6 +740,9 @@ class StructSchema(metaclass=StructSchemaMeta):
     _fields: ClassVar[dict[str, Field]] = {}
     _alias_map: ClassVar[dict[str, str]] = {}
     _schema_name: ClassVar[str] = ""
+    _load_safe: ClassVar[Any]
+    _load_fast: ClassVar[Any]
+    _dump: ClassVar[Any]
     
     def __init__(self, **kwargs):
         """Initialize with field values."""
@@ -638,45 +783,7 @@ class StructSchema(metaclass=StructSchemaMeta):
         """
         if data is None:
             data = {}
-        
-        result = {}
-        extra_data = {}
-        
-        # 1. Resolve aliases (e.g., "lang" -> "language")
-        normalized = {}
-        for key, value in data.items():
-            if key in cls._fields:
-                normalized[key] = value
-            elif key in cls._alias_map:
-                actual_key = cls._alias_map[key]
-                normalized[actual_key] = value
-                logger.debug(f"Mapped alias '{key}' -> '{actual_key}'")
-            else:
-                # Unknown field - will be preserved in extra_data
-                extra_data[key] = value
-        
-        # 2. Load defined fields
-        for name, field in cls._fields.items():
-            if name in normalized:
-                try:
-                    result[name] = field.coerce(normalized[name])
-                except (ValueError, TypeError) as e:
-                    # Coercion failed - log warning and use default
-                    logger.warning(f"Field '{name}' coercion failed: {e}. Using default.")
-                    result[name] = field.get_default()
-            else:
-                # Field missing - use default
-                result[name] = field.get_default()
-        
-        # 3. Create instance
-        instance = cls.__new__(cls)
-        for name, value in result.items():
-            super(StructSchema, instance).__setattr__(name, value)
-        
-        # 4. Store extra data
-        super(StructSchema, instance).__setattr__("_extra_data", extra_data)
-        
-        return instance
+        return cls._load_safe(data)
     
     @classmethod
     def from_dict_fast(cls, data: dict[str, Any]) -> StructSchema:
@@ -684,48 +791,11 @@ class StructSchema(metaclass=StructSchemaMeta):
         Fast loading for large schemas. No validation during load.
         
         - Uses fast_coerce instead of coerce
-        - Preserves dict reference for extra_data (no copy)
+        - Coercion failures fall back to defaults silently
         """
         if data is None:
             data = {}
-        
-        result = {}
-        extra_data = data  # Reference, not copy!
-        
-        # 1. Resolve aliases and separate known/unknown fields
-        for key, value in data.items():
-            if key in cls._fields:
-                field = cls._fields[key]
-                try:
-                    result[key] = field.fast_coerce(value)
-                except (ValueError, TypeError):
-                    result[key] = field.get_default()
-                # Remove from extra_data (it's a known field)
-                extra_data = {k: v for k, v in extra_data.items() if k != key}
-            elif key in cls._alias_map:
-                actual_key = cls._alias_map[key]
-                field = cls._fields[actual_key]
-                try:
-                    result[actual_key] = field.fast_coerce(value)
-                except (ValueError, TypeError):
-                    result[actual_key] = field.get_default()
-                # Remove from extra_data
-                extra_data = {k: v for k, v in extra_data.items() if k != key}
-        
-        # 2. Fill missing fields with defaults
-        for name, field in cls._fields.items():
-            if name not in result:
-                result[name] = field.get_default()
-        
-        # 3. Create instance
-        instance = cls.__new__(cls)
-        for name, value in result.items():
-            super(StructSchema, instance).__setattr__(name, value)
-        
-        # 4. Store extra data (unknown fields only)
-        super(StructSchema, instance).__setattr__("_extra_data", extra_data)
-        
-        return instance
+        return cls._load_fast(data)
     
     def to_dict(self) -> dict[str, Any]:
         """
@@ -734,11 +804,19 @@ class StructSchema(metaclass=StructSchemaMeta):
         - Uses current field names (never aliases)
         - Includes extra data (preserved fields)
         """
+        try:
+            return self._dump(self)
+        except KeyError:
+            # Instância incompleta (sem __init__/loader): caminho genérico
+            pass
+        
         result = {}
         
         # Serialize defined fields
         for name, field in self._fields.items():
-            value = getattr(self, name, field.get_default())
+            value = self.__dict__.get(name, _MISSING)
+            if value is _MISSING:
+                value = field.get_default()
             result[name] = field.serialize(value)
         
         # Include extra data (preserved unknown fields)
@@ -802,8 +880,8 @@ class StructSchema(metaclass=StructSchemaMeta):
     
     @classmethod
     def default_dict(cls) -> dict[str, Any]:
-        """Get default values as a dict."""
-        return {name: field.get_default() for name, field in cls._fields.items()}
+        """Get default values as a dict (JSON-ready, nested schemas serialized)."""
+        return {name: field.serialize(field.get_default()) for name, field in cls._fields.items()}
     
     @classmethod
     def get_field(cls, name: str) -> Field | None:
@@ -833,6 +911,81 @@ class StructSchema(metaclass=StructSchemaMeta):
 # StructDescriptor for Model Integration
 # =============================================================================
 
+# Caminhos alterados via StructDescriptor, guardados na própria instância:
+# {coluna: [base, atual, {path, ...}]}. ``base`` é o dict que estava na
+# coluna antes da primeira escrita; ``Model.save`` só usa os caminhos se
+# ``base`` ainda for o valor commitado e ``atual`` o valor da coluna.
+_DIRTY_PATHS_ATTR = "_struct_dirty_paths"
+
+# Acima disso um rewrite completo é mais barato que encadear jsonb_set
+JSON_PATCH_MAX_PATHS = 32
+
+
+def _diff_paths(old: dict, new: dict, prefix: tuple = ()) -> set[tuple]:
+    """
+    Caminhos (tuplas de chaves) que diferem entre dois documentos JSON.
+    
+    Só desce em subárvores que são dict nos dois lados, então o pai de
+    todo caminho retornado existe em `old`.
+    """
+    paths: set[tuple] = set()
+    for key in old.keys() | new.keys():
+        a = old.get(key, _MISSING)
+        b = new.get(key, _MISSING)
+        if a is b or (type(a) is type(b) and a == b):
+            continue
+        if isinstance(a, dict) and isinstance(b, dict):
+            paths |= _diff_paths(a, b, (*prefix, key))
+        else:
+            paths.add((*prefix, key))
+    return paths
+
+
+def _collapse_paths(paths: set[tuple]) -> set[tuple]:
+    """Remove caminhos cobertos por um ancestral também alterado."""
+    kept: set[tuple] = set()
+    for path in sorted(paths, key=len):
+        if not any(path[:i] in kept for i in range(1, len(path))):
+            kept.add(path)
+    return kept
+
+
+def _track_dirty_paths(obj: Any, column_name: str, existing: Any, raw: Any) -> None:
+    tracked = obj.__dict__.setdefault(_DIRTY_PATHS_ATTR, {})
+    entry = tracked.get(column_name)
+    
+    if entry is not None and entry[1] is not existing:
+        # A coluna foi reatribuída por fora do descriptor: rewrite completo
+        entry = [None, raw, None]
+    elif not isinstance(existing, dict) or not isinstance(raw, dict):
+        entry = [None, raw, None]
+    else:
+        paths = _diff_paths(existing, raw)
+        if entry is None:
+            entry = [existing, raw, paths]
+        elif entry[2] is not None:
+            entry = [entry[0], raw, entry[2] | paths]
+        else:
+            entry = [None, raw, None]
+    
+    tracked[column_name] = entry
+
+
+def pop_dirty_paths(obj: Any) -> dict[str, tuple[Any, Any, set[tuple] | None]]:
+    """
+    Retorna e limpa os caminhos JSON alterados via StructDescriptor.
+    
+    Returns:
+        {coluna: (base, atual, paths)}; ``paths`` é None quando as mudanças
+        não puderam ser rastreadas (exige rewrite completo).
+    """
+    tracked = obj.__dict__.pop(_DIRTY_PATHS_ATTR, None) or {}
+    return {
+        column: (base, raw, _collapse_paths(paths) if paths is not None else None)
+        for column, (base, raw, paths) in tracked.items()
+    }
+
+
 class StructDescriptor(Generic[T]):
     """
     Descriptor that converts between dict (database) and StructSchema instance (Python).
@@ -842,6 +995,8 @@ class StructDescriptor(Generic[T]):
     - __set__: StructSchema/dict → dict (for database storage)
     - Caching for performance
     - Automatic merge for partial updates
+    - Dirty-path tracking: ``Model.save`` atualiza só os caminhos alterados
+      (``jsonb_set``) no PostgreSQL
     """
     
     def __init__(self, schema_class: type[T], column_name: str, cache: bool = True):
@@ -889,16 +1044,23 @@ class StructDescriptor(Generic[T]):
         if obj in self._cache:
             del self._cache[obj]
         
+        existing = getattr(obj, self.column_name, None)
+        
         if value is None:
-            setattr(obj, self.column_name, {} if not getattr(self.schema_class, "_nullable", False) else None)
+            raw_dict = {} if not getattr(self.schema_class, "_nullable", False) else None
+            _track_dirty_paths(obj, self.column_name, existing, raw_dict)
+            setattr(obj, self.column_name, raw_dict)
             return
         
         if isinstance(value, self.schema_class):
             # StructSchema instance → dict
             raw_dict = value.to_dict()
         elif isinstance(value, dict):
-            # Dict - merge with existing for partial updates
-            existing = getattr(obj, self.column_name, None) or {}
+            # Dict - merge with existing for partial updates (aliases já
+            # normalizados, senão o nome canônico existente prevaleceria)
+            alias_map = self.schema_class._alias_map
+            if alias_map:
+                value = {alias_map.get(k, k): v for k, v in value.items()}
             if isinstance(existing, dict):
                 merged = {**existing, **value}
             else:
@@ -910,6 +1072,7 @@ class StructDescriptor(Generic[T]):
         else:
             raise TypeError(f"Expected {self.schema_class.__name__} or dict, got {type(value).__name__}")
         
+        _track_dirty_paths(obj, self.column_name, existing, raw_dict)
         setattr(obj, self.column_name, raw_dict)
     
     def __delete__(self, obj) -> None:
@@ -15,7 +15,7 @@ from __future__ import annotations
 from typing import Any, ClassVar, Generic, TypeVar, get_type_hints
 from collections.abc import Sequence
 
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, create_model, field_validator, model_validator
 from pydantic.functional_validators import BeforeValidator, AfterValidator
 
 # Type vars para generics
@@ -23,6 +23,12 @@ ModelT = TypeVar("ModelT")
 InputT = TypeVar("InputT", bound="InputSchema")
 OutputT = TypeVar("OutputT", bound="OutputSchema")
 
+# Schemas reduzidos de sparse fieldsets: (schema, campos) -> modelo
+_subset_schema_cache: dict[tuple[type, frozenset[str]], type["OutputSchema"]] = {}
+
+# Alias de validação que nenhum objeto tem: campos fora do subset não são lidos
+_UNSELECTED_ALIAS = "__strider_unselected__"
+
 
 class InputSchema(BaseModel):
     """
@@ -98,6 +104,73 @@ class OutputSchema(BaseModel):
             data = {k: v for k, v in data.items() if k in incl}
         return data
     
+    @classmethod
+    async def prefetch(cls, objects: Sequence[Any], loaders: Any = None) -> None:
+        """
+        Carrega em lote os relacionamentos que este schema serializa como
+        schemas aninhados (uma query por relacionamento e nível), para que
+        model_validate não dispare uma query por objeto.
+        
+        Usa os loaders do request (``get_loaders``) ou cria um a partir da
+        sessão dos objetos.
+        """
+        from strider.dataloader import Loaders, get_current_loaders, nested_schema
+        
+        objects = [obj for obj in objects if obj is not None]
+        if not objects or not any(
+            nested_schema(info.annotation) for info in cls.model_fields.values()
+        ):
+            return
+        loaders = loaders or get_current_loaders()
+        if loaders is None:
+            from sqlalchemy.ext.asyncio import async_object_session
+            
+            session = async_object_session(objects[0])
+            if session is None:
+                return
+            loaders = Loaders(session)
+        await loaders.prefetch(objects, cls)
+    
+    @classmethod
+    def list_field_names(cls) -> set[str]:
+        """Campos visíveis na listagem (aplica list_include / list_exclude)."""
+        names = set(cls.model_fields)
+        if cls.list_exclude:
+            names -= set(cls.list_exclude)
+        if cls.list_include is not None:
+            names &= set(cls.list_include)
+        return names
+    
+    @classmethod
+    def subset(cls, names: frozenset[str]) -> type["OutputSchema"]:
+        """
+        Schema que valida só os campos ``names`` (cacheado por conjunto).
+        
+        Usado por sparse fieldsets: validar só esses campos evita tocar
+        atributos que não foram carregados do banco. O subset é uma
+        subclasse do próprio schema, então ``model_config``, validators,
+        ``@field_serializer`` e métodos continuam valendo; os demais campos
+        viram opcionais, não são lidos do objeto e ficam fora do dump.
+        Serialize com ``model_dump(include=names)`` para omitir também os
+        campos calculados.
+        """
+        key = (cls, names)
+        schema = _subset_schema_cache.get(key)
+        if schema is None:
+            unselected = {
+                name: (
+                    Any,
+                    Field(default=None, exclude=True, validate_default=False, validation_alias=_UNSELECTED_ALIAS),
+                )
+                for name in cls.model_fields
+                if name not in names
+            }
+            schema = create_model(
+                f"{cls.__name__}Subset", __base__=cls, __module__=cls.__module__, **unselected,
+            )
+            _subset_schema_cache[key] = schema
+        return schema
+    
     @classmethod
     def from_orm(cls, obj: Any) -> "OutputSchema":
         """
@@ -307,6 +380,19 @@ class PaginatedResponse(OutputSchema, Generic[OutputT]):
             self.pages = (self.total + self.page_size - 1) // self.page_size
 
 
+class BatchResponse(OutputSchema, Generic[OutputT]):
+    """
+    Schema da rota ``GET /<recurso>/batch?ids=`` de ViewSets com
+    ``batch_retrieve = True``.
+    
+    ``items`` segue a ordem dos ids pedidos; ``missing`` lista os ids sem
+    registro visível para o usuário.
+    """
+    
+    items: list[OutputT]
+    missing: list[Any] = []
+
+
 class ErrorResponse(OutputSchema):
     """Schema padrão para respostas de erro."""
     
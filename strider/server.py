@@ -0,0 +1,683 @@
+"""
+Production server - prefork supervisor for Stride apps.
+
+The supervisor imports the application once in the master process (models,
+routes and the OpenAPI schema are built before forking, so workers share
+those pages copy-on-write) and then forks N uvicorn workers.
+
+Features:
+    - Worker count defaults to the cgroup CPU quota (containers/k8s)
+    - SO_REUSEPORT listeners per worker (kernel load balancing)
+    - uvloop/httptools when installed
+    - max-requests recycling with jitter
+    - Zero-downtime rolling reload on SIGHUP
+    - SIGTTIN/SIGTTOU to add/remove a worker
+
+Usage:
+    strider serve                       # workers = CPU quota
+    strider serve -w 4 --max-requests 10000 --max-requests-jitter 1000
+
+    # Programmatic
+    from strider.server import serve
+    serve("src.main", host="0.0.0.0", port=8000)
+
+Signals (master):
+    SIGHUP          Rolling reload: start a new worker, wait until it is
+                    ready, then gracefully stop one old worker, repeat.
+    SIGTERM/SIGINT  Graceful shutdown (waits up to graceful_timeout).
+    SIGQUIT         Immediate shutdown.
+    SIGTTIN/SIGTTOU Increase/decrease the number of workers by one.
+
+Note:
+    With preloading the code is imported once, so SIGHUP recycles workers
+    (fresh connections, memory) but does not pick up new code. To deploy
+    new code, start a new supervisor next to the old one (SO_REUSEPORT lets
+    both accept on the same port) and then send SIGTERM to the old one.
+"""
+
+from __future__ import annotations
+
+import errno
+import gc
+import importlib
+import importlib.util
+import logging
+import math
+import os
+import random
+import selectors
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("strider.server")
+
+# Boot failures in a row before the supervisor gives up
+MAX_BOOT_FAILURES = 5
+
+
+# =============================================================================
+# Worker count detection
+# =============================================================================
+
+def _read_text(path: str) -> str | None:
+    try:
+        return Path(path).read_text().strip()
+    except (OSError, ValueError):
+        return None
+
+
+def cgroup_cpu_quota(root: str = "/sys/fs/cgroup") -> float | None:
+    """
+    Return the CPU quota of the current cgroup in CPUs, or None if unlimited.
+
+    Supports cgroup v2 (``cpu.max``) and cgroup v1
+    (``cpu.cfs_quota_us`` / ``cpu.cfs_period_us``).
+    """
+    # cgroup v2: "<quota> <period>" or "max <period>"
+    raw = _read_text(os.path.join(root, "cpu.max"))
+    if raw:
+        parts = raw.split()
+        if len(parts) == 2 and parts[0] != "max":
+            try:
+                quota, period = int(parts[0]), int(parts[1])
+            except ValueError:
+                return None
+            if quota > 0 and period > 0:
+                return quota / period
+        return None
+
+    # cgroup v1
+    for base in (os.path.join(root, "cpu"), os.path.join(root, "cpu,cpuacct")):
+        quota_raw = _read_text(os.path.join(base, "cpu.cfs_quota_us"))
+        period_raw = _read_text(os.path.join(base, "cpu.cfs_period_us"))
+        if quota_raw is None or period_raw is None:
+            continue
+        try:
+            quota, period = int(quota_raw), int(period_raw)
+        except ValueError:
+            return None
+        if quota > 0 and period > 0:
+            return quota / period
+        return None
+
+    return None
+
+
+def default_worker_count() -> int:
+    """
+    Number of workers when none is configured.
+
+    Uses the cgroup CPU quota (rounded up) when the process is limited,
+    otherwise the CPUs available to this process (affinity mask).
+    """
+    try:
+        available = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        available = os.cpu_count() or 1
+
+    quota = cgroup_cpu_quota()
+    if quota is not None:
+        return max(1, min(available, math.ceil(quota)))
+    return max(1, available)
+
+
+def _best_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def _best_http() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+# =============================================================================
+# Sockets
+# =============================================================================
+
+def reuse_port_supported() -> bool:
+    return hasattr(socket, "SO_REUSEPORT") and sys.platform.startswith("linux")
+
+
+def create_listener(
+    host: str,
+    port: int,
+    backlog: int = 2048,
+    reuse_port: bool = False,
+) -> socket.socket:
+    """Create a non-blocking listening TCP socket."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.setblocking(False)
+    sock.set_inheritable(True)
+    return sock
+
+
+# =============================================================================
+# Preloading
+# =============================================================================
+
+def preload_app(app_module: str) -> Any:
+    """
+    Import the ASGI app once in the master and warm shared state.
+
+    Builds SQLAlchemy mappers and the OpenAPI schema up front, then freezes
+    the GC generations so forked workers do not dirty those pages.
+    """
+    import uvicorn  # noqa: F401  (imported once, shared by workers)
+
+    module_path, _, attr = app_module.partition(":")
+    module = importlib.import_module(module_path)
+    if attr:
+        app = getattr(module, attr)
+    else:
+        app = getattr(module, "app", None) or getattr(module, "application", None)
+    if app is None:
+        raise RuntimeError(f"No 'app' found in module '{module_path}'")
+
+    try:
+        from sqlalchemy.orm import configure_mappers
+        configure_mappers()
+    except Exception as e:
+        logger.warning(f"Could not configure mappers before fork: {e}")
+
+    fastapi_app = getattr(app, "app", app)
+    if hasattr(fastapi_app, "openapi"):
+        try:
+            fastapi_app.openapi()
+        except Exception as e:
+            logger.warning(f"Could not build OpenAPI schema before fork: {e}")
+
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+    return app
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+class WorkerProcess:
+    """Bookkeeping for a forked worker (master side)."""
+
+    def __init__(self, pid: int, ready_fd: int) -> None:
+        self.pid = pid
+        self.ready_fd = ready_fd
+        self.ready = False
+        self.retiring = False
+        self.started_at = time.monotonic()
+        self.kill_at: float | None = None
+
+    def __repr__(self) -> str:
+        return f"<WorkerProcess pid={self.pid} ready={self.ready} retiring={self.retiring}>"
+
+
+def _run_worker(
+    app: Any,
+    listener: socket.socket | None,
+    ready_fd: int,
+    *,
+    host: str,
+    port: int,
+    backlog: int,
+    max_requests: int,
+    max_requests_jitter: int,
+    graceful_timeout: float,
+    log_level: str,
+) -> None:
+    """Body of a forked worker. Never returns."""
+    import uvicorn
+
+    # Fresh state for the child
+    random.seed()
+    # Control signals are meant for the master (a terminal hangup or
+    # `kill -HUP -<pgid>` must not take workers down)
+    for sig in (signal.SIGHUP, signal.SIGTTIN, signal.SIGTTOU):
+        signal.signal(sig, signal.SIG_IGN)
+    for sig in (signal.SIGQUIT, signal.SIGCHLD):
+        signal.signal(sig, signal.SIG_DFL)
+    signal.set_wakeup_fd(-1)
+
+    if listener is None:
+        listener = create_listener(host, port, backlog=backlog, reuse_port=True)
+
+    limit = None
+    if max_requests > 0:
+        limit = max_requests + random.randint(0, max(0, max_requests_jitter))
+
+    config = uvicorn.Config(
+        app,
+        interface="asgi3",
+        loop=_best_loop(),
+        http=_best_http(),
+        lifespan="auto",
+        log_level=log_level,
+        limit_max_requests=limit,
+        timeout_graceful_shutdown=graceful_timeout or None,
+        proxy_headers=True,
+    )
+
+    class _Server(uvicorn.Server):
+        async def startup(self, sockets: list[socket.socket] | None = None) -> None:
+            await super().startup(sockets=sockets)
+            if not self.should_exit:
+                try:
+                    os.write(ready_fd, b"1")
+                except OSError:
+                    pass
+
+    code = 0
+    try:
+        _Server(config).run(sockets=[listener])
+    except BaseException:
+        logger.exception(f"Worker {os.getpid()} crashed")
+        code = 1
+    finally:
+        try:
+            os.close(ready_fd)
+        except OSError:
+            pass
+    os._exit(code)
+
+
+# =============================================================================
+# Supervisor
+# =============================================================================
+
+class Supervisor:
+    """
+    Prefork master process.
+
+    Example:
+        app = preload_app("src.main")
+        Supervisor(app, host="0.0.0.0", port=8000, workers=4).run()
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        workers: int | None = None,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        graceful_timeout: float = 30.0,
+        reuse_port: bool = True,
+        backlog: int = 2048,
+        ready_timeout: float = 60.0,
+        log_level: str = "info",
+    ) -> None:
+        self.app = app
+        self.host = host
+        self.port = port
+        self.num_workers = workers or default_worker_count()
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.reuse_port = reuse_port and reuse_port_supported()
+        self.backlog = backlog
+        self.ready_timeout = ready_timeout
+        self.log_level = log_level
+
+        self.workers: dict[int, WorkerProcess] = {}
+        self._listener: socket.socket | None = None
+        self._signals: list[int] = []
+        self._wakeup_r: int | None = None
+        self._wakeup_w: int | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._stopping = False
+        self._stop_deadline: float | None = None
+        self._boot_failures = 0
+        self._exit_code = 0
+
+    # -------------------------------------------------------------------------
+    # Setup
+    # -------------------------------------------------------------------------
+
+    def _bind(self) -> None:
+        if self.reuse_port:
+            # Fail fast on bind errors; each worker opens its own listener.
+            probe = create_listener(self.host, self.port, self.backlog, reuse_port=True)
+            probe.close()
+        else:
+            self._listener = create_listener(self.host, self.port, self.backlog)
+
+    def _install_signals(self) -> None:
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        signal.set_wakeup_fd(self._wakeup_w)
+
+        for sig in (
+            signal.SIGHUP,
+            signal.SIGTERM,
+            signal.SIGINT,
+            signal.SIGQUIT,
+            signal.SIGCHLD,
+            signal.SIGTTIN,
+            signal.SIGTTOU,
+        ):
+            signal.signal(sig, self._on_signal)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+
+    def _on_signal(self, signum: int, frame: Any) -> None:
+        self._signals.append(signum)
+
+    # -------------------------------------------------------------------------
+    # Main loop
+    # -------------------------------------------------------------------------
+
+    def run(self) -> int:
+        """Run the supervisor until shutdown. Returns the exit code."""
+        self._bind()
+        self._install_signals()
+
+        logger.info(
+            f"Supervisor {os.getpid()} listening on http://{self.host}:{self.port} "
+            f"({self.num_workers} workers, loop={_best_loop()}, http={_best_http()}, "
+            f"reuse_port={self.reuse_port})"
+        )
+
+        try:
+            self._maintain()
+            while True:
+                self._reap()
+                self._handle_signals()
+
+                if self._stopping:
+                    if not self.workers:
+                        break
+                    if self._stop_deadline and time.monotonic() >= self._stop_deadline:
+                        self._kill_all(signal.SIGKILL)
+                        self._stop_deadline = None
+                else:
+                    self._maintain()
+                    self._kill_overdue()
+
+                self._wait(1.0)
+        finally:
+            if self._listener is not None:
+                self._listener.close()
+            signal.set_wakeup_fd(-1)
+
+        logger.info("Supervisor stopped")
+        return self._exit_code
+
+    def _wait(self, timeout: float) -> None:
+        """Sleep until a signal arrives, a worker becomes ready, or timeout."""
+        assert self._selector is not None
+        try:
+            events = self._selector.select(timeout)
+        except InterruptedError:
+            return
+        for key, _ in events:
+            if key.fd == self._wakeup_r:
+                try:
+                    while os.read(self._wakeup_r, 512):
+                        pass
+                except (BlockingIOError, InterruptedError):
+                    pass
+            else:
+                self._mark_ready(key.data)
+
+    def _mark_ready(self, worker: WorkerProcess) -> None:
+        assert self._selector is not None
+        try:
+            data = os.read(worker.ready_fd, 1)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        self._selector.unregister(worker.ready_fd)
+        if data:
+            worker.ready = True
+            self._boot_failures = 0
+            logger.info(f"Worker {worker.pid} ready")
+
+    def _handle_signals(self) -> None:
+        while self._signals:
+            sig = self._signals.pop(0)
+            if sig == signal.SIGCHLD:
+                continue
+            if sig == signal.SIGHUP:
+                logger.info("SIGHUP received, rolling reload")
+                self.reload()
+            elif sig in (signal.SIGTERM, signal.SIGINT):
+                self.stop(graceful=True)
+            elif sig == signal.SIGQUIT:
+                self.stop(graceful=False)
+            elif sig == signal.SIGTTIN:
+                self.num_workers += 1
+                logger.info(f"Workers increased to {self.num_workers}")
+            elif sig == signal.SIGTTOU and self.num_workers > 1:
+                self.num_workers -= 1
+                logger.info(f"Workers decreased to {self.num_workers}")
+
+    # -------------------------------------------------------------------------
+    # Worker management
+    # -------------------------------------------------------------------------
+
+    def _spawn(self) -> WorkerProcess:
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child
+            os.close(ready_r)
+            for fd in (self._wakeup_r, self._wakeup_w):
+                if fd is not None:
+                    os.close(fd)
+            for other in self.workers.values():
+                try:
+                    os.close(other.ready_fd)
+                except OSError:
+                    pass
+            _run_worker(
+                self.app,
+                self._listener,
+                ready_w,
+                host=self.host,
+                port=self.port,
+                backlog=self.backlog,
+                max_requests=self.max_requests,
+                max_requests_jitter=self.max_requests_jitter,
+                graceful_timeout=self.graceful_timeout,
+                log_level=self.log_level,
+            )
+
+        os.close(ready_w)
+        os.set_blocking(ready_r, False)
+        worker = WorkerProcess(pid, ready_r)
+        self.workers[pid] = worker
+        assert self._selector is not None
+        self._selector.register(ready_r, selectors.EVENT_READ, worker)
+        logger.info(f"Booted worker {pid}")
+        return worker
+
+    def _active(self) -> list[WorkerProcess]:
+        return [w for w in self.workers.values() if not w.retiring]
+
+    def _maintain(self) -> None:
+        """Spawn or retire workers to match ``num_workers``."""
+        if self._boot_failures >= MAX_BOOT_FAILURES:
+            logger.error("Workers failed to boot repeatedly, shutting down")
+            self._exit_code = 1
+            self.stop(graceful=False)
+            return
+
+        active = self._active()
+        for _ in range(self.num_workers - len(active)):
+            self._spawn()
+
+        excess = len(active) - self.num_workers
+        if excess > 0:
+            for worker in sorted(active, key=lambda w: w.started_at)[:excess]:
+                self._retire(worker)
+
+    def _retire(self, worker: WorkerProcess) -> None:
+        worker.retiring = True
+        worker.kill_at = time.monotonic() + self.graceful_timeout + 5
+        self._send(worker.pid, signal.SIGTERM)
+
+    def _kill_overdue(self) -> None:
+        now = time.monotonic()
+        for worker in list(self.workers.values()):
+            if worker.kill_at is not None and now >= worker.kill_at:
+                logger.warning(f"Worker {worker.pid} did not exit in time, killing")
+                self._send(worker.pid, signal.SIGKILL)
+                worker.kill_at = None
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            worker = self.workers.pop(pid, None)
+            if worker is None:
+                continue
+
+            if self._selector is not None and not worker.ready:
+                try:
+                    self._selector.unregister(worker.ready_fd)
+                except (KeyError, ValueError):
+                    pass
+            try:
+                os.close(worker.ready_fd)
+            except OSError:
+                pass
+
+            code = os.waitstatus_to_exitcode(status)
+            if not worker.ready and not worker.retiring and not self._stopping:
+                self._boot_failures += 1
+                logger.error(f"Worker {pid} exited before becoming ready (code {code})")
+            elif code != 0 and not worker.retiring and not self._stopping:
+                logger.warning(f"Worker {pid} exited with code {code}")
+            else:
+                logger.info(f"Worker {pid} exited")
+
+    def _send(self, pid: int, sig: int) -> None:
+        try:
+            os.kill(pid, sig)
+        except OSError as e:
+            if e.errno != errno.ESRCH:
+                raise
+
+    def _kill_all(self, sig: int) -> None:
+        for pid in list(self.workers):
+            self._send(pid, sig)
+
+    def _wait_ready(self, worker: WorkerProcess, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while not worker.ready:
+            if worker.pid not in self.workers or self._stopping:
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._wait(min(remaining, 0.5))
+            self._reap()
+            if self._stop_pending():
+                return False
+        return True
+
+    def _stop_pending(self) -> bool:
+        return any(s in (signal.SIGTERM, signal.SIGINT, signal.SIGQUIT) for s in self._signals)
+
+    # -------------------------------------------------------------------------
+    # Public control
+    # -------------------------------------------------------------------------
+
+    def reload(self) -> None:
+        """
+        Zero-downtime rolling reload.
+
+        Replaces workers one at a time: a new worker must report ready before
+        an old one is asked to drain, so capacity never drops below N.
+        """
+        for old in list(self._active()):
+            if self._stopping or self._stop_pending():
+                return
+            new = self._spawn()
+            if not self._wait_ready(new, self.ready_timeout):
+                if not self._stop_pending():
+                    logger.error(f"Worker {new.pid} did not become ready, aborting reload")
+                if new.pid in self.workers:
+                    self._retire(new)
+                return
+            if old.pid in self.workers:
+                self._retire(old)
+        logger.info("Rolling reload complete")
+
+    def stop(self, graceful: bool = True) -> None:
+        """Stop all workers (SIGTERM, then SIGKILL after graceful_timeout)."""
+        if self._stopping and graceful:
+            return
+        self._stopping = True
+        if graceful:
+            logger.info("Graceful shutdown")
+            self._kill_all(signal.SIGTERM)
+            self._stop_deadline = time.monotonic() + self.graceful_timeout + 5
+        else:
+            logger.info("Immediate shutdown")
+            self._kill_all(signal.SIGKILL)
+            self._stop_deadline = None
+
+
+def serve(
+    app_module: str,
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int | None = None,
+    max_requests: int = 0,
+    max_requests_jitter: int = 0,
+    graceful_timeout: float = 30.0,
+    reuse_port: bool = True,
+    backlog: int = 2048,
+    log_level: str = "info",
+) -> int:
+    """
+    Preload ``app_module`` and run the prefork supervisor.
+
+    Args:
+        app_module: Module path ("src.main" or "src.main:app")
+        host: Bind host
+        port: Bind port
+        workers: Number of workers (None = cgroup CPU quota)
+        max_requests: Recycle a worker after this many requests (0 = never)
+        max_requests_jitter: Random extra requests per worker, avoids
+            all workers restarting at once
+        graceful_timeout: Seconds a worker may drain before SIGKILL
+        reuse_port: One SO_REUSEPORT listener per worker (Linux)
+        backlog: Listen backlog
+        log_level: uvicorn log level
+
+    Returns:
+        Exit code
+    """
+    app = preload_app(app_module)
+    supervisor = Supervisor(
+        app,
+        host=host,
+        port=port,
+        workers=workers,
+        max_requests=max_requests,
+        max_requests_jitter=max_requests_jitter,
+        graceful_timeout=graceful_timeout,
+        reuse_port=reuse_port,
+        backlog=backlog,
+        log_level=log_level,
+    )
+    return supervisor.run()
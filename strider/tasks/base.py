@@ -18,6 +18,9 @@ from strider.datetime import timezone
 
 F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
 
+# Políticas para execuções perdidas de PeriodicTask (ver PeriodicTask.due_runs)
+CATCHUP_POLICIES = ("once", "all", "skip")
+
 
 class TaskStatus(str, Enum):
     """Task execution status."""
@@ -173,6 +176,7 @@ class Task:
         retry_delay: int = 60,
         timeout: int = 300,
         bind: bool = False,
+        durable: bool = False,
     ):
         """
         Initialize task.
@@ -185,6 +189,8 @@ class Task:
             retry_delay: Delay between retries in seconds
             timeout: Task timeout in seconds
             bind: Whether to pass task instance as first argument
+            durable: Record lifecycle transitions synchronously instead of
+                through the worker's write-behind buffer
         """
         self.func = func
         self.name = name or f"{func.__module__}.{func.__name__}"
@@ -193,6 +199,7 @@ class Task:
         self.retry_delay = retry_delay
         self.timeout = timeout
         self.bind = bind
+        self.durable = durable
         
         # Copy function metadata
         self.__name__ = func.__name__
@@ -297,6 +304,7 @@ class PeriodicTask:
         interval: int | None = None,
         queue: str = "scheduled",
         enabled: bool = True,
+        catchup: str = "once",
     ):
         """
         Initialize periodic task.
@@ -308,9 +316,17 @@ class PeriodicTask:
             interval: Interval in seconds
             queue: Queue to send task to
             enabled: Whether task is enabled
+            catchup: Missed-run policy when the scheduler falls behind
+                (downtime, leader failover): "once" fires a single run for
+                all missed slots, "all" fires every missed slot (capped by
+                task_scheduler_max_catchup), "skip" drops missed slots
         """
         if not cron and not interval:
             raise ValueError("Either 'cron' or 'interval' must be specified")
+        if catchup not in CATCHUP_POLICIES:
+            raise ValueError(
+                f"Invalid catchup '{catchup}'. Use one of: {', '.join(CATCHUP_POLICIES)}"
+            )
         
         self.func = func
         self.name = name or f"{func.__module__}.{func.__name__}"
@@ -318,6 +334,7 @@ class PeriodicTask:
         self.interval = interval
         self.queue = queue
         self.enabled = enabled
+        self.catchup = catchup
         
         # Copy function metadata
         self.__name__ = func.__name__
@@ -328,6 +345,10 @@ class PeriodicTask:
         self.last_run: datetime | None = None
         self.next_run: datetime | None = None
         self.run_count: int = 0
+        
+        # croniter reaproveitado entre avaliações (avança em vez de reconstruir)
+        self._cron_iter: Any = None
+        self._cron_cursor: datetime | None = None
     
     async def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Execute task immediately."""
@@ -351,18 +372,68 @@ class PeriodicTask:
             return base + timedelta(seconds=self.interval)
         
         if self.cron:
-            try:
-                from croniter import croniter
-                cron = croniter(self.cron, base)
-                return cron.get_next(datetime)
-            except ImportError:
-                raise ImportError(
-                    "croniter is required for cron expressions. "
-                    "Install with: pip install croniter"
-                )
+            if self._cron_iter is None:
+                try:
+                    from croniter import croniter
+                except ImportError:
+                    raise ImportError(
+                        "croniter is required for cron expressions. "
+                        "Install with: pip install croniter"
+                    )
+                self._cron_iter = croniter(self.cron, base)
+            elif self._cron_cursor != base:
+                self._cron_iter.set_current(base)
+            self._cron_cursor = self._cron_iter.get_next(datetime)
+            return self._cron_cursor
         
         raise ValueError("No schedule defined")
     
+    def due_runs(
+        self,
+        now: datetime,
+        *,
+        limit: int = 100,
+        grace: float = 0.0,
+    ) -> tuple[list[datetime], datetime]:
+        """
+        Resolve the slots due at *now* according to ``catchup``.
+        
+        Args:
+            now: Current time
+            limit: Maximum runs returned for catchup="all"
+            grace: Seconds a slot may be late and still count as on time
+                (catchup="skip")
+        
+        Returns:
+            (scheduled times to fire now, next run after *now*)
+        """
+        from datetime import timedelta
+        
+        next_run = self.next_run or self.get_next_run(now)
+        if now < next_run:
+            return [], next_run
+        
+        if self.interval:
+            # Slots fixos: calcula direto, sem iterar os perdidos
+            step = timedelta(seconds=self.interval)
+            count = int((now - next_run) / step) + 1
+            missed = [next_run + i * step for i in range(min(count, limit))]
+            latest = next_run + (count - 1) * step
+            next_run += count * step
+        else:
+            missed = []
+            while next_run <= now:
+                latest = next_run
+                if len(missed) < limit:
+                    missed.append(next_run)
+                next_run = self.get_next_run(next_run)
+        
+        if self.catchup == "all":
+            return missed, next_run
+        if self.catchup == "skip" and (now - latest).total_seconds() > grace:
+            return [], next_run
+        return [latest], next_run
+    
     def should_run(self, now: datetime | None = None) -> bool:
         """
         Check if task should run now.
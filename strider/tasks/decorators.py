@@ -28,6 +28,7 @@ def task(
     retry_delay: int = 60,
     timeout: int = 300,
     bind: bool = False,
+    durable: bool = False,
 ) -> Callable[[F], Task]: ...
 
 
@@ -40,6 +41,7 @@ def task(
     retry_delay: int = 60,
     timeout: int = 300,
     bind: bool = False,
+    durable: bool = False,
 ) -> Task | Callable[[F], Task]:
     """
     Decorator to define a background task.
@@ -62,6 +64,7 @@ def task(
         retry_delay: Delay between retries in seconds
         timeout: Task timeout in seconds
         bind: Pass task instance as first argument
+        durable: Record start/finish synchronously (not write-behind)
     
     Returns:
         Task instance
@@ -93,6 +96,7 @@ def task(
             retry_delay=retry_delay,
             timeout=timeout,
             bind=bind,
+            durable=durable,
         )
         register_task(task_instance)
         return task_instance
@@ -116,6 +120,7 @@ def periodic_task(
     interval: int | None = None,
     queue: str = "scheduled",
     enabled: bool = True,
+    catchup: str = "once",
 ) -> Callable[[F], PeriodicTask]: ...
 
 
@@ -127,6 +132,7 @@ def periodic_task(
     interval: int | None = None,
     queue: str = "scheduled",
     enabled: bool = True,
+    catchup: str = "once",
 ) -> PeriodicTask | Callable[[F], PeriodicTask]:
     """
     Decorator to define a periodic/scheduled task.
@@ -140,6 +146,7 @@ def periodic_task(
         interval: Interval in seconds
         queue: Queue to send task to
         enabled: Whether task is enabled
+        catchup: Missed-run policy ("once", "all" or "skip")
     
     Returns:
         PeriodicTask instance
@@ -182,6 +189,7 @@ def periodic_task(
             interval=interval,
             queue=queue,
             enabled=enabled,
+            catchup=catchup,
         )
         register_periodic_task(task_instance)
         return task_instance
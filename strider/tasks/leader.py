@@ -0,0 +1,252 @@
+"""
+Leader election for the task scheduler.
+
+Several schedulers can run for availability; only the one holding the
+lease fires periodic tasks.  The leader renews its lease well before it
+expires (every ``ttl / 3``); if it dies, another scheduler takes over once
+the lease expires.
+
+Backends:
+    DatabaseLeaderElector: conditional UPDATE on ``admin_scheduler_leases``
+    RedisLeaderElector:    ``SET NX PX`` + compare-and-renew script
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Callable
+import logging
+import os
+import socket
+import uuid
+
+from strider.datetime import timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+def default_holder_id() -> str:
+    """Identity of this scheduler process: ``host:pid:random``."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderElector:
+    """
+    Base class for lease-based leader election.
+
+    ``acquire()`` takes the lease if it is free or expired, or renews it
+    if this holder already owns it, and returns whether this process is
+    the leader.  ``release()`` gives it up so a standby can take over
+    without waiting for the TTL.
+    """
+
+    def __init__(
+        self,
+        name: str = "scheduler",
+        *,
+        ttl: float = 30.0,
+        holder: str | None = None,
+        clock: Callable[[], datetime] = timezone.now,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.holder = holder or default_holder_id()
+        self.clock = clock
+        self.is_leader = False
+
+    @property
+    def renew_interval(self) -> float:
+        """Seconds between renewals while leading."""
+        return self.ttl / 3
+
+    async def acquire(self) -> bool:
+        raise NotImplementedError
+
+    async def release(self) -> None:
+        raise NotImplementedError
+
+    def _transition(self, leader: bool) -> None:
+        if leader != self.is_leader:
+            logger.info(
+                "Scheduler %s leadership of '%s' (holder=%s)",
+                "acquired" if leader else "lost",
+                self.name,
+                self.holder,
+            )
+        self.is_leader = leader
+
+
+class DatabaseLeaderElector(LeaderElector):
+    """
+    Leader election over the application database.
+
+    Uses a single conditional ``UPDATE`` (holder is me or the lease is
+    expired) so that exactly one scheduler wins, with an ``INSERT`` the
+    first time a lease name is used.  Expiry is compared against this
+    process's clock, so ``ttl`` must be well above the clock skew between
+    hosts.
+    """
+
+    def __init__(
+        self,
+        name: str = "scheduler",
+        *,
+        session_factory: Callable[[], Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(name, **kwargs)
+        self._session_factory = session_factory
+        self.token: int | None = None
+
+    async def _session(self) -> Any:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from strider.models import get_session
+        return await get_session()
+
+    async def acquire(self) -> bool:
+        from sqlalchemy import case, insert, or_, select, update
+        from sqlalchemy.exc import IntegrityError
+        from strider.admin.models import SchedulerLease
+
+        now = self.clock()
+        expires_at = now + timedelta(seconds=self.ttl)
+        db = await self._session()
+        async with db:
+            result = await db.execute(
+                update(SchedulerLease)
+                .where(
+                    SchedulerLease.name == self.name,
+                    or_(SchedulerLease.holder == self.holder, SchedulerLease.expires_at <= now),
+                )
+                .values(
+                    holder=self.holder,
+                    expires_at=expires_at,
+                    token=case(
+                        (SchedulerLease.holder == self.holder, SchedulerLease.token),
+                        else_=SchedulerLease.token + 1,
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            won = result.rowcount == 1
+            if not won:
+                exists = await db.scalar(
+                    select(SchedulerLease.id).where(SchedulerLease.name == self.name)
+                )
+                if exists is None:
+                    try:
+                        await db.execute(
+                            insert(SchedulerLease).values(
+                                name=self.name, holder=self.holder, token=1, expires_at=expires_at,
+                            )
+                        )
+                        won = True
+                    except IntegrityError:
+                        await db.rollback()
+                        won = False
+            if won:
+                self.token = await db.scalar(
+                    select(SchedulerLease.token).where(SchedulerLease.name == self.name)
+                )
+            await db.commit()
+
+        self._transition(won)
+        return won
+
+    async def release(self) -> None:
+        if not self.is_leader:
+            return
+        from sqlalchemy import update
+        from strider.admin.models import SchedulerLease
+
+        db = await self._session()
+        async with db:
+            await db.execute(
+                update(SchedulerLease)
+                .where(SchedulerLease.name == self.name, SchedulerLease.holder == self.holder)
+                .values(expires_at=self.clock())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        self._transition(False)
+
+
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLeaderElector(LeaderElector):
+    """
+    Leader election over Redis.
+
+    ``SET key holder NX PX ttl`` takes a free lease; renewal and release
+    run as scripts that only touch the key while this process still holds
+    it.  Expiry is enforced by Redis, so host clocks do not matter.
+    """
+
+    def __init__(
+        self,
+        name: str = "scheduler",
+        *,
+        url: str | None = None,
+        prefix: str = "strider:leader:",
+        client: Any = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(name, **kwargs)
+        self.url = url
+        self.key = prefix + name
+        self._client = client
+
+    async def connect(self) -> Any:
+        if self._client is None:
+            from strider.messaging.redis.connection import create_redis_client
+            self._client = await create_redis_client(url=self.url)
+        return self._client
+
+    async def acquire(self) -> bool:
+        client = await self.connect()
+        ttl_ms = int(self.ttl * 1000)
+        won = bool(await client.set(self.key, self.holder, nx=True, px=ttl_ms))
+        if not won:
+            won = bool(await client.eval(_RENEW_SCRIPT, 1, self.key, self.holder, ttl_ms))
+        self._transition(won)
+        return won
+
+    async def release(self) -> None:
+        if not self.is_leader:
+            return
+        client = await self.connect()
+        await client.eval(_RELEASE_SCRIPT, 1, self.key, self.holder)
+        self._transition(False)
+
+
+def create_leader_elector_from_settings(name: str = "scheduler") -> LeaderElector | None:
+    """
+    Build the elector selected by ``settings.task_scheduler_leader_election``.
+
+    Returns ``None`` for ``"none"`` (every scheduler fires).
+    """
+    from strider.config import get_settings
+
+    settings = get_settings()
+    backend = settings.task_scheduler_leader_election
+    ttl = float(settings.task_scheduler_lease_seconds)
+    if backend == "database":
+        return DatabaseLeaderElector(name, ttl=ttl)
+    if backend == "redis":
+        return RedisLeaderElector(name, ttl=ttl, url=settings.redis_url)
+    return None
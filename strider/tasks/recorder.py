@@ -0,0 +1,208 @@
+"""
+Write-behind persistence of task lifecycle transitions.
+
+The worker records two transitions per task (start and finish).  Writing
+each one in its own session and transaction costs two round-trips per
+task; at high throughput that dominates database load.
+
+``TaskLifecycleRecorder`` buffers transitions in memory, keyed by
+``task_id``, and flushes them periodically as multi-row upserts on
+``admin_task_executions``:
+
+- a task that starts and finishes between two flushes becomes a single
+  ``INSERT`` row;
+- transitions are grouped by the columns they carry, so a flush issues at
+  most one statement per group (start-only, finish-only, complete);
+- memory is bounded by ``max_pending``: recording into a full buffer waits
+  for a flush, and if the database stays unavailable the oldest entries
+  are dropped (counted in ``dropped``);
+- ``close()`` flushes what is left (worker shutdown);
+- ``durable=True`` writes the transition immediately, for tasks that must
+  be recorded synchronously.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+# Colunas de identidade: não mudam entre transições (não entram no DO UPDATE)
+_IDENTITY_FIELDS = frozenset({"task_id", "task_name", "queue"})
+
+
+class TaskLifecycleRecorder:
+    """
+    Buffered recorder for ``TaskExecution`` rows.
+
+    Example:
+        recorder = TaskLifecycleRecorder(flush_interval=1.0)
+        await recorder.start()
+
+        await recorder.record_start(task_id=..., task_name=..., queue=...)
+        await recorder.record_finish(task_id=..., task_name=..., queue=..., status="SUCCESS")
+
+        await recorder.close()  # flush final
+
+    Args:
+        session_factory: Session factory (default: ``strider.models.get_session``)
+        flush_interval: Seconds between periodic flushes
+        batch_size: Pending transitions that trigger an early flush, and
+            rows per statement
+        max_pending: Maximum buffered tasks (bounded memory)
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Any] | None = None,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+        max_pending: int = 10_000,
+    ):
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max(max_pending, batch_size)
+
+        # task_id -> colunas acumuladas (ordem de inserção = ordem de chegada)
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Tasks waiting to be written."""
+        return len(self._pending)
+
+    async def start(self) -> None:
+        """Start the periodic flush loop."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop(), name="task-recorder-flush")
+
+    async def close(self) -> None:
+        """Stop the flush loop and write everything still buffered."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+        if self._pending:
+            logger.warning("Task recorder closed with %d unwritten transition(s)", len(self._pending))
+
+    async def record_start(self, *, durable: bool = False, **fields: Any) -> None:
+        """Record the RUNNING transition (``TaskExecution`` columns as kwargs)."""
+        fields.setdefault("status", "RUNNING")
+        await self._record(fields, durable)
+
+    async def record_finish(self, *, durable: bool = False, **fields: Any) -> None:
+        """Record the final transition (status, result, error, duration...)."""
+        await self._record(fields, durable)
+
+    async def _record(self, fields: dict[str, Any], durable: bool) -> None:
+        task_id = fields["task_id"]
+        entry = self._pending.get(task_id)
+        if entry is None:
+            if len(self._pending) >= self.max_pending:
+                # Backpressure: espera o flush em vez de crescer sem limite
+                await self.flush()
+                self._trim()
+            entry = self._pending[task_id] = {}
+        entry.update(fields)
+
+        if durable:
+            await self._write_now(task_id)
+        elif len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _write_now(self, task_id: str) -> None:
+        async with self._flush_lock:
+            row = self._pending.pop(task_id, None)
+            if row is None:
+                return
+            try:
+                await self._write([row])
+            except Exception:
+                self._pending.setdefault(task_id, {}).update(row)
+                raise
+
+    async def flush(self) -> int:
+        """Write all buffered transitions.  Returns the number of tasks written."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            try:
+                await self._write(list(batch.values()))
+            except Exception as e:
+                logger.warning("Failed to persist %d task transition(s): %s", len(batch), e)
+                # Devolve ao buffer; transições mais novas ficam por cima
+                for task_id, fields in self._pending.items():
+                    batch.setdefault(task_id, {}).update(fields)
+                self._pending = batch
+                return 0
+            return len(batch)
+
+    def _trim(self) -> None:
+        overflow = len(self._pending) - self.max_pending + 1
+        if overflow <= 0:
+            return
+        for task_id in list(self._pending)[:overflow]:
+            del self._pending[task_id]
+        self.dropped += overflow
+        logger.warning("Task recorder buffer full: dropped %d transition(s)", overflow)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def _session(self) -> Any:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from strider.models import get_session
+        return await get_session()
+
+    async def _write(self, rows: list[dict[str, Any]]) -> None:
+        """Upsert *rows* in one transaction, one statement per column set."""
+        from strider.admin.models import TaskExecution
+
+        groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(frozenset(row), []).append(row)
+
+        db = await self._session()
+        async with db:
+            manager = TaskExecution.objects.using(db)
+            for columns, group in groups.items():
+                try:
+                    await manager.bulk_create(
+                        group,
+                        batch_size=self.batch_size,
+                        update_conflicts=True,
+                        unique_fields=["task_id"],
+                        update_fields=sorted(columns - _IDENTITY_FIELDS),
+                        hydrate=False,
+                    )
+                except NotImplementedError:
+                    # Dialeto sem ON CONFLICT: UPDATE por task_id, INSERT se não existir
+                    for row in group:
+                        updated = await manager.update(
+                            {"task_id": row["task_id"]},
+                            **{k: v for k, v in row.items() if k not in _IDENTITY_FIELDS},
+                        )
+                        if not updated:
+                            db.add(TaskExecution(**row))
+            await db.commit()
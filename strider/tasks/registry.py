@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 # Global registries
 _tasks: dict[str, "Task"] = {}
 _periodic_tasks: dict[str, "PeriodicTask"] = {}
+_periodic_version = 0
 _task_producer: "Producer | None" = None
 
 
@@ -71,7 +72,9 @@ def register_periodic_task(task: "PeriodicTask") -> None:
     Args:
         task: PeriodicTask instance
     """
+    global _periodic_version
     _periodic_tasks[task.name] = task
+    _periodic_version += 1
 
 
 def get_periodic_task(name: str) -> "PeriodicTask":
@@ -102,6 +105,15 @@ def get_periodic_tasks() -> dict[str, "PeriodicTask"]:
     return _periodic_tasks.copy()
 
 
+def get_periodic_tasks_version() -> int:
+    """
+    Counter bumped whenever the periodic registry changes.
+    
+    Lets the scheduler detect new registrations in O(1) per tick.
+    """
+    return _periodic_version
+
+
 def set_task_producer(producer: "Producer") -> None:
     """
     Set the producer for sending task messages.
@@ -138,9 +150,10 @@ def clear_registry() -> None:
     
     Useful for testing.
     """
-    global _task_producer
+    global _task_producer, _periodic_version
     _tasks.clear()
     _periodic_tasks.clear()
+    _periodic_version += 1
     _task_producer = None
 
 
@@ -3,18 +3,34 @@ Task scheduler for periodic tasks.
 
 Monitors periodic tasks and schedules them for execution
 when their time comes.
+
+Engine:
+- Leader election (lease over the database or Redis): any number of
+  schedulers may run, only the leader fires.
+- Min-heap keyed by next run: each tick pops only the due tasks and
+  sleeps until the next one, so a tick costs O(due jobs).
+- Persisted next-run table (``admin_periodic_tasks``): a new leader
+  resumes where the previous one stopped instead of re-firing.
+- Missed runs resolved per task by ``PeriodicTask.catchup``.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime
+from typing import Any, Callable, Literal
 import asyncio
+import heapq
 import logging
 import signal
 
 from strider.tasks.base import PeriodicTask, TaskMessage
+from strider.tasks.leader import LeaderElector, create_leader_elector_from_settings
 from strider.config import get_settings
-from strider.tasks.registry import get_periodic_tasks, get_task_producer
+from strider.tasks.registry import (
+    get_periodic_tasks,
+    get_periodic_tasks_version,
+    get_task_producer,
+)
 from strider.datetime import timezone
 
 
@@ -34,9 +50,28 @@ class TaskScheduler:
         
         # Run until interrupted
         await scheduler.run_forever()
+    
+    Args:
+        elector: Leader elector.  ``None`` builds it from
+            ``task_scheduler_leader_election``; ``False`` disables election
+            (every scheduler fires).
+        producer: Producer used to send task messages (default:
+            ``get_task_producer()``).
+        clock: Returns the current time; injectable for tests.
+        session_factory: Session factory for the next-run table (default:
+            ``strider.models.get_session``).
+        persist: Persist next runs to ``admin_periodic_tasks``.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        elector: LeaderElector | Literal[False] | None = None,
+        producer: Any = None,
+        clock: Callable[[], datetime] = timezone.now,
+        session_factory: Callable[[], Any] | None = None,
+        persist: bool = True,
+    ):
         """Initialize scheduler."""
         self._settings = get_settings()
         self._running = False
@@ -47,6 +82,31 @@ class TaskScheduler:
         self._shutdown_grace_seconds = float(
             getattr(self._settings, "task_shutdown_grace_seconds", 5.0)
         )
+        self._interval = float(getattr(self._settings, "task_scheduler_interval", 1.0))
+        self._max_catchup = int(getattr(self._settings, "task_scheduler_max_catchup", 100))
+        self._refresh_seconds = float(getattr(self._settings, "task_scheduler_refresh_seconds", 30.0))
+        
+        self._elector = create_leader_elector_from_settings() if elector is None else elector or None
+        self._producer = producer
+        self._clock = clock
+        self._session_factory = session_factory
+        self._persist = persist
+        
+        # Heap de (next_run, seq, nome); None = recarregar (start ou nova liderança)
+        self._heap: list[tuple[datetime, int, str]] | None = None
+        self._tasks: dict[str, PeriodicTask] = {}
+        self._registry_version = -1
+        # Desabilitadas pelo admin (is_enabled da tabela); relido a cada _refresh_seconds
+        self._disabled: set[str] = set()
+        self._refresh_at: datetime | None = None
+        self._seq = 0
+        self._renew_at: datetime | None = None
+        self._lease_until: datetime | None = None
+    
+    @property
+    def is_leader(self) -> bool:
+        """Whether this scheduler currently fires tasks."""
+        return self._elector is None or self._elector.is_leader
     
     async def start(self) -> None:
         """Start the scheduler."""
@@ -57,14 +117,15 @@ class TaskScheduler:
         self._signal_received = False
         
         # Initialize database for persistence
-        try:
-            from strider.models import init_database
-            from strider.config import get_settings
-            settings = get_settings()
-            await init_database(settings.database_url)
-            logger.info("Database initialized for scheduler")
-        except Exception as e:
-            logger.warning(f"Failed to initialize database: {e}")
+        if self._session_factory is None:
+            try:
+                from strider.models import init_database
+                from strider.config import get_settings
+                settings = get_settings()
+                await init_database(settings.database_url)
+                logger.info("Database initialized for scheduler")
+            except Exception as e:
+                logger.warning(f"Failed to initialize database: {e}")
         
         # Setup signal handlers - use threadsafe approach
         loop = asyncio.get_running_loop()
@@ -110,6 +171,13 @@ class TaskScheduler:
                 logger.warning("Scheduler task stop timeout reached")
             self._task = None
         
+        # Libera o lease para um standby assumir sem esperar o TTL
+        if self._elector is not None:
+            try:
+                await self._elector.release()
+            except Exception as e:
+                logger.warning(f"Failed to release scheduler lease: {e}")
+        
         self._shutdown_event.set()
         logger.info("Scheduler stopped")
     
@@ -140,25 +208,237 @@ class TaskScheduler:
         """Main scheduler loop."""
         while self._running:
             try:
-                await self._check_tasks()
-                await asyncio.sleep(self._settings.task_scheduler_interval)
+                delay = await self.tick()
+                await asyncio.sleep(delay)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Scheduler error: {e}", exc_info=True)
-                await asyncio.sleep(self._settings.task_scheduler_interval)
+                await asyncio.sleep(self._interval)
+    
+    async def tick(self) -> float:
+        """
+        Run one scheduling step.
+        
+        Renews (or tries to take) leadership, fires the due tasks and
+        returns how many seconds to sleep before the next step.
+        """
+        now = self._clock()
+        
+        if not await self._check_leadership(now):
+            return self._elector.renew_interval if self._elector else self._interval
+        
+        if self._heap is None or get_periodic_tasks_version() != self._registry_version:
+            await self._load_schedule(now)
+        elif self._refresh_at is not None and now >= self._refresh_at:
+            await self._refresh_disabled(now)
+        
+        fired: list[PeriodicTask] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            when, _, name = heapq.heappop(heap)
+            task = self._tasks.get(name)
+            if task is None or not self._enabled(task) or task.next_run != when:
+                continue  # entrada obsoleta
+            
+            runs, next_run = task.due_runs(now, limit=self._max_catchup, grace=self._interval)
+            for scheduled_for in runs:
+                if not await self._schedule_task(task, scheduled_for):
+                    # Falha no envio: o slot fica pendente para o próximo tick
+                    next_run = scheduled_for
+                    break
+                task.last_run = now
+                task.run_count += 1
+            
+            task.next_run = next_run
+            fired.append(task)
+        
+        # Reinsere só depois: um slot que falhou continua vencido neste tick
+        for task in fired:
+            self._push(task)
+        
+        if fired:
+            await self._save_schedule(fired)
+        
+        return self._next_delay(now)
     
     async def _check_tasks(self) -> None:
         """Check all periodic tasks and schedule if needed."""
-        now = timezone.now()
-        periodic_tasks = get_periodic_tasks()
+        await self.tick()
+    
+    async def _check_leadership(self, now: datetime) -> bool:
+        """Renew or acquire the lease when due; drop the schedule when lost."""
+        elector = self._elector
+        if elector is None:
+            return True
+        if elector.is_leader and self._renew_at is not None and now < self._renew_at:
+            return True
         
-        for name, task in periodic_tasks.items():
-            if task.should_run(now):
-                await self._schedule_task(task)
+        from datetime import timedelta
+        
+        try:
+            leader = await elector.acquire()
+        except Exception as e:
+            logger.warning(f"Scheduler lease check failed: {e}")
+            # Sem confirmação, só continua líder enquanto o lease vigente não expira
+            leader = elector.is_leader and self._lease_until is not None and now < self._lease_until
+        else:
+            if leader:
+                self._renew_at = now + timedelta(seconds=elector.renew_interval)
+                self._lease_until = now + timedelta(seconds=elector.ttl)
+        
+        if not leader:
+            # Outro scheduler assumiu: recarregar do banco ao voltar a liderar
+            self._heap = None
+            self._renew_at = self._lease_until = None
+        return leader
+    
+    def _push(self, task: PeriodicTask) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (task.next_run, self._seq, task.name))
+    
+    def _next_delay(self, now: datetime) -> float:
+        delay = self._interval
+        if self._heap:
+            delay = min(delay, (self._heap[0][0] - now).total_seconds())
+        if self._renew_at is not None:
+            delay = min(delay, (self._renew_at - now).total_seconds())
+        return max(delay, 0.0)
+    
+    async def _session(self) -> Any:
+        if self._session_factory is not None:
+            return self._session_factory()
+        from strider.models import get_session
+        return await get_session()
+    
+    async def _load_schedule(self, now: datetime) -> None:
+        """Build the heap from the registry and the persisted next runs."""
+        self._registry_version = get_periodic_tasks_version()
+        self._tasks = get_periodic_tasks()
+        
+        if self._persist:
+            try:
+                await self._sync_schedule_rows(now)
+            except Exception as e:
+                logger.warning(f"Failed to load persisted schedule: {e}")
+        
+        self._heap = []
+        for task in self._tasks.values():
+            if not self._enabled(task):
+                continue
+            if task.next_run is None:
+                task.next_run = task.get_next_run(now)
+            self._seq += 1
+            self._heap.append((task.next_run, self._seq, task.name))
+        heapq.heapify(self._heap)
+    
+    def _enabled(self, task: PeriodicTask) -> bool:
+        """Enabled in code and not disabled in the admin."""
+        return task.enabled and task.name not in self._disabled
     
-    async def _schedule_task(self, task: PeriodicTask) -> None:
-        """Schedule a periodic task for execution."""
+    def _schedule_refresh(self, now: datetime) -> None:
+        from datetime import timedelta
+        
+        if self._persist and self._refresh_seconds > 0:
+            self._refresh_at = now + timedelta(seconds=self._refresh_seconds)
+    
+    async def _refresh_disabled(self, now: datetime) -> None:
+        """Re-read the admin flags; re-enabled tasks go back to the heap from now on."""
+        from sqlalchemy import select
+        from strider.admin.models import PeriodicTaskSchedule
+        
+        self._schedule_refresh(now)
+        try:
+            db = await self._session()
+            async with db:
+                disabled = set((await db.scalars(
+                    select(PeriodicTaskSchedule.task_name).where(PeriodicTaskSchedule.is_enabled.is_(False))
+                )).all())
+        except Exception as e:
+            logger.warning(f"Failed to refresh periodic task flags: {e}")
+            return
+        
+        enabled_again = self._disabled - disabled
+        self._disabled = disabled
+        for name in enabled_again:
+            task = self._tasks.get(name)
+            if task is not None and self._enabled(task):
+                # Sem catch-up do período em que ficou desabilitada
+                task.next_run = task.get_next_run(now)
+                self._push(task)
+    
+    async def _sync_schedule_rows(self, now: datetime) -> None:
+        from sqlalchemy import select
+        from strider.admin.models import PeriodicTaskSchedule
+        
+        self._schedule_refresh(now)
+        db = await self._session()
+        async with db:
+            rows = {
+                row.task_name: row
+                for row in (await db.scalars(select(PeriodicTaskSchedule))).all()
+            }
+            self._disabled = {name for name, row in rows.items() if not row.is_enabled}
+            for name, task in self._tasks.items():
+                row = rows.get(name)
+                if row is None:
+                    task.next_run = task.get_next_run(now)
+                    db.add(PeriodicTaskSchedule(
+                        task_name=name,
+                        cron=task.cron,
+                        interval_seconds=task.interval,
+                        queue=task.queue,
+                        # is_enabled é só a flag do admin; task.enabled é a do código
+                        is_enabled=True,
+                        next_run=task.next_run,
+                    ))
+                    continue
+                # O próximo slot vem de quem liderou antes
+                task.run_count = row.run_count
+                task.last_run = _aware(row.last_run)
+                task.next_run = _aware(row.next_run) or task.get_next_run(now)
+                row.queue = task.queue
+                if (row.cron, row.interval_seconds) != (task.cron, task.interval):
+                    # Agenda mudou no código: o slot salvo era da agenda antiga
+                    row.cron, row.interval_seconds = task.cron, task.interval
+                    task.next_run = row.next_run = task.get_next_run(now)
+            await db.commit()
+    
+    async def _save_schedule(self, tasks: list[PeriodicTask]) -> None:
+        """Persist next runs of the tasks handled in this tick (one round-trip)."""
+        if not self._persist:
+            return
+        try:
+            from sqlalchemy import bindparam, update
+            from strider.admin.models import PeriodicTaskSchedule
+            
+            db = await self._session()
+            async with db:
+                await db.execute(
+                    update(PeriodicTaskSchedule.__table__)
+                    .where(PeriodicTaskSchedule.__table__.c.task_name == bindparam("_name"))
+                    .values(
+                        next_run=bindparam("_next_run"),
+                        last_run=bindparam("_last_run"),
+                        run_count=bindparam("_run_count"),
+                        last_status="SCHEDULED",
+                    ),
+                    [
+                        {
+                            "_name": task.name,
+                            "_next_run": task.next_run,
+                            "_last_run": task.last_run,
+                            "_run_count": task.run_count,
+                        }
+                        for task in tasks
+                    ],
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist schedule: {e}")
+    
+    async def _schedule_task(self, task: PeriodicTask, scheduled_for: datetime | None = None) -> bool:
+        """Schedule a periodic task for execution. Returns False if sending failed."""
         import uuid
         
         task_msg = TaskMessage(
@@ -168,25 +448,33 @@ class TaskScheduler:
         )
         
         try:
-            producer = await get_task_producer()
+            producer = self._producer or await get_task_producer()
             await producer.send(
                 f"tasks.{task_msg.queue}",
                 task_msg.to_dict(),
                 headers={
                     "event_id": task_msg.task_id,
                     "event_name": f"periodic.{task.name}",
+                    "scheduled_for": (scheduled_for or self._clock()).isoformat(),
                 },
             )
             
-            task.mark_run()
-            
             logger.info(
                 f"Scheduled periodic task: {task.name} "
-                f"(next run: {task.next_run})"
+                f"(slot: {scheduled_for}, next run: {task.next_run})"
             )
+            return True
             
         except Exception as e:
             logger.error(f"Failed to schedule task {task.name}: {e}")
+            return False
+
+
+def _aware(value: datetime | None) -> datetime | None:
+    """SQLite devolve datetimes naive (UTC); o scheduler compara com datetimes aware."""
+    if value is not None and timezone.is_naive(value):
+        return timezone.make_aware(value, "UTC")
+    return value
 
 
 class CombinedWorkerScheduler:
@@ -14,6 +14,7 @@ from typing import Any, Callable
 from strider.datetime import timezone
 from strider.tasks.base import TaskMessage, TaskResult, TaskStatus
 from strider.config import get_settings
+from strider.tasks.recorder import TaskLifecycleRecorder
 from strider.tasks.registry import get_task
 
 logger = logging.getLogger(__name__)
@@ -77,6 +78,8 @@ class TaskWorker:
         import uuid
         self._worker_id = str(uuid.uuid4())
         self._persist_enabled = getattr(self._settings, "ops_task_persist", True)
+        self._persist_sync = getattr(self._settings, "ops_task_persist_mode", "buffered") == "sync"
+        self._recorder: TaskLifecycleRecorder | None = None
         self._heartbeat_interval = getattr(self._settings, "ops_worker_heartbeat_interval", 30)
         self._offline_ttl_hours = getattr(self._settings, "ops_worker_offline_ttl", 24)
         self._heartbeat_task: asyncio.Task | None = None
@@ -216,6 +219,11 @@ class TaskWorker:
                     except asyncio.TimeoutError:
                         logger.warning("Forced cancellation timeout reached")
         
+        # Flush das transições ainda no buffer (write-behind)
+        if self._recorder is not None:
+            await self._recorder.close()
+            self._recorder = None
+        
         # Stop heartbeat
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
@@ -367,6 +375,8 @@ class TaskWorker:
         
         await self._persist_task_finish(
             task_id=task_msg.task_id,
+            task_name=task_msg.task_name,
+            queue=task_msg.queue,
             status=result.status.value.upper(),
             result_json=result_json,
             error=result.error,
@@ -399,28 +409,47 @@ class TaskWorker:
                 logger.warning("Models module '%s' not found", models_module)
                 self._registry = False
     
+    async def _get_recorder(self) -> TaskLifecycleRecorder:
+        """Recorder write-behind de TaskExecution (criado no primeiro uso)."""
+        if self._recorder is None:
+            settings = self._settings
+            self._recorder = TaskLifecycleRecorder(
+                session_factory=self._db_session_factory,
+                flush_interval=float(getattr(settings, "ops_task_persist_flush_interval", 1.0)),
+                batch_size=int(getattr(settings, "ops_task_persist_batch_size", 500)),
+                max_pending=int(getattr(settings, "ops_task_persist_max_pending", 10000)),
+            )
+            await self._recorder.start()
+        return self._recorder
+    
+    def _is_durable(self, task_name: str) -> bool:
+        """Transições gravadas na hora: modo 'sync' ou @task(durable=True)."""
+        if self._persist_sync:
+            return True
+        try:
+            return bool(getattr(get_task(task_name), "durable", False))
+        except KeyError:
+            return False
+    
     async def _persist_task_start(self, task_msg: TaskMessage) -> None:
-        """Persist task execution start to the database."""
+        """Record task execution start (buffered unless durable)."""
         if not self._persist_enabled:
             return
         try:
             import json as _json
-            from strider.models import get_session
-            from strider.admin.models import TaskExecution
             
-            db = await get_session()
-            async with db:
-                await TaskExecution.record_start(
-                    db,
-                    task_name=task_msg.task_name,
-                    task_id=task_msg.task_id,
-                    queue=task_msg.queue,
-                    args_json=_json.dumps(list(task_msg.args), default=str)[:5000] if task_msg.args else None,
-                    kwargs_json=_json.dumps(task_msg.kwargs, default=str)[:5000] if task_msg.kwargs else None,
-                    max_retries=task_msg.max_retries,
-                    worker_id=self._worker_id,
-                )
-                await db.commit()
+            recorder = await self._get_recorder()
+            await recorder.record_start(
+                durable=self._is_durable(task_msg.task_name),
+                task_name=task_msg.task_name,
+                task_id=task_msg.task_id,
+                queue=task_msg.queue,
+                args_json=_json.dumps(list(task_msg.args), default=str)[:5000] if task_msg.args else None,
+                kwargs_json=_json.dumps(task_msg.kwargs, default=str)[:5000] if task_msg.kwargs else None,
+                max_retries=task_msg.max_retries,
+                worker_id=self._worker_id,
+                started_at=timezone.now(),
+            )
         except Exception as e:
             logger.warning("Failed to persist task start: %s", e)
     
@@ -433,25 +462,26 @@ class TaskWorker:
         error: str | None = None,
         retries: int = 0,
         duration_ms: int | None = None,
+        task_name: str = "",
+        queue: str = "default",
     ) -> None:
-        """Persist task execution finish to the database."""
+        """Record task execution finish (buffered unless durable)."""
         if not self._persist_enabled:
             return
         try:
-            from strider.models import get_session
-            from strider.admin.models import TaskExecution
-            
-            db = await get_session()
-            async with db:
-                await TaskExecution.record_finish(
-                    db,
-                    task_id=task_id,
-                    status=status,
-                    result_json=result_json,
-                    error=error[:5000] if error else None,
-                    retries=retries,
-                    duration_ms=duration_ms,
-                )
+            recorder = await self._get_recorder()
+            await recorder.record_finish(
+                durable=self._is_durable(task_name),
+                task_id=task_id,
+                task_name=task_name,
+                queue=queue,
+                status=status,
+                result_json=result_json,
+                error=error[:5000] if error else None,
+                retries=retries,
+                duration_ms=duration_ms,
+                finished_at=timezone.now(),
+            )
         except Exception as e:
             logger.warning("Failed to persist task finish: %s", e)
     
@@ -25,7 +25,9 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from typing import Any, Callable
 from datetime import datetime, timedelta
@@ -124,6 +126,16 @@ class MockKafka:
         for msg in messages:
             await self.send(topic, msg)
     
+    async def send_batch_with_headers(
+        self,
+        topic: str,
+        records: list[tuple[dict[str, Any], str | None, dict[str, str] | None]],
+    ) -> int:
+        """Send (message, key, headers) records to a topic."""
+        for value, key, headers in records:
+            await self.send(topic, value, key=key, headers=headers)
+        return len(records)
+    
     def subscribe(self, topic: str, callback: Callable) -> None:
         """Subscribe to a topic."""
         if topic not in self._consumers:
@@ -228,6 +240,9 @@ class MockRedis:
     _hash_data: dict[str, dict[str, Any]] = field(default_factory=dict)
     _list_data: dict[str, list[Any]] = field(default_factory=dict)
     _set_data: dict[str, set[Any]] = field(default_factory=dict)
+    _pubsubs: list["MockPubSub"] = field(default_factory=list)
+    _streams: dict[str, list[tuple[str, dict[str, Any]]]] = field(default_factory=dict)
+    _stream_groups: dict[tuple[str, str], "MockStreamGroup"] = field(default_factory=dict)
     
     async def get(self, key: str) -> Any | None:
         """Get value by key."""
@@ -254,6 +269,7 @@ class MockRedis:
             nx: Only set if key doesn't exist
             xx: Only set if key exists
         """
+        self._check_expiry(key)
         if nx and key in self.data:
             return False
         if xx and key not in self.data:
@@ -268,6 +284,10 @@ class MockRedis:
         
         return True
     
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        """Get multiple values (None for missing keys)."""
+        return [await self.get(key) for key in keys]
+    
     async def setex(self, key: str, seconds: int, value: Any) -> bool:
         """Set value with expiration in seconds."""
         return await self.set(key, value, ex=seconds)
@@ -393,6 +413,200 @@ class MockRedis:
         """Check if value is in set."""
         return value in self._set_data.get(name, set())
     
+    # Streams
+    async def xadd(
+        self,
+        name: str,
+        fields: dict[str, Any],
+        id: str = "*",
+        maxlen: int | None = None,
+        approximate: bool = True,
+    ) -> str:
+        """Append an entry. Returns its ID (``ms-seq``)."""
+        entries = self._streams.setdefault(name, [])
+        if id == "*":
+            ms = int(time.time() * 1000)
+            last = _stream_id(entries[-1][0]) if entries else (0, -1)
+            seq = last[1] + 1 if last[0] >= ms else 0
+            id = f"{max(ms, last[0])}-{seq}"
+        entries.append((id, dict(fields)))
+        if maxlen is not None and len(entries) > maxlen:
+            del entries[: len(entries) - maxlen]
+        return id
+    
+    async def xlen(self, name: str) -> int:
+        """Number of entries in the stream."""
+        return len(self._streams.get(name, []))
+    
+    async def xrange(self, name: str, min: str = "-", max: str = "+", count: int | None = None) -> list:
+        """Entries between *min* and *max* (inclusive)."""
+        entries = [e for e in self._streams.get(name, []) if _in_range(e[0], min, max)]
+        return entries[:count] if count else entries
+    
+    async def xgroup_create(self, name: str, groupname: str, id: str = "$", mkstream: bool = False) -> bool:
+        """Create a consumer group (raises ``BUSYGROUP`` if it exists)."""
+        if name not in self._streams:
+            if not mkstream:
+                raise Exception("ERR The XGROUP subcommand requires the key to exist")
+            self._streams[name] = []
+        if (name, groupname) in self._stream_groups:
+            raise Exception("BUSYGROUP Consumer Group name already exists")
+        entries = self._streams[name]
+        last = (entries[-1][0] if entries else "0-0") if id == "$" else id
+        self._stream_groups[(name, groupname)] = MockStreamGroup(last_delivered=last)
+        return True
+    
+    async def xreadgroup(
+        self,
+        groupname: str,
+        consumername: str,
+        streams: dict[str, str],
+        count: int | None = None,
+        block: int | None = None,
+        noack: bool = False,
+    ) -> list:
+        """Read new entries (``>``) or this consumer's pending entries (any other ID)."""
+        result = []
+        for name, start in streams.items():
+            group = self._stream_groups[(name, groupname)]
+            group.touch(consumername)
+            if start == ">":
+                entries = [
+                    e for e in self._streams.get(name, [])
+                    if _stream_id(e[0]) > _stream_id(group.last_delivered)
+                ][:count]
+                for entry_id, _ in entries:
+                    group.last_delivered = entry_id
+                    if not noack:
+                        group.deliver(entry_id, consumername)
+            else:
+                pending = [
+                    entry_id for entry_id, (owner, _, _) in sorted(group.pel.items(), key=lambda i: _stream_id(i[0]))
+                    if owner == consumername and _stream_id(entry_id) > _stream_id(start)
+                ][:count]
+                stored = dict(self._streams.get(name, []))
+                entries = [(entry_id, stored.get(entry_id)) for entry_id in pending]
+            if entries:
+                result.append([name, entries])
+        if not result and block:
+            await asyncio.sleep(min(block / 1000, 0.01))
+        return result
+    
+    async def xack(self, name: str, groupname: str, *ids: str) -> int:
+        """Remove entries from the group's pending list."""
+        group = self._stream_groups.get((name, groupname))
+        if group is None:
+            return 0
+        return sum(1 for entry_id in ids if group.pel.pop(entry_id, None) is not None)
+    
+    async def xautoclaim(
+        self,
+        name: str,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str = "0-0",
+        count: int | None = None,
+        justid: bool = False,
+    ) -> list:
+        """Claim pending entries idle for at least *min_idle_time* ms (Redis 7 reply)."""
+        group = self._stream_groups[(name, groupname)]
+        group.touch(consumername)
+        stored = dict(self._streams.get(name, []))
+        now = _now_ms()
+        candidates = sorted(
+            (entry_id for entry_id in group.pel if _stream_id(entry_id) >= _stream_id(start_id)),
+            key=_stream_id,
+        )
+        limit = count or 100
+        claimed, deleted, next_id = [], [], "0-0"
+        for index, entry_id in enumerate(candidates):
+            if len(claimed) + len(deleted) >= limit:
+                next_id = candidates[index]
+                break
+            _, delivered_at, deliveries = group.pel[entry_id]
+            if now - delivered_at < min_idle_time:
+                continue
+            if entry_id not in stored:
+                del group.pel[entry_id]
+                deleted.append(entry_id)
+                continue
+            group.pel[entry_id] = (consumername, now, deliveries + (0 if justid else 1))
+            claimed.append(entry_id if justid else (entry_id, stored[entry_id]))
+        return [next_id, claimed, deleted]
+    
+    async def xpending_range(
+        self,
+        name: str,
+        groupname: str,
+        min: str,
+        max: str,
+        count: int,
+        consumername: str | None = None,
+        idle: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Pending entries with owner, idle time and delivery count."""
+        group = self._stream_groups[(name, groupname)]
+        now = _now_ms()
+        rows = []
+        for entry_id in sorted(group.pel, key=_stream_id):
+            owner, delivered_at, deliveries = group.pel[entry_id]
+            if not _in_range(entry_id, min, max):
+                continue
+            if consumername is not None and owner != consumername:
+                continue
+            if idle is not None and now - delivered_at < idle:
+                continue
+            rows.append({
+                "message_id": entry_id,
+                "consumer": owner,
+                "time_since_delivered": now - delivered_at,
+                "times_delivered": deliveries,
+            })
+        return rows[:count]
+    
+    async def xinfo_consumers(self, name: str, groupname: str) -> list[dict[str, Any]]:
+        """Consumers of a group with pending count and idle time (ms)."""
+        group = self._stream_groups[(name, groupname)]
+        now = _now_ms()
+        return [
+            {
+                "name": consumer,
+                "pending": sum(1 for owner, _, _ in group.pel.values() if owner == consumer),
+                "idle": now - seen,
+            }
+            for consumer, seen in group.consumers.items()
+        ]
+    
+    async def xgroup_delconsumer(self, name: str, groupname: str, consumername: str) -> int:
+        """Delete a consumer; its pending entries are dropped. Returns how many."""
+        group = self._stream_groups[(name, groupname)]
+        group.consumers.pop(consumername, None)
+        owned = [entry_id for entry_id, (owner, _, _) in group.pel.items() if owner == consumername]
+        for entry_id in owned:
+            del group.pel[entry_id]
+        return len(owned)
+    
+    def pipeline(self, transaction: bool = True) -> "MockPipeline":
+        """Queue commands and run them on ``execute()``."""
+        return MockPipeline(self)
+    
+    # Pub/Sub
+    async def publish(self, channel: str, message: Any) -> int:
+        """Publish to every subscribed pubsub. Returns receiver count."""
+        receivers = [ps for ps in self._pubsubs if channel in ps.channels]
+        for pubsub in receivers:
+            pubsub.messages.put_nowait(
+                {"type": "message", "channel": channel.encode(), "data": message}
+            )
+        return len(receivers)
+    
+    def pubsub(self) -> "MockPubSub":
+        """Create a pubsub connection bound to this mock."""
+        pubsub = MockPubSub(self)
+        self._pubsubs.append(pubsub)
+        return pubsub
+    
     def _check_expiry(self, key: str) -> None:
         """Check and remove expired key."""
         if key in self._expiry and datetime.now() > self._expiry[key]:
@@ -406,9 +620,103 @@ class MockRedis:
         self._hash_data.clear()
         self._list_data.clear()
         self._set_data.clear()
+        self._streams.clear()
+        self._stream_groups.clear()
         logger.debug("MockRedis: cleared all data")
 
 
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _stream_id(entry_id: str) -> tuple[int, int]:
+    ms, _, seq = str(entry_id).partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _in_range(entry_id: str, min: str, max: str) -> bool:
+    key = _stream_id(entry_id)
+    return (min == "-" or key >= _stream_id(min)) and (max == "+" or key <= _stream_id(max))
+
+
+@dataclass
+class MockStreamGroup:
+    """Consumer group state: last delivered ID, pending entries and consumers."""
+    
+    last_delivered: str = "0-0"
+    # entry_id -> (consumer, delivered_at_ms, times_delivered)
+    pel: dict[str, tuple[str, int, int]] = field(default_factory=dict)
+    # consumer -> last_seen_ms
+    consumers: dict[str, int] = field(default_factory=dict)
+    
+    def touch(self, consumer: str) -> None:
+        self.consumers[consumer] = _now_ms()
+    
+    def deliver(self, entry_id: str, consumer: str) -> None:
+        _, _, deliveries = self.pel.get(entry_id, ("", 0, 0))
+        self.pel[entry_id] = (consumer, _now_ms(), deliveries + 1)
+
+
+class MockPipeline:
+    """Pipeline returned by ``MockRedis.pipeline()``: commands run in order on ``execute()``."""
+    
+    def __init__(self, redis: MockRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple, dict]] = []
+        self.executions = 0
+    
+    def __getattr__(self, name: str) -> Callable[..., "MockPipeline"]:
+        if not hasattr(self.redis, name):
+            raise AttributeError(name)
+        
+        def queue(*args: Any, **kwargs: Any) -> "MockPipeline":
+            self.commands.append((name, args, kwargs))
+            return self
+        
+        return queue
+    
+    async def execute(self) -> list[Any]:
+        commands, self.commands = self.commands, []
+        self.executions += 1
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in commands]
+    
+    async def __aenter__(self) -> "MockPipeline":
+        return self
+    
+    async def __aexit__(self, *exc: Any) -> None:
+        self.commands.clear()
+
+
+class MockPubSub:
+    """In-memory pubsub connection returned by ``MockRedis.pubsub()``."""
+    
+    def __init__(self, redis: MockRedis) -> None:
+        self.redis = redis
+        self.channels: set[str] = set()
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+    
+    async def unsubscribe(self, *channels: str) -> None:
+        self.channels.difference_update(channels)
+    
+    async def get_message(
+        self,
+        ignore_subscribe_messages: bool = False,
+        timeout: float | None = 0.0,
+    ) -> dict[str, Any] | None:
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout or 0.001)
+        except asyncio.TimeoutError:
+            return None
+    
+    async def aclose(self) -> None:
+        self.channels.clear()
+        if self in self.redis._pubsubs:
+            self.redis._pubsubs.remove(self)
+
+
 # =============================================================================
 # HTTP Mocks
 # =============================================================================
@@ -11,11 +11,16 @@ Usage:
 
 from __future__ import annotations
 
+from datetime import datetime, timezone as dt_timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from typing import Any, ClassVar, Generic, TypeVar, get_type_hints
 from collections.abc import Sequence, Callable, Awaitable
+import hashlib
+import json
 
 from fastapi import APIRouter, Request, HTTPException, status, Depends
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import inspect
 
@@ -62,6 +67,48 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
 _pending_viewsets: set[type] = set()
 
 
+# =============================================================================
+# Conditional GET (ETag / Last-Modified)
+# =============================================================================
+
+def make_etag(*parts: Any) -> str:
+    """ETag fraco a partir de partes arbitrárias (hash estável)."""
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt_timezone.utc)
+    return value.astimezone(dt_timezone.utc)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """
+    Avalia If-None-Match / If-Modified-Since (RFC 9110).
+    
+    If-None-Match tem precedência; comparação fraca de ETags.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tag = etag.removeprefix("W/")
+        return any(
+            candidate.strip().removeprefix("W/") == tag
+            for candidate in if_none_match.split(",")
+        )
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+    return False
+
+
 def validate_pending_viewsets(*, strict: bool | None = None) -> list[str]:
     """
     Validate all pending viewsets.
@@ -356,6 +403,30 @@ class ViewSet(Generic[ModelT, InputT, OutputT]):
     # Campos cujo valor é struct/JSON: em PUT e PATCH faz merge profundo com o atual (evita perda de dados)
     struct_merge_fields: ClassVar[list[str]] = []
     
+    # Load profile por action: nome em Model.__load_profiles__ ou LoadProfile
+    # Ex: {"list": "summary", "retrieve": LoadProfile(joined=["author"])}
+    load_profiles: ClassVar[dict[str, Any]] = {}
+    
+    # Cache de respostas por action (TTL em segundos): {"list": 60, "retrieve": 300}
+    # Invalidado automaticamente por Model.save()/delete() do model da ViewSet
+    cache_actions: ClassVar[dict[str, float]] = {}
+    # Se False, a mesma resposta é servida a todos os usuários (só dados públicos)
+    cache_vary_on_user: ClassVar[bool] = True
+    
+    # Conditional GET em list/retrieve: ETag/Last-Modified e 304 quando o cliente já tem a versão
+    conditional_get: ClassVar[bool] = True
+    # Coluna validadora (datetime ou versão inteira). None: usa "updated_at" se existir;
+    # sem coluna (ou com ""), o ETag é o hash do corpo serializado
+    etag_field: ClassVar[str | None] = None
+    
+    # Sparse fieldsets: ?fields=a,b / ?exclude=c em list/retrieve, com projeção no SELECT
+    sparse_fieldsets: ClassVar[bool] = True
+    
+    # Rota GET /<prefix>/batch?ids=1,2,3 (opt-in): vários objetos em uma query IN,
+    # com as permissões e o escopo (get_queryset) do retrieve
+    batch_retrieve: ClassVar[bool] = False
+    batch_max_ids: ClassVar[int] = 100
+    
     # Schema/Model Validation
     # Se True, valida schemas contra model no startup (falha em DEBUG)
     strict_validation: ClassVar[bool] = True
@@ -416,6 +487,11 @@ class ViewSet(Generic[ModelT, InputT, OutputT]):
         self.action: str | None = None
         self.request: Request | None = None
         self.kwargs: dict[str, Any] = {}
+        # Headers extras aplicados pela rota à resposta (ETag, Last-Modified)
+        self.response_headers: dict[str, str] = {}
+        # Campos pedidos via ?fields=/?exclude= e colunas projetadas no SELECT
+        self.sparse_fields: frozenset[str] | None = None
+        self._sparse_columns: list[str] | None = None
     
     def get_permissions(self, action: str) -> list[Permission]:
         """Retorna instâncias de permissões para a action."""
@@ -441,6 +517,7 @@ class ViewSet(Generic[ModelT, InputT, OutputT]):
     
     async def check_permissions(self, request: Request, action: str) -> None:
         """Verifica permissões antes de executar a action."""
+        self.action = action
         permissions = self.get_permissions(action)
         await check_permissions(permissions, request, self)
     
@@ -463,6 +540,197 @@ class ViewSet(Generic[ModelT, InputT, OutputT]):
         from strider.querysets import QuerySet
         return QuerySet(self.model, db)
     
+    def apply_load_profile(self, queryset: Any) -> Any:
+        """Aplica o load profile configurado para a action atual."""
+        profile = self.load_profiles.get(self.action) if self.action else None
+        if profile is None or not hasattr(queryset, "load_profile"):
+            return queryset
+        return queryset.load_profile(profile)
+    
+    async def cache_action(
+        self,
+        request: Request,
+        action: str,
+        build: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Executa ``build`` passando pelo cache quando a action está em
+        ``cache_actions``. Permissões da action já devem ter sido checadas.
+        """
+        ttl = self.cache_actions.get(action)
+        if ttl is None or request.method not in ("GET", "HEAD"):
+            return await build()
+        
+        from strider.cache import get_cache, view_cache_key
+        
+        key = await view_cache_key(
+            f"{type(self).__module__}.{type(self).__qualname__}.{action}",
+            request,
+            [self.model],
+            vary_on_user=self.cache_vary_on_user,
+        )
+        return await get_cache().get_or_set(key, build, ttl=ttl)
+    
+    def select_sparse_fields(self, request: Request, action: str) -> frozenset[str] | None:
+        """
+        Lê ``?fields=``/``?exclude=``, valida contra o output schema e
+        prepara a projeção de colunas da query.
+        
+        Raises:
+            HTTPException 422: Campo inexistente ou seleção vazia
+        """
+        self.sparse_fields = self._sparse_columns = None
+        params = request.query_params
+        raw_fields, raw_exclude = params.get("fields"), params.get("exclude")
+        if not self.sparse_fieldsets or not (raw_fields or raw_exclude):
+            return None
+        
+        schema = self.get_output_schema()
+        available = schema.list_field_names() if action == "list" else set(schema.model_fields)
+        
+        def parse(raw: str | None) -> set[str]:
+            return {name.strip() for name in (raw or "").split(",") if name.strip()}
+        
+        selected = parse(raw_fields) or set(available)
+        excluded = parse(raw_exclude)
+        for param, names in (("fields", selected), ("exclude", excluded)):
+            unknown = names - available
+            if unknown:
+                self._raise_invalid_fields(param, sorted(unknown), sorted(available))
+        selected -= excluded
+        if not selected:
+            self._raise_invalid_fields("fields", [], sorted(available))
+        
+        self.sparse_fields = frozenset(selected)
+        self._sparse_columns = self._sparse_projection(self.sparse_fields, action)
+        return self.sparse_fields
+    
+    def _raise_invalid_fields(self, param: str, unknown: list[str], available: list[str]) -> None:
+        message = f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields selected"
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "validation_error",
+                "message": message,
+                "errors": [
+                    {
+                        "loc": ["query", param],
+                        "msg": message,
+                        "type": "invalid_fields",
+                        "input": unknown,
+                    }
+                ],
+                "field": param,
+                "available": available,
+            },
+        )
+    
+    def _sparse_projection(self, fields: frozenset[str], action: str) -> list[str] | None:
+        """
+        Colunas a carregar para os campos pedidos; None carrega todas.
+        
+        Não projeta quando algum campo é calculado (pode ler qualquer
+        coluna) ou, no retrieve, quando há permissão por objeto.
+        """
+        mapper = getattr(self.model, "__mapper__", None)
+        if mapper is None:
+            return None
+        if action == "retrieve" and any(
+            type(perm).has_object_permission is not Permission.has_object_permission
+            for perm in self.get_permissions(action)
+        ):
+            return None
+        
+        columns: list[str] = []
+        for name in fields:
+            if name in mapper.column_attrs:
+                columns.append(name)
+            elif name in mapper.relationships:
+                # FKs locais: o carregamento do relacionamento depende delas
+                for column in mapper.relationships[name].local_columns:
+                    columns.append(mapper.get_property_by_column(column).key)
+            else:
+                return None
+        
+        etag_field = self.get_etag_field()
+        if etag_field in mapper.column_attrs:
+            columns.append(etag_field)
+        return sorted(set(columns))
+    
+    def apply_sparse_fields(self, queryset: Any) -> Any:
+        """Restringe as colunas carregadas aos campos pedidos (load_only)."""
+        if not self._sparse_columns or not hasattr(queryset, "only"):
+            return queryset
+        return queryset.only(*self._sparse_columns)
+    
+    async def prefetch_related_fields(self, objects: Sequence[Any]) -> None:
+        """Carrega em lote os relacionamentos aninhados no output schema."""
+        output_schema = self.get_output_schema()
+        if self.sparse_fields is not None:
+            output_schema = output_schema.subset(self.sparse_fields)
+        await output_schema.prefetch(objects)
+    
+    def serialize(self, obj: Any, action: str) -> dict[str, Any]:
+        """Serializa um objeto para a action, respeitando sparse fieldsets."""
+        output_schema = self.get_output_schema()
+        if self.sparse_fields is not None:
+            subset = output_schema.subset(self.sparse_fields)
+            return subset.model_validate(obj).model_dump(include=self.sparse_fields)
+        if action == "list":
+            return output_schema.dump_for_list(obj)
+        return output_schema.model_validate(obj).model_dump()
+    
+    def sparse_response(self, result: Any) -> Any:
+        """
+        Respostas com sparse fieldsets não batem com o response_model da
+        rota: são devolvidas já codificadas.
+        """
+        if self.sparse_fields is None or isinstance(result, Response):
+            return result
+        return JSONResponse(jsonable_encoder(result), headers=self.response_headers)
+    
+    def get_etag_field(self) -> str | None:
+        """Coluna usada como validador barato de conditional GET."""
+        if not self.conditional_get:
+            return None
+        if self.etag_field is not None:
+            return self.etag_field or None
+        table = getattr(getattr(self, "model", None), "__table__", None)
+        if table is not None and "updated_at" in table.c:
+            return "updated_at"
+        return None
+    
+    def not_modified(
+        self,
+        request: Request,
+        etag: str,
+        last_modified: datetime | None = None,
+    ) -> Response | None:
+        """
+        Registra ETag/Last-Modified nos headers da resposta e retorna um
+        304 se o cliente já tem essa versão (None caso contrário).
+        """
+        self.response_headers["ETag"] = etag
+        if last_modified is not None:
+            self.response_headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+        if is_not_modified(request, etag, last_modified):
+            return Response(status_code=304, headers=dict(self.response_headers))
+        return None
+    
+    def conditional_body(self, request: Request, body: Any) -> Any:
+        """Conditional GET com ETag derivado do corpo serializado."""
+        if not self.conditional_get:
+            return body
+        etag = make_etag(json.dumps(body, sort_keys=True, default=str))
+        return self.not_modified(request, etag) or body
+    
+    def _validator_etag(self, request: Request, action: str, value: Any) -> str:
+        schema = self.get_output_schema()
+        return make_etag(
+            type(self).__qualname__, action, ",".join(schema.model_fields),
+            request.url.path, request.url.query, value,
+        )
+    
     async def get_object(self, db: AsyncSession, **kwargs: Any) -> ModelT:
         """
         Retorna um objeto específico.
@@ -483,9 +751,8 @@ class ViewSet(Generic[ModelT, InputT, OutputT]):
         lookup_value = self._convert_lookup_value(lookup_value)
         
         try:
-            obj = await self.get_queryset(db).filter(
-                **{self.lookup_field: lookup_value}
-            ).get()
+            queryset = self.apply_sparse_fields(self.apply_load_profile(self.get_queryset(db)))
+            obj = await queryset.filter(**{self.lookup_field: lookup_value}).get()
             return obj
         except DoesNotExist:
             raise HTTPException(
@@ -805,42 +1072,155 @@ class ViewSet(Generic[ModelT, InputT, OutputT]):
         page: int = 1,
         page_size: int | None = None,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | Response:
         """Lista todos os objetos com paginação."""
         await self.check_permissions(request, "list")
+        self.select_sparse_fields(request, "list")
         
         page_size = min(page_size or self.page_size, self.max_page_size)
         offset = (page - 1) * page_size
+        queryset = self.apply_sparse_fields(self.apply_load_profile(self.get_queryset(db)))
+        
+        async def build(total: int | None = None) -> dict[str, Any]:
+            if total is None:
+                total = await queryset.count()
+            objects = await queryset.offset(offset).limit(page_size).all()
+            await self.prefetch_related_fields(objects)
+            items = [self.serialize(obj, "list") for obj in objects]
+            
+            return {
+                "items": items,
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "pages": (total + page_size - 1) // page_size if page_size > 0 else 0,
+            }
         
-        queryset = self.get_queryset(db)
-        total = await queryset.count()
-        objects = await queryset.offset(offset).limit(page_size).all()
+        return self.sparse_response(await self.conditional_list(request, queryset, build))
+    
+    async def conditional_list(
+        self,
+        request: Request,
+        queryset: Any,
+        build: Callable[..., Awaitable[dict[str, Any]]],
+    ) -> Any:
+        """
+        Executa ``build`` com conditional GET.
         
-        output_schema = self.get_output_schema()
-        items = [output_schema.dump_for_list(obj) for obj in objects]
+        Com coluna validadora, ``COUNT(*)`` e ``MAX(coluna)`` saem numa só
+        query (que substitui o count da paginação) e o 304 é decidido antes
+        de buscar e serializar a página. Sem ela, o ETag é o hash do corpo.
+        """
+        field = self.get_etag_field()
+        if field and "list" not in self.cache_actions and hasattr(queryset, "aggregate"):
+            from strider.querysets import Count, Max
+            
+            stats = await queryset.aggregate(total=Count(), latest=Max(field))
+            latest = stats["latest"]
+            etag = self._validator_etag(request, "list", f"{stats['total']}:{latest}")
+            last_modified = latest if isinstance(latest, datetime) else None
+            return self.not_modified(request, etag, last_modified) or await build(stats["total"] or 0)
         
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "pages": (total + page_size - 1) // page_size if page_size > 0 else 0,
-        }
+        body = await self.cache_action(request, "list", build)
+        return self.conditional_body(request, body)
     
     async def retrieve(
         self,
         request: Request,
         db: AsyncSession,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | Response:
         """Retorna um objeto específico."""
         await self.check_permissions(request, "retrieve")
+        self.select_sparse_fields(request, "retrieve")
+        
+        async def build(obj: Any = None) -> dict[str, Any]:
+            if obj is None:
+                obj = await self.get_object(db, **kwargs)
+                await self.check_object_permissions(request, obj, "retrieve")
+            await self.prefetch_related_fields([obj])
+            return self.serialize(obj, "retrieve")
+        
+        field = self.get_etag_field()
+        if field and "retrieve" not in self.cache_actions:
+            obj = await self.get_object(db, **kwargs)
+            await self.check_object_permissions(request, obj, "retrieve")
+            value = getattr(obj, field, None)
+            if value is not None:
+                etag = self._validator_etag(request, "retrieve", value)
+                last_modified = value if isinstance(value, datetime) else None
+                result = self.not_modified(request, etag, last_modified) or await build(obj)
+            else:
+                result = self.conditional_body(request, await build(obj))
+        else:
+            result = self.conditional_body(request, await self.cache_action(request, "retrieve", build))
+        return self.sparse_response(result)
+    
+    async def batch(
+        self,
+        request: Request,
+        db: AsyncSession,
+        ids: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any] | Response:
+        """
+        Retorna os objetos de ``?ids=1,2,3`` (pelo ``lookup_field``).
+        
+        Usa as permissões do retrieve; objetos fora do queryset ou sem
+        permissão de objeto aparecem em ``missing``.
+        
+        Raises:
+            HTTPException 422: ids ausentes, inválidos ou acima de ``batch_max_ids``
+        """
+        await self.check_permissions(request, "retrieve")
+        self.select_sparse_fields(request, "retrieve")
+        
+        if ids is None:
+            ids = request.query_params.get("ids")
+        raw_ids = list(dict.fromkeys(part.strip() for part in (ids or "").split(",") if part.strip()))
+        if not raw_ids or len(raw_ids) > self.batch_max_ids:
+            message = (
+                "No ids provided" if not raw_ids
+                else f"Maximum {self.batch_max_ids} ids allowed"
+            )
+            raise HTTPException(
+                status_code=422,
+                detail={
+                    "error": "validation_error",
+                    "message": message,
+                    "errors": [
+                        {"loc": ["query", "ids"], "msg": message, "type": "invalid_ids", "input": ids},
+                    ],
+                    "field": "ids",
+                },
+            )
+        values = {raw: self._convert_lookup_value(raw) for raw in raw_ids}
         
-        obj = await self.get_object(db, **kwargs)
-        await self.check_object_permissions(request, obj, "retrieve")
+        async def build() -> dict[str, Any]:
+            queryset = self.apply_sparse_fields(self.apply_load_profile(self.get_queryset(db)))
+            found = await queryset.in_bulk(values.values(), field_name=self.lookup_field)
+            
+            objects: list[Any] = []
+            missing: list[Any] = []
+            for value in values.values():
+                obj = found.get(value)
+                if obj is not None:
+                    try:
+                        await self.check_object_permissions(request, obj, "retrieve")
+                    except HTTPException:
+                        obj = None
+                if obj is None:
+                    missing.append(value)
+                else:
+                    objects.append(obj)
+            
+            await self.prefetch_related_fields(objects)
+            return {
+                "items": [self.serialize(obj, "retrieve") for obj in objects],
+                "missing": missing,
+            }
         
-        output_schema = self.get_output_schema()
-        return output_schema.model_validate(obj).model_dump()
+        return self.sparse_response(await self.cache_action(request, "batch", build))
     
     async def create(
         self,
@@ -1228,14 +1608,15 @@ class SearchModelViewSet(ModelViewSet[ModelT, InputT, OutputT]):
         page: int = 1,
         page_size: int | None = None,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> dict[str, Any] | Response:
         """Lista com busca, filtros e ordenação."""
         await self.check_permissions(request, "list")
+        self.select_sparse_fields(request, "list")
         
         page_size = min(page_size or self.page_size, self.max_page_size)
         offset = (page - 1) * page_size
         
-        queryset = self.get_queryset(db)
+        queryset = self.apply_sparse_fields(self.apply_load_profile(self.get_queryset(db)))
         
         # Aplicar busca textual
         search_query = request.query_params.get(self.search_param)
@@ -1249,19 +1630,22 @@ class SearchModelViewSet(ModelViewSet[ModelT, InputT, OutputT]):
         ordering = request.query_params.get("ordering")
         queryset = self._apply_ordering(queryset, ordering)
         
-        total = await queryset.count()
-        objects = await queryset.offset(offset).limit(page_size).all()
-        
-        output_schema = self.get_output_schema()
-        items = [output_schema.dump_for_list(obj) for obj in objects]
+        async def build(total: int | None = None) -> dict[str, Any]:
+            if total is None:
+                total = await queryset.count()
+            objects = await queryset.offset(offset).limit(page_size).all()
+            await self.prefetch_related_fields(objects)
+            items = [self.serialize(obj, "list") for obj in objects]
+            
+            return {
+                "items": items,
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "pages": (total + page_size - 1) // page_size if page_size > 0 else 0,
+            }
         
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "pages": (total + page_size - 1) // page_size if page_size > 0 else 0,
-        }
+        return self.sparse_response(await self.conditional_list(request, queryset, build))
     
     def _apply_search(self, queryset: Any, search_query: str) -> Any:
         """Aplica busca textual nos campos configurados."""
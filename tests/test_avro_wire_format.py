@@ -0,0 +1,170 @@
+"""
+Testes da serialização Avro: cache de schemas parseados, resolução
+writer/reader e wire format Confluent (magic byte + schema id) com registros
+em memória e em arquivo.
+"""
+
+import json
+import struct
+
+import pytest
+
+from strider.messaging import avro
+from strider.messaging.avro import (
+    AvroModel,
+    FileSchemaRegistry,
+    InMemorySchemaRegistry,
+    decode_envelope,
+    encode_envelope,
+    get_schema_registry,
+    schema_fingerprint,
+    set_schema_registry,
+)
+
+
+class OrderPlaced(AvroModel):
+    __avro_namespace__ = "com.shop"
+
+    order_id: int
+    total: float
+    note: str | None = None
+
+
+SCHEMA = OrderPlaced.__avro_schema__()
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    avro.clear_schema_cache()
+    yield
+    avro.clear_schema_cache()
+    avro._schema_registry, avro._schema_registry_set = None, False
+
+
+class TestSchema:
+    def test_pep604_optional_is_nullable_union(self):
+        class Shipment(AvroModel):
+            carrier: str | None = None
+            weight: float | int
+
+        fields = {f["name"]: f for f in Shipment.__avro_schema__()["fields"]}
+
+        assert fields["carrier"] == {"name": "carrier", "type": ["null", "string"], "default": None}
+        assert fields["weight"]["type"] == ["double", "long"]
+
+
+class TestFingerprint:
+    def test_key_order_does_not_matter(self):
+        reordered = dict(reversed(list(SCHEMA.items())))
+
+        assert schema_fingerprint(reordered) == schema_fingerprint(SCHEMA)
+        assert schema_fingerprint(json.dumps(SCHEMA)) == schema_fingerprint(SCHEMA)
+
+    def test_defaults_change_fingerprint(self):
+        changed = json.loads(json.dumps(SCHEMA))
+        changed["fields"][2]["default"] = "x"
+
+        assert schema_fingerprint(changed) != schema_fingerprint(SCHEMA)
+
+
+class TestEnvelope:
+    def test_roundtrip(self):
+        data = encode_envelope(42, b"\x02\x04")
+
+        assert data[:5] == struct.pack(">bI", 0, 42)
+        schema_id, payload = decode_envelope(data)
+        assert (schema_id, bytes(payload)) == (42, b"\x02\x04")
+
+    @pytest.mark.parametrize("data", [b"\x00\x00", b"\x01\x00\x00\x00\x01\x02"])
+    def test_rejects_malformed(self, data):
+        with pytest.raises(ValueError):
+            decode_envelope(data)
+
+
+class TestRegistries:
+    def test_memory_ids_are_stable_and_shared_across_subjects(self):
+        registry = InMemorySchemaRegistry()
+        other = {"type": "record", "name": "Other", "fields": []}
+
+        first = registry.register("orders-value", SCHEMA)
+
+        assert registry.register("orders-value", dict(SCHEMA)) == first
+        assert registry.register("audit-value", SCHEMA) == first
+        assert registry.register("orders-value", other) == first + 1
+        assert registry.subjects == {"orders-value": [1, 2], "audit-value": [1]}
+        assert registry.get_schema(first) is SCHEMA
+
+    def test_unknown_id(self):
+        with pytest.raises(KeyError):
+            InMemorySchemaRegistry().get_schema(99)
+
+    def test_file_registry_survives_restart(self, tmp_path):
+        path = tmp_path / "schemas.json"
+        schema_id = FileSchemaRegistry(path).register("com.shop.OrderPlaced", SCHEMA)
+
+        reopened = FileSchemaRegistry(path)
+
+        assert reopened.get_schema(schema_id) == SCHEMA
+        assert reopened.register("com.shop.OrderPlaced", SCHEMA) == schema_id
+        assert json.loads(path.read_text())["subjects"] == {"com.shop.OrderPlaced": [schema_id]}
+
+    def test_default_registry_from_settings(self, tmp_path, monkeypatch):
+        from strider import config
+
+        settings = config.Settings(avro_schema_registry="file", avro_schema_registry_path=str(tmp_path / "s.json"))
+        monkeypatch.setattr(config, "is_configured", lambda: True)
+        monkeypatch.setattr(config, "get_settings", lambda: settings)
+
+        registry = get_schema_registry()
+
+        assert isinstance(registry, FileSchemaRegistry)
+        assert registry.path == tmp_path / "s.json"
+        assert get_schema_registry() is registry
+
+    def test_explicit_registry_overrides_settings(self):
+        registry = InMemorySchemaRegistry()
+        set_schema_registry(registry)
+
+        assert get_schema_registry() is registry
+
+
+class TestSerialization:
+    @pytest.fixture(autouse=True)
+    def fastavro(self):
+        return pytest.importorskip("fastavro")
+
+    def test_schema_is_parsed_once(self, fastavro, monkeypatch):
+        calls = []
+        parse = fastavro.parse_schema
+        monkeypatch.setattr(fastavro, "parse_schema", lambda schema: calls.append(1) or parse(schema))
+        event = OrderPlaced(order_id=1, total=9.5)
+
+        for _ in range(3):
+            assert OrderPlaced.from_avro(event.to_avro()) == event
+
+        assert len(calls) == 1
+
+    def test_wire_format_roundtrip(self):
+        registry = InMemorySchemaRegistry()
+        event = OrderPlaced(order_id=7, total=1.25, note="gift")
+
+        data = event.to_avro(registry=registry)
+
+        assert data[0] == 0
+        assert decode_envelope(data)[0] == registry.register("com.shop.OrderPlaced", SCHEMA)
+        assert OrderPlaced.from_avro(data, registry=registry) == event
+
+    def test_reader_resolves_older_writer(self):
+        class OrderPlacedV1(AvroModel):
+            __avro_namespace__ = "com.shop"
+
+            order_id: int
+            total: float
+
+        OrderPlacedV1.__avro_schema__()["name"] = "OrderPlaced"
+        registry = InMemorySchemaRegistry()
+        old = OrderPlacedV1(order_id=3, total=2.0).to_avro(registry=registry, subject="orders")
+
+        event = OrderPlaced.from_avro(old, registry=registry)
+
+        assert event == OrderPlaced(order_id=3, total=2.0, note=None)
@@ -0,0 +1,164 @@
+"""
+Testes de Manager.in_bulk e da rota GET /<recurso>/batch?ids=.
+"""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import Mapped
+
+from strider.dependencies import get_db
+from strider.models import Field, Model
+from strider.permissions import Permission
+from strider.routing import Router
+from strider.serializers import OutputSchema
+from strider.views import ViewSet
+
+
+class Book(Model):
+    __tablename__ = "test_batch_books"
+
+    id: Mapped[int] = Field.pk()
+    isbn: Mapped[str] = Field.string(max_length=20, unique=True)
+    title: Mapped[str] = Field.string(max_length=50)
+    published: Mapped[bool] = Field.boolean(default=True)
+
+
+class BookOutput(OutputSchema):
+    id: int
+    isbn: str
+    title: str
+
+
+class HideSecondBook(Permission):
+    async def has_permission(self, request, view=None) -> bool:
+        return True
+
+    async def has_object_permission(self, request, view=None, obj=None) -> bool:
+        return obj is None or obj.id != 2
+
+
+class BookViewSet(ViewSet):
+    model = Book
+    output_schema = BookOutput
+    batch_retrieve = True
+    batch_max_ids = 5
+
+    def get_queryset(self, db):
+        return Book.objects.using(db).filter(published=True)
+
+
+class GuardedBookViewSet(BookViewSet):
+    permission_classes_by_action = {"retrieve": [HideSecondBook]}
+
+
+class PlainBookViewSet(ViewSet):
+    model = Book
+    output_schema = BookOutput
+
+
+@pytest.fixture
+async def books(db_session):
+    db_session.add_all(
+        [Book(isbn=f"isbn-{i}", title=f"b{i}", published=i != 3) for i in range(1, 6)]
+    )
+    await db_session.commit()
+    db_session.expunge_all()
+    return db_session
+
+
+@pytest.fixture
+async def client(books):
+    router = Router()
+    router.register_viewset("/books", BookViewSet, basename="book")
+    router.register_viewset("/guarded", GuardedBookViewSet, basename="guarded")
+    router.register_viewset("/plain", PlainBookViewSet, basename="plain")
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = lambda: books
+
+    statements: list[str] = []
+    engine = books.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+        http.statements = statements
+        yield http
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+class TestInBulk:
+    async def test_returns_mapping_by_pk(self, books):
+        found = await Book.objects.using(books).in_bulk([4, 1, 99, 1])
+
+        assert set(found) == {1, 4}
+        assert found[4].title == "b4"
+
+    async def test_chunks_large_id_lists(self, books):
+        statements = []
+        engine = books.get_bind()
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            found = await Book.objects.using(books).filter(published=True).in_bulk(
+                [1, 2, 3, 4, 5], batch_size=2,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert sorted(found) == [1, 2, 4, 5]
+        assert len(statements) == 3
+
+    async def test_unique_field_and_only(self, books):
+        found = await Book.objects.using(books).only("title").in_bulk(
+            ["isbn-2", "isbn-5"], field_name="isbn",
+        )
+
+        assert {k: v.title for k, v in found.items()} == {"isbn-2": "b2", "isbn-5": "b5"}
+
+    async def test_rejects_non_unique_field_and_slices(self, books):
+        with pytest.raises(ValueError, match="não é PK nem coluna única"):
+            await Book.objects.using(books).in_bulk(["b1"], field_name="title")
+        with pytest.raises(TypeError):
+            await Book.objects.using(books).limit(2).in_bulk([1])
+
+
+class TestBatchRoute:
+    async def test_returns_items_in_request_order_with_one_query(self, client):
+        client.statements.clear()
+
+        response = await client.get("/books/batch?ids=5,1,4")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [5, 1, 4]
+        assert response.json()["missing"] == []
+        assert len(client.statements) == 1
+
+    async def test_queryset_scoping_and_missing_ids(self, client):
+        response = await client.get("/books/batch?ids=3,2,42")
+
+        assert [item["id"] for item in response.json()["items"]] == [2]
+        assert response.json()["missing"] == [3, 42]
+
+    async def test_object_permissions_hide_items(self, client):
+        response = await client.get("/guarded/batch?ids=1,2")
+
+        assert [item["id"] for item in response.json()["items"]] == [1]
+        assert response.json()["missing"] == [2]
+
+    async def test_sparse_fields(self, client):
+        response = await client.get("/books/batch?ids=1&fields=title")
+
+        assert response.json()["items"] == [{"title": "b1"}]
+
+    @pytest.mark.parametrize("query", ["", "ids=", "ids=1,2,3,4,5,6", "ids=1,abc"])
+    async def test_invalid_ids_are_422(self, client, query):
+        response = await client.get(f"/books/batch?{query}")
+
+        assert response.status_code == 422
+
+    async def test_route_is_opt_in(self, client):
+        assert (await client.get("/plain/batch?ids=1")).status_code == 422
+        assert (await client.get("/plain/batch")).json()["detail"]["errors"][0]["loc"] == ["path", "id"]
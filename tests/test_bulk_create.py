@@ -0,0 +1,219 @@
+"""
+Testes do bulk_create com multi-row INSERT ... RETURNING, hooks em lote e upsert.
+"""
+
+import sys
+import types
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Mapped
+
+from strider.datetime import DateTime
+from strider.models import Field, Model
+from strider.relations import Rel
+
+
+_MODULE = "src.apps.bulkapp.models"
+_models = types.ModuleType(_MODULE)
+sys.modules.setdefault(_MODULE, _models)
+
+
+class Reading(Model):
+    __tablename__ = "test_bulk_readings"
+
+    id: Mapped[int] = Field.pk()
+    sensor: Mapped[str] = Field.string(max_length=20, unique=True)
+    value: Mapped[int] = Field.integer(default=0)
+    active: Mapped[bool] = Field.boolean(default=True)
+    created_at: Mapped[DateTime] = Field.datetime(auto_now_add=True)
+
+    batches = []
+    created = []
+
+    @classmethod
+    async def before_bulk_create(cls, instances):
+        cls.batches.append(len(instances))
+        for instance in instances:
+            instance.sensor = instance.sensor.upper()
+
+    async def after_create(self):
+        Reading.created.append(self.id)
+
+
+class BulkParent(Model):
+    __module__ = _MODULE
+    __tablename__ = "test_bulk_parents"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=20)
+    children: Mapped[list["BulkChild"]] = Rel.one_to_many(
+        "bulkapp.BulkChild", foreign_keys=["parent_id"], back_populates="parent",
+    )
+
+
+_models.BulkParent = BulkParent
+
+
+class BulkChild(Model):
+    __module__ = _MODULE
+    __tablename__ = "test_bulk_children"
+
+    id: Mapped[int] = Field.pk()
+    parent_id: Mapped[int] = Rel.foreign_key("test_bulk_parents.id")
+    parent: Mapped[BulkParent] = Rel.many_to_one(
+        "bulkapp.BulkParent", foreign_keys=["parent_id"], back_populates="children",
+    )
+
+
+_models.BulkChild = BulkChild
+
+
+@pytest.fixture
+def statements(db_session):
+    captured: list[str] = []
+    engine = db_session.get_bind()
+    listener = lambda *args: captured.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    Reading.batches.clear()
+    Reading.created.clear()
+    yield captured
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def _inserts(statements: list[str]) -> list[str]:
+    return [sql for sql in statements if sql.lstrip().upper().startswith("INSERT")]
+
+
+class TestFastPath:
+    async def test_multi_row_insert_returning_in_batches(self, db_session, statements):
+        pks = await Reading.objects.using(db_session).bulk_create(
+            [{"sensor": f"s{i}", "value": i} for i in range(5)], batch_size=2, hydrate=False,
+        )
+
+        inserts = _inserts(statements)
+        assert len(inserts) == 3
+        assert "RETURNING" in inserts[0].upper()
+        assert inserts[0].count("?") == 2 * inserts[-1].count("?")
+        assert sorted(pks) == [1, 2, 3, 4, 5]
+        assert len(statements) == 3
+
+    async def test_generated_values_fill_the_given_instances(self, db_session, statements):
+        given = [Reading(sensor=f"s{i}", value=i) for i in range(5)]
+
+        rows = await Reading.objects.using(db_session).bulk_create(given, batch_size=2)
+
+        assert all(row is instance for row, instance in zip(rows, given))
+        assert [r.sensor for r in rows] == ["S0", "S1", "S2", "S3", "S4"]
+        assert all(r.id and r.active and r.created_at for r in rows)
+        assert len({r.id for r in rows}) == 5
+        assert all(r in db_session for r in rows)
+        stored = await Reading.objects.using(db_session).get(id=given[3].id)
+        assert stored is given[3] and stored.value == 3
+
+    async def test_hydrating_insert_stays_multi_row(self, db_session, statements):
+        given = [Reading(sensor=f"m{i}", value=i) for i in range(5)]
+
+        await Reading.objects.using(db_session).bulk_create(given)
+
+        assert len(_inserts(statements)) == 1
+        assert [r.id for r in given] == [1, 2, 3, 4, 5]
+
+    async def test_given_primary_keys_are_matched_by_key(self, db_session, statements):
+        given = [Reading(id=pk, sensor=f"k{pk}", value=pk) for pk in (30, 10, 20)]
+
+        await Reading.objects.using(db_session).bulk_create(given)
+
+        assert len(_inserts(statements)) == 1
+        assert [(r.id, r.value) for r in given] == [(30, 30), (10, 10), (20, 20)]
+        assert all(r.created_at for r in given)
+
+    async def test_rows_with_different_columns_are_not_mixed(self, db_session, statements):
+        given = [Reading(sensor="a"), Reading(sensor="b", value=5), Reading(sensor="c", value=6)]
+
+        await Reading.objects.using(db_session).bulk_create(given)
+
+        assert len(_inserts(statements)) == 2
+        assert [r.value for r in given] == [0, 5, 6]
+        assert await Reading.objects.using(db_session).values_list("value", flat=True) == [0, 5, 6]
+
+    async def test_vectorized_hooks_receive_whole_batch(self, db_session, statements):
+        rows = await Reading.objects.using(db_session).bulk_create(
+            [{"sensor": f"h{i}"} for i in range(3)], batch_size=2,
+        )
+
+        assert Reading.batches == [3]
+        assert Reading.created == [r.id for r in rows]
+
+    async def test_accepts_instances(self, db_session, statements):
+        rows = await Reading.objects.using(db_session).bulk_create([Reading(sensor="x", value=7)])
+
+        assert rows[0].value == 7
+        assert await Reading.objects.using(db_session).count() == 1
+
+    async def test_no_hydrate_returns_primary_keys(self, db_session, statements):
+        pks = await Reading.objects.using(db_session).bulk_create(
+            [{"sensor": "a"}, {"sensor": "b"}], hydrate=False,
+        )
+
+        assert sorted(pks) == [1, 2]
+        assert _inserts(statements)[0].rstrip().endswith("RETURNING id")
+
+
+class TestConflicts:
+    async def test_ignore_conflicts_skips_existing(self, db_session, statements):
+        manager = Reading.objects.using(db_session)
+        await manager.bulk_create([{"sensor": "a"}])
+
+        rows = await manager.bulk_create(
+            [{"sensor": "a"}, {"sensor": "b"}], ignore_conflicts=True, unique_fields=["sensor"],
+        )
+
+        assert [r.sensor for r in rows] == ["B"]
+        assert await manager.count() == 2
+
+    async def test_update_conflicts_upserts(self, db_session, statements):
+        manager = Reading.objects.using(db_session)
+        existing = (await manager.bulk_create([{"sensor": "a", "value": 1}]))[0]
+
+        rows = await manager.bulk_create(
+            [{"sensor": "a", "value": 9}, {"sensor": "c", "value": 3}],
+            update_conflicts=True, unique_fields=["sensor"], update_fields=["value"],
+        )
+
+        assert {r.sensor: r.value for r in rows} == {"A": 9, "C": 3}
+        assert existing.value == 9
+        assert await manager.count() == 2
+
+    async def test_invalid_conflict_options(self, db_session):
+        manager = Reading.objects.using(db_session)
+
+        with pytest.raises(ValueError):
+            await manager.bulk_create([{"sensor": "a"}], ignore_conflicts=True, update_conflicts=True)
+        with pytest.raises(ValueError, match="update_fields"):
+            await manager.bulk_create([{"sensor": "a"}], update_conflicts=True)
+
+
+class TestRelationships:
+    async def test_many_to_one_sets_the_foreign_key(self, db_session):
+        parent = await BulkParent.objects.using(db_session).create(name="p")
+
+        children = await BulkChild.objects.using(db_session).bulk_create(
+            [BulkChild(parent=parent), {"parent": parent}],
+        )
+
+        assert [c.parent_id for c in children] == [parent.id, parent.id]
+        assert await BulkChild.objects.using(db_session).filter(parent_id=parent.id).count() == 2
+
+    async def test_unsaved_parent_falls_back_to_flush(self, db_session):
+        parent = BulkParent(name="new")
+
+        children = await BulkChild.objects.using(db_session).bulk_create([BulkChild(parent=parent)])
+
+        assert parent.id and children[0].parent_id == parent.id
+
+    async def test_conflicts_reject_relationship_state(self, db_session):
+        with pytest.raises(ValueError, match="FK"):
+            await BulkChild.objects.using(db_session).bulk_create(
+                [BulkChild(parent=BulkParent(name="new"))], ignore_conflicts=True,
+            )
@@ -0,0 +1,287 @@
+"""
+Testes do framework de cache: backends, single-flight e cache de views.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.orm import Mapped
+from starlette.requests import Request
+
+import strider.cache
+from strider.cache import (
+    LocalMemoryCache,
+    RedisCache,
+    cache_response,
+    configure_cache,
+    get_cache,
+    invalidate_model,
+    model_versions,
+)
+from strider.config import configure, is_configured, reset_settings
+from strider.models import Field, Model
+from strider.serializers import OutputSchema
+from strider.testing import MockRedis
+from strider.views import ViewSet
+
+
+class CachedItem(Model):
+    __tablename__ = "test_cached_items"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=50)
+
+
+class UncachedItem(Model):
+    """Sem ViewSet com cache neste processo (como num worker)."""
+
+    __tablename__ = "test_uncached_items"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=50)
+
+
+class CachedItemOutput(OutputSchema):
+    id: int
+    name: str
+
+
+class CachedItemViewSet(ViewSet):
+    model = CachedItem
+    output_schema = CachedItemOutput
+    cache_actions = {"list": 60, "retrieve": 60}
+
+
+def _request(path: str = "/items", query: str = "", method: str = "GET", user=None) -> Request:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [],
+        "state": {"user": user} if user is not None else {},
+    }
+    return Request(scope)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    backend = LocalMemoryCache(max_entries=100) if request.param == "memory" else RedisCache(client=MockRedis())
+    configure_cache(backend)
+    yield backend
+    configure_cache(None)
+
+
+class TestBackends:
+    async def test_get_set_delete(self, cache):
+        await cache.set("a", {"n": 1})
+
+        assert await cache.get("a") == {"n": 1}
+        assert await cache.delete("a") is True
+        assert await cache.get("a", default="x") == "x"
+
+    async def test_cached_none_is_distinct_from_missing(self, cache):
+        await cache.set("none", None)
+
+        assert await cache.get("none", default="x") is None
+
+    async def test_get_many_returns_present_keys(self, cache):
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+        assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+    async def test_add_only_when_absent(self, cache):
+        assert await cache.add("k", 1) is True
+        assert await cache.add("k", 2) is False
+        assert await cache.get("k") == 1
+
+    async def test_ttl_expires(self, cache):
+        await cache.set("t", 1, ttl=0.01)
+        await asyncio.sleep(0.02)
+
+        assert await cache.get("t") is None
+
+    async def test_redis_uses_prefix_and_pickle(self):
+        client = MockRedis()
+        cache = RedisCache(client=client, key_prefix="app:")
+
+        await cache.set("k", {"n": 1}, ttl=10)
+
+        assert list(client.data) == ["app:k"]
+        assert isinstance(client.data["app:k"], bytes)
+
+
+class TestLocalMemoryLRU:
+    async def test_evicts_least_recently_used(self):
+        cache = LocalMemoryCache(max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+
+        await cache.set("c", 3)
+
+        assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+        assert len(cache) == 2
+
+
+class TestSingleFlight:
+    async def test_concurrent_misses_compute_once(self, cache):
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(cache.get_or_set("hot", compute) for _ in range(10)))
+
+        assert calls == 1
+        assert results == [1] * 10
+        assert await cache.get("hot") == 1
+
+    async def test_failure_propagates_and_is_not_cached(self, cache):
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("k", boom) for _ in range(3)), return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await cache.get_or_set("k", lambda: asyncio.sleep(0, result="ok")) == "ok"
+
+
+class TestViewSetCache:
+    async def test_list_is_cached_until_model_save(self, cache, db_session):
+        await CachedItem(name="a").save(db_session)
+        await db_session.commit()
+        view = CachedItemViewSet()
+
+        first = await view.list(_request(), db_session)
+        db_session.add(CachedItem(name="b"))
+        await db_session.commit()
+        cached = await view.list(_request(), db_session)
+
+        assert first == cached
+        assert first["total"] == 1
+
+        await CachedItem(name="c").save(db_session)
+        await db_session.commit()
+        fresh = await view.list(_request(), db_session)
+
+        assert fresh["total"] == 3
+
+    async def test_version_changes_only_after_commit(self, cache, db_session):
+        await CachedItem(name="a").save(db_session)
+        await db_session.commit()
+        view = CachedItemViewSet()
+        await view.list(_request(), db_session)
+        version = await cache.get("version:test_cached_items")
+
+        await CachedItem(name="b").save(db_session)
+        await asyncio.sleep(0)
+
+        # Antes do commit, uma leitura não pode cachear sob a versão nova
+        assert await cache.get("version:test_cached_items") == version
+
+        await db_session.commit()
+
+        assert await cache.get("version:test_cached_items") != version
+        assert (await view.list(_request(), db_session))["total"] == 2
+
+    async def test_rollback_does_not_invalidate(self, cache, db_session):
+        await CachedItem(name="a").save(db_session)
+        await db_session.commit()
+        view = CachedItemViewSet()
+        await view.list(_request(), db_session)
+        version = await cache.get("version:test_cached_items")
+
+        await CachedItem(name="b").save(db_session)
+        await db_session.rollback()
+        await db_session.commit()
+
+        assert await cache.get("version:test_cached_items") == version
+
+    async def test_key_varies_on_query_and_user(self, cache, db_session):
+        item = await CachedItem(name="a").save(db_session)
+        view = CachedItemViewSet()
+
+        await view.list(_request(), db_session)
+        item.name = "renamed"
+        await db_session.flush()
+
+        paged = await view.list(_request(query="page_size=5"), db_session, page_size=5)
+        other_user = await view.list(_request(user=type("U", (), {"id": 7})()), db_session)
+
+        assert paged["items"][0]["name"] == "renamed"
+        assert other_user["items"][0]["name"] == "renamed"
+
+    async def test_retrieve_invalidated_by_delete(self, cache, db_session):
+        item = await CachedItem(name="a").save(db_session)
+        await db_session.commit()
+        view = CachedItemViewSet()
+
+        assert (await view.retrieve(_request(f"/items/{item.id}"), db_session, id=item.id))["name"] == "a"
+
+        await item.delete(db_session)
+        await db_session.commit()
+
+        with pytest.raises(Exception):
+            await view.retrieve(_request(f"/items/{item.id}"), db_session, id=item.id)
+
+    async def test_evicted_version_never_revives_old_entries(self, cache, db_session):
+        await CachedItem(name="a").save(db_session)
+        view = CachedItemViewSet()
+        await view.list(_request(), db_session)
+
+        await cache.delete("version:test_cached_items")
+        db_session.add(CachedItem(name="b"))
+        await db_session.flush()
+
+        assert (await view.list(_request(), db_session))["total"] == 2
+
+    async def test_commit_bumps_version_before_returning(self, cache, db_session):
+        # Processos sem views em cache também invalidam o cache compartilhado
+        [before] = await model_versions([UncachedItem])
+
+        await UncachedItem(name="a").save(db_session)
+        await db_session.commit()
+
+        assert not strider.cache._pending_invalidations
+        assert await model_versions([UncachedItem]) != [before]
+
+
+class TestCacheResponseDecorator:
+    async def test_caches_get_and_skips_other_methods(self, cache):
+        calls = []
+
+        class Handler:
+            @cache_response(ttl=30, models=[CachedItem])
+            async def get(self, request):
+                calls.append(request.method)
+                return {"n": len(calls)}
+
+        handler = Handler()
+
+        assert await handler.get(_request()) == {"n": 1}
+        assert await handler.get(_request()) == {"n": 1}
+        assert await handler.get(_request(method="POST")) == {"n": 2}
+
+        await invalidate_model(CachedItem)
+
+        assert await handler.get(_request()) == {"n": 3}
+
+    def test_global_cache_follows_settings(self):
+        configured = is_configured()
+        if not configured:
+            configure()
+        configure_cache(None)
+        try:
+            assert isinstance(get_cache(), LocalMemoryCache)
+        finally:
+            configure_cache(None)
+            if not configured:
+                reset_settings()
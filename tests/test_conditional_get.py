@@ -0,0 +1,163 @@
+"""
+Testes de conditional GET (ETag / Last-Modified / 304) nas rotas CRUD.
+"""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import Mapped
+
+from strider.datetime import DateTime
+from strider.dependencies import get_db
+from strider.models import Field, Model
+from strider.routing import Router
+from strider.serializers import OutputSchema
+from strider.views import ViewSet, make_etag
+
+
+class Article(Model):
+    __tablename__ = "test_cond_articles"
+
+    id: Mapped[int] = Field.pk()
+    title: Mapped[str] = Field.string(max_length=50)
+    updated_at: Mapped[DateTime] = Field.datetime(auto_now=True)
+
+
+class Tag(Model):
+    __tablename__ = "test_cond_tags"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=50)
+
+
+class ArticleOutput(OutputSchema):
+    id: int
+    title: str
+
+
+class TagOutput(OutputSchema):
+    id: int
+    name: str
+
+
+class ArticleViewSet(ViewSet):
+    model = Article
+    output_schema = ArticleOutput
+
+
+class TagViewSet(ViewSet):
+    model = Tag
+    output_schema = TagOutput
+
+
+@pytest.fixture
+async def client(db_session):
+    db_session.add_all([Article(title="a"), Article(title="b"), Tag(name="t")])
+    await db_session.commit()
+
+    router = Router()
+    router.register_viewset("/articles", ArticleViewSet, basename="article")
+    router.register_viewset("/tags", TagViewSet, basename="tag")
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = lambda: db_session
+
+    statements: list[str] = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+        http.statements = statements
+        yield http
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+class TestRetrieve:
+    async def test_emits_validators(self, client):
+        response = await client.get("/articles/1")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert "last-modified" in response.headers
+
+    async def test_if_none_match_returns_304(self, client):
+        etag = (await client.get("/articles/1")).headers["etag"]
+
+        response = await client.get("/articles/1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    async def test_if_modified_since_returns_304(self, client):
+        last_modified = (await client.get("/articles/1")).headers["last-modified"]
+
+        response = await client.get("/articles/1", headers={"If-Modified-Since": last_modified})
+
+        assert response.status_code == 304
+
+    async def test_update_changes_etag(self, client, db_session):
+        etag = (await client.get("/articles/1")).headers["etag"]
+
+        article = await Article.objects.using(db_session).get(id=1)
+        article.title = "changed"
+        await article.save(db_session)
+        await db_session.commit()
+
+        response = await client.get("/articles/1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["title"] == "changed"
+
+    async def test_body_hash_without_validator_column(self, client):
+        etag = (await client.get("/tags/1")).headers["etag"]
+
+        assert (await client.get("/tags/1", headers={"If-None-Match": etag})).status_code == 304
+        assert "last-modified" not in (await client.get("/tags/1")).headers
+
+
+class TestList:
+    async def test_304_skips_page_query(self, client):
+        etag = (await client.get("/articles/")).headers["etag"]
+        client.statements.clear()
+
+        response = await client.get("/articles/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert len(client.statements) == 1
+        assert "max(" in client.statements[0].lower()
+
+    async def test_validator_query_replaces_count(self, client):
+        client.statements.clear()
+
+        response = await client.get("/articles/")
+
+        assert response.json()["total"] == 2
+        assert len(client.statements) == 2
+
+    async def test_etag_depends_on_page(self, client):
+        first = (await client.get("/articles/?page=1&page_size=1")).headers["etag"]
+        second = (await client.get("/articles/?page=2&page_size=1")).headers["etag"]
+
+        assert first != second
+
+    async def test_insert_changes_etag(self, client, db_session):
+        etag = (await client.get("/articles/")).headers["etag"]
+
+        await Article(title="c").save(db_session)
+        await db_session.commit()
+
+        assert (await client.get("/articles/", headers={"If-None-Match": etag})).status_code == 200
+
+
+class TestHelpers:
+    def test_disabled_viewset_emits_no_validators(self):
+        class Plain(ArticleViewSet):
+            conditional_get = False
+
+        assert Plain().get_etag_field() is None
+        assert Plain().conditional_body(None, {"a": 1}) == {"a": 1}
+
+    def test_make_etag_is_stable(self):
+        assert make_etag("a", 1) == make_etag("a", 1) != make_etag("a", 2)
@@ -0,0 +1,274 @@
+"""
+Testes do DataLoader e do carregamento em lote de relacionamentos.
+"""
+
+import asyncio
+import sys
+import types
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped
+
+from strider.dataloader import DataLoader, Loaders, get_current_loaders
+from strider.dependencies import get_db, get_loaders
+from strider.models import Field, Model
+from strider.relations import AssociationTable, Rel
+from strider.serializers import OutputSchema
+
+
+_MODULE = "src.apps.dlapp.models"
+_models = types.ModuleType(_MODULE)
+sys.modules.setdefault(_MODULE, _models)
+
+dl_order_labels = AssociationTable.create(
+    "dl_order_labels",
+    left=("order_id", "dl_orders.id"),
+    right=("label_id", "dl_labels.id"),
+)
+
+
+class DLCustomer(Model):
+    __module__ = _MODULE
+    __tablename__ = "dl_customers"
+    __relationship_loading__ = "raise"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=50)
+
+
+_models.DLCustomer = DLCustomer
+
+
+class DLLabel(Model):
+    __module__ = _MODULE
+    __tablename__ = "dl_labels"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=20)
+
+
+_models.DLLabel = DLLabel
+
+
+class DLOrder(Model):
+    __module__ = _MODULE
+    __tablename__ = "dl_orders"
+    __relationship_loading__ = "raise"
+
+    id: Mapped[int] = Field.pk()
+    customer_id: Mapped[int] = Rel.foreign_key("dl_customers.id")
+    customer: Mapped[DLCustomer] = Rel.many_to_one("dlapp.DLCustomer")
+    items: Mapped[list["DLItem"]] = Rel.one_to_many(
+        "dlapp.DLItem", foreign_keys=["order_id"], back_populates="order",
+    )
+    labels: Mapped[list[DLLabel]] = Rel.many_to_many("dlapp.DLLabel", secondary=dl_order_labels)
+
+
+_models.DLOrder = DLOrder
+
+
+class DLItem(Model):
+    __module__ = _MODULE
+    __tablename__ = "dl_items"
+    __relationship_loading__ = "raise"
+
+    id: Mapped[int] = Field.pk()
+    sku: Mapped[str] = Field.string(max_length=20)
+    order_id: Mapped[int] = Rel.foreign_key("dl_orders.id")
+    order: Mapped[DLOrder] = Rel.many_to_one(
+        "dlapp.DLOrder", foreign_keys=["order_id"], back_populates="items",
+    )
+
+
+_models.DLItem = DLItem
+
+
+class CustomerOut(OutputSchema):
+    id: int
+    name: str
+
+
+class ItemOut(OutputSchema):
+    sku: str
+
+
+class LabelOut(OutputSchema):
+    name: str
+
+
+class OrderOut(OutputSchema):
+    id: int
+    customer: CustomerOut
+    items: list[ItemOut]
+    labels: list[LabelOut]
+
+
+_TABLES = [DLCustomer.__table__, DLLabel.__table__, DLOrder.__table__, DLItem.__table__, dl_order_labels]
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'loaders.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Model.metadata.create_all(c, tables=_TABLES))
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        labels = [DLLabel(name="a"), DLLabel(name="b")]
+        db.add_all(labels)
+        for c in range(3):
+            customer = DLCustomer(name=f"c{c}")
+            db.add(customer)
+            await db.flush()
+            for _ in range(2):
+                order = DLOrder(customer_id=customer.id)
+                db.add(order)
+                await db.flush()
+                db.add_all([DLItem(sku=f"s{order.id}-{i}", order_id=order.id) for i in range(2)])
+                await db.execute(dl_order_labels.insert().values(order_id=order.id, label_id=labels[0].id))
+        await db.commit()
+        db.expunge_all()
+
+        statements: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+        db.info["statements"] = statements
+        yield db
+    await engine.dispose()
+
+
+def _selects(db) -> int:
+    return sum(1 for sql in db.info["statements"] if sql.lstrip().upper().startswith("SELECT"))
+
+
+class TestDataLoader:
+    async def test_batches_loads_in_same_tick(self):
+        calls = []
+
+        async def batch(keys):
+            calls.append(keys)
+            return [k * 10 for k in keys]
+
+        loader = DataLoader(batch)
+        values = await asyncio.gather(*(loader.load(k) for k in [1, 2, 1, 3]))
+
+        assert values == [10, 20, 10, 30]
+        assert calls == [[1, 2, 3]]
+
+    async def test_caches_across_ticks(self):
+        calls = []
+
+        async def batch(keys):
+            calls.append(keys)
+            return {k: str(k) for k in keys}
+
+        loader = DataLoader(batch)
+        await loader.load(1)
+        assert await loader.load_many([1, 2]) == ["1", "2"]
+        assert calls == [[1], [2]]
+
+    async def test_max_batch_size_and_missing_keys(self):
+        calls = []
+
+        async def batch(keys):
+            calls.append(keys)
+            return {k: k for k in keys if k != 2}
+
+        loader = DataLoader(batch, max_batch_size=2)
+
+        assert await loader.load_many([1, 2, 3]) == [1, None, 3]
+        assert calls == [[1, 2], [3]]
+
+    async def test_errors_propagate_and_are_not_cached(self):
+        attempts = 0
+
+        async def batch(keys):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("db down")
+            return keys
+
+        loader = DataLoader(batch)
+        with pytest.raises(RuntimeError):
+            await loader.load(1)
+
+        assert await loader.load(1) == 1
+
+
+class TestLoaders:
+    async def test_model_loader_uses_single_in_query(self, session):
+        orders = await DLOrder.objects.using(session).all()
+        loaders = Loaders(session)
+        before = _selects(session)
+
+        customers = await asyncio.gather(
+            *(loaders.model(DLCustomer).load(o.customer_id) for o in orders)
+        )
+
+        assert [c.name for c in customers] == ["c0", "c0", "c1", "c1", "c2", "c2"]
+        assert _selects(session) - before == 1
+
+    async def test_load_related_fills_relationships(self, session):
+        orders = await DLOrder.objects.using(session).all()
+        loaders = Loaders(session)
+        before = _selects(session)
+
+        items = await loaders.load_related(orders, "items")
+        await loaders.load_related(orders, "customer")
+        await loaders.load_related(orders, "labels")
+
+        assert len(items) == 12
+        assert [i.sku for i in orders[0].items] == ["s1-0", "s1-1"]
+        assert orders[0].customer.name == "c0"
+        assert [label.name for label in orders[0].labels] == ["a"]
+        assert _selects(session) - before == 3
+
+    async def test_schema_prefetch_is_per_level(self, session):
+        orders = await DLOrder.objects.using(session).all()
+        before = _selects(session)
+
+        await OrderOut.prefetch(orders)
+        data = [OrderOut.model_validate(o).model_dump() for o in orders]
+
+        assert _selects(session) - before == 3
+        assert data[0]["customer"] == {"id": 1, "name": "c0"}
+        assert data[0]["items"] == [{"sku": "s1-0"}, {"sku": "s1-1"}]
+
+    async def test_prefetch_skips_loaded_relationships(self, session):
+        orders = await DLOrder.objects.using(session).prefetch_related("customer", "items", "labels").all()
+        before = _selects(session)
+
+        await OrderOut.prefetch(orders, Loaders(session))
+
+        assert _selects(session) == before
+
+    async def test_non_relationship_raises(self, session):
+        with pytest.raises(ValueError, match="não é um relacionamento"):
+            Loaders(session).related(DLOrder, "customer_id")
+
+
+class TestDependency:
+    async def test_loaders_are_request_scoped(self, session):
+        app = FastAPI()
+        app.dependency_overrides[get_db] = lambda: session
+        seen = []
+
+        @app.get("/orders")
+        async def orders(loaders=Depends(get_loaders)):
+            seen.append(loaders)
+            assert get_current_loaders() is loaders
+            rows = await DLOrder.objects.using(loaders.session).all()
+            await OrderOut.prefetch(rows)
+            return [OrderOut.model_validate(o).model_dump() for o in rows]
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+            first = await http.get("/orders")
+            await http.get("/orders")
+
+        assert first.status_code == 200
+        assert len(first.json()) == 6
+        assert seen[0] is not seen[1]
+        assert get_current_loaders() is None
@@ -0,0 +1,314 @@
+"""
+Testes do controle de fluxo: marcas alta/baixa de mensagens e bytes em
+processamento, pausa nativa do consumer (ou bloqueio no acquire) e
+retomada quando o backlog drena, inclusive no runtime dos workers.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+import strider.messaging
+import strider.messaging.registry
+from strider.config import configure, is_configured, reset_settings
+from strider.messaging.flow import FlowController
+from strider.messaging.redis.consumer import RedisConsumer
+from strider.messaging.workers import WorkerConfig, _run_worker_config
+from strider.testing import MockKafka, MockRedis
+
+
+class Source:
+    """Registra pause/resume; ``native`` define o retorno de pause()."""
+
+    def __init__(self, native: bool = True) -> None:
+        self.native = native
+        self.calls: list[str] = []
+
+    async def pause(self) -> bool:
+        self.calls.append("pause")
+        return self.native
+
+    async def resume(self) -> None:
+        self.calls.append("resume")
+
+
+def _flow(source: Source, **kwargs) -> FlowController:
+    return FlowController(on_pause=source.pause, on_resume=source.resume, **kwargs)
+
+
+class TestWatermarks:
+    async def test_pauses_at_high_and_resumes_at_low(self):
+        source = Source()
+        flow = _flow(source, high_messages=4, low_messages=1)
+
+        for _ in range(4):
+            await flow.acquire()
+        assert flow.paused and source.calls == ["pause"]
+
+        # Entre as marcas não há oscilação
+        await flow.release(2)
+        assert flow.paused and source.calls == ["pause"]
+
+        await flow.release()
+        assert not flow.paused and source.calls == ["pause", "resume"]
+
+    async def test_low_defaults_to_half(self):
+        flow = FlowController(high_messages=10)
+
+        assert flow.low_messages == 5
+
+    async def test_bytes_watermark(self):
+        source = Source()
+        flow = _flow(source, high_messages=0, high_bytes=1000)
+
+        await flow.acquire(600)
+        assert not flow.paused
+        await flow.acquire(600)
+        assert flow.paused
+
+        await flow.release(size=600)
+        assert flow.paused  # 600 > 500 (metade)
+        await flow.release(size=600)
+        assert not flow.paused
+
+    async def test_acquire_blocks_without_native_pause(self):
+        flow = _flow(Source(native=False), high_messages=2, low_messages=0)
+        await flow.acquire()
+        await flow.acquire()
+
+        waiting = asyncio.create_task(flow.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+        await flow.release(2)
+        await asyncio.wait_for(waiting, 1)
+        assert flow.inflight == 1
+
+    async def test_native_pause_does_not_block(self):
+        flow = _flow(Source(), high_messages=1)
+        await flow.acquire()
+
+        # Mensagens já buscadas antes da pausa continuam entrando
+        await asyncio.wait_for(flow.acquire(), 1)
+        assert flow.inflight == 2
+
+    async def test_pause_errors_fall_back_to_blocking(self):
+        async def broken() -> bool:
+            raise ConnectionError("broker down")
+
+        flow = FlowController(high_messages=1, low_messages=0, on_pause=broken)
+        await flow.acquire()
+
+        waiting = asyncio.create_task(flow.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        await flow.release()
+        await asyncio.wait_for(waiting, 1)
+
+    async def test_metrics(self):
+        now = [0.0]
+        flow = _flow(Source(), high_messages=2, low_messages=0, clock=lambda: now[0])
+        await flow.acquire(10)
+        await flow.acquire(10)
+        now[0] = 3.0
+        await flow.release(2, 20)
+
+        assert flow.metrics() == {
+            "flow_inflight": 0,
+            "flow_inflight_bytes": 0,
+            "flow_max_inflight": 2,
+            "flow_paused": False,
+            "flow_pauses": 1,
+            "flow_paused_seconds": 3.0,
+        }
+
+
+class TestRedisConsumerPause:
+    @pytest.fixture(autouse=True)
+    def settings(self):
+        configured = is_configured()
+        if not configured:
+            configure()
+        yield
+        if not configured:
+            reset_settings()
+
+    async def test_paused_consumer_stops_reading(self):
+        redis = MockRedis()
+        seen = []
+
+        async def handler(message):
+            seen.append(message["n"])
+
+        consumer = RedisConsumer(
+            "billing", ["orders"], message_handler=handler, consumer_name="a", client=redis, claim_interval=0,
+        )
+        await consumer.start()
+        try:
+            assert await consumer.pause() is True
+            await asyncio.sleep(0.05)
+            await redis.xadd("orders", {"data": json.dumps({"n": 1})})
+            await asyncio.sleep(0.1)
+            assert seen == []
+
+            await consumer.resume()
+            for _ in range(100):
+                if seen:
+                    break
+                await asyncio.sleep(0.02)
+            assert seen == [1]
+        finally:
+            await consumer.stop()
+
+
+class Recorder(MockKafka):
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class FakeConsumer(Source):
+    # Como o aio-pika com o prefetch default
+    concurrent_deliveries = 10
+
+    def __init__(self, message_handler) -> None:
+        super().__init__()
+        self.handler = message_handler
+        self.started = asyncio.Event()
+
+    async def start(self) -> None:
+        self.started.set()
+
+    async def stop(self) -> None:
+        pass
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    """Roda _run_worker_config com consumer e producer falsos."""
+    consumers: list[FakeConsumer] = []
+
+    def create_consumer(group_id, topics, message_handler):
+        consumers.append(FakeConsumer(message_handler))
+        return consumers[-1]
+
+    monkeypatch.setattr(strider.messaging.registry, "create_consumer", create_consumer)
+    monkeypatch.setattr(strider.messaging, "get_producer", lambda: Recorder(), raising=False)
+
+    async def start(config: WorkerConfig):
+        task = asyncio.create_task(_run_worker_config(config))
+        while not consumers:
+            await asyncio.sleep(0.01)
+        await asyncio.wait_for(consumers[0].started.wait(), 5)
+        await asyncio.sleep(0)
+        return task, consumers[0]
+
+    return start
+
+
+async def _stop(task: asyncio.Task) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+class TestWorkerRuntime:
+    @pytest.fixture(autouse=True)
+    def settings(self):
+        configured = is_configured()
+        if not configured:
+            configure()
+        yield
+        if not configured:
+            reset_settings()
+
+    async def test_slow_handlers_pause_the_consumer(self, runtime, monkeypatch):
+        from strider import config as config_module
+
+        settings = config_module.get_settings().model_copy(
+            update={"messaging_flow_high_messages": 4, "messaging_flow_low_messages": 1}
+        )
+        monkeypatch.setattr(config_module, "get_settings", lambda: settings)
+
+        gate = asyncio.Event()
+        handled = []
+
+        async def handler(message):
+            await gate.wait()
+            handled.append(message["n"])
+
+        config = WorkerConfig(name="slow", handler=handler, input_topic="orders", flow_control=True)
+        task, consumer = await runtime(config)
+
+        # Entregas simultâneas, como o aio-pika até o prefetch: cada uma
+        # espera o próprio handler antes do ack
+        deliveries = [asyncio.create_task(consumer.handler({"n": n})) for n in range(4)]
+        await asyncio.sleep(0.05)
+        assert not any(d.done() for d in deliveries)
+        assert consumer.calls == ["pause"]
+
+        gate.set()
+        await asyncio.wait_for(asyncio.gather(*deliveries), 1)
+        await _stop(task)
+
+        assert sorted(handled) == [0, 1, 2, 3]
+        assert consumer.calls == ["pause", "resume"]
+
+    async def test_default_watermarks_follow_concurrent_deliveries(self, runtime):
+        gate = asyncio.Event()
+
+        async def handler(message):
+            await gate.wait()
+
+        config = WorkerConfig(name="prefetch", handler=handler, input_topic="orders", flow_control=True)
+        task, consumer = await runtime(config)
+
+        # Marca alta default (1000) acima do que o worker segura: vale o prefetch
+        deliveries = [asyncio.create_task(consumer.handler({"n": n})) for n in range(9)]
+        await asyncio.sleep(0.05)
+        assert consumer.calls == []
+        deliveries.append(asyncio.create_task(consumer.handler({"n": 9})))
+        await asyncio.sleep(0.05)
+        assert consumer.calls == ["pause"]
+
+        gate.set()
+        await asyncio.wait_for(asyncio.gather(*deliveries), 1)
+        await _stop(task)
+
+        assert consumer.calls == ["pause", "resume"]
+
+    async def test_one_delivery_at_a_time_does_not_pause_per_batch(self, runtime, monkeypatch):
+        monkeypatch.setattr(FakeConsumer, "concurrent_deliveries", 1)
+        batches = []
+
+        async def batch_handler(messages):
+            batches.append(len(messages))
+
+        config = WorkerConfig(
+            name="batched", handler=batch_handler, batch_handler=batch_handler, batch_size=2,
+            input_topic="orders", flow_control=True,
+        )
+        task, consumer = await runtime(config)
+
+        for n in range(4):
+            await consumer.handler({"n": n})
+        await _stop(task)
+
+        assert batches == [2, 2] and consumer.calls == []
+
+    async def test_disabled_by_default(self, runtime):
+        handled = []
+
+        async def handler(message):
+            handled.append(message["n"])
+
+        task, consumer = await runtime(WorkerConfig(name="plain", handler=handler, input_topic="orders"))
+        await consumer.handler({"n": 1})
+        await _stop(task)
+
+        assert handled == [1] and consumer.calls == []
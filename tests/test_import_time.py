@@ -0,0 +1,119 @@
+"""
+Import-time benchmark for CLI and worker cold start.
+
+`import strider` and the CLI/admin/messaging entry points must stay cheap:
+public names are exported lazily (PEP 562), so FastAPI, SQLAlchemy,
+pydantic, Jinja and Starlette are only loaded when something uses them.
+
+Each check runs in a fresh interpreter with ``-X importtime``. The time
+budget can be tuned for slow CI machines via STRIDER_IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_MODULES = ("fastapi", "starlette", "sqlalchemy", "pydantic", "jinja2")
+
+LIGHT_ENTRY_POINTS = (
+    "strider",
+    "strider.cli",
+    "strider.cli.main",
+    "strider.admin",
+    "strider.messaging",
+    "strider.server",
+)
+
+BUDGET_MS = float(os.environ.get("STRIDER_IMPORT_BUDGET_MS", "400"))
+
+
+def _import_in_subprocess(module: str) -> tuple[set[str], dict[str, float]]:
+    """Import ``module`` in a clean interpreter; return loaded modules and cumulative times (ms)."""
+    code = (
+        f"import {module}, sys\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    cumulative: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line.split("|")
+        try:
+            cumulative[name.strip()] = int(cum) / 1000
+        except ValueError:
+            continue
+    return set(result.stdout.split()), cumulative
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize("module", LIGHT_ENTRY_POINTS)
+    def test_entry_point_does_not_load_heavy_dependencies(self, module):
+        loaded, _ = _import_in_subprocess(module)
+        heavy = sorted(m for m in HEAVY_MODULES if m in loaded)
+        assert not heavy, f"'import {module}' eagerly loads {heavy}"
+
+    @pytest.mark.parametrize("module", LIGHT_ENTRY_POINTS)
+    def test_entry_point_import_time_budget(self, module):
+        _, cumulative = _import_in_subprocess(module)
+        top = module.split(".")[0]
+        elapsed = max(cumulative.get(module, 0.0), cumulative.get(top, 0.0))
+        assert elapsed < BUDGET_MS, (
+            f"'import {module}' took {elapsed:.1f}ms (budget {BUDGET_MS:.0f}ms)"
+        )
+
+
+class TestLazyExportTables:
+    def test_all_names_are_exported(self):
+        import strider
+
+        missing = set(strider.__all__) - set(strider._LAZY_EXPORTS)
+        assert not missing
+
+    def test_lazy_name_resolves_and_is_cached(self):
+        import strider
+        from strider.models import Model
+
+        assert strider.Model is Model
+        assert strider.__dict__["Model"] is Model
+
+    def test_alias_resolves_to_original_name(self):
+        import strider
+        from strider.auth import Permission
+
+        assert strider.AuthPermission is Permission
+
+    def test_unknown_name_raises_attribute_error(self):
+        import strider
+
+        with pytest.raises(AttributeError):
+            strider.does_not_exist
+
+    def test_admin_default_site_is_singleton(self):
+        import strider.admin as admin_pkg
+
+        assert admin_pkg.default_site is admin_pkg.admin
+        assert admin_pkg.register.__self__ is admin_pkg.default_site
+
+    def test_admin_site_registers_internal_models(self):
+        from strider.admin import default_site  # noqa: F401
+        from strider.models import Model
+
+        assert "admin_audit_log" in Model.metadata.tables
+
+    def test_messaging_exports(self):
+        import strider.messaging as messaging
+        from strider.messaging.topics import Topic
+
+        assert messaging.Topic is Topic
+        assert set(messaging.__all__) == set(messaging._LAZY_EXPORTS)
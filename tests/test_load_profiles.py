@@ -0,0 +1,278 @@
+"""
+Testes de políticas de carregamento de relacionamentos, load profiles
+por query/endpoint e strict loading.
+"""
+
+import sys
+import types
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped
+
+from strider.models import Field, Model
+from strider.querysets import LoadProfile, strict_loading
+from strider.relations import Rel
+from strider.views import ViewSet
+
+
+# Rel resolve targets "app.Model" em src.apps.<app>.models
+_MODULE = "src.apps.loadprof.models"
+_models = types.ModuleType(_MODULE)
+sys.modules.setdefault(_MODULE, _models)
+
+
+class LPAuthor(Model):
+    __module__ = _MODULE
+    __tablename__ = "lp_authors"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=50)
+
+
+_models.LPAuthor = LPAuthor
+
+
+class LPPost(Model):
+    __module__ = _MODULE
+    __tablename__ = "lp_posts"
+    __load_profiles__ = {
+        "list": LoadProfile(joined=["author"], others="raise"),
+        "detail": LoadProfile(joined=["author"], selectin=["comments"]),
+    }
+
+    id: Mapped[int] = Field.pk()
+    title: Mapped[str] = Field.string(max_length=100)
+    author_id: Mapped[int] = Rel.foreign_key("lp_authors.id")
+    author: Mapped[LPAuthor] = Rel.many_to_one("loadprof.LPAuthor")
+    comments: Mapped[list["LPComment"]] = Rel.one_to_many(
+        "loadprof.LPComment", foreign_keys=["post_id"], back_populates="post",
+    )
+
+
+_models.LPPost = LPPost
+
+
+class LPComment(Model):
+    __module__ = _MODULE
+    __tablename__ = "lp_comments"
+
+    id: Mapped[int] = Field.pk()
+    body: Mapped[str] = Field.string(max_length=100)
+    post_id: Mapped[int] = Rel.foreign_key("lp_posts.id")
+    post: Mapped[LPPost] = Rel.many_to_one(
+        "loadprof.LPPost", foreign_keys=["post_id"], back_populates="comments",
+    )
+
+
+_models.LPComment = LPComment
+
+
+class LPDeferredPost(Model):
+    __module__ = _MODULE
+    __tablename__ = "lp_deferred_posts"
+    __relationship_loading__ = "deferred"
+
+    id: Mapped[int] = Field.pk()
+    author_id: Mapped[int] = Rel.foreign_key("lp_authors.id")
+    author: Mapped[LPAuthor] = Rel.many_to_one("loadprof.LPAuthor")
+    post_id: Mapped[int] = Rel.foreign_key("lp_posts.id")
+    post: Mapped[LPPost] = Rel.many_to_one("loadprof.LPPost", foreign_keys=["post_id"])
+    comment_id: Mapped[int] = Rel.foreign_key("lp_comments.id")
+    comment: Mapped[LPComment] = Rel.many_to_one("loadprof.LPComment", lazy="joined")
+
+
+_TABLES = [LPAuthor.__table__, LPPost.__table__, LPComment.__table__]
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'profiles.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Model.metadata.create_all(c, tables=_TABLES))
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        author = LPAuthor(name="ana")
+        db.add(author)
+        await db.flush()
+        for i in range(3):
+            post = LPPost(title=f"p{i}", author_id=author.id)
+            db.add(post)
+            await db.flush()
+            db.add_all([LPComment(body="c", post_id=post.id) for _ in range(2)])
+        await db.commit()
+        db.expunge_all()
+
+        statements: list[str] = []
+        event.listen(
+            engine.sync_engine, "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        db.info["statements"] = statements
+        yield db
+    await engine.dispose()
+
+
+def _selects(db) -> int:
+    return sum(1 for sql in db.info["statements"] if sql.lstrip().upper().startswith("SELECT"))
+
+
+class TestRelationshipLoadingPolicy:
+    def test_default_is_selectin(self):
+        assert LPPost.author.property.lazy == "selectin"
+
+    def test_model_policy_applies_to_direct_and_descriptor_relationships(self):
+        assert LPDeferredPost.author.property.lazy == "select"
+        assert LPDeferredPost.post.property.lazy == "select"
+
+    def test_explicit_lazy_is_kept(self):
+        assert LPDeferredPost.comment.property.lazy == "joined"
+
+    def test_invalid_policy_raises(self):
+        from strider.relations import apply_relationship_loading
+
+        with pytest.raises(ValueError):
+            apply_relationship_loading({}, "eager")
+
+    def test_settings_policy_is_resolved_at_mapper_configuration(self, monkeypatch):
+        import strider.config
+        from sqlalchemy import inspect
+
+        from strider.relations import _resolve_default_lazy
+
+        def unavailable():
+            raise AssertionError("settings lidos na definição da classe")
+
+        monkeypatch.setattr(strider.config, "get_settings", unavailable)
+
+        class LPLatePost(Model):
+            __module__ = _MODULE
+            __tablename__ = "lp_late_posts"
+
+            id: Mapped[int] = Field.pk()
+            author_id: Mapped[int] = Rel.foreign_key("lp_authors.id")
+            author: Mapped[LPAuthor] = Rel.many_to_one("loadprof.LPAuthor")
+            post_id: Mapped[int] = Rel.foreign_key("lp_posts.id")
+            post: Mapped[LPPost] = Rel.many_to_one("loadprof.LPPost", foreign_keys=["post_id"])
+
+        settings = types.SimpleNamespace(relationship_loading="raise")
+        monkeypatch.setattr(strider.config, "get_settings", lambda: settings)
+        _resolve_default_lazy(inspect(LPLatePost), LPLatePost)
+
+        assert LPLatePost.author.property.lazy == "raise_on_sql"
+        assert LPLatePost.post.property.lazy == "raise_on_sql"
+
+    def test_missing_settings_fall_back_to_selectin(self, monkeypatch):
+        import strider.config
+
+        from strider.relations import _default_lazy
+
+        def missing():
+            raise RuntimeError("No settings module found.")
+
+        monkeypatch.setattr(strider.config, "get_settings", missing)
+
+        assert _default_lazy() == "selectin"
+
+    def test_broken_settings_are_not_swallowed(self, monkeypatch):
+        import strider.config
+
+        from strider.relations import _default_lazy
+
+        def broken():
+            raise ValueError("invalid DATABASE_URL")
+
+        monkeypatch.setattr(strider.config, "get_settings", broken)
+
+        with pytest.raises(ValueError, match="DATABASE_URL"):
+            _default_lazy()
+
+
+class TestQuerySetLoadProfiles:
+    async def test_default_loads_fan_out(self, session):
+        await LPPost.objects.using(session).all()
+
+        # posts + selectin(author) + selectin(comments)
+        assert _selects(session) == 3
+
+    async def test_profile_limits_loads_to_one_round_trip(self, session):
+        posts = await LPPost.objects.using(session).load_profile("list").all()
+
+        assert _selects(session) == 1
+        assert posts[0].author.name == "ana"
+        with pytest.raises(InvalidRequestError):
+            posts[0].comments
+
+    async def test_profile_with_collections(self, session):
+        posts = await LPPost.objects.using(session).load_profile("detail").all()
+
+        assert len(posts) == 3
+        assert all(len(p.comments) == 2 for p in posts)
+        assert _selects(session) == 2
+
+    async def test_inline_profile_and_nested_paths(self, session):
+        comments = await LPComment.objects.using(session).load_profile(
+            LoadProfile(joined=["post__author"], others="raise")
+        ).all()
+
+        assert comments[0].post.author.name == "ana"
+        assert _selects(session) == 1
+
+    async def test_select_related_is_applied(self, session):
+        qs = LPPost.objects.using(session).select_related("author").load_profile(LoadProfile(others="raise"))
+
+        posts = await qs.all()
+
+        assert posts[0].author.name == "ana"
+        assert _selects(session) == 1
+
+    def test_unknown_profile_raises(self):
+        with pytest.raises(ValueError, match="load profile"):
+            LPPost.objects.load_profile("missing")
+
+    def test_invalid_relationship_path_raises(self):
+        qs = LPPost.objects.load_profile(LoadProfile(joined=["title"]))
+
+        with pytest.raises(ValueError, match="não é um relacionamento"):
+            qs._build_query()
+
+
+class TestStrictLoading:
+    async def test_implicit_load_raises(self, session):
+        with strict_loading():
+            posts = await LPPost.objects.using(session).all()
+
+        assert _selects(session) == 1
+        with pytest.raises(InvalidRequestError):
+            posts[0].author
+
+    async def test_requested_relationships_still_load(self, session):
+        with strict_loading():
+            posts = await LPPost.objects.using(session).load_profile("detail").all()
+
+        assert posts[0].author.name == "ana"
+        assert len(posts[0].comments) == 2
+
+    async def test_strict_applies_below_requested_paths(self, session):
+        with strict_loading():
+            comments = await LPComment.objects.using(session).select_related("post").all()
+
+        assert comments[0].post.title.startswith("p")
+        with pytest.raises(InvalidRequestError):
+            comments[0].post.comments
+
+
+class TestViewSetLoadProfiles:
+    def test_profile_follows_action(self):
+        class PostViewSet(ViewSet):
+            model = LPPost
+            load_profiles = {"list": "list"}
+
+        view = PostViewSet()
+        qs = view.get_queryset(None)
+
+        assert view.apply_load_profile(qs)._load_profile is None
+        view.action = "list"
+        assert view.apply_load_profile(qs)._load_profile is LPPost.__load_profiles__["list"]
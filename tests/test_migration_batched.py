@@ -0,0 +1,133 @@
+"""
+Testes das operações de dados em lotes (RunBatched / BackfillColumn).
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from strider.migrations import BackfillColumn, MigrationEngine, RunBatched
+from strider.migrations.operations import CHECKPOINTS_TABLE
+
+
+MIGRATION = '''
+from strider.migrations import Migration, BackfillColumn
+
+migration = Migration(
+    name="0001_backfill",
+    operations=[
+        BackfillColumn(table_name="orders", column_name="channel", value="web", batch_size=3),
+    ],
+)
+'''
+
+
+async def _create_orders(conn, rows: int = 10) -> None:
+    await conn.execute(text(
+        'CREATE TABLE "orders" (id INTEGER PRIMARY KEY, price INTEGER, qty INTEGER, '
+        'total INTEGER, channel VARCHAR(10))'
+    ))
+    for i in range(1, rows + 1):
+        await conn.execute(
+            text('INSERT INTO "orders" (id, price, qty) VALUES (:id, :price, 2)'),
+            {"id": i, "price": i * 10},
+        )
+    await conn.commit()
+
+
+@pytest.fixture
+async def conn(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'batched.db'}")
+    async with engine.connect() as connection:
+        await _create_orders(connection)
+        yield connection
+    await engine.dispose()
+
+
+async def _checkpoints(conn) -> list:
+    result = await conn.execute(text(f'SELECT op_key, last_pk, rows_done FROM "{CHECKPOINTS_TABLE}"'))
+    return result.fetchall()
+
+
+class TestBackfillColumn:
+    async def test_backfills_value_in_chunks(self, conn):
+        op = BackfillColumn(table_name="orders", column_name="channel", value="web", batch_size=3)
+
+        await op.forward(conn, "sqlite")
+
+        values = (await conn.execute(text('SELECT DISTINCT channel FROM "orders"'))).scalars().all()
+        assert values == ["web"]
+        assert await _checkpoints(conn) == []
+
+    async def test_backfills_expression(self, conn):
+        op = BackfillColumn(table_name="orders", column_name="total", expression='"price" * "qty"', batch_size=4)
+
+        await op.forward(conn, "sqlite")
+
+        totals = (await conn.execute(text('SELECT total FROM "orders" ORDER BY id'))).scalars().all()
+        assert totals == [i * 20 for i in range(1, 11)]
+
+    def test_requires_column_name(self):
+        with pytest.raises(ValueError):
+            BackfillColumn(table_name="orders", value=1)
+
+
+class TestRunBatched:
+    def test_requires_exactly_one_forward(self):
+        with pytest.raises(ValueError):
+            RunBatched(table_name="orders")
+
+    async def test_sql_receives_chunk_bounds(self, conn):
+        op = RunBatched(
+            table_name="orders",
+            forward_sql='UPDATE "orders" SET total = price WHERE id BETWEEN :start AND :end',
+            batch_size=4,
+        )
+
+        await op.forward(conn, "sqlite")
+
+        assert (await conn.execute(text('SELECT COUNT(*) FROM "orders" WHERE total = price'))).scalar() == 10
+
+    async def test_resumes_from_checkpoint(self, conn):
+        chunks = []
+        fail_at = {4}
+
+        async def touch(connection, start, end):
+            if start in fail_at:
+                fail_at.clear()
+                raise RuntimeError("interrupted")
+            chunks.append((start, end))
+            return end - start + 1
+
+        op = RunBatched(table_name="orders", forward_func=touch, batch_size=3, description="touch")
+
+        with pytest.raises(RuntimeError):
+            await op.forward(conn, "sqlite")
+        assert chunks == [(1, 3)]
+        [(_, last_pk, rows_done)] = await _checkpoints(conn)
+        assert (last_pk, rows_done) == ("3", 3)
+
+        await op.forward(conn, "sqlite")
+
+        assert chunks == [(1, 3), (4, 6), (7, 9), (10, 10)]
+        assert await _checkpoints(conn) == []
+
+
+class TestEngineRunsBatchedOperations:
+    async def test_migrate_commits_per_chunk(self, tmp_path):
+        migrations_dir = tmp_path / "migrations"
+        migrations_dir.mkdir()
+        (migrations_dir / "0001_backfill.py").write_text(MIGRATION)
+        url = f"sqlite+aiosqlite:///{tmp_path / 'engine.db'}"
+
+        engine = MigrationEngine(url, migrations_dir=migrations_dir)
+        async with engine._engine.connect() as conn:
+            await _create_orders(conn)
+
+        applied = await engine.migrate(check=False, interactive=False)
+
+        assert applied == ["0001_backfill"]
+        async with engine._engine.connect() as conn:
+            nulls = (await conn.execute(text('SELECT COUNT(*) FROM "orders" WHERE channel IS NULL'))).scalar()
+        await engine._engine.dispose()
+        assert nulls == 0
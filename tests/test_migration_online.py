@@ -0,0 +1,237 @@
+"""
+Testes das operações de migração online (baixo lock) para tabelas grandes.
+"""
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from strider.migrations import (
+    AddColumnOnline,
+    CreateIndex,
+    CreateIndexOnline,
+    MigrationAnalyzer,
+    MigrationEngine,
+    IssueCode,
+)
+from strider.migrations.dialects import get_compiler
+from strider.migrations.operations import ColumnDef
+
+
+INITIAL = '''
+from strider.migrations import Migration, CreateTable
+from strider.migrations.operations import ColumnDef
+
+migration = Migration(
+    operations=[
+        CreateTable(
+            table_name="items",
+            columns=[
+                ColumnDef(name="id", type="INTEGER", primary_key=True, autoincrement=True),
+                ColumnDef(name="sku", type="VARCHAR(32)", nullable=True),
+            ],
+        ),
+    ],
+)
+'''
+
+# Operações online primeiro; as atômicas rodam depois, com o registro
+MIGRATION = '''
+from strider.migrations import Migration, CreateIndex, CreateIndexOnline, AddColumnOnline
+from strider.migrations.operations import ColumnDef
+
+migration = Migration(
+    operations=[
+        CreateIndexOnline(table_name="items", index_name="ix_items_sku", columns=["sku"]),
+        AddColumnOnline(
+            table_name="items",
+            column=ColumnDef(name="stock", type="INTEGER", nullable=False, default=0),
+        ),
+        CreateIndex(table_name="items", index_name="ix_items_stock", columns=["stock"]),
+    ],
+)
+'''
+
+MISPLACED = '''
+from strider.migrations import Migration, CreateIndex, CreateIndexOnline
+
+migration = Migration(
+    operations=[
+        CreateIndex(table_name="items", index_name="ix_items_id_sku", columns=["id", "sku"]),
+        CreateIndexOnline(table_name="items", index_name="ix_items_sku", columns=["sku"]),
+    ],
+)
+'''
+
+
+@pytest.fixture
+async def conn(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'online.db'}")
+    async with engine.connect() as connection:
+        await connection.execute(text('CREATE TABLE "items" (id INTEGER PRIMARY KEY, qty INTEGER)'))
+        await connection.execute(text(
+            'INSERT INTO "items" (id, qty) VALUES (1, NULL), (2, 5), (3, NULL), (4, NULL), (5, NULL)'
+        ))
+        await connection.commit()
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        yield connection
+    await engine.dispose()
+
+
+class TestOnlineDialectSQL:
+    def test_postgresql_index_is_concurrent(self):
+        sql = get_compiler("postgresql").create_index_online_sql("items", "ix_items_sku", ["sku"], unique=True)
+        assert sql.startswith('CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "ix_items_sku"')
+
+    def test_postgresql_not_null_validates_check_first(self):
+        steps = get_compiler("postgresql").set_nullable_online_sql("items", "stock", "INTEGER", False)
+        assert any("NOT VALID" in s for s in steps)
+        assert steps.index(next(s for s in steps if "VALIDATE" in s)) < steps.index(
+            next(s for s in steps if "SET NOT NULL" in s)
+        )
+
+    def test_postgresql_lock_timeout(self):
+        compiler = get_compiler("postgresql")
+        assert compiler.lock_timeout_sql(2000) == "SET lock_timeout = '2000ms'"
+        assert compiler.lock_timeout_sql(None) == "RESET lock_timeout"
+
+    def test_mysql_uses_inplace_no_lock(self):
+        compiler = get_compiler("mysql")
+        assert compiler.create_index_online_sql("items", "ix", ["sku"]).endswith("ALGORITHM=INPLACE, LOCK=NONE")
+        assert compiler.add_column_online_sql("items", "`a` INT").endswith("ALGORITHM=INPLACE, LOCK=NONE")
+        assert compiler.lock_timeout_sql(1500) == "SET SESSION lock_wait_timeout = 2"
+
+
+class TestBackfill:
+    async def test_backfills_nulls_in_batches(self, conn):
+        op = AddColumnOnline("items", ColumnDef(name="qty", type="INTEGER", default=0))
+        compiler = get_compiler("sqlite")
+
+        filled = await op._backfill(conn, compiler, "items", "qty", 0, pk="id", batch_size=2, throttle=0)
+
+        assert filled == 4
+        rows = (await conn.execute(text('SELECT qty FROM "items" ORDER BY id'))).scalars().all()
+        assert rows == [0, 5, 0, 0, 0]
+
+    async def test_retries_on_lock_timeout(self):
+        op = CreateIndexOnline("items", "ix", ["sku"], max_retries=3, retry_backoff=0)
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("database is locked")
+            return "ok"
+
+        assert await op._retry(get_compiler("sqlite"), flaky) == "ok"
+        assert len(calls) == 3
+
+    async def test_gives_up_on_other_errors(self):
+        op = CreateIndexOnline("items", "ix", ["sku"], retry_backoff=0)
+
+        async def broken():
+            raise RuntimeError("syntax error")
+
+        with pytest.raises(RuntimeError):
+            await op._retry(get_compiler("sqlite"), broken)
+
+
+async def _reflect(engine: MigrationEngine) -> tuple[set[str], set[str]]:
+    async with engine._engine.connect() as conn:
+        def reflect(sync_conn):
+            insp = inspect(sync_conn)
+            return (
+                {c["name"] for c in insp.get_columns("items")},
+                {i["name"] for i in insp.get_indexes("items")},
+            )
+        return await conn.run_sync(reflect)
+
+
+@pytest.fixture
+def migrations(tmp_path):
+    """Engine sobre um diretório com a migração inicial e as informadas."""
+    engines: list[MigrationEngine] = []
+
+    def make(**files: str) -> MigrationEngine:
+        migrations_dir = tmp_path / "migrations"
+        migrations_dir.mkdir()
+        (migrations_dir / "0001_initial.py").write_text(INITIAL)
+        for name, code in files.items():
+            (migrations_dir / f"{name}.py").write_text(code)
+        engines.append(MigrationEngine(f"sqlite+aiosqlite:///{tmp_path / 'engine.db'}", migrations_dir=migrations_dir))
+        return engines[-1]
+
+    yield make
+
+
+class TestEngineRunsOnlineOperations:
+    async def test_migrate_applies_online_operations(self, migrations):
+        engine = migrations(**{"0002_online": MIGRATION})
+        applied = await engine.migrate(check=False, interactive=False)
+
+        assert applied == ["0001_initial", "0002_online"]
+        columns, indexes = await _reflect(engine)
+        await engine._engine.dispose()
+
+        assert "stock" in columns
+        assert {"ix_items_sku", "ix_items_stock"} <= indexes
+
+    async def test_rollback_unmarks_with_the_atomic_operations(self, migrations):
+        engine = migrations(**{"0002_online": MIGRATION})
+        await engine.migrate(check=False, interactive=False)
+
+        assert await engine.rollback() == ["0002_online"]
+
+        columns, indexes = await _reflect(engine)
+        async with engine._engine.connect() as conn:
+            applied = await engine._get_applied_migrations(conn)
+        await engine._engine.dispose()
+
+        assert "stock" not in columns
+        assert not {"ix_items_sku", "ix_items_stock"} & indexes
+        assert [name for _, name in applied] == ["0001_initial"]
+
+    async def test_online_operation_after_atomic_is_refused(self, migrations):
+        engine = migrations(**{"0002_misplaced": MISPLACED})
+
+        with pytest.raises(RuntimeError, match="must come before atomic"):
+            await engine.migrate(check=False, interactive=False)
+
+        # Nada da migração foi executado nem registrado
+        _, indexes = await _reflect(engine)
+        async with engine._engine.connect() as conn:
+            applied = await engine._get_applied_migrations(conn)
+        await engine._engine.dispose()
+
+        assert not {"ix_items_id_sku", "ix_items_sku"} & indexes
+        assert [name for _, name in applied] == ["0001_initial"]
+
+
+class TestAnalyzerRecommendsOnline:
+    async def test_large_table_index_recommends_online(self, conn):
+        analyzer = MigrationAnalyzer(dialect="postgresql")
+        analyzer._row_counts["items"] = 5_000_000
+
+        result = await analyzer.analyze([CreateIndex("items", "ix_items_qty", ["qty"])], conn)
+
+        issue = next(i for i in result.issues if i.code == IssueCode.ONLINE_OPERATION_RECOMMENDED)
+        assert "CreateIndexOnline" in issue.auto_fix
+
+    async def test_online_operation_is_not_flagged(self, conn):
+        analyzer = MigrationAnalyzer(dialect="postgresql")
+        analyzer._row_counts["items"] = 5_000_000
+
+        result = await analyzer.analyze([CreateIndexOnline("items", "ix_items_qty", ["qty"])], conn)
+
+        assert not any(i.code == IssueCode.ONLINE_OPERATION_RECOMMENDED for i in result.issues)
+
+    async def test_online_operation_after_atomic_is_an_error(self, conn):
+        analyzer = MigrationAnalyzer(dialect="postgresql")
+
+        result = await analyzer.analyze(
+            [CreateIndex("items", "ix_items_qty", ["qty"]), CreateIndexOnline("items", "ix_items_id", ["id"])],
+            conn,
+        )
+
+        issue = next(i for i in result.issues if i.code == IssueCode.NON_ATOMIC_AFTER_ATOMIC)
+        assert issue.operation_index == 1
@@ -0,0 +1,79 @@
+"""
+Testes da reflexão do schema e da coleta de informações do analisador.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from strider.migrations.analyzer import MigrationAnalyzer
+from strider.migrations.operations import AddColumn, ColumnDef, CreateTable
+from strider.migrations.state import get_database_schema_state
+
+
+@pytest.fixture
+async def conn(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'state.db'}")
+    async with engine.connect() as connection:
+        await connection.execute(text(
+            'CREATE TABLE "authors" (id INTEGER PRIMARY KEY, name VARCHAR(50) NOT NULL)'
+        ))
+        await connection.execute(text(
+            'CREATE TABLE "books" ('
+            'id INTEGER PRIMARY KEY, '
+            'author_id INTEGER REFERENCES "authors"(id), '
+            'title TEXT)'
+        ))
+        await connection.execute(text('CREATE INDEX "ix_books_title" ON "books" (title)'))
+        await connection.execute(text('CREATE TABLE "_core_migrations" (id INTEGER)'))
+        await connection.execute(text('INSERT INTO "authors" (name) VALUES (\'a\'), (\'b\')'))
+        await connection.commit()
+        yield connection
+    await engine.dispose()
+
+
+class TestDatabaseSchemaState:
+    async def test_reflects_columns_fks_and_indexes(self, conn):
+        state = await get_database_schema_state(conn)
+
+        assert set(state.tables) == {"authors", "books"}
+
+        authors = state.tables["authors"]
+        assert authors.columns["id"].primary_key
+        assert not authors.columns["name"].nullable
+
+        books = state.tables["books"]
+        assert [(fk.column, fk.references_table, fk.references_column) for fk in books.foreign_keys] == [
+            ("author_id", "authors", "id"),
+        ]
+        assert [(idx.name, idx.columns) for idx in books.indexes] == [
+            ("ix_books_title", ["title"]),
+        ]
+
+
+class TestAnalyzerDatabaseInfo:
+    async def test_counts_only_touched_tables(self, conn):
+        analyzer = MigrationAnalyzer(dialect="sqlite")
+        ops = [AddColumn(table_name="authors", column=ColumnDef(name="bio", type="TEXT", nullable=True))]
+
+        result = await analyzer.analyze(ops, conn)
+
+        assert result.table_row_counts == {"authors": 2}
+
+    async def test_new_tables_are_not_counted(self, conn):
+        analyzer = MigrationAnalyzer(dialect="sqlite")
+        ops = [CreateTable(table_name="publishers", columns=[ColumnDef(name="id", type="INTEGER", primary_key=True)])]
+
+        result = await analyzer.analyze(ops, conn)
+
+        assert result.table_row_counts == {}
+
+    async def test_counts_are_cached_between_migrations(self, conn):
+        analyzer = MigrationAnalyzer(dialect="sqlite")
+        ops = [AddColumn(table_name="authors", column=ColumnDef(name="bio", type="TEXT", nullable=True))]
+
+        await analyzer.analyze(ops, conn)
+        await conn.execute(text('INSERT INTO "authors" (name) VALUES (\'c\')'))
+        result = await analyzer.analyze(ops, conn, migration_name="0002")
+
+        assert result.table_row_counts == {"authors": 2}
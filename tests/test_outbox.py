@@ -0,0 +1,197 @@
+"""
+Testes do outbox transacional: mensagens gravadas na transação do model,
+relay em lotes ordenados por tópico com send_batch e marcação de entrega.
+"""
+
+import json
+
+import pytest
+from sqlalchemy import Text, select
+
+import strider.models
+from strider.admin.models import OutboxMessage
+from strider.config import configure, get_settings, is_configured, reset_settings
+from strider.messaging.outbox import OutboxRelay, enqueue, enqueue_event, run_outbox_relay
+from strider.testing import MockKafka
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    configured = is_configured()
+    if not configured:
+        configure()
+    yield
+    if not configured:
+        reset_settings()
+
+
+class Broker(MockKafka):
+    """MockKafka que registra as chamadas e pode falhar por tópico."""
+
+    def __init__(self, down: set[str] = frozenset()) -> None:
+        super().__init__()
+        self.down = set(down)
+        self.calls: list[tuple[str, str, int]] = []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(self, topic, value, key=None, headers=None):
+        if topic in self.down:
+            raise ConnectionError("broker down")
+        self.calls.append(("send", topic, 1))
+        await super().send(topic, value, key=key, headers=headers)
+
+    async def send_batch(self, topic, messages):
+        if topic in self.down:
+            raise ConnectionError("broker down")
+        self.calls.append(("send_batch", topic, len(messages)))
+        for message in messages:
+            await super().send(topic, message)
+
+    async def send_batch_with_headers(self, topic, records):
+        if topic in self.down:
+            raise ConnectionError("broker down")
+        self.calls.append(("send_batch_with_headers", topic, len(records)))
+        for message, key, headers in records:
+            await super().send(topic, message, key=key, headers=headers)
+        return len(records)
+
+
+async def _rows(session) -> list[OutboxMessage]:
+    session.expire_all()
+    return list((await session.execute(select(OutboxMessage).order_by(OutboxMessage.id))).scalars())
+
+
+class TestEnqueue:
+    async def test_rolled_back_with_the_transaction(self, db_session):
+        enqueue(db_session, "orders", {"n": 1})
+        await db_session.rollback()
+
+        assert await _rows(db_session) == []
+
+    async def test_committed_with_the_transaction(self, db_session):
+        enqueue(db_session, "orders", {"n": 1}, key="c-1")
+        await db_session.commit()
+
+        [row] = await _rows(db_session)
+        assert (row.topic, row.key, json.loads(row.payload_json)) == ("orders", "c-1", {"n": 1})
+        assert row.delivered_at is None
+
+    async def test_event_envelope(self, db_session):
+        enqueue_event(db_session, "order.created", {"id": 7}, topic="orders", source="shop")
+        await db_session.commit()
+
+        [row] = await _rows(db_session)
+        payload, headers = json.loads(row.payload_json), json.loads(row.headers_json)
+        assert (payload["name"], payload["data"], payload["source"]) == ("order.created", {"id": 7}, "shop")
+        assert headers["event_id"] == payload["id"]
+
+    async def test_large_headers_fit(self, db_session):
+        enqueue(db_session, "orders", {"n": 1}, headers={"trace": "x" * 5000})
+        await db_session.commit()
+
+        [row] = await _rows(db_session)
+        assert isinstance(OutboxMessage.__table__.c.headers_json.type, Text)
+        assert len(json.loads(row.headers_json)["trace"]) == 5000
+
+
+class TestRelay:
+    async def test_batches_per_topic_in_order(self, db_session):
+        for n in range(3):
+            enqueue(db_session, "orders", {"n": n})
+        enqueue(db_session, "audit", {"n": 9})
+        await db_session.commit()
+        broker = Broker()
+
+        assert await OutboxRelay(broker, batch_size=10).relay_once() == 4
+
+        assert broker.calls == [("send_batch", "orders", 3), ("send_batch", "audit", 1)]
+        assert [m.value["n"] for m in broker.get_messages("orders")] == [0, 1, 2]
+        assert all(row.delivered_at is not None for row in await _rows(db_session))
+
+    async def test_keyed_messages_keep_their_position(self, db_session):
+        enqueue(db_session, "orders", {"n": 0})
+        enqueue(db_session, "orders", {"n": 1}, key="c-1")
+        enqueue(db_session, "orders", {"n": 2})
+        await db_session.commit()
+        broker = Broker()
+
+        await OutboxRelay(broker).relay_once()
+
+        assert [call[0] for call in broker.calls] == ["send_batch", "send_batch_with_headers", "send_batch"]
+        assert [(m.value["n"], m.key) for m in broker.get_messages("orders")] == [(0, None), (1, "c-1"), (2, None)]
+
+    async def test_events_are_sent_in_one_batch(self, db_session):
+        for n in range(3):
+            enqueue_event(db_session, "order.created", {"n": n}, topic="orders")
+        await db_session.commit()
+        broker = Broker()
+
+        assert await OutboxRelay(broker).relay_once() == 3
+
+        assert broker.calls == [("send_batch_with_headers", "orders", 3)]
+        sent = broker.get_messages("orders")
+        assert [m.value["data"]["n"] for m in sent] == [0, 1, 2]
+        assert all(m.headers["event_id"] == m.value["id"] for m in sent)
+
+    async def test_reads_in_batches(self, db_session):
+        for n in range(5):
+            enqueue(db_session, "orders", {"n": n})
+        await db_session.commit()
+        broker = Broker()
+        relay = OutboxRelay(broker, batch_size=2)
+
+        assert [await relay.relay_once() for _ in range(4)] == [2, 2, 1, 0]
+        assert [m.value["n"] for m in broker.get_messages("orders")] == [0, 1, 2, 3, 4]
+
+    async def test_failed_topic_stays_pending(self, db_session):
+        enqueue(db_session, "orders", {"n": 1})
+        enqueue(db_session, "audit", {"n": 2})
+        await db_session.commit()
+
+        relay = OutboxRelay(Broker(down={"orders"}), max_attempts=2)
+        assert await relay.relay_once() == 1
+
+        orders, audit = await _rows(db_session)
+        assert (orders.delivered_at, orders.attempts, orders.last_error) == (None, 1, "broker down")
+        assert audit.delivered_at is not None
+        assert relay.metrics() == {"outbox_relayed": 1, "outbox_failed": 1, "outbox_batches": 1}
+
+        # Esgotadas as tentativas, a linha fica parada para inspeção
+        await relay.relay_once()
+        assert await relay.relay_once() == 0
+        assert (await _rows(db_session))[0].attempts == 2
+
+    async def test_redelivery_after_broker_recovers(self, db_session):
+        enqueue(db_session, "orders", {"n": 1})
+        await db_session.commit()
+        broker = Broker(down={"orders"})
+        relay = OutboxRelay(broker)
+
+        await relay.relay_once()
+        broker.down.clear()
+
+        assert await relay.relay_once() == 1
+        assert [m.value for m in broker.get_messages("orders")] == [{"n": 1}]
+
+
+class TestRunOutboxRelay:
+    async def test_initializes_the_database_first(self, monkeypatch):
+        calls = []
+
+        async def init_database(url):
+            calls.append(("init_database", url))
+
+        async def run(self):
+            calls.append(("run", None))
+
+        monkeypatch.setattr(strider.models, "init_database", init_database)
+        monkeypatch.setattr(OutboxRelay, "run", run)
+
+        await run_outbox_relay()
+
+        assert calls == [("init_database", get_settings().database_url), ("run", None)]
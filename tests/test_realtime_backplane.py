@@ -0,0 +1,250 @@
+"""
+Testes do backplane realtime (Channel nomeado entre processos) e dos heartbeats SSE.
+"""
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from strider.realtime import (
+    Channel,
+    MemoryBackplane,
+    RedisBackplane,
+    SSEView,
+    _with_heartbeats,
+    sse_response,
+)
+from strider.testing import MockRedis
+from strider.testing.mocks import MockPubSub
+
+
+async def _drain(queue: asyncio.Queue, count: int) -> list:
+    return [await asyncio.wait_for(queue.get(), 1) for _ in range(count)]
+
+
+class FlakyPubSub(MockPubSub):
+    """Pub/sub cuja conexão cai quando ``broken`` é setado."""
+
+    def __init__(self, redis: MockRedis) -> None:
+        super().__init__(redis)
+        self.broken = False
+
+    async def subscribe(self, *channels: str) -> None:
+        if self.redis.subscribe_failures:
+            self.redis.subscribe_failures -= 1
+            raise ConnectionError("connection refused")
+        await super().subscribe(*channels)
+
+    async def get_message(self, *args, **kwargs):
+        if self.broken:
+            raise ConnectionError("connection reset")
+        return await super().get_message(*args, **kwargs)
+
+
+class FlakyRedis(MockRedis):
+    subscribe_failures = 0
+
+    def pubsub(self) -> FlakyPubSub:
+        pubsub = FlakyPubSub(self)
+        self._pubsubs.append(pubsub)
+        return pubsub
+
+
+class TestLocalChannel:
+    async def test_fanout_to_every_subscriber(self):
+        channel = Channel()
+        first, second = await channel.subscribe_queue(), await channel.subscribe_queue()
+
+        assert await channel.publish({"n": 1}) == 2
+        assert await _drain(first, 1) == [{"n": 1}]
+        assert await _drain(second, 1) == [{"n": 1}]
+
+    async def test_slow_consumer_drops_oldest(self):
+        channel = Channel(maxlen=2)
+        queue = await channel.subscribe_queue()
+
+        for n in range(3):
+            await channel.publish(n)
+
+        assert await _drain(queue, 2) == [1, 2]
+
+    async def test_unsubscribe(self):
+        channel = Channel()
+        queue = await channel.subscribe_queue()
+        await channel.unsubscribe_queue(queue)
+
+        assert channel.subscriber_count == 0
+        assert await channel.publish("x") == 0
+
+
+class TestNamedChannel:
+    async def test_memory_backplane_serializes_once(self):
+        backplane = MemoryBackplane()
+        channel = Channel(name="ticks", backplane=backplane)
+        decoded = await channel.subscribe_queue()
+        raw_a = await channel.subscribe_queue(raw=True)
+        raw_b = await channel.subscribe_queue(raw=True)
+
+        await channel.publish({"price": 1.5})
+
+        assert await _drain(decoded, 1) == [{"price": 1.5}]
+        frame_a, frame_b = (await _drain(raw_a, 1))[0], (await _drain(raw_b, 1))[0]
+        assert frame_a == '{"price":1.5}'
+        assert frame_a is frame_b
+
+    async def test_redis_backplane_reaches_other_processes(self):
+        redis = MockRedis()
+        worker_a = RedisBackplane(client=redis)
+        worker_b = RedisBackplane(client=redis)
+        on_a = Channel(name="room:1", backplane=worker_a)
+        on_b = Channel(name="room:1", backplane=worker_b)
+        queue_a, queue_b = await on_a.subscribe_queue(), await on_b.subscribe_queue()
+
+        assert await on_a.publish({"msg": "hi"}) == 2
+
+        assert await _drain(queue_a, 1) == [{"msg": "hi"}]
+        assert await _drain(queue_b, 1) == [{"msg": "hi"}]
+        await worker_a.close()
+        await worker_b.close()
+
+    async def test_last_unsubscribe_detaches_topic(self):
+        redis = MockRedis()
+        backplane = RedisBackplane(client=redis, prefix="rt:")
+        channel = Channel(name="alerts", backplane=backplane)
+
+        queue = await channel.subscribe_queue()
+        assert redis._pubsubs[0].channels == {"rt:alerts"}
+
+        await channel.unsubscribe_queue(queue)
+        assert redis._pubsubs[0].channels == set()
+        assert await channel.publish("x") == 0
+        await backplane.close()
+
+    async def test_reader_reconnects_and_resubscribes(self):
+        redis = FlakyRedis()
+        backplane = RedisBackplane(client=redis, prefix="rt:", reconnect_delay=0.01)
+        alerts = Channel(name="alerts", backplane=backplane)
+        prices = Channel(name="prices", backplane=backplane)
+        queue_alerts, queue_prices = await alerts.subscribe_queue(), await prices.subscribe_queue()
+
+        redis._pubsubs[0].broken = True
+        for _ in range(100):
+            if redis._pubsubs and not redis._pubsubs[0].broken:
+                break
+            await asyncio.sleep(0.01)
+
+        assert redis._pubsubs[0].channels == {"rt:alerts", "rt:prices"}
+        await alerts.publish("a")
+        await prices.publish("p")
+        assert await _drain(queue_alerts, 1) == ["a"]
+        assert await _drain(queue_prices, 1) == ["p"]
+        await backplane.close()
+
+    async def test_failed_first_subscribe_is_retried_by_the_reader(self):
+        redis = FlakyRedis()
+        redis.subscribe_failures = 1
+        backplane = RedisBackplane(client=redis, prefix="rt:", reconnect_delay=0.01)
+        channel = Channel(name="alerts", backplane=backplane)
+        first = await channel.subscribe_queue()
+
+        for _ in range(100):
+            if any(p.channels == {"rt:alerts"} for p in redis._pubsubs):
+                break
+            await asyncio.sleep(0.01)
+        second = await channel.subscribe_queue()
+
+        await channel.publish("a")
+        assert await _drain(first, 1) == ["a"]
+        assert await _drain(second, 1) == ["a"]
+        await backplane.close()
+
+    async def test_failed_listen_is_rolled_back(self):
+        class Unavailable(MemoryBackplane):
+            failures = 1
+
+            async def _listen(self, topic):
+                if self.failures:
+                    self.failures -= 1
+                    raise ConnectionError("down")
+
+        backplane = Unavailable()
+        channel = Channel(name="alerts", backplane=backplane)
+        with pytest.raises(ConnectionError):
+            await channel.subscribe_queue()
+        assert channel.subscriber_count == 0 and backplane._handlers == {}
+
+        queue = await channel.subscribe_queue()
+        await channel.publish("a")
+        assert await _drain(queue, 1) == ["a"]
+
+    async def test_subscribe_iterator_cleans_up(self):
+        backplane = MemoryBackplane()
+        channel = Channel(name="iter", backplane=backplane)
+
+        async def consume():
+            async with aclosing(channel.subscribe()) as messages:
+                async for message in messages:
+                    return message
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        await channel.publish("done")
+
+        assert await task == "done"
+        assert channel.subscriber_count == 0
+        assert backplane.dispatch("iter", '"x"') == 0
+
+
+async def _slow_events(delay: float, count: int = 1):
+    for n in range(count):
+        await asyncio.sleep(delay)
+        yield {"event": "tick", "data": {"n": n}}
+
+
+class TestHeartbeats:
+    async def test_idle_stream_yields_heartbeats(self):
+        items = [item async for item in _with_heartbeats(_slow_events(0.05), 0.01)]
+
+        assert items[-1] == {"event": "tick", "data": {"n": 0}}
+        assert items[:-1] and all(item is None for item in items[:-1])
+
+    async def test_disabled_interval_passes_through(self):
+        items = [item async for item in _with_heartbeats(_slow_events(0.01, 2), 0)]
+
+        assert len(items) == 2
+
+    async def test_errors_propagate(self):
+        async def broken():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("boom")
+            yield  # pragma: no cover
+
+        with pytest.raises(RuntimeError):
+            async for _ in _with_heartbeats(broken(), 0.005):
+                pass
+
+    async def test_sse_view_emits_ping_comments(self):
+        class Ticks(SSEView):
+            ping_interval = 0.01
+
+            async def stream(self, request, **params):
+                async for event in _slow_events(0.05):
+                    yield event
+
+        app = FastAPI()
+        app.router.routes.append(Ticks.as_route("/ticks"))
+
+        @app.get("/fn")
+        async def fn():
+            return sse_response(_slow_events(0.05), ping_interval=0.01)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+            body = (await http.get("/ticks")).text
+            fn_body = (await http.get("/fn")).text
+
+        assert ": ping\n\n" in body
+        assert body.rstrip().endswith('data: {"n": 0}')
+        assert ": ping\n\n" in fn_body
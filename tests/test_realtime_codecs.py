@@ -0,0 +1,147 @@
+"""
+Testes dos codecs WebSocket negociados por subprotocolo (JSON/msgpack/CBOR + deflate).
+"""
+
+import json
+import zlib
+
+import pytest
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from strider.realtime import (
+    Channel,
+    DeflateCodec,
+    JSONCodec,
+    MemoryBackplane,
+    WebSocketView,
+    codec_available,
+    get_codec,
+    register_codec,
+)
+
+
+class UpperCodec(JSONCodec):
+    """Codec de teste: JSON em caixa alta, para provar o registro de codecs."""
+
+    name = "upper"
+
+    def encode(self, message):
+        return super().encode(message).upper()
+
+
+register_codec("upper", UpperCodec)
+
+
+class Echo(WebSocketView):
+    codecs = ["upper", "json"]
+    compression = True
+    keepalive = 0
+
+    async def on_receive(self, ws, data):
+        await self.send(ws, {"codec": self.codec.name, "echo": data})
+
+
+def _client() -> TestClient:
+    return TestClient(Starlette(routes=[Echo.as_route("/ws")]))
+
+
+class TestCodecs:
+    def test_json_is_compact(self):
+        assert get_codec("json").encode({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_deflate_roundtrip(self):
+        codec = get_codec("json+deflate")
+
+        frame = codec.encode({"n": 1})
+
+        assert isinstance(codec, DeflateCodec) and codec.binary
+        assert zlib.decompress(frame) == b'{"n":1}'
+        assert codec.decode(frame) == {"n": 1}
+        assert get_codec("json+deflate") is codec
+
+    def test_unknown_codec(self):
+        assert not codec_available("yaml")
+        with pytest.raises(KeyError):
+            get_codec("yaml")
+
+    @pytest.mark.parametrize("name", ["msgpack", "cbor"])
+    def test_binary_codecs_roundtrip(self, name):
+        pytest.importorskip({"msgpack": "msgpack", "cbor": "cbor2"}[name])
+        codec = get_codec(name)
+
+        frame = codec.encode({"price": 1.5, "tags": ["a"]})
+
+        assert codec.binary and isinstance(frame, bytes)
+        assert codec.decode(frame) == {"price": 1.5, "tags": ["a"]}
+
+
+class TestNegotiation:
+    def test_server_preference_wins(self):
+        with _client().websocket_connect("/ws", subprotocols=["json", "upper"]) as ws:
+            assert ws.accepted_subprotocol == "upper"
+            ws.send_text('{"x":1}')
+            assert ws.receive_text() == '{"CODEC":"UPPER","ECHO":{"X":1}}'
+
+    def test_compressed_variant_is_preferred(self):
+        with _client().websocket_connect("/ws", subprotocols=["json", "json+deflate"]) as ws:
+            assert ws.accepted_subprotocol == "json+deflate"
+            ws.send_bytes(zlib.compress(b'"hi"'))
+            reply = json.loads(zlib.decompress(ws.receive_bytes()))
+
+        assert reply == {"codec": "json+deflate", "echo": "hi"}
+
+    def test_no_offer_falls_back_to_first_codec(self):
+        with _client().websocket_connect("/ws") as ws:
+            assert ws.accepted_subprotocol is None
+            ws.send_text("1")
+            assert ws.receive_text() == '{"CODEC":"UPPER","ECHO":1}'
+
+    def test_unsupported_offer_is_rejected(self):
+        with pytest.raises(WebSocketDisconnect) as exc:
+            with _client().websocket_connect("/ws", subprotocols=["wamp"]):
+                pass
+
+        assert exc.value.code == 4006
+
+
+class TestChannelCodecs:
+    async def test_frames_encoded_once_per_codec(self):
+        encoded = []
+
+        class CountingCodec(JSONCodec):
+            name = "counting"
+
+            def encode(self, message):
+                encoded.append(message)
+                return super().encode(message)
+
+        register_codec("counting", CountingCodec)
+        channel = Channel()
+        queues = [await channel.subscribe_queue(codec="counting") for _ in range(3)]
+        decoded = await channel.subscribe_queue()
+
+        await channel.publish({"n": 1})
+
+        frames = [queue.get_nowait() for queue in queues]
+        assert encoded == [{"n": 1}]
+        assert frames[0] == '{"n":1}' and all(frame is frames[0] for frame in frames)
+        assert decoded.get_nowait() == {"n": 1}
+
+    async def test_named_channel_reuses_backplane_frame(self):
+        channel = Channel(name="codec", backplane=MemoryBackplane())
+        plain = await channel.subscribe_queue(codec="json")
+        packed = await channel.subscribe_queue(codec="json+deflate")
+
+        await channel.publish([1, 2])
+
+        assert plain.get_nowait() == "[1,2]"
+        assert zlib.decompress(packed.get_nowait()) == b"[1,2]"
+
+    async def test_unknown_codec_fails_on_subscribe(self):
+        channel = Channel()
+
+        with pytest.raises(KeyError):
+            await channel.subscribe_queue(codec="yaml")
+        assert channel.subscriber_count == 0
@@ -0,0 +1,175 @@
+"""
+Testes do RedisConsumer: XACK em lote, recuperação de pendências via
+XAUTOCLAIM, dead-letter por número de entregas e limpeza de consumers.
+"""
+
+import json
+
+import pytest
+
+from strider.config import configure, is_configured, reset_settings
+from strider.messaging.redis.consumer import RedisConsumer
+from strider.testing import MockRedis
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    configured = is_configured()
+    if not configured:
+        configure()
+    yield
+    if not configured:
+        reset_settings()
+
+
+@pytest.fixture
+async def redis():
+    client = MockRedis()
+    await client.xgroup_create("orders", "billing", id="0", mkstream=True)
+    return client
+
+
+class Recorder:
+    def __init__(self, fail: set[int] = frozenset()) -> None:
+        self.fail = set(fail)
+        self.seen: list[int] = []
+
+    async def __call__(self, message: dict) -> None:
+        self.seen.append(message["n"])
+        if message["n"] in self.fail:
+            raise RuntimeError("handler failed")
+
+
+def _consumer(redis, name: str, handler, **kwargs) -> RedisConsumer:
+    kwargs.setdefault("claim_interval", 0)
+    return RedisConsumer(
+        "billing", ["orders"], message_handler=handler, consumer_name=name, client=redis, **kwargs,
+    )
+
+
+async def _publish(redis, *numbers: int) -> None:
+    for n in numbers:
+        await redis.xadd("orders", {"data": json.dumps({"n": n})})
+
+
+async def _pending(redis) -> dict[str, str]:
+    rows = await redis.xpending_range("orders", "billing", min="-", max="+", count=100)
+    return {row["message_id"]: row["consumer"] for row in rows}
+
+
+class TestBatchAck:
+    async def test_one_pipelined_xack_per_batch(self, redis):
+        pipelines = []
+        make_pipeline = redis.pipeline
+
+        def pipeline(**kwargs):
+            pipelines.append(make_pipeline(**kwargs))
+            return pipelines[-1]
+
+        redis.pipeline = pipeline
+        handler = Recorder()
+        consumer = _consumer(redis, "a", handler)
+        await _publish(redis, 1, 2, 3)
+
+        assert await consumer.poll() == 3
+
+        assert handler.seen == [1, 2, 3]
+        assert await _pending(redis) == {}
+        assert [p.executions for p in pipelines] == [1]
+
+    async def test_failed_entry_stays_pending(self, redis):
+        consumer = _consumer(redis, "a", Recorder(fail={2}))
+        await _publish(redis, 1, 2, 3)
+
+        await consumer.poll()
+
+        assert list((await _pending(redis)).values()) == ["a"]
+
+
+class TestRecovery:
+    async def test_crashed_consumer_entries_are_claimed(self, redis):
+        crashed = _consumer(redis, "crashed", Recorder(fail={1, 2}))
+        await _publish(redis, 1, 2)
+        await crashed.poll()
+
+        handler = Recorder()
+        survivor = _consumer(redis, "survivor", handler, min_idle_ms=0)
+
+        assert await survivor.claim_pending() == 2
+        assert handler.seen == [1, 2]
+        assert await _pending(redis) == {}
+
+    async def test_recent_entries_are_not_claimed(self, redis):
+        crashed = _consumer(redis, "crashed", Recorder(fail={1}))
+        await _publish(redis, 1)
+        await crashed.poll()
+
+        survivor = _consumer(redis, "survivor", Recorder(), min_idle_ms=60_000)
+
+        assert await survivor.claim_pending() == 0
+        assert list((await _pending(redis)).values()) == ["crashed"]
+
+    async def test_poison_message_is_dead_lettered(self, redis):
+        handler = Recorder(fail={7})
+        consumer = _consumer(redis, "a", handler, min_idle_ms=0, max_deliveries=3, dead_letter_stream="orders.dlq")
+        await _publish(redis, 7)
+        await consumer.poll()
+
+        for _ in range(3):
+            await consumer.claim_pending()
+
+        assert handler.seen == [7, 7, 7]
+        assert await _pending(redis) == {}
+        [(_, dead)] = await redis.xrange("orders.dlq")
+        assert json.loads(dead["data"]) == {"n": 7}
+        assert (dead["source_stream"], dead["group"]) == ("orders", "billing")
+
+    async def test_sweep_runs_from_poll_when_due(self, redis):
+        crashed = _consumer(redis, "crashed", Recorder(fail={1}))
+        await _publish(redis, 1)
+        await crashed.poll()
+
+        handler = Recorder()
+        survivor = _consumer(redis, "survivor", handler, min_idle_ms=0, claim_interval=30)
+        await survivor.poll()
+        await survivor.poll()
+
+        assert handler.seen == [1]
+
+
+class TestConsumerNames:
+    async def test_stop_removes_idle_name(self, redis):
+        consumer = _consumer(redis, "a", Recorder())
+        await _publish(redis, 1)
+        await consumer.poll()
+
+        await consumer.stop()
+
+        assert await redis.xinfo_consumers("orders", "billing") == []
+
+    async def test_stop_keeps_name_with_pending_entries(self, redis):
+        consumer = _consumer(redis, "a", Recorder(fail={1}))
+        await _publish(redis, 1)
+        await consumer.poll()
+
+        await consumer.stop()
+
+        assert [c["name"] for c in await redis.xinfo_consumers("orders", "billing")] == ["a"]
+        assert list((await _pending(redis)).values()) == ["a"]
+
+    async def test_sweep_removes_stale_consumers(self, redis):
+        await _consumer(redis, "gone", Recorder()).poll()
+        survivor = _consumer(redis, "survivor", Recorder(), stale_ms=1)
+        redis._stream_groups[("orders", "billing")].consumers["gone"] -= 10
+
+        await survivor.claim_pending()
+
+        names = [c["name"] for c in await redis.xinfo_consumers("orders", "billing")]
+        assert names == ["survivor"]
+
+    def test_default_name_is_unique_per_instance(self):
+        first = RedisConsumer("billing", ["orders"], client=MockRedis())
+        second = RedisConsumer("billing", ["orders"], client=MockRedis())
+
+        assert first.consumer_name.startswith("billing:")
+        assert first.consumer_name != second.consumer_name
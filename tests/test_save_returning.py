@@ -0,0 +1,66 @@
+"""
+Testes do Model.save em um único round-trip (RETURNING em vez de flush + refresh).
+"""
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from strider.datetime import DateTime
+from strider.models import Field, Model
+
+
+class Counter(Model):
+    __tablename__ = "test_save_counters"
+
+    id: Mapped[int] = Field.pk()
+    name: Mapped[str] = Field.string(max_length=20)
+    hits: Mapped[int] = Field.integer(default=0)
+    status: Mapped[str] = mapped_column(server_default=text("'new'"))
+    created_at: Mapped[DateTime] = Field.datetime(auto_now_add=True)
+    updated_at: Mapped[DateTime] = Field.datetime(auto_now=True)
+
+
+@pytest.fixture
+def statements(db_session):
+    captured: list[str] = []
+    engine = db_session.get_bind()
+    listener = lambda *args: captured.append(args[2].lstrip().split()[0].upper())  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    yield captured
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+class TestSaveRoundTrips:
+    async def test_insert_returns_generated_values(self, db_session, statements):
+        counter = await Counter(name="a").save(db_session)
+
+        assert statements == ["INSERT"]
+        assert counter.id == 1
+        assert counter.status == "new"
+        assert counter.hits == 0
+        assert counter.created_at is not None
+
+    async def test_update_skips_refresh(self, db_session, statements):
+        counter = await Counter(name="a").save(db_session)
+        first_update = counter.updated_at
+        statements.clear()
+
+        counter.name = "b"
+        await counter.save(db_session)
+
+        assert statements == ["UPDATE"]
+        assert counter.updated_at >= first_update
+
+    async def test_sql_expression_is_reloaded(self, db_session, statements):
+        counter = await Counter(name="a", hits=1).save(db_session)
+        statements.clear()
+
+        counter.hits = Counter.hits + 1
+        await counter.save(db_session)
+
+        assert counter.hits == 2
+        assert statements == ["UPDATE", "SELECT"]
+
+    def test_eager_defaults_enabled(self):
+        assert Counter.__mapper__.eager_defaults is True
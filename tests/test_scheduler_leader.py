@@ -0,0 +1,318 @@
+"""
+Testes do TaskScheduler: eleição de líder por lease, heap de próximas execuções
+persistido e políticas de catch-up (SQLite + relógio falso).
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import pytest
+
+from strider.admin.models import PeriodicTaskSchedule, SchedulerLease
+from strider.config import configure, is_configured, reset_settings
+from strider.testing import MockKafka
+
+# strider.tasks lê as settings na importação
+_configured = is_configured()
+if not _configured:
+    configure()
+from strider.tasks.base import PeriodicTask  # noqa: E402
+from strider.tasks.leader import DatabaseLeaderElector  # noqa: E402
+from strider.tasks.registry import clear_registry, register_periodic_task  # noqa: E402
+from strider.tasks.scheduler import TaskScheduler  # noqa: E402
+if not _configured:
+    reset_settings()
+
+
+T0 = datetime(2026, 1, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+
+class FakeClock:
+    def __init__(self, now: datetime = T0) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+async def _noop():
+    pass
+
+
+def _periodic(name: str, interval: int, **kwargs) -> PeriodicTask:
+    task = PeriodicTask(_noop, name=name, interval=interval, **kwargs)
+    register_periodic_task(task)
+    return task
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    configured = is_configured()
+    if not configured:
+        configure()
+    clear_registry()
+    yield
+    clear_registry()
+    if not configured:
+        reset_settings()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _scheduler(clock, producer, holder: str | None = None, **kwargs) -> TaskScheduler:
+    elector = DatabaseLeaderElector(holder=holder, ttl=30, clock=clock) if holder else False
+    return TaskScheduler(elector=elector, producer=producer, clock=clock, **kwargs)
+
+
+def _fired(producer: MockKafka) -> list[str]:
+    return [m.value["task_name"] for m in producer.messages]
+
+
+class TestDatabaseLease:
+    async def test_single_holder_until_expiry(self, db_session, clock):
+        a = DatabaseLeaderElector(holder="a", ttl=30, clock=clock)
+        b = DatabaseLeaderElector(holder="b", ttl=30, clock=clock)
+
+        assert await a.acquire() is True
+        assert await b.acquire() is False
+        clock.advance(20)
+        assert await a.acquire() is True  # renovação
+        clock.advance(29)
+        assert await b.acquire() is False
+
+        clock.advance(2)
+        assert await b.acquire() is True
+        assert await a.acquire() is False
+        assert (a.is_leader, b.is_leader) == (False, True)
+        assert b.token == 2
+
+    async def test_release_hands_over_immediately(self, db_session, clock):
+        a = DatabaseLeaderElector(holder="a", ttl=30, clock=clock)
+        b = DatabaseLeaderElector(holder="b", ttl=30, clock=clock)
+        await a.acquire()
+
+        await a.release()
+
+        assert await b.acquire() is True
+        lease = await SchedulerLease.objects.using(db_session).get(name="scheduler")
+        assert lease.holder == "b"
+
+
+class TestHeapScheduling:
+    async def test_fires_only_due_tasks_and_sleeps_until_next(self, db_session, clock):
+        _periodic("fast", 10)
+        _periodic("slow", 100)
+        producer = MockKafka()
+        scheduler = _scheduler(clock, producer)
+
+        assert await scheduler.tick() == 1.0
+        clock.advance(10)
+        await scheduler.tick()
+        clock.advance(10)
+        await scheduler.tick()
+
+        assert _fired(producer) == ["fast", "fast"]
+        assert [when for when, _, _ in scheduler._heap] == sorted(
+            [T0 + timedelta(seconds=30), T0 + timedelta(seconds=100)]
+        )
+
+    async def test_next_runs_are_persisted(self, db_session, clock):
+        _periodic("job", 60)
+        scheduler = _scheduler(clock, MockKafka())
+
+        await scheduler.tick()
+        clock.advance(60)
+        await scheduler.tick()
+
+        db_session.expire_all()
+        row = await PeriodicTaskSchedule.objects.using(db_session).get(task_name="job")
+        assert row.run_count == 1
+        assert row.last_status == "SCHEDULED"
+        assert row.next_run.replace(tzinfo=dt_timezone.utc) == T0 + timedelta(seconds=120)
+
+    async def test_admin_disable_is_respected(self, db_session, clock):
+        _periodic("job", 60)
+        await PeriodicTaskSchedule(task_name="job", interval_seconds=60, is_enabled=False).save(db_session)
+        await db_session.commit()
+        producer = MockKafka()
+        scheduler = _scheduler(clock, producer)
+
+        clock.advance(600)
+        await scheduler.tick()
+
+        assert producer.messages == []
+
+    async def test_admin_reenable_is_picked_up(self, db_session, clock):
+        task = _periodic("job", 60)
+        row = PeriodicTaskSchedule(task_name="job", interval_seconds=60, is_enabled=False)
+        await row.save(db_session)
+        await db_session.commit()
+        producer = MockKafka()
+        scheduler = _scheduler(clock, producer)
+
+        await scheduler.tick()
+        clock.advance(120)
+        await scheduler.tick()
+        assert producer.messages == [] and task.enabled
+
+        row.is_enabled = True
+        await db_session.commit()
+        clock.advance(30)
+        await scheduler.tick()  # relê a flag; o próximo slot conta a partir daqui
+        assert producer.messages == []
+        clock.advance(60)
+        await scheduler.tick()
+        assert _fired(producer) == ["job"]
+
+        row.is_enabled = False
+        await db_session.commit()
+        clock.advance(30)
+        await scheduler.tick()
+        clock.advance(60)
+        await scheduler.tick()
+        assert _fired(producer) == ["job"]
+
+    async def test_code_disabled_task_keeps_admin_flag_enabled(self, db_session, clock):
+        task = _periodic("job", 60, enabled=False)
+        producer = MockKafka()
+        await _scheduler(clock, producer).tick()
+
+        row = await PeriodicTaskSchedule.objects.using(db_session).get(task_name="job")
+        assert row.is_enabled is True
+
+        # Habilitada no próximo deploy: a flag do admin não a segura
+        task.enabled = True
+        scheduler = _scheduler(clock, producer)
+        await scheduler.tick()
+        clock.advance(60)
+        await scheduler.tick()
+        assert _fired(producer) == ["job"]
+
+    async def test_changed_schedule_updates_row_and_next_run(self, db_session, clock):
+        await PeriodicTaskSchedule(
+            task_name="job", interval_seconds=3600, queue="old", next_run=T0 + timedelta(hours=1),
+        ).save(db_session)
+        await db_session.commit()
+        _periodic("job", 60, queue="fast")
+        producer = MockKafka()
+        scheduler = _scheduler(clock, producer)
+
+        await scheduler.tick()
+        clock.advance(60)
+        await scheduler.tick()
+
+        assert _fired(producer) == ["job"]
+        db_session.expire_all()
+        row = await PeriodicTaskSchedule.objects.using(db_session).get(task_name="job")
+        assert (row.interval_seconds, row.queue) == (60, "fast")
+        assert row.next_run.replace(tzinfo=dt_timezone.utc) == T0 + timedelta(seconds=120)
+
+    async def test_send_failure_keeps_slot_pending(self, db_session, clock):
+        class FlakyProducer(MockKafka):
+            fail = True
+
+            async def send(self, *args, **kwargs):
+                if self.fail:
+                    raise ConnectionError("broker down")
+                await super().send(*args, **kwargs)
+
+        _periodic("job", 60)
+        producer = FlakyProducer()
+        scheduler = _scheduler(clock, producer)
+        await scheduler.tick()
+        clock.advance(60)
+
+        await scheduler.tick()
+        producer.fail = False
+        clock.advance(1)
+        await scheduler.tick()
+
+        assert _fired(producer) == ["job"]
+        assert producer.messages[0].headers["scheduled_for"] == (T0 + timedelta(seconds=60)).isoformat()
+
+
+class TestLeaderElection:
+    async def test_standby_does_not_double_fire_and_takes_over(self, db_session, clock):
+        _periodic("job", 60)
+        producer = MockKafka()
+        leader = _scheduler(clock, producer, holder="a")
+        standby = _scheduler(clock, producer, holder="b")
+
+        for _ in range(4):  # t = 0, 20, 40, 60
+            await leader.tick()
+            await standby.tick()
+            clock.advance(20)
+        assert _fired(producer) == ["job"]
+        assert (leader.is_leader, standby.is_leader) == (True, False)
+
+        # líder morre: o standby assume após o TTL e continua do próximo slot persistido
+        clock.advance(40)
+        await standby.tick()
+
+        assert standby.is_leader
+        assert _fired(producer) == ["job", "job"]
+        headers = [m.headers["scheduled_for"] for m in producer.messages]
+        assert headers == [(T0 + timedelta(seconds=s)).isoformat() for s in (60, 120)]
+
+    async def test_stop_releases_lease(self, db_session, clock):
+        leader = _scheduler(clock, MockKafka(), holder="a")
+        standby = _scheduler(clock, MockKafka(), holder="b")
+        await leader.tick()
+
+        leader._running = True
+        await leader.stop()
+        await standby.tick()
+
+        assert standby.is_leader
+
+
+class TestCatchup:
+    @pytest.mark.parametrize(
+        ("policy", "expected"),
+        [("once", [250]), ("all", [100, 150, 200, 250]), ("skip", [])],
+    )
+    def test_missed_runs(self, policy, expected):
+        task = PeriodicTask(_noop, name="job", interval=50, catchup=policy)
+        task.next_run = T0 + timedelta(seconds=100)
+
+        runs, next_run = task.due_runs(T0 + timedelta(seconds=260), grace=1)
+
+        assert runs == [T0 + timedelta(seconds=s) for s in expected]
+        assert next_run == T0 + timedelta(seconds=300)
+
+    def test_skip_fires_on_time_slot(self):
+        task = PeriodicTask(_noop, name="job", interval=50, catchup="skip")
+        task.next_run = T0
+
+        runs, _ = task.due_runs(T0 + timedelta(seconds=0.5), grace=1)
+
+        assert runs == [T0]
+
+    def test_all_is_capped(self):
+        task = PeriodicTask(_noop, name="job", interval=1, catchup="all")
+        task.next_run = T0
+
+        runs, next_run = task.due_runs(T0 + timedelta(days=1), limit=5)
+
+        assert len(runs) == 5
+        assert next_run == T0 + timedelta(days=1, seconds=1)
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError, match="catchup"):
+            PeriodicTask(_noop, name="job", interval=1, catchup="later")
+
+    def test_cron_iterator_is_reused(self):
+        pytest.importorskip("croniter")
+        task = PeriodicTask(_noop, name="job", cron="*/5 * * * *")
+
+        first = task.get_next_run(T0)
+        iterator = task._cron_iter
+        second = task.get_next_run(first)
+
+        assert task._cron_iter is iterator
+        assert second - first == timedelta(minutes=5)
@@ -0,0 +1,152 @@
+"""
+Testes dos loaders/dumpers compilados por classe do StructSchema.
+"""
+
+import logging
+
+import pytest
+
+from strider.schema import (
+    BooleanField,
+    DictField,
+    IntegerField,
+    ListField,
+    NestedField,
+    StringField,
+    StructSchema,
+    _compile_codecs,
+)
+
+
+class Address(StructSchema):
+    street = StringField(default="")
+    number = IntegerField(default=0)
+
+
+class Profile(StructSchema):
+    name = StringField(default="anon", aliases=["full_name", "nome"])
+    age = IntegerField(default=0, nullable=True)
+    active = BooleanField(default=True)
+    tags = ListField(StringField(), max_size=3)
+    meta = DictField()
+    address = NestedField(Address)
+
+
+DATA = {
+    "nome": "Ana",
+    "age": "31",
+    "active": 0,
+    "tags": ["a", "b", "c", "d"],
+    "meta": {"k": 1},
+    "address": {"street": "Rua A", "number": "10", "zip": "01000"},
+    "legacy": True,
+}
+
+
+@pytest.fixture(params=["from_dict_safe", "from_dict_fast"])
+def load(request):
+    return getattr(Profile, request.param)
+
+
+class TestCompiledLoaders:
+    def test_loads_and_coerces(self, load):
+        p = load(DATA)
+
+        assert (p.name, p.age, p.active) == ("Ana", 31, False)
+        assert p.tags == ["a", "b", "c"]
+        assert p.meta == {"k": 1}
+        assert isinstance(p.address, Address)
+        assert (p.address.street, p.address.number) == ("Rua A", 10)
+        assert p.address._extra_data == {"zip": "01000"}
+
+    def test_preserves_only_unknown_keys(self, load):
+        assert load(DATA)._extra_data == {"legacy": True}
+        assert load({"name": "x"})._extra_data == {}
+
+    def test_canonical_name_wins_over_alias(self, load):
+        p = load({"full_name": "old", "name": "new", "nome": "older"})
+
+        assert p.name == "new"
+        assert p._extra_data == {}
+
+    def test_missing_fields_use_defaults(self, load):
+        p = load({})
+
+        assert (p.name, p.age, p.active, p.tags) == ("anon", 0, True, [])
+        assert p.tags is not load({}).tags
+
+    def test_none_respects_nullable(self, load):
+        p = load({"age": None, "name": None})
+
+        assert p.age is None
+        assert p.name == "anon"
+
+    def test_coercion_failure_falls_back_to_default(self, load):
+        assert load({"age": "not a number"}).age == 0
+
+    def test_none_input_is_empty(self):
+        assert Profile.from_dict_safe(None).to_dict() == Profile.from_dict_safe({}).to_dict()
+
+    def test_safe_logs_coercion_failure(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="strider.schema"):
+            Profile.from_dict_safe({"age": "x"})
+
+        assert "Field 'age' coercion failed" in caplog.text
+
+
+class TestCompiledDumper:
+    def test_round_trip(self):
+        data = Profile.from_dict_safe(DATA).to_dict()
+
+        assert data["name"] == "Ana"
+        assert data["address"] == {"street": "Rua A", "number": 10, "zip": "01000"}
+        assert data["legacy"] is True
+        assert "nome" not in data
+        assert Profile.from_dict_fast(data).to_dict() == data
+
+    def test_instance_built_with_init(self):
+        p = Profile(name="Bia")
+        p.age = 20
+
+        assert p.to_dict()["name"] == "Bia"
+        assert p.to_dict()["age"] == 20
+
+    def test_incomplete_instance_uses_defaults(self):
+        p = Profile.__new__(Profile)
+
+        assert p.to_dict()["name"] == "anon"
+
+
+class TestCodecCompilation:
+    def test_subclass_gets_own_codecs(self):
+        class Extended(Profile):
+            nickname = StringField(default="", aliases=["apelido"])
+
+        p = Extended.from_dict_safe({"nome": "Ana", "apelido": "Aninha"})
+
+        assert (p.name, p.nickname) == ("Ana", "Aninha")
+        assert "nickname" not in Profile.from_dict_safe({"apelido": "x"}).to_dict()
+        assert Extended._load_safe is not Profile._load_safe
+
+    def test_recompile_after_changing_fields(self):
+        class Dynamic(StructSchema):
+            a = IntegerField(default=1)
+
+        Dynamic._fields["b"] = IntegerField(default=2)
+        assert Dynamic.from_dict_safe({"b": 5})._extra_data == {"b": 5}
+
+        _compile_codecs(Dynamic)
+
+        p = Dynamic.from_dict_safe({"b": 5})
+        assert p.b == 5
+        assert p.to_dict() == {"a": 1, "b": 5}
+
+    def test_field_with_custom_coerce_is_not_inlined(self):
+        class Upper(StringField):
+            def coerce(self, value):
+                return str(value).upper()
+
+        class Tagged(StructSchema):
+            code = Upper(default="")
+
+        assert Tagged.from_dict_safe({"code": "abc"}).code == "ABC"
@@ -0,0 +1,196 @@
+"""
+Tests for the prefork server: worker count detection and the supervisor
+(spawn, ready signalling, SIGHUP rolling reload, max-requests recycling).
+"""
+
+import importlib.util
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from strider import server
+from strider.server import cgroup_cpu_quota, default_worker_count
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestCgroupCpuQuota:
+    def test_cgroup_v2_quota(self, tmp_path):
+        (tmp_path / "cpu.max").write_text("250000 100000\n")
+        assert cgroup_cpu_quota(str(tmp_path)) == 2.5
+
+    def test_cgroup_v2_unlimited(self, tmp_path):
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+        assert cgroup_cpu_quota(str(tmp_path)) is None
+
+    def test_cgroup_v1_quota(self, tmp_path):
+        cpu = tmp_path / "cpu"
+        cpu.mkdir()
+        (cpu / "cpu.cfs_quota_us").write_text("150000")
+        (cpu / "cpu.cfs_period_us").write_text("100000")
+        assert cgroup_cpu_quota(str(tmp_path)) == 1.5
+
+    def test_cgroup_v1_unlimited(self, tmp_path):
+        cpu = tmp_path / "cpu"
+        cpu.mkdir()
+        (cpu / "cpu.cfs_quota_us").write_text("-1")
+        (cpu / "cpu.cfs_period_us").write_text("100000")
+        assert cgroup_cpu_quota(str(tmp_path)) is None
+
+    def test_missing_cgroup(self, tmp_path):
+        assert cgroup_cpu_quota(str(tmp_path / "nope")) is None
+
+
+class TestDefaultWorkerCount:
+    def test_rounds_quota_up(self, monkeypatch):
+        monkeypatch.setattr(server, "cgroup_cpu_quota", lambda: 2.5)
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+        assert default_worker_count() == 3
+
+    def test_quota_capped_by_available_cpus(self, monkeypatch):
+        monkeypatch.setattr(server, "cgroup_cpu_quota", lambda: 16.0)
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+        assert default_worker_count() == 2
+
+    def test_small_quota_gives_one_worker(self, monkeypatch):
+        monkeypatch.setattr(server, "cgroup_cpu_quota", lambda: 0.25)
+        assert default_worker_count() == 1
+
+    def test_unlimited_uses_affinity(self, monkeypatch):
+        monkeypatch.setattr(server, "cgroup_cpu_quota", lambda: None)
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2, 3}, raising=False)
+        assert default_worker_count() == 4
+
+
+# =============================================================================
+# Supervisor (processos reais)
+# =============================================================================
+
+APP = '''
+import os
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"connection", b"close")]})
+    await send({"type": "http.response.body", "body": str(os.getpid()).encode()})
+'''
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _children(pid: int) -> set[int]:
+    found = set()
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            stat = open(f"/proc/{entry}/stat").read()
+        except OSError:
+            continue
+        # "pid (comm) state ppid ..." (comm pode ter espaços)
+        fields = stat.rsplit(")", 1)[1].split()
+        if fields[0] != "Z" and int(fields[1]) == pid:
+            found.add(int(entry))
+    return found
+
+
+def _get(port: int) -> int | None:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=2) as response:
+            return int(response.read())
+    except OSError:
+        return None
+
+
+def _until(check, timeout: float = 20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = check()
+        if result:
+            return result
+        time.sleep(0.05)
+    raise AssertionError("timed out")
+
+
+@pytest.fixture
+def supervisor(tmp_path):
+    """Sobe `serve()` em um subprocesso com um app ASGI que devolve o pid do worker."""
+    (tmp_path / "pidapp.py").write_text(APP)
+    procs: list[subprocess.Popen] = []
+
+    def start(**options):
+        port = _free_port()
+        code = (
+            "import sys; from strider.server import serve; "
+            f"sys.exit(serve('pidapp', host='127.0.0.1', port={port}, log_level='warning', **{options!r}))"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path), str(ROOT)]))
+        proc = subprocess.Popen([sys.executable, "-c", code], cwd=tmp_path, env=env)
+        procs.append(proc)
+        _until(lambda: _get(port))
+        return proc, port
+
+    yield start
+
+    for proc in procs:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux") or importlib.util.find_spec("uvicorn") is None,
+    reason="prefork supervisor needs Linux and uvicorn",
+)
+class TestSupervisor:
+    def test_spawns_workers_and_stops_gracefully(self, supervisor):
+        proc, port = supervisor(workers=2)
+
+        workers = _until(lambda: (found := _children(proc.pid)) and len(found) == 2 and found)
+        assert _get(port) in workers
+
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(timeout=20) == 0
+        assert not _children(proc.pid)
+
+    def test_sighup_replaces_every_worker_without_downtime(self, supervisor):
+        proc, port = supervisor(workers=2)
+        old = _until(lambda: (found := _children(proc.pid)) and len(found) == 2 and found)
+
+        proc.send_signal(signal.SIGHUP)
+        served = []
+
+        def replaced():
+            served.append(_get(port))
+            found = _children(proc.pid)
+            return len(found) == 2 and not found & old and found
+
+        new = _until(replaced)
+
+        # Um worker novo só substitui um antigo depois de pronto
+        assert None not in served
+        assert _get(port) in new
+
+    def test_max_requests_recycles_the_worker(self, supervisor):
+        proc, port = supervisor(workers=1, max_requests=3, max_requests_jitter=0)
+
+        # uvicorn confere o limite a cada tick (0.1s)
+        pids = set()
+        for _ in range(10):
+            pids.add(_until(lambda: _get(port)))
+            time.sleep(0.15)
+
+        assert len(pids) >= 3
+        assert proc.poll() is None
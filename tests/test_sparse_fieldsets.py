@@ -0,0 +1,212 @@
+"""
+Testes de sparse fieldsets (?fields= / ?exclude=) com projeção no SELECT.
+"""
+
+import pytest
+from fastapi import FastAPI
+from pydantic import computed_field, field_serializer, field_validator
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import Mapped
+
+from strider.dependencies import get_db
+from strider.models import Field, Model
+from strider.permissions import IsOwner
+from strider.routing import Router
+from strider.serializers import OutputSchema
+from strider.views import ViewSet
+
+
+class Document(Model):
+    __tablename__ = "test_sparse_documents"
+
+    id: Mapped[int] = Field.pk()
+    title: Mapped[str] = Field.string(max_length=50)
+    body: Mapped[str] = Field.text()
+    user_id: Mapped[int] = Field.integer(default=1)
+
+    @property
+    def summary(self) -> str:
+        return self.body[:5]
+
+
+class DocumentOutput(OutputSchema):
+    id: int
+    title: str
+    body: str
+    user_id: int
+
+
+class DocumentSummaryOutput(DocumentOutput):
+    summary: str
+
+
+class MaskedDocumentOutput(DocumentOutput):
+    """Schema com serializer/validator próprios: valem também no subset."""
+
+    @field_serializer("title")
+    def mask_title(self, title: str) -> str:
+        return title[0] + "***"
+
+    @field_validator("user_id")
+    @classmethod
+    def shift_user(cls, user_id: int) -> int:
+        return user_id + 100
+
+    @computed_field
+    @property
+    def preview(self) -> str:
+        return self.body[:4]
+
+
+class DocumentViewSet(ViewSet):
+    model = Document
+    output_schema = DocumentOutput
+
+
+class DocumentSummaryViewSet(ViewSet):
+    model = Document
+    output_schema = DocumentSummaryOutput
+
+
+class MaskedDocumentViewSet(ViewSet):
+    model = Document
+    output_schema = MaskedDocumentOutput
+
+
+class OwnedDocumentViewSet(ViewSet):
+    model = Document
+    output_schema = DocumentOutput
+    permission_classes_by_action = {"retrieve": [IsOwner]}
+
+
+@pytest.fixture
+async def client(db_session):
+    db_session.add_all([Document(title=f"t{i}", body="long body " * 50) for i in range(3)])
+    await db_session.commit()
+    db_session.expunge_all()
+
+    router = Router()
+    router.register_viewset("/docs", DocumentViewSet, basename="doc")
+    router.register_viewset("/summaries", DocumentSummaryViewSet, basename="summary")
+    router.register_viewset("/owned", OwnedDocumentViewSet, basename="owned")
+    router.register_viewset("/masked", MaskedDocumentViewSet, basename="masked")
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = lambda: db_session
+
+    statements: list[str] = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+        http.statements = statements
+        yield http
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def _page_select(statements: list[str]) -> str:
+    return next(sql for sql in statements if "LIMIT" in sql.upper())
+
+
+class TestList:
+    async def test_fields_trim_response_and_select(self, client):
+        response = await client.get("/docs/?fields=title")
+
+        assert response.status_code == 200
+        assert response.json()["items"][0] == {"title": "t0"}
+        sql = _page_select(client.statements)
+        assert "body" not in sql
+        assert "title" in sql
+
+    async def test_exclude(self, client):
+        response = await client.get("/docs/?exclude=body,user_id")
+
+        assert response.json()["items"][0] == {"id": 1, "title": "t0"}
+        assert "body" not in _page_select(client.statements)
+
+    async def test_unknown_field_is_422(self, client):
+        response = await client.get("/docs/?fields=title,secret")
+
+        assert response.status_code == 422
+        assert response.json()["detail"]["errors"][0]["input"] == ["secret"]
+
+    async def test_empty_selection_is_422(self, client):
+        assert (await client.get("/docs/?fields=id&exclude=id")).status_code == 422
+
+    async def test_computed_field_loads_all_columns(self, client):
+        response = await client.get("/summaries/?fields=summary")
+
+        assert response.json()["items"][0] == {"summary": "long "}
+
+    async def test_field_serializer_still_applies(self, client):
+        full = (await client.get("/masked/")).json()["items"][0]
+        sparse = (await client.get("/masked/?fields=id,title,user_id")).json()["items"][0]
+
+        assert full["title"] == "t***"
+        assert sparse == {"id": 1, "title": "t***", "user_id": 101}
+
+    async def test_without_params_returns_full_schema(self, client):
+        item = (await client.get("/docs/")).json()["items"][0]
+
+        assert set(item) == {"id", "title", "body", "user_id"}
+
+
+class TestRetrieve:
+    async def test_fields_on_detail(self, client):
+        response = await client.get("/docs/2?fields=id,title")
+
+        assert response.json() == {"id": 2, "title": "t1"}
+        assert "body" not in client.statements[-1]
+
+    async def test_object_permissions_disable_projection(self, client):
+        view = OwnedDocumentViewSet()
+
+        assert view._sparse_projection(frozenset({"title"}), "retrieve") is None
+        assert view._sparse_projection(frozenset({"title"}), "list") == ["title"]
+
+
+class TestQuerySetProjection:
+    async def test_only_and_defer(self, db_session):
+        db_session.add(Document(title="x", body="y"))
+        await db_session.flush()
+        db_session.expunge_all()
+
+        doc = await Document.objects.using(db_session).only("title").first()
+        assert "body" not in doc.__dict__
+        assert doc.title == "x"
+
+        db_session.expunge_all()
+        doc = await Document.objects.using(db_session).defer("body").first()
+        assert "body" not in doc.__dict__
+        assert "user_id" in doc.__dict__
+
+    def test_only_rejects_non_columns(self):
+        qs = Document.objects.only("summary")
+
+        with pytest.raises(ValueError, match="não é uma coluna"):
+            qs._build_query()
+
+
+class TestSubsetSchema:
+    def test_subset_is_cached_per_field_set(self):
+        first = DocumentOutput.subset(frozenset({"id", "title"}))
+
+        assert first is DocumentOutput.subset(frozenset({"title", "id"}))
+
+    def test_unselected_fields_are_not_read(self):
+        class Partial:
+            id = 1
+            title = "t"
+
+            def __getattr__(self, name):
+                # Colunas fora do load_only disparariam lazy load
+                if name in ("body", "user_id"):
+                    raise AssertionError(f"{name} read")
+                raise AttributeError(name)
+
+        schema = MaskedDocumentOutput.subset(frozenset({"id", "title"}))
+
+        assert issubclass(schema, MaskedDocumentOutput)
+        assert schema.model_validate(Partial()).model_dump(include={"id", "title"}) == {"id": 1, "title": "t***"}
@@ -0,0 +1,159 @@
+"""
+Testes do rastreamento de caminhos alterados (StructDescriptor) e do
+UPDATE parcial com jsonb_set no PostgreSQL.
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped
+
+from strider.fields import AdaptiveJSON
+from strider.models import Model, Field
+from strider.schema import (
+    BooleanField,
+    DictField,
+    NestedField,
+    StringField,
+    StructDescriptor,
+    StructSchema,
+    _collapse_paths,
+    _diff_paths,
+    pop_dirty_paths,
+)
+
+
+class Notifications(StructSchema):
+    email = BooleanField(default=True)
+    push = BooleanField(default=True)
+
+
+class Preferences(StructSchema):
+    theme = StringField(default="system")
+    language = StringField(default="pt-BR", aliases=["lang"])
+    notifications = NestedField(Notifications)
+    extra = DictField()
+
+
+class Account(Model):
+    __tablename__ = "test_struct_accounts"
+
+    id: Mapped[int] = Field.pk()
+    preferences: Mapped[dict] = Field.struct(Preferences)
+
+    prefs = StructDescriptor(Preferences, "preferences")
+
+
+class _PostgresBind:
+    dialect = postgresql.dialect()
+
+
+@pytest.fixture
+async def account(db_session):
+    account = Account()
+    await account.save(db_session)
+    await db_session.commit()
+    return account
+
+
+def _compile(expr) -> str:
+    return str(expr.compile(dialect=postgresql.dialect()))
+
+
+class TestDiffPaths:
+    def test_nested_change_yields_leaf_path(self):
+        old = {"a": 1, "n": {"x": 1, "y": 2}}
+        new = {"a": 1, "n": {"x": 1, "y": 3}}
+
+        assert _diff_paths(old, new) == {("n", "y")}
+
+    def test_added_removed_and_replaced_keys(self):
+        old = {"a": 1, "b": {"x": 1}, "c": [1]}
+        new = {"b": 5, "c": [1], "d": True}
+
+        assert _diff_paths(old, new) == {("a",), ("b",), ("d",)}
+
+    def test_bool_and_int_are_different(self):
+        assert _diff_paths({"a": 1}, {"a": True}) == {("a",)}
+
+    def test_collapse_drops_covered_paths(self):
+        assert _collapse_paths({("n",), ("n", "x"), ("m", "y")}) == {("n",), ("m", "y")}
+
+
+class TestDescriptorTracking:
+    async def test_partial_assignment_records_changed_paths(self, account):
+        account.prefs = {"lang": "en", "notifications": {"email": False}}
+
+        [(base, document, paths)] = pop_dirty_paths(account).values()
+
+        assert document is account.preferences
+        assert base["language"] == "pt-BR"
+        assert paths == {("language",), ("notifications", "email")}
+
+    async def test_consecutive_assignments_accumulate(self, account):
+        account.prefs = {"theme": "dark"}
+        account.prefs = {"notifications": {"push": False}}
+
+        [(_, _, paths)] = pop_dirty_paths(account).values()
+
+        assert paths == {("theme",), ("notifications", "push")}
+
+    async def test_direct_column_assignment_disables_patch(self, account):
+        account.prefs = {"theme": "dark"}
+        account.preferences = {**account.preferences, "theme": "light"}
+        account.prefs = {"language": "en"}
+
+        [(_, _, paths)] = pop_dirty_paths(account).values()
+
+        assert paths is None
+
+    async def test_alias_overrides_existing_canonical_value(self, account):
+        account.prefs = {"lang": "es"}
+
+        assert account.prefs.language == "es"
+        assert "lang" not in account.preferences
+
+
+class TestPartialUpdate:
+    async def test_postgres_save_uses_jsonb_set(self, db_session, account, monkeypatch):
+        monkeypatch.setattr(db_session, "get_bind", lambda **kw: _PostgresBind())
+        account.prefs = {"theme": "dark", "notifications": {"email": False}}
+        document = account.preferences
+
+        patched = account._apply_json_patches(db_session)
+
+        assert patched == {"preferences": document}
+        sql = _compile(account.__dict__["preferences"])
+        assert sql.count("jsonb_set(") == 2
+        assert sql.startswith("jsonb_set(jsonb_set(test_struct_accounts.preferences")
+        db_session.expunge(account)
+
+    async def test_removed_key_uses_delete_operator(self, account):
+        column = Account.__table__.c.preferences
+
+        expr = AdaptiveJSON.patch_expression(column, {"theme": "dark"}, {("legacy",), ("theme",)})
+
+        sql = _compile(expr)
+        assert "#-" in sql
+        assert "jsonb_set(" in sql
+
+    async def test_other_dialects_write_full_document(self, db_session, account):
+        account.prefs = {"theme": "dark", "notifications": {"push": False}}
+
+        await account.save(db_session)
+        await db_session.commit()
+
+        assert "_struct_dirty_paths" not in account.__dict__
+        db_session.expunge_all()
+        stored = (await db_session.execute(
+            select(Account.preferences).where(Account.id == account.id)
+        )).scalar_one()
+        assert stored["theme"] == "dark"
+        assert stored["notifications"] == {"email": True, "push": False}
+
+    async def test_new_instances_are_not_patched(self, db_session, monkeypatch):
+        monkeypatch.setattr(db_session, "get_bind", lambda **kw: _PostgresBind())
+        account = Account()
+        account.prefs = {"theme": "dark"}
+
+        assert account._apply_json_patches(db_session) == {}
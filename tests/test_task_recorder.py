@@ -0,0 +1,167 @@
+"""
+Testes do TaskLifecycleRecorder: transições de TaskExecution coalescidas em
+upserts multi-linha, memória limitada, flush no shutdown e modo durável.
+"""
+
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from strider.admin.models import TaskExecution
+from strider.config import configure, is_configured, reset_settings
+
+# strider.tasks lê as settings na importação
+_configured = is_configured()
+if not _configured:
+    configure()
+from strider.tasks.recorder import TaskLifecycleRecorder  # noqa: E402
+if not _configured:
+    reset_settings()
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    configured = is_configured()
+    if not configured:
+        configure()
+    yield
+    if not configured:
+        reset_settings()
+
+
+@contextmanager
+def _capture_writes(session):
+    statements: list[str] = []
+    engine = session.bind.sync_engine
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if verb in ("INSERT", "UPDATE"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+
+
+def _start(task_id: str) -> dict:
+    return {"task_id": task_id, "task_name": "send_email", "queue": "default", "worker_id": "w1"}
+
+
+def _finish(task_id: str, status: str = "SUCCESS") -> dict:
+    return {"task_id": task_id, "task_name": "send_email", "queue": "default", "status": status, "duration_ms": 5}
+
+
+async def _rows(session) -> dict[str, TaskExecution]:
+    session.expire_all()
+    return {row.task_id: row for row in await TaskExecution.objects.using(session).all()}
+
+
+class TestCoalescing:
+    async def test_start_and_finish_become_one_insert(self, db_session):
+        recorder = TaskLifecycleRecorder(flush_interval=60)
+        for n in range(10):
+            await recorder.record_start(**_start(f"t{n}"))
+            await recorder.record_finish(**_finish(f"t{n}"))
+
+        with _capture_writes(db_session) as statements:
+            assert await recorder.flush() == 10
+
+        assert len(statements) == 1
+        rows = await _rows(db_session)
+        assert len(rows) == 10
+        assert {row.status for row in rows.values()} == {"SUCCESS"}
+        assert rows["t3"].worker_id == "w1"
+
+    async def test_finish_upserts_row_written_by_earlier_flush(self, db_session):
+        recorder = TaskLifecycleRecorder(flush_interval=60)
+        await recorder.record_start(**_start("t1"), max_retries=5)
+        await recorder.flush()
+
+        await recorder.record_finish(**_finish("t1", "FAILURE"), error="boom")
+        await recorder.flush()
+
+        row = (await _rows(db_session))["t1"]
+        assert (row.status, row.error, row.max_retries) == ("FAILURE", "boom", 5)
+
+    async def test_retry_restart_reuses_row(self, db_session):
+        recorder = TaskLifecycleRecorder(flush_interval=60)
+        await recorder.record_start(**_start("t1"))
+        await recorder.record_finish(**_finish("t1", "RETRY"))
+        await recorder.flush()
+
+        await recorder.record_start(**_start("t1"))
+        await recorder.flush()
+
+        rows = await _rows(db_session)
+        assert list(rows) == ["t1"] and rows["t1"].status == "RUNNING"
+
+
+class TestDurability:
+    async def test_durable_transition_is_written_immediately(self, db_session):
+        recorder = TaskLifecycleRecorder(flush_interval=60)
+        await recorder.record_start(**_start("buffered"))
+
+        await recorder.record_start(**_start("charge"), durable=True)
+
+        assert recorder.pending == 1
+        assert list(await _rows(db_session)) == ["charge"]
+
+    async def test_close_flushes_pending(self, db_session):
+        recorder = TaskLifecycleRecorder(flush_interval=60)
+        await recorder.start()
+        await recorder.record_start(**_start("t1"))
+
+        await recorder.close()
+
+        assert recorder.pending == 0
+        assert list(await _rows(db_session)) == ["t1"]
+
+
+class TestBoundedMemory:
+    async def test_failed_flush_keeps_transitions(self, db_session):
+        recorder = TaskLifecycleRecorder(flush_interval=60)
+        await recorder.record_start(**_start("t1"))
+
+        async def broken(rows):
+            raise ConnectionError("db down")
+
+        recorder._write = broken
+        assert await recorder.flush() == 0
+        await recorder.record_finish(**_finish("t1"))
+        del recorder._write
+        await recorder.flush()
+
+        assert (await _rows(db_session))["t1"].status == "SUCCESS"
+
+    async def test_full_buffer_drops_oldest_when_db_is_down(self):
+        recorder = TaskLifecycleRecorder(flush_interval=60, batch_size=2, max_pending=3)
+
+        async def broken(rows):
+            raise ConnectionError("db down")
+
+        recorder._write = broken
+        for n in range(5):
+            await recorder.record_start(**_start(f"t{n}"))
+
+        assert recorder.pending == 3
+        assert recorder.dropped == 2
+        assert list(recorder._pending) == ["t2", "t3", "t4"]
+
+    async def test_batch_size_wakes_flusher(self, db_session):
+        recorder = TaskLifecycleRecorder(flush_interval=60, batch_size=2)
+        await recorder.start()
+
+        await recorder.record_start(**_start("t1"))
+        await recorder.record_start(**_start("t2"))
+        for _ in range(20):
+            if not recorder.pending:
+                break
+            await asyncio.sleep(0.01)
+
+        assert recorder.pending == 0
+        await recorder.close()
@@ -0,0 +1,267 @@
+"""
+Testes do consumer idempotente: stores de chaves processadas (memória,
+Redis, banco), derivação da chave por payload/header e supressão de
+reentregas nos workers com métricas de hit rate.
+"""
+
+import asyncio
+
+import pytest
+
+import strider.messaging
+import strider.messaging.registry
+from strider.admin.models import ProcessedMessage
+from strider.messaging.dedup import (
+    DatabaseDedupStore,
+    Deduplicator,
+    MemoryDedupStore,
+    RedisDedupStore,
+    key_getter,
+)
+from strider.messaging.tracking import track_incoming
+from strider.messaging.workers import RetryPolicy, WorkerConfig, _run_worker_config
+from strider.testing import MockKafka, MockRedis
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMemoryStore:
+    async def test_keys_expire_after_ttl(self):
+        clock = FakeClock()
+        store = MemoryDedupStore(ttl=10, clock=clock)
+        await store.add(["a"])
+
+        assert await store.contains("a")
+        clock.now = 10
+        assert not await store.contains("a")
+
+    async def test_evicts_least_recently_seen(self):
+        store = MemoryDedupStore(max_keys=2)
+        await store.add(["a", "b"])
+        await store.contains("a")
+        await store.add(["c"])
+
+        assert [await store.contains(k) for k in "abc"] == [True, False, True]
+
+
+class TestRedisStore:
+    async def test_setnx_with_ttl_in_one_pipeline(self):
+        redis = MockRedis()
+        pipelines = []
+        make_pipeline = redis.pipeline
+
+        def pipeline(**kwargs):
+            pipelines.append(make_pipeline(**kwargs))
+            return pipelines[-1]
+
+        redis.pipeline = pipeline
+        store = RedisDedupStore(ttl=60, client=redis)
+
+        await store.add(["g:1", "g:2"])
+
+        assert await store.contains("g:1") and not await store.contains("g:3")
+        assert [p.executions for p in pipelines] == [1]
+        assert "strider:dedup:g:2" in redis._expiry
+
+
+class TestDatabaseStore:
+    async def test_keys_are_written_in_batches(self, db_session):
+        store = DatabaseDedupStore(batch_size=3, flush_interval=60)
+        await store.add(["g:1", "g:2"])
+
+        assert await store.contains("g:1")
+        assert await ProcessedMessage.objects.using(db_session).count() == 0
+
+        await store.add(["g:3"])
+
+        assert await ProcessedMessage.objects.using(db_session).count() == 3
+        assert await store.contains("g:2")
+
+    async def test_expired_keys_do_not_count(self, db_session):
+        store = DatabaseDedupStore(ttl=0)
+        await store.add(["g:1"])
+        await store.flush()
+
+        assert not await store.contains("g:1")
+        assert await store.purge() == 1
+
+    async def test_long_keys_are_hashed(self, db_session):
+        store = DatabaseDedupStore()
+        key = "g:" + "x" * 300
+        await store.add([key])
+        await store.flush()
+
+        assert await store.contains(key)
+
+
+class TestKeys:
+    def test_payload_path(self):
+        get = key_getter("data.order_id")
+
+        assert get({"data": {"order_id": 7}}) == "7"
+        assert get({"data": None}) is None
+
+    async def test_header_of_current_message(self):
+        await track_incoming("orders", 0, 1, {"n": 1}, headers={"event_id": "e-1"})
+
+        assert key_getter("header:event_id")({"n": 1}) == "e-1"
+
+    def test_callable(self):
+        assert key_getter(lambda m: m["a"] + m["b"])({"a": "x", "b": "y"}) == "xy"
+
+
+class TestDeduplicator:
+    async def test_hit_rate(self):
+        dedup = Deduplicator(MemoryDedupStore(), "id", scope="g")
+        key = dedup.key_for({"id": 1})
+
+        assert not await dedup.is_duplicate(key)
+        assert await dedup.is_duplicate(key)  # em processamento
+        await dedup.processed([key])
+        assert await dedup.is_duplicate(key)
+
+        assert dedup.metrics() == {
+            "dedup_checked": 3, "dedup_hits": 2, "dedup_hit_rate": 0.6667, "dedup_errors": 0,
+        }
+
+    async def test_held_keys_are_resumed_by_the_retry(self):
+        dedup = Deduplicator(MemoryDedupStore(), "id", scope="g")
+        key = dedup.key_for({"id": 1})
+
+        assert not await dedup.is_duplicate(key)
+        dedup.hold([key], 30)
+        assert await dedup.is_duplicate(key)  # aguardando retry
+        assert dedup.resume(key)
+        assert not dedup.resume(key)
+        dedup.release([key])
+        assert not await dedup.is_duplicate(key)
+
+    async def test_store_errors_fail_open(self):
+        class Down(MemoryDedupStore):
+            async def contains(self, key):
+                raise ConnectionError("store down")
+
+        dedup = Deduplicator(Down(), "id")
+
+        assert not await dedup.is_duplicate("k")
+        assert dedup.errors == 1
+
+
+class Recorder(MockKafka):
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class FakeConsumer:
+    def __init__(self, message_handler) -> None:
+        self.handler = message_handler
+        self.started = asyncio.Event()
+
+    async def start(self) -> None:
+        self.started.set()
+
+    async def stop(self) -> None:
+        pass
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    """Roda _run_worker_config com consumer e producer falsos."""
+    consumers: list[FakeConsumer] = []
+    producer = Recorder()
+
+    def create_consumer(group_id, topics, message_handler):
+        consumers.append(FakeConsumer(message_handler))
+        return consumers[-1]
+
+    monkeypatch.setattr(strider.messaging.registry, "create_consumer", create_consumer)
+    monkeypatch.setattr(strider.messaging, "get_producer", lambda: producer, raising=False)
+
+    async def start(config: WorkerConfig):
+        task = asyncio.create_task(_run_worker_config(config))
+        while not consumers:
+            await asyncio.sleep(0.01)
+        await asyncio.wait_for(consumers[0].started.wait(), 5)
+        await asyncio.sleep(0)
+        return task, consumers[0].handler, producer
+
+    return start
+
+
+async def _stop(task: asyncio.Task) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+class TestWorkerRuntime:
+    async def test_redelivered_message_skips_handler(self, runtime):
+        handled = []
+
+        async def handler(message):
+            handled.append(message.get("id"))
+
+        store = MemoryDedupStore()
+        config = WorkerConfig(name="charges", handler=handler, input_topic="payments", dedup_key="id", dedup_store=store)
+        task, process, _ = await runtime(config)
+
+        for n in (1, 2, 1, 1, 3):
+            await process({"id": n})
+        await process({"no_key": True})
+        await _stop(task)
+
+        # Sem chave, a mensagem é sempre processada
+        assert handled == [1, 2, 3, None]
+        assert len(store) == 3
+
+    async def test_dead_lettered_message_is_not_recorded(self, runtime):
+        calls = []
+
+        async def handler(message):
+            calls.append(message["id"])
+            raise ValueError("boom")
+
+        store = MemoryDedupStore()
+        config = WorkerConfig(
+            name="failing", handler=handler, input_topic="payments", dlq_topic="payments.dlq",
+            retry_policy=RetryPolicy(max_retries=0), dedup_key="id", dedup_store=store,
+        )
+        task, process, _ = await runtime(config)
+
+        await process({"id": 1})
+        await process({"id": 1})
+        await _stop(task)
+
+        assert calls == [1, 1]
+        assert len(store) == 0
+
+    async def test_batch_records_keys_after_success(self, runtime):
+        batches = []
+
+        async def batch_handler(messages):
+            batches.append([m["id"] for m in messages])
+
+        store = MemoryDedupStore()
+        config = WorkerConfig(
+            name="batched", handler=batch_handler, input_topic="payments", batch_size=2,
+            batch_handler=batch_handler, dedup_key="id", dedup_store=store,
+        )
+        task, process, _ = await runtime(config)
+
+        for n in (1, 2, 2, 1, 3, 4):
+            await process({"id": n})
+        await _stop(task)
+
+        assert batches == [[1, 2], [3, 4]]
+        assert len(store) == 4
@@ -0,0 +1,360 @@
+"""
+Testes do tratamento de falhas dos workers de mensageria: retry durável via
+tópico de retry fora do hot path, DLQ em lote por tópico e métricas.
+"""
+
+import asyncio
+
+import pytest
+
+import strider.messaging
+import strider.messaging.registry
+from strider import config as config_module
+from strider.config import configure, is_configured, reset_settings
+from strider.messaging import tracking
+from strider.messaging.dedup import MemoryDedupStore
+from strider.messaging.retry import DeadLetterError, DeadLetterWriter, RetryScheduler
+from strider.messaging.tracking import IncomingMessage
+from strider.messaging.workers import RetryPolicy, WorkerConfig, _run_worker_config
+from strider.testing import MockKafka
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class BatchRecorder(MockKafka):
+    """MockKafka que registra cada chamada de send_batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[tuple[str, int]] = []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send_batch(self, topic, messages):
+        self.batches.append((topic, len(messages)))
+        await super().send_batch(topic, messages)
+
+
+class TestRetryScheduler:
+    async def test_publishes_attempt_and_due_time(self):
+        clock = FakeClock()
+        clock.now = 1000.0
+        producer = BatchRecorder()
+        scheduler = RetryScheduler(producer, "orders.retry", clock=clock)
+
+        await scheduler.schedule({"id": 1}, attempt=2, delay=30)
+
+        sent = producer.get_messages("orders.retry")
+        assert [m.value for m in sent] == [{"id": 1}]
+        assert sent[0].headers == {"retry_attempt": "2", "retry_at": "1030.000"}
+        assert scheduler.scheduled_by_attempt() == {2: 1}
+
+    async def test_wait_sleeps_until_due(self):
+        scheduler = RetryScheduler(BatchRecorder(), "orders.retry")
+        due = f"{scheduler.clock() + 0.05:.3f}"
+
+        waiting = asyncio.create_task(scheduler.wait({"retry_attempt": "3", "retry_at": due}))
+        await asyncio.sleep(0.01)
+        assert not waiting.done() and scheduler.waiting == 1
+
+        assert await asyncio.wait_for(waiting, 1) == 3
+        assert scheduler.metrics()["retry_redelivered"] == 1
+
+    async def test_wait_is_capped_and_not_due_messages_are_deferred(self):
+        clock = FakeClock()
+        producer = BatchRecorder()
+        scheduler = RetryScheduler(producer, "orders.retry", max_wait=0.01, clock=clock)
+        headers = {"retry_attempt": "2", "retry_at": "60.000"}
+
+        assert await asyncio.wait_for(scheduler.wait(headers), 1) is None
+        await scheduler.defer({"id": 1}, headers)
+
+        sent = producer.get_messages("orders.retry")
+        assert [(m.value, m.headers) for m in sent] == [({"id": 1}, headers)]
+        assert scheduler.metrics()["retry_deferred"] == 1
+        assert scheduler.metrics()["retry_redelivered"] == 0
+
+        clock.now = 60.0
+        assert await scheduler.wait(headers) == 2
+
+    async def test_publish_failure_is_raised(self):
+        class Down(BatchRecorder):
+            async def send(self, *args, **kwargs):
+                raise ConnectionError("broker down")
+
+        scheduler = RetryScheduler(Down(), "orders.retry")
+
+        with pytest.raises(ConnectionError):
+            await scheduler.schedule({"id": 1}, attempt=1, delay=0)
+        assert scheduler.failed == 1 and scheduler.scheduled == 0
+
+
+class TestDeadLetterWriter:
+    async def test_batches_per_topic(self):
+        producer = BatchRecorder()
+        writer = DeadLetterWriter(producer, batch_size=3, flush_interval=0)
+
+        for n in range(4):
+            await writer.put("a.dlq", {"n": n})
+        await writer.put("b.dlq", {"n": 9})
+        assert producer.batches == [("a.dlq", 3)]
+
+        await writer.close()
+
+        assert producer.batches == [("a.dlq", 3), ("a.dlq", 1), ("b.dlq", 1)]
+        assert writer.metrics() == {"dlq_pending": 0, "dlq_written": 5, "dlq_failed": 0}
+
+    async def test_failed_batches_are_kept_and_retried(self):
+        class Flaky(BatchRecorder):
+            down = True
+
+            async def send_batch(self, topic, messages):
+                if self.down:
+                    raise ConnectionError("broker down")
+                await super().send_batch(topic, messages)
+
+        producer = Flaky()
+        writer = DeadLetterWriter(producer, batch_size=10, flush_interval=0)
+        await writer.put("a.dlq", {"n": 1})
+
+        assert await writer.flush() == 0
+        assert writer.failed == 1 and writer.pending == 1
+
+        await writer.put("a.dlq", {"n": 2})
+        producer.down = False
+        assert await writer.flush() == 2
+        assert [m.value for m in producer.get_messages("a.dlq")] == [{"n": 1}, {"n": 2}]
+
+    async def test_wait_raises_until_published(self):
+        class Down(BatchRecorder):
+            async def send_batch(self, topic, messages):
+                raise ConnectionError("broker down")
+
+        writer = DeadLetterWriter(Down(), batch_size=10, flush_interval=0)
+
+        with pytest.raises(DeadLetterError):
+            await writer.put("a.dlq", {"n": 1}, wait=True)
+        assert writer.pending == 1
+
+
+class FakeConsumer:
+    def __init__(self, message_handler) -> None:
+        self.handler = message_handler
+        self.started = asyncio.Event()
+
+    async def start(self) -> None:
+        self.started.set()
+
+    async def stop(self) -> None:
+        pass
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    """Roda _run_worker_config com consumers e producer falsos."""
+    consumers: dict[str, FakeConsumer] = {}
+    producer = BatchRecorder()
+
+    def create_consumer(group_id, topics, message_handler):
+        consumers[topics[0]] = FakeConsumer(message_handler)
+        return consumers[topics[0]]
+
+    monkeypatch.setattr(strider.messaging.registry, "create_consumer", create_consumer)
+    monkeypatch.setattr(strider.messaging, "get_producer", lambda: producer, raising=False)
+
+    async def start(config: WorkerConfig):
+        task = asyncio.create_task(_run_worker_config(config))
+        while config.input_topic not in consumers:
+            await asyncio.sleep(0.01)
+        await asyncio.wait_for(consumers[config.input_topic].started.wait(), 5)
+        await asyncio.sleep(0)
+        return task, consumers, producer
+
+    return start
+
+
+async def _stop(task: asyncio.Task) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _deliver_retries(consumer: FakeConsumer, producer: MockKafka, topic: str) -> None:
+    """Entrega ao consumer de retry o que foi publicado no tópico, com os headers."""
+    for sent in producer.get_messages(topic):
+        producer.messages.remove(sent)
+        tracking._current_message.set(IncomingMessage(topic, 0, 0, sent.headers))
+        await consumer.handler(sent.value)
+
+
+class TestWorkerRuntime:
+    async def test_poison_message_does_not_stall_consumer(self, runtime):
+        handled = []
+
+        async def handler(message):
+            if message.get("poison"):
+                raise ValueError("bad payload")
+            handled.append(message["n"])
+
+        config = WorkerConfig(
+            name="poison", handler=handler, input_topic="orders", dlq_topic="orders.dlq",
+            retry_policy=RetryPolicy(max_retries=3, initial_delay=30),
+        )
+        task, consumers, producer = await runtime(config)
+
+        await asyncio.wait_for(consumers["orders"].handler({"poison": True}), 1)
+        await asyncio.wait_for(consumers["orders"].handler({"n": 1}), 1)
+        await _stop(task)
+
+        assert handled == [1]
+        # Antes do ack a mensagem já está no tópico de retry, com a tentativa
+        retried = producer.get_messages("orders.retry")
+        assert [m.value for m in retried] == [{"poison": True}]
+        assert retried[0].headers["retry_attempt"] == "1"
+        assert producer.get_messages("orders") == []
+
+    async def test_attempts_travel_in_headers_until_dead_letter(self, runtime):
+        async def handler(message):
+            raise ValueError("always fails")
+
+        config = WorkerConfig(
+            name="failing", handler=handler, input_topic="orders", dlq_topic="orders.dlq",
+            retry_policy=RetryPolicy(max_retries=2, backoff="fixed", initial_delay=0),
+        )
+        task, consumers, producer = await runtime(config)
+
+        await consumers["orders"].handler({"n": 1})
+        await _deliver_retries(consumers["orders.retry"], producer, "orders.retry")
+        assert [m.headers["retry_attempt"] for m in producer.get_messages("orders.retry")] == ["2"]
+        await _deliver_retries(consumers["orders.retry"], producer, "orders.retry")
+        await _stop(task)
+
+        assert producer.get_messages("orders.retry") == []
+        letters = producer.get_messages("orders.dlq")
+        assert [(letter.value["original"], letter.value["retries"]) for letter in letters] == [({"n": 1}, 2)]
+
+    async def test_dead_letters_are_published_before_returning(self, runtime):
+        async def handler(message):
+            raise ValueError("always fails")
+
+        config = WorkerConfig(
+            name="failing", handler=handler, input_topic="orders", dlq_topic="orders.dlq",
+            retry_policy=RetryPolicy(max_retries=0),
+        )
+        task, consumers, producer = await runtime(config)
+
+        await consumers["orders"].handler({"n": 0})
+        letters = producer.get_messages("orders.dlq")
+        assert [(letter.value["original"], letter.value["retries"]) for letter in letters] == [({"n": 0}, 0)]
+        await _stop(task)
+        assert "orders.retry" not in consumers
+
+    async def test_failed_batch_is_dead_lettered_in_one_send(self, runtime):
+        async def batch_handler(messages):
+            raise ValueError("always fails")
+
+        config = WorkerConfig(
+            name="failing", handler=batch_handler, batch_handler=batch_handler, batch_size=5,
+            input_topic="orders", dlq_topic="orders.dlq", retry_policy=RetryPolicy(max_retries=0),
+        )
+        task, consumers, producer = await runtime(config)
+
+        for n in range(5):
+            await consumers["orders"].handler({"n": n})
+        await _stop(task)
+
+        letters = producer.get_messages("orders.dlq")
+        assert [letter.value["original"] for letter in letters] == [{"n": n} for n in range(5)]
+        assert producer.batches == [("orders.dlq", 5)]
+
+    async def test_retry_succeeds_after_backoff(self, runtime):
+        calls = []
+
+        async def handler(message):
+            calls.append(message["n"])
+            if len(calls) == 1:
+                raise ValueError("transient")
+
+        config = WorkerConfig(
+            name="flaky", handler=handler, input_topic="orders",
+            retry_policy=RetryPolicy(max_retries=2, backoff="fixed", initial_delay=0.05),
+        )
+        task, consumers, producer = await runtime(config)
+
+        await consumers["orders"].handler({"n": 7})
+        await asyncio.wait_for(_deliver_retries(consumers["orders.retry"], producer, "orders.retry"), 1)
+        await _stop(task)
+
+        assert calls == [7, 7]
+        assert producer.messages == []
+
+    async def test_redelivery_while_retry_is_pending_is_suppressed(self, runtime):
+        calls = []
+
+        async def handler(message):
+            calls.append(message["id"])
+            if len(calls) == 1:
+                raise ValueError("transient")
+
+        store = MemoryDedupStore()
+        config = WorkerConfig(
+            name="flaky", handler=handler, input_topic="orders", dedup_key="id", dedup_store=store,
+            retry_policy=RetryPolicy(max_retries=2, backoff="fixed", initial_delay=0),
+        )
+        task, consumers, producer = await runtime(config)
+
+        await consumers["orders"].handler({"id": 7})
+        # Reentrega do original (rebalance) antes do retry: a chave segue retida
+        await consumers["orders"].handler({"id": 7})
+        assert calls == [7]
+        # O retry assume a chave em vez de ser suprimido por ela
+        await asyncio.wait_for(_deliver_retries(consumers["orders.retry"], producer, "orders.retry"), 1)
+        await consumers["orders"].handler({"id": 7})
+        await _stop(task)
+
+        assert calls == [7, 7]
+        assert len(store) == 1
+
+    async def test_not_due_retry_goes_back_to_the_topic(self, runtime, monkeypatch):
+        configured = is_configured()
+        if not configured:
+            configure()
+        try:
+            settings = config_module.get_settings().model_copy(update={"messaging_retry_max_wait": 0.01})
+            monkeypatch.setattr(config_module, "get_settings", lambda: settings)
+            calls = []
+
+            async def handler(message):
+                calls.append(message["n"])
+                raise ValueError("transient")
+
+            config = WorkerConfig(
+                name="slow-retry", handler=handler, input_topic="orders",
+                retry_policy=RetryPolicy(max_retries=2, backoff="fixed", initial_delay=30),
+            )
+            task, consumers, producer = await runtime(config)
+
+            await consumers["orders"].handler({"n": 7})
+            [scheduled] = producer.get_messages("orders.retry")
+            # O consumer de retry não segura a entrada até o horário
+            await asyncio.wait_for(_deliver_retries(consumers["orders.retry"], producer, "orders.retry"), 1)
+            await _stop(task)
+
+            [deferred] = producer.get_messages("orders.retry")
+            assert calls == [7]
+            assert deferred.value == {"n": 7} and deferred.headers == scheduled.headers
+        finally:
+            if not configured:
+                reset_settings()